@@ -0,0 +1,30 @@
+-- Migration: Add analytics read model tables
+-- Purpose: Keep per-project conversation counters, phase timings and maturity
+-- trends, and per-user LLM usage totals, up to date on write so analytics
+-- endpoints no longer rescan conversation history on every request.
+-- Rows for existing projects and users are backfilled lazily on first read.
+
+CREATE TABLE IF NOT EXISTS project_analytics (
+    project_id TEXT PRIMARY KEY,
+    message_count INTEGER DEFAULT 0,
+    question_count INTEGER DEFAULT 0,
+    answer_count INTEGER DEFAULT 0,
+    code_block_count INTEGER DEFAULT 0,
+    code_lines_generated INTEGER DEFAULT 0,
+    last_message_at TIMESTAMP,
+    phase_timings TEXT,  -- JSON {"current": phase, "phases": {phase: {...}}}
+    maturity_trend TEXT,  -- JSON array of capped score snapshots
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (project_id) REFERENCES projects(project_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS user_analytics (
+    user_id TEXT PRIMARY KEY,
+    llm_requests INTEGER DEFAULT 0,
+    input_tokens INTEGER DEFAULT 0,
+    output_tokens INTEGER DEFAULT 0,
+    llm_cost REAL DEFAULT 0.0,
+    last_llm_call_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,10 @@
+-- Migration: Add materialized maturity state columns
+-- Purpose: Keep the running sums behind each category score and the rolling
+-- velocity/plateau aggregates, so maturity and analytics can be updated
+-- incrementally instead of being recomputed from every spec and history event
+
+ALTER TABLE category_scores ADD COLUMN target_score REAL;
+ALTER TABLE category_scores ADD COLUMN weighted_sum REAL;
+ALTER TABLE category_scores ADD COLUMN confidence_sum REAL;
+ALTER TABLE category_scores ADD COLUMN spec_count INTEGER;
+ALTER TABLE analytics_metrics ADD COLUMN progression_state TEXT;
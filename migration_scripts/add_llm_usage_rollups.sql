@@ -0,0 +1,53 @@
+-- Migration: Add LLM usage rollups
+-- Purpose: Aggregate LLM calls per user, provider and model into hourly and
+-- daily buckets, so usage reports read a number of rows proportional to the
+-- time range instead of the number of calls. ProjectDatabase.save_usage_record()
+-- updates both rollups in the same transaction as the raw llm_usage row, which
+-- lets raw rows be purged after a retention period without changing reports.
+-- Buckets are ISO strings: 'YYYY-MM-DDTHH:00:00' for hours, 'YYYY-MM-DD' for days.
+
+CREATE TABLE IF NOT EXISTS llm_usage_hourly (
+    user_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0.0,
+    last_call_at TIMESTAMP,
+
+    PRIMARY KEY (user_id, bucket, provider, model)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS llm_usage_daily (
+    user_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0.0,
+    last_call_at TIMESTAMP,
+
+    PRIMARY KEY (user_id, bucket, provider, model)
+) WITHOUT ROWID;
+
+-- Backfill from existing raw rows. Timestamps written before ISO serialization
+-- use a space instead of 'T', so the hour is taken by position.
+INSERT OR REPLACE INTO llm_usage_hourly
+    (user_id, bucket, provider, model, requests, input_tokens, output_tokens, cost, last_call_at)
+SELECT user_id, substr(timestamp, 1, 10) || 'T' || substr(timestamp, 12, 2) || ':00:00',
+       provider, model, COUNT(*), SUM(COALESCE(input_tokens, 0)),
+       SUM(COALESCE(output_tokens, 0)), SUM(COALESCE(cost, 0.0)), MAX(timestamp)
+FROM llm_usage
+GROUP BY user_id, 2, provider, model;
+
+INSERT OR REPLACE INTO llm_usage_daily
+    (user_id, bucket, provider, model, requests, input_tokens, output_tokens, cost, last_call_at)
+SELECT user_id, substr(timestamp, 1, 10), provider, model, COUNT(*),
+       SUM(COALESCE(input_tokens, 0)), SUM(COALESCE(output_tokens, 0)),
+       SUM(COALESCE(cost, 0.0)), MAX(timestamp)
+FROM llm_usage
+GROUP BY user_id, 2, provider, model;
@@ -0,0 +1,184 @@
+-- Migration: Add storage usage counters
+-- Purpose: Keep per-user and per-project storage totals up to date on write so
+-- storage quota checks read a single row instead of summing every document.
+-- Triggers update the counters in the same transaction as the document or file
+-- change; ProjectDatabase.reconcile_storage_usage() corrects any drift, such as
+-- files still counted toward a project's previous owner, and drops empty rows.
+-- Knowledge documents count toward their uploader, project files toward the
+-- project owner. A document's size is its file_size, or its content length.
+
+CREATE TABLE IF NOT EXISTS user_storage_usage (
+    user_id TEXT PRIMARY KEY,
+    document_bytes INTEGER NOT NULL DEFAULT 0,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    file_bytes INTEGER NOT NULL DEFAULT 0,
+    file_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS project_storage_usage (
+    project_id TEXT PRIMARY KEY,
+    owner TEXT,  -- User the project's files are counted toward
+    document_bytes INTEGER NOT NULL DEFAULT 0,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    file_bytes INTEGER NOT NULL DEFAULT 0,
+    file_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- Knowledge documents. INSERT OR REPLACE does not fire delete triggers, so the
+-- replaced row is subtracted before the insert.
+CREATE TRIGGER IF NOT EXISTS trg_knowledge_documents_storage_replace
+BEFORE INSERT ON knowledge_documents
+WHEN EXISTS (SELECT 1 FROM knowledge_documents WHERE id = NEW.id)
+BEGIN
+    UPDATE user_storage_usage
+    SET document_bytes = document_bytes - (
+            SELECT COALESCE(NULLIF(file_size, 0), LENGTH(CAST(content AS BLOB)), 0)
+            FROM knowledge_documents WHERE id = NEW.id),
+        document_count = document_count - 1
+    WHERE user_id = (SELECT user_id FROM knowledge_documents WHERE id = NEW.id);
+    UPDATE project_storage_usage
+    SET document_bytes = document_bytes - (
+            SELECT COALESCE(NULLIF(file_size, 0), LENGTH(CAST(content AS BLOB)), 0)
+            FROM knowledge_documents WHERE id = NEW.id),
+        document_count = document_count - 1
+    WHERE project_id = (SELECT project_id FROM knowledge_documents WHERE id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_knowledge_documents_storage_insert
+AFTER INSERT ON knowledge_documents
+BEGIN
+    INSERT INTO user_storage_usage (user_id, document_bytes, document_count)
+    VALUES (
+        NEW.user_id,
+        COALESCE(NULLIF(NEW.file_size, 0), LENGTH(CAST(NEW.content AS BLOB)), 0),
+        1
+    )
+    ON CONFLICT(user_id) DO UPDATE SET
+        document_bytes = document_bytes + excluded.document_bytes,
+        document_count = document_count + 1;
+    INSERT INTO project_storage_usage (project_id, owner, document_bytes, document_count)
+    SELECT
+        NEW.project_id,
+        (SELECT owner FROM projects WHERE project_id = NEW.project_id),
+        COALESCE(NULLIF(NEW.file_size, 0), LENGTH(CAST(NEW.content AS BLOB)), 0),
+        1
+    WHERE NEW.project_id IS NOT NULL
+    ON CONFLICT(project_id) DO UPDATE SET
+        owner = COALESCE(owner, excluded.owner),
+        document_bytes = document_bytes + excluded.document_bytes,
+        document_count = document_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_knowledge_documents_storage_delete
+AFTER DELETE ON knowledge_documents
+BEGIN
+    UPDATE user_storage_usage
+    SET document_bytes = document_bytes
+            - COALESCE(NULLIF(OLD.file_size, 0), LENGTH(CAST(OLD.content AS BLOB)), 0),
+        document_count = document_count - 1
+    WHERE user_id = OLD.user_id;
+    UPDATE project_storage_usage
+    SET document_bytes = document_bytes
+            - COALESCE(NULLIF(OLD.file_size, 0), LENGTH(CAST(OLD.content AS BLOB)), 0),
+        document_count = document_count - 1
+    WHERE project_id = OLD.project_id;
+END;
+
+-- Project files (imported repositories), counted toward the project owner.
+-- The owner is kept on the project's counter row so that files removed by a
+-- cascade, after the project row is gone, are still released from the owner.
+CREATE TRIGGER IF NOT EXISTS trg_project_files_storage_replace
+BEFORE INSERT ON project_files
+WHEN EXISTS (
+    SELECT 1 FROM project_files WHERE project_id = NEW.project_id AND file_path = NEW.file_path
+)
+BEGIN
+    UPDATE user_storage_usage
+    SET file_bytes = file_bytes - (
+            SELECT COALESCE(file_size, 0) FROM project_files
+            WHERE project_id = NEW.project_id AND file_path = NEW.file_path),
+        file_count = file_count - 1
+    WHERE user_id = (SELECT owner FROM project_storage_usage WHERE project_id = NEW.project_id);
+    UPDATE project_storage_usage
+    SET file_bytes = file_bytes - (
+            SELECT COALESCE(file_size, 0) FROM project_files
+            WHERE project_id = NEW.project_id AND file_path = NEW.file_path),
+        file_count = file_count - 1
+    WHERE project_id = NEW.project_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_files_storage_insert
+AFTER INSERT ON project_files
+BEGIN
+    INSERT INTO project_storage_usage (project_id, owner, file_bytes, file_count)
+    VALUES (
+        NEW.project_id,
+        (SELECT owner FROM projects WHERE project_id = NEW.project_id),
+        COALESCE(NEW.file_size, 0),
+        1
+    )
+    ON CONFLICT(project_id) DO UPDATE SET
+        owner = COALESCE(owner, excluded.owner),
+        file_bytes = file_bytes + excluded.file_bytes,
+        file_count = file_count + 1;
+    INSERT INTO user_storage_usage (user_id, file_bytes, file_count)
+    SELECT owner, COALESCE(NEW.file_size, 0), 1
+    FROM project_storage_usage WHERE project_id = NEW.project_id AND owner IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET
+        file_bytes = file_bytes + excluded.file_bytes,
+        file_count = file_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_files_storage_update
+AFTER UPDATE OF file_size ON project_files
+BEGIN
+    UPDATE user_storage_usage
+    SET file_bytes = file_bytes - COALESCE(OLD.file_size, 0) + COALESCE(NEW.file_size, 0)
+    WHERE user_id = (SELECT owner FROM project_storage_usage WHERE project_id = NEW.project_id);
+    UPDATE project_storage_usage
+    SET file_bytes = file_bytes - COALESCE(OLD.file_size, 0) + COALESCE(NEW.file_size, 0)
+    WHERE project_id = NEW.project_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_project_files_storage_delete
+AFTER DELETE ON project_files
+BEGIN
+    UPDATE user_storage_usage
+    SET file_bytes = file_bytes - COALESCE(OLD.file_size, 0),
+        file_count = file_count - 1
+    WHERE user_id = (SELECT owner FROM project_storage_usage WHERE project_id = OLD.project_id);
+    UPDATE project_storage_usage
+    SET file_bytes = file_bytes - COALESCE(OLD.file_size, 0),
+        file_count = file_count - 1
+    WHERE project_id = OLD.project_id;
+END;
+
+-- Backfill counters for existing documents and files
+INSERT OR REPLACE INTO user_storage_usage
+    (user_id, document_bytes, document_count, file_bytes, file_count)
+SELECT user_id, SUM(document_bytes), SUM(document_count), SUM(file_bytes), SUM(file_count)
+FROM (
+    SELECT user_id,
+           COALESCE(NULLIF(file_size, 0), LENGTH(CAST(content AS BLOB)), 0) AS document_bytes,
+           1 AS document_count, 0 AS file_bytes, 0 AS file_count
+    FROM knowledge_documents
+    UNION ALL
+    SELECT p.owner, 0, 0, COALESCE(f.file_size, 0), 1
+    FROM project_files f JOIN projects p ON p.project_id = f.project_id
+)
+GROUP BY user_id;
+
+INSERT OR REPLACE INTO project_storage_usage
+    (project_id, owner, document_bytes, document_count, file_bytes, file_count)
+SELECT u.project_id, p.owner,
+       SUM(u.document_bytes), SUM(u.document_count), SUM(u.file_bytes), SUM(u.file_count)
+FROM (
+    SELECT project_id,
+           COALESCE(NULLIF(file_size, 0), LENGTH(CAST(content AS BLOB)), 0) AS document_bytes,
+           1 AS document_count, 0 AS file_bytes, 0 AS file_count
+    FROM knowledge_documents WHERE project_id IS NOT NULL
+    UNION ALL
+    SELECT project_id, 0, 0, COALESCE(file_size, 0), 1 FROM project_files
+) u
+LEFT JOIN projects p ON p.project_id = u.project_id
+GROUP BY u.project_id;
@@ -1,5 +1,13 @@
 """Caching layer for Socrates API."""
 
+from .endpoint_cache import (
+    CACHE_TTL_ENDPOINT,
+    attach_bus,
+    cached_endpoint,
+    invalidate_tags,
+    project_tag,
+    watch_events,
+)
 from .redis_cache import (
     CACHE_TTL_PRESENCE,
     CACHE_TTL_PROJECT,
@@ -23,6 +31,11 @@ __all__ = [
     "RedisCache",
     "InMemoryCache",
     "get_cache",
+    "attach_bus",
+    "cached_endpoint",
+    "invalidate_tags",
+    "project_tag",
+    "watch_events",
     "cache_key_user",
     "cache_key_project",
     "cache_key_project_list",
@@ -36,4 +49,5 @@ __all__ = [
     "CACHE_TTL_SEARCH",
     "CACHE_TTL_SESSION",
     "CACHE_TTL_PRESENCE",
+    "CACHE_TTL_ENDPOINT",
 ]
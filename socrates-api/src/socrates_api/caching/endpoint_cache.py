@@ -0,0 +1,210 @@
+"""
+Endpoint Response Caching - Cache read endpoints, invalidate on writes.
+
+Read endpoints are cached per caller and tagged with the project they read.
+Writes to a project, reported through an EventEmitter (the database's write
+notifications or the orchestrator's events), invalidate every cached response
+tagged with that project. In multi-worker deployments invalidations are shared
+through a message bus, since each worker has its own in-memory fallback cache.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import weakref
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from fastapi.encoders import jsonable_encoder
+
+from socratic_system.events.event_emitter import EventEmitter
+from socratic_system.events.event_types import EventType
+
+from .redis_cache import get_cache
+
+if TYPE_CHECKING:
+    from socratic_system.events import SharedMessageBus
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_KEY_PREFIX = "endpoint:"
+
+# Short TTL bounds staleness from writes that race a response being cached
+CACHE_TTL_ENDPOINT = 300  # 5 minutes
+
+# Events whose ``project_id`` payload invalidates that project's cached responses
+INVALIDATING_EVENTS = (
+    EventType.PROJECT_SAVED,
+    EventType.PROJECT_UPDATED,
+    EventType.PROJECT_DELETED,
+    EventType.PROJECT_ARCHIVED,
+    EventType.PROJECT_RESTORED,
+    EventType.PHASE_ADVANCED,
+    EventType.DOCUMENT_IMPORTED,
+    EventType.DOCUMENT_DELETED,
+    EventType.DOCUMENTS_INDEXED,
+    EventType.NOTE_ADDED,
+    EventType.NOTE_UPDATED,
+    EventType.NOTE_DELETED,
+    EventType.COLLABORATOR_ADDED,
+    EventType.COLLABORATOR_REMOVED,
+)
+
+# Watched emitter -> event loop that Redis invalidations are scheduled on
+_watched: "weakref.WeakKeyDictionary[EventEmitter, asyncio.AbstractEventLoop]" = (
+    weakref.WeakKeyDictionary()
+)
+_pending: set[asyncio.Future] = set()
+
+# Message bus channel repeating invalidations in the other worker processes
+INVALIDATION_CHANNEL = "cache.invalidate"
+_bus: "SharedMessageBus | None" = None
+
+
+def project_tag(project_id: str) -> str:
+    """Build the invalidation tag for a project's cached responses."""
+    return f"project:{project_id}"
+
+
+def invalidate_tags(tags: Iterable[str], loop: asyncio.AbstractEventLoop | None = None) -> None:
+    """
+    Invalidate cached responses from synchronous code on any thread.
+
+    In-memory entries are dropped immediately; Redis entries are invalidated
+    by a task scheduled on ``loop`` (the current loop if omitted).
+
+    Args:
+        tags: Tags to invalidate
+        loop: Event loop the cache's Redis connection runs on
+    """
+    tags = list(tags)
+    cache = get_cache()
+    cache.fallback.discard_tags(tags)
+    if _bus is not None:
+        _bus.publish(INVALIDATION_CHANNEL, tags)
+    if cache.client is None:
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    loop = loop or running
+    if loop is None or loop.is_closed():
+        return
+
+    if loop is running:
+        future = loop.create_task(cache.invalidate_tags(tags))
+    else:
+        future = asyncio.run_coroutine_threadsafe(cache.invalidate_tags(tags), loop)
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+
+
+def attach_bus(bus: "SharedMessageBus") -> None:
+    """
+    Share invalidations with other worker processes through a message bus.
+
+    Redis entries are shared by all workers already; the other workers drop
+    the tags from their own in-memory fallback.
+
+    Args:
+        bus: Message bus shared by all API worker processes
+    """
+    global _bus
+    _bus = bus
+    bus.subscribe(
+        INVALIDATION_CHANNEL, lambda _message_id, tags: get_cache().fallback.discard_tags(tags)
+    )
+
+
+def watch_events(emitter: EventEmitter) -> None:
+    """
+    Invalidate cached project responses whenever ``emitter`` reports a write.
+
+    Safe to call repeatedly; listeners are registered once per emitter. Must be
+    called from the event loop that serves requests.
+
+    Args:
+        emitter: EventEmitter publishing INVALIDATING_EVENTS with a project_id
+    """
+    loop = asyncio.get_running_loop()
+    if emitter in _watched:
+        _watched[emitter] = loop
+        return
+    _watched[emitter] = loop
+
+    emitter_ref = weakref.ref(emitter)
+
+    def on_write(data):
+        project_id = data.get("project_id")
+        current = emitter_ref()
+        if project_id and current is not None:
+            invalidate_tags([project_tag(project_id)], _watched.get(current))
+
+    for event_type in INVALIDATING_EVENTS:
+        emitter.on(event_type, on_write)
+    logger.debug(f"Watching {emitter!r} for cache invalidation")
+
+
+def cached_endpoint(
+    key: str,
+    ttl: int = CACHE_TTL_ENDPOINT,
+    tags: tuple[str, ...] = ("project:{project_id}",),
+) -> Callable:
+    """
+    Cache the JSON-encoded response of an async read endpoint.
+
+    ``key`` and ``tags`` are format strings over the endpoint's arguments.
+    Endpoints that check access must put the caller (``{current_user}``) in
+    the key, since a cache hit skips the endpoint body. Exceptions are not
+    cached. The endpoint's ``db`` is watched, so any write through it
+    invalidates the entries it tagged.
+
+    Example:
+        >>> @router.get("/{project_id}/stats")
+        ... @cached_endpoint("project_stats:{project_id}:{current_user}")
+        ... async def get_project_stats(project_id: str, current_user: str, db): ...
+
+    Args:
+        key: Cache key template
+        ttl: Time to live in seconds
+        tags: Invalidation tag templates (default: the project's tag)
+
+    Returns:
+        Decorator for the endpoint function
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+
+            # Entries only exist once read through a db, so this covers local writes
+            events = getattr(arguments.get("db"), "events", None)
+            if isinstance(events, EventEmitter):
+                watch_events(events)
+
+            cache = get_cache()
+            cache_key = ENDPOINT_KEY_PREFIX + key.format(**arguments)
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            result = await func(*args, **kwargs)
+            await cache.set(
+                cache_key,
+                jsonable_encoder(result),
+                ttl,
+                tags=[tag.format(**arguments) for tag in tags],
+            )
+            return result
+
+        return wrapper
+
+    return decorator
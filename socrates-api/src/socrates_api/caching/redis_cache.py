@@ -7,96 +7,279 @@ Provides:
 - Search result caching
 - Rate limit counter storage
 - Real-time presence tracking
+- Tag-based invalidation of cached endpoint responses
 
-Falls back to in-memory cache if Redis unavailable.
+Uses the asyncio Redis client, so cache operations never block the event loop.
+Falls back to a bounded in-memory TTL-LRU cache if Redis is unavailable.
 """
 
+import asyncio
+import fnmatch
 import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 try:
-    import redis
+    import redis.asyncio as aioredis
 
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     logger.warning("redis package not installed - caching will be in-memory only")
 
+# In-memory fallback bounds
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 32 MB of serialized values
+
+# Seconds to wait before retrying an unreachable Redis server
+RECONNECT_INTERVAL = 30.0
+
+# Tag sets outlive the entries they index, so invalidation can always find them
+TAG_TTL = 86400  # 24 hours
+
+
+def _tag_key(tag: str) -> str:
+    """Build the key of the set holding the cache keys for a tag."""
+    return f"tag:{tag}"
+
+
+def _encode(value: Any) -> str:
+    """Serialize a value for storage (JSON, non-JSON types as strings)."""
+    return json.dumps(value, default=str)
+
+
+def _decode(payload: str) -> Any:
+    """Deserialize a stored value; plain strings from older writers pass through."""
+    try:
+        return json.loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return payload
+
 
 class InMemoryCache:
-    """Simple in-memory cache fallback."""
+    """
+    Bounded in-memory TTL-LRU cache.
+
+    Values are stored serialized, so callers never share mutable state with
+    the cache and the memory cap is measured on the serialized size. Expired
+    entries are dropped when read, and the least recently used entries are
+    evicted once either ``max_entries`` or ``max_bytes`` is exceeded.
+    """
 
-    def __init__(self):
-        self.cache: dict[str, Any] = {}
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize in-memory cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of serialized values
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, payload, tags)
+        self._entries: OrderedDict[str, tuple[float, str, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0}
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its tag memberships (lock must be held)."""
+        _, payload, tags = self._entries.pop(key)
+        self._size -= len(payload)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _lookup(self, key: str) -> str | None:
+        """Get a live payload, dropping it if expired (lock must be held)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: str, payload: str, ttl: float, tags: tuple[str, ...] = ()) -> None:
+        """Store a payload and evict down to the bounds (lock must be held)."""
+        if key in self._entries:
+            self._remove(key)
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, payload, tags)
+        self._size += len(payload)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats["evictions"] += 1
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
-        return self.cache.get(key)
-
-    async def set(self, key: str, value: Any, ttl: int = 300):
-        """Set value in cache with TTL (ignored for in-memory)."""
-        self.cache[key] = value
+        with self._lock:
+            payload = self._lookup(key)
+            self.stats["hits" if payload is not None else "misses"] += 1
+        return None if payload is None else _decode(payload)
+
+    async def set(self, key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()):
+        """Set value in cache with TTL, optionally indexed under tags."""
+        payload = _encode(value)
+        with self._lock:
+            self._store(key, payload, ttl, tuple(tags))
+            self.stats["sets"] += 1
 
     async def delete(self, key: str):
         """Delete value from cache."""
-        self.cache.pop(key, None)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
 
     async def clear(self, pattern: str = "*"):
         """Clear cache entries matching pattern."""
-        if pattern == "*":
-            self.cache.clear()
-        else:
-            # Simple pattern matching for in-memory
-            import fnmatch
-
-            keys_to_delete = [k for k in self.cache if fnmatch.fnmatch(k, pattern)]
-            for k in keys_to_delete:
-                del self.cache[k]
+        with self._lock:
+            if pattern == "*":
+                self._entries.clear()
+                self._tags.clear()
+                self._size = 0
+                return
+            for key in [k for k in self._entries if fnmatch.fnmatch(k, pattern)]:
+                self._remove(key)
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        return key in self.cache
+        with self._lock:
+            return self._lookup(key) is not None
+
+    async def increment(self, key: str, amount: int = 1, ttl: int = 300) -> int:
+        """Increment numeric value in cache (created with TTL if missing)."""
+        with self._lock:
+            payload = self._lookup(key)
+            value = int(_decode(payload)) + amount if payload is not None else amount
+            entry = self._entries.get(key)
+            remaining = entry[0] - time.monotonic() if entry else ttl
+            self._store(key, _encode(value), remaining)
+        return value
+
+    def discard_tags(self, tags: Iterable[str]) -> int:
+        """
+        Drop all entries indexed under any of the tags.
+
+        Synchronous so write paths on any thread can invalidate immediately.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete all entries indexed under any of the tags."""
+        return self.discard_tags(tags)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "type": "in-memory",
+                "status": "available",
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self.stats,
+            }
 
 
 class RedisCache:
-    """Distributed Redis-backed cache."""
+    """
+    Distributed Redis-backed cache.
+
+    All operations go through ``redis.asyncio``. The connection is opened on
+    first use; while Redis is unreachable, operations are served by a bounded
+    ``InMemoryCache`` and reconnection is retried every ``RECONNECT_INTERVAL``
+    seconds.
+    """
 
-    def __init__(self, redis_url: str | None = None):
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        client: Any = None,
+        fallback: InMemoryCache | None = None,
+    ):
         """
         Initialize Redis cache.
 
         Args:
             redis_url: Redis connection URL (e.g., "redis://localhost:6379")
+            client: Already connected asyncio Redis client (skips connecting)
+            fallback: Cache used while Redis is unavailable
         """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
-        self.client = None
-        self._connect()
-
-    def _connect(self):
-        """Establish Redis connection."""
-        if not REDIS_AVAILABLE:
-            logger.warning("Redis not available - using in-memory cache")
-            return
+        self.client = client
+        self.fallback = fallback or InMemoryCache()
+        self._retry_at = 0.0
+        # Loop the connection pool belongs to (None for an injected client)
+        self._loop = None
+
+    async def _backend(self):
+        """Get the connected Redis client, or None to use the fallback."""
+        if self.client is not None:
+            if self._loop is None or self._loop is asyncio.get_running_loop():
+                return self.client
+            # Asyncio connections can't be shared across event loops
+            self.client = None
+            self._retry_at = 0.0
+        if not REDIS_AVAILABLE or time.monotonic() < self._retry_at:
+            return None
 
+        # Claim the attempt before awaiting so concurrent callers don't all connect
+        self._retry_at = time.monotonic() + RECONNECT_INTERVAL
+        client = aioredis.from_url(
+            self.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
         try:
-            self.client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_keepalive=True,
-                health_check_interval=30,
-            )
-            # Test connection
-            self.client.ping()
-            logger.info(f"Redis cache connected: {self.redis_url}")
+            await client.ping()
         except Exception as e:
             logger.warning(f"Failed to connect to Redis: {e} - using in-memory cache")
+            await client.aclose()
+            return None
+
+        logger.info(f"Redis cache connected: {self.redis_url}")
+        self.client = client
+        self._loop = asyncio.get_running_loop()
+        return client
+
+    def _on_error(self, operation: str, error: Exception) -> None:
+        """Log a Redis error, falling back to in-memory if the connection was lost."""
+        logger.error(f"Redis {operation} error: {error}")
+        if REDIS_AVAILABLE and isinstance(
+            error, (aioredis.ConnectionError, aioredis.TimeoutError, OSError)
+        ):
             self.client = None
+            self._retry_at = time.monotonic() + RECONNECT_INTERVAL
 
     async def get(self, key: str) -> Any | None:
         """
@@ -108,22 +291,18 @@ class RedisCache:
         Returns:
             Cached value or None if not found
         """
-        if self.client is None:
-            return None
+        client = await self._backend()
+        if client is None:
+            return await self.fallback.get(key)
 
         try:
-            value = self.client.get(key)
-            if value:
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
-            return None
+            value = await client.get(key)
+            return None if value is None else _decode(value)
         except Exception as e:
-            logger.error(f"Redis get error: {e}")
+            self._on_error("get", e)
             return None
 
-    async def set(self, key: str, value: Any, ttl: int = 300):
+    async def set(self, key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()):
         """
         Set value in cache with TTL.
 
@@ -131,16 +310,23 @@ class RedisCache:
             key: Cache key
             value: Value to cache (will be JSON serialized)
             ttl: Time to live in seconds (default: 300)
+            tags: Tags to index the key under for invalidate_tags()
         """
-        if self.client is None:
+        client = await self._backend()
+        if client is None:
+            await self.fallback.set(key, value, ttl, tags)
             return
 
         try:
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            self.client.setex(key, ttl, value)
+            # One round trip for the value and its tag index
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, _encode(value), ex=ttl)
+            for tag in tags:
+                pipe.sadd(_tag_key(tag), key)
+                pipe.expire(_tag_key(tag), max(ttl, TAG_TTL))
+            await pipe.execute()
         except Exception as e:
-            logger.error(f"Redis set error: {e}")
+            self._on_error("set", e)
 
     async def delete(self, key: str):
         """
@@ -149,13 +335,15 @@ class RedisCache:
         Args:
             key: Cache key
         """
-        if self.client is None:
+        client = await self._backend()
+        if client is None:
+            await self.fallback.delete(key)
             return
 
         try:
-            self.client.delete(key)
+            await client.delete(key)
         except Exception as e:
-            logger.error(f"Redis delete error: {e}")
+            self._on_error("delete", e)
 
     async def clear(self, pattern: str = "*"):
         """
@@ -164,19 +352,22 @@ class RedisCache:
         Args:
             pattern: Pattern to match (e.g., "user:*", "project:*")
         """
-        if self.client is None:
+        client = await self._backend()
+        if client is None:
+            await self.fallback.clear(pattern)
             return
 
         try:
-            cursor = 0
-            while True:
-                cursor, keys = self.client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    self.client.delete(*keys)
-                if cursor == 0:
-                    break
+            batch = []
+            async for key in client.scan_iter(match=pattern, count=100):
+                batch.append(key)
+                if len(batch) >= 100:
+                    await client.delete(*batch)
+                    batch = []
+            if batch:
+                await client.delete(*batch)
         except Exception as e:
-            logger.error(f"Redis clear error: {e}")
+            self._on_error("clear", e)
 
     async def exists(self, key: str) -> bool:
         """
@@ -188,13 +379,14 @@ class RedisCache:
         Returns:
             True if key exists, False otherwise
         """
-        if self.client is None:
-            return False
+        client = await self._backend()
+        if client is None:
+            return await self.fallback.exists(key)
 
         try:
-            return self.client.exists(key) > 0
+            return await client.exists(key) > 0
         except Exception as e:
-            logger.error(f"Redis exists error: {e}")
+            self._on_error("exists", e)
             return False
 
     async def increment(self, key: str, amount: int = 1) -> int:
@@ -208,33 +400,72 @@ class RedisCache:
         Returns:
             New value
         """
-        if self.client is None:
-            return 0
+        client = await self._backend()
+        if client is None:
+            return await self.fallback.increment(key, amount)
 
         try:
-            return self.client.incrby(key, amount)
+            return await client.incrby(key, amount)
         except Exception as e:
-            logger.error(f"Redis increment error: {e}")
+            self._on_error("increment", e)
             return 0
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Delete all entries indexed under any of the tags.
+
+        Entries in the in-memory fallback are dropped as well, so values cached
+        during a Redis outage cannot outlive the write that invalidated them.
+
+        Args:
+            tags: Tags passed to set()
+
+        Returns:
+            Number of entries removed
+        """
+        tags = list(tags)
+        removed = self.fallback.discard_tags(tags)
+        client = await self._backend()
+        if client is None:
+            return removed
+
+        try:
+            for tag in tags:
+                keys = await client.smembers(_tag_key(tag))
+                if keys:
+                    removed += await client.delete(*keys)
+                await client.delete(_tag_key(tag))
+        except Exception as e:
+            self._on_error("invalidate", e)
+        return removed
+
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        if self.client is None:
-            return {"type": "in-memory", "status": "unavailable"}
+        client = await self._backend()
+        if client is None:
+            return {**await self.fallback.get_stats(), "status": "fallback"}
 
         try:
-            info = self.client.info("stats")
+            info = await client.info("stats")
             return {
                 "type": "redis",
                 "status": "connected",
                 "total_connections_received": info.get("total_connections_received", 0),
                 "total_commands_processed": info.get("total_commands_processed", 0),
                 "instantaneous_ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
+                "keyspace_hits": info.get("keyspace_hits", 0),
+                "keyspace_misses": info.get("keyspace_misses", 0),
             }
         except Exception as e:
-            logger.error(f"Redis stats error: {e}")
+            self._on_error("stats", e)
             return {"type": "redis", "status": "error", "error": str(e)}
 
+    async def close(self):
+        """Close the Redis connection pool, if open."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
 
 # Global cache instance
 _cache: RedisCache | None = None
@@ -249,7 +480,12 @@ def get_cache() -> RedisCache:
     """
     global _cache
     if _cache is None:
-        _cache = RedisCache()
+        _cache = RedisCache(
+            fallback=InMemoryCache(
+                max_entries=int(os.getenv("CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+                max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+            )
+        )
     return _cache
 
 
@@ -4,6 +4,7 @@ Socrates API - FastAPI application for Socrates AI tutoring system
 Provides REST endpoints for project management, Socratic questioning, and code generation.
 """
 
+import asyncio
 import logging
 import os
 import socket
@@ -19,18 +20,19 @@ from slowapi.errors import RateLimitExceeded
 
 from socrates_api.auth import get_current_user
 from socrates_api.database import ProjectDatabase, get_database
-from socrates_api.middleware.activity_tracker import ActivityTrackerMiddleware
-from socrates_api.middleware.cors_fix import SimpleCORSMiddleware
 from socrates_api.middleware.metrics import (
-    add_metrics_middleware,
     get_metrics_summary,
     get_metrics_text,
 )
+from socrates_api.middleware.pipeline import add_api_middleware
 from socrates_api.middleware.rate_limit import (
     initialize_limiter,
 )
-from socrates_api.middleware.security_headers import add_security_headers_middleware
-from socratic_system.events import EventType
+from socrates_api.routers.websocket import (
+    websocket_chat_endpoint,
+    websocket_collaboration_endpoint,
+)
+from socratic_system.events import DurableJobQueue, EventType, JobWorker, SharedMessageBus
 from socratic_system.exceptions import SocratesError
 from socratic_system.orchestration.orchestrator import AgentOrchestrator
 
@@ -117,7 +119,9 @@ _initialize_jwt_secret_key()
 # Use localhost for local development, redis service for Docker deployments
 # Set REDIS_URL environment variable to override (e.g., for Docker Compose: "redis://redis:6379")
 _redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-limiter = initialize_limiter(_redis_url)  # Export for use in routers
+# Worker processes of a multi-worker deployment share state through this SQLite file (see run())
+_shared_state_db = os.getenv("SOCRATES_SHARED_STATE_DB")
+limiter = initialize_limiter(_redis_url, _shared_state_db)  # Export for use in routers
 
 # Global state
 app_state = {
@@ -125,6 +129,11 @@ app_state = {
     "start_time": time.time(),
     "event_listeners_registered": False,
     "limiter": limiter,
+    "job_queue": None,
+    "job_worker": None,
+    "storage_reconciler": None,
+    "usage_purger": None,
+    "message_bus": None,
 }
 
 
@@ -135,6 +144,13 @@ def get_orchestrator() -> AgentOrchestrator:
     return app_state["orchestrator"]
 
 
+def get_job_queue() -> DurableJobQueue:
+    """Get the durable job queue shared by all API workers"""
+    if app_state["job_queue"] is None:
+        raise RuntimeError("Job queue not initialized")
+    return app_state["job_queue"]
+
+
 def get_rate_limiter_for_app():
     """Get rate limiter instance from app state"""
     return app_state.get("limiter")
@@ -186,6 +202,11 @@ def _setup_event_listeners(orchestrator: AgentOrchestrator):
     orchestrator.event_emitter.on(EventType.CODE_GENERATED, on_code_generated)
     orchestrator.event_emitter.on(EventType.AGENT_ERROR, on_agent_error)
 
+    # Invalidate cached endpoint responses for projects the agents change
+    from socrates_api.caching import watch_events
+
+    watch_events(orchestrator.event_emitter)
+
     app_state["event_listeners_registered"] = True
     logger.info("Event listeners registered")
 
@@ -218,11 +239,12 @@ async def _cleanup_orchestrator():
                 except Exception as e:
                     logger.warning(f"Error closing Claude client: {e}")
 
-            # Close vector database if it has a close method
-            if hasattr(orchestrator, "vector_db"):
+            # Close vector database if it was opened (it is created on first use)
+            vector_db = getattr(orchestrator, "_vector_db", None)
+            if vector_db is not None:
                 try:
-                    if hasattr(orchestrator.vector_db, "close"):
-                        orchestrator.vector_db.close()
+                    if hasattr(vector_db, "close"):
+                        vector_db.close()
                     logger.info("Vector database closed")
                 except Exception as e:
                     logger.warning(f"Error closing vector database: {e}")
@@ -232,6 +254,22 @@ async def _cleanup_orchestrator():
         logger.error(f"Error during orchestrator cleanup: {e}")
 
 
+async def _reconcile_storage_periodically(db: ProjectDatabase, interval: float) -> None:
+    """Correct drift in the storage quota counters every ``interval`` seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(db.reconcile_storage_usage)
+
+
+async def _purge_usage_records_periodically(
+    db: ProjectDatabase, retention_days: int, interval: float
+) -> None:
+    """Delete raw LLM usage records past their retention every ``interval`` seconds"""
+    while True:
+        await asyncio.to_thread(db.purge_usage_records, retention_days)
+        await asyncio.sleep(interval)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -259,6 +297,30 @@ async def lifespan(app: FastAPI):
         DatabaseSingleton.initialize(db_path=db_path)
         db = DatabaseSingleton.get_instance()
         logger.info(f"✓ Database initialized at {db.db_path}")
+
+        # Invalidate cached endpoint responses on every write to the database
+        from socrates_api.caching import watch_events
+
+        watch_events(db.events)
+
+        # Storage quota counters are kept on write; reconcile them periodically (0 disables)
+        reconcile_interval = float(os.getenv("SOCRATES_STORAGE_RECONCILE_INTERVAL", "3600"))
+        if reconcile_interval > 0:
+            app_state["storage_reconciler"] = asyncio.create_task(
+                _reconcile_storage_periodically(db, reconcile_interval)
+            )
+
+        # Usage reports read the LLM usage rollups, so raw records are only kept
+        # for a retention period (0 keeps them indefinitely)
+        usage_retention_days = int(os.getenv("SOCRATES_LLM_USAGE_RETENTION_DAYS", "90"))
+        if usage_retention_days > 0:
+            app_state["usage_purger"] = asyncio.create_task(
+                _purge_usage_records_periodically(
+                    db,
+                    usage_retention_days,
+                    float(os.getenv("SOCRATES_LLM_USAGE_PURGE_INTERVAL", "86400")),
+                )
+            )
     except Exception as db_e:
         logger.error(f"✗ CRITICAL: Failed to initialize database: {db_e}")
         import traceback
@@ -267,6 +329,38 @@ async def lifespan(app: FastAPI):
         # Re-raise to prevent API from starting without database
         raise
 
+    # Worker processes fan out WebSocket broadcasts, stream events and cache
+    # invalidations to each other through a message bus on the shared state file
+    if _shared_state_db:
+        from socrates_api.caching import attach_bus as share_cache_invalidations
+        from socrates_api.routers import events as event_stream
+        from socrates_api.websocket import get_connection_manager
+
+        bus = SharedMessageBus(_shared_state_db)
+        get_connection_manager().attach_bus(bus)
+        event_stream.attach_bus(bus)
+        share_cache_invalidations(bus)
+        await bus.start()
+        app_state["message_bus"] = bus
+
+    # Durable job queue for async agent invocations, shared through the data directory
+    # so that jobs and results survive restarts and can be served by any API process.
+    # SOCRATES_JOB_WORKERS=0 disables job execution in this process (enqueue only).
+    from socrates_api.routers.agents import AGENT_REQUEST_TASK, run_agent_request
+
+    job_queue = DurableJobQueue(
+        os.path.join(data_dir, "jobs.db"),
+        queue_limits={"agents": int(os.getenv("SOCRATES_AGENT_JOB_LIMIT", "8"))},
+    )
+    job_queue.register_task(AGENT_REQUEST_TASK, run_agent_request)
+    job_queue.purge(older_than_seconds=7 * 24 * 3600)
+    app_state["job_queue"] = job_queue
+
+    job_concurrency = int(os.getenv("SOCRATES_JOB_WORKERS", "4"))
+    if job_concurrency > 0:
+        app_state["job_worker"] = JobWorker(job_queue, concurrency=job_concurrency)
+        await app_state["job_worker"].start()
+
     # Auto-initialize orchestrator on startup
     # All API credentials are per-user from database. No environment variable fallback.
     try:
@@ -278,6 +372,12 @@ async def lifespan(app: FastAPI):
         from socratic_system.config import SocratesConfig
 
         config = SocratesConfig.from_env()
+
+        # Derive the credential master key once, before the first LLM request
+        from socratic_system.encryption import initialize_master_key
+
+        initialize_master_key(config.encryption_key)
+
         orchestrator = AgentOrchestrator(api_key_or_config=config)
         logger.info("AgentOrchestrator created successfully (credential-less)")
         logger.info("All agents will use per-user LLM configurations from database")
@@ -307,6 +407,36 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Socrates API server...")
 
+    # Drop decrypted credentials held in memory
+    from socratic_system.encryption import credential_cache
+
+    credential_cache.clear()
+
+    if app_state.get("storage_reconciler") is not None:
+        app_state["storage_reconciler"].cancel()
+        app_state["storage_reconciler"] = None
+    if app_state.get("usage_purger") is not None:
+        app_state["usage_purger"].cancel()
+        app_state["usage_purger"] = None
+    if app_state.get("message_bus") is not None:
+        await app_state["message_bus"].stop()
+        app_state["message_bus"] = None
+
+    # Let running jobs finish; unfinished ones are retried by another worker
+    if app_state.get("job_worker") is not None:
+        await app_state["job_worker"].stop()
+        app_state["job_worker"] = None
+
+    # Flush batched audit entries before the database goes away
+    orchestrator = app_state.get("orchestrator")
+    if orchestrator is not None and getattr(orchestrator, "audit_logger", None) is not None:
+        orchestrator.audit_logger.close()
+
+    # Close the Redis connection pool, if one was opened
+    from socrates_api.caching import get_cache
+
+    await get_cache().close()
+
     # Close database connection
     from socrates_api.database import close_database
 
@@ -368,16 +498,10 @@ else:
 logger.info(f"Environment: {environment}")
 logger.info(f"CORS allowed origins: {allowed_origins}")
 
-# Add middleware in proper order: inner layers first, outermost (CORS) last
-add_security_headers_middleware(app, environment=environment)
-add_metrics_middleware(app)
-
-# Add activity tracking middleware
-app.add_middleware(ActivityTrackerMiddleware)
-
-# IMPORTANT: Add CORS middleware LAST so it's the outermost layer
-# This ensures CORS headers are applied to all responses, including preflight OPTIONS requests
-app.add_middleware(SimpleCORSMiddleware, allowed_origins=allowed_origins)
+# CORS, activity tracking, metrics and security headers run as one pure ASGI layer.
+# Add it LAST so it stays the outermost layer: CORS headers are applied to all
+# responses, including preflight OPTIONS requests.
+add_api_middleware(app, allowed_origins=allowed_origins, environment=environment)
 
 
 # Include API routers
@@ -410,6 +534,10 @@ app.include_router(chat_sessions_router)
 app.include_router(database_health_router)
 app.include_router(websocket_polling_router)
 
+# Only the WebSocket endpoints: the router's HTTP chat fallbacks duplicate projects_chat
+app.add_api_websocket_route("/ws/chat/{project_id}", websocket_chat_endpoint)
+app.add_api_websocket_route("/ws/collaboration/{project_id}", websocket_collaboration_endpoint)
+
 
 @app.get("/")
 async def root():
@@ -440,6 +568,30 @@ async def health_check():
     }
 
 
+@app.get("/health/ready", response_model=dict)
+async def readiness_check():
+    """
+    Readiness probe.
+
+    Reports each orchestrator startup stage (core, agents, vector store,
+    knowledge base, model discovery). Responds 503 until the core stage is
+    ready; background stages still warming up do not block readiness.
+    """
+    orchestrator = app_state.get("orchestrator")
+    startup = getattr(orchestrator, "startup", None)
+    if startup is None:
+        snapshot = {"ready": False, "stages": {}}
+    else:
+        snapshot = startup.snapshot()
+
+    return JSONResponse(
+        status_code=(
+            status.HTTP_200_OK if snapshot["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content={"timestamp": time.time(), **snapshot},
+    )
+
+
 @app.get("/api/providers", response_model=dict)
 async def get_available_providers(
     current_user: str = Depends(get_current_user), db: ProjectDatabase = Depends(get_database)
@@ -502,9 +654,9 @@ async def get_provider_models(
         try:
             encrypted_key = db.get_api_key(current_user, provider)
             if encrypted_key:
-                from socratic_system.encryption import decrypt_data
+                from socratic_system.encryption import decrypt_credential
 
-                api_key = decrypt_data(encrypted_key)
+                api_key = decrypt_credential(encrypted_key)
                 logger.debug(f"API key found and decrypted for {provider}")
             else:
                 logger.debug(f"API key not found for {provider}")
@@ -623,7 +775,8 @@ async def detailed_health_check():
     Returns comprehensive system status including database, cache, and service details.
     """
     from socrates_api.caching import get_cache
-    from socratic_system.performance import get_profiler
+    from socrates_api.middleware.metrics import app_metrics
+    from socratic_system.database.query_profiler import get_profiler
 
     try:
         cache = get_cache()
@@ -652,6 +805,9 @@ async def detailed_health_check():
             "orchestrator": {
                 "status": "ready" if orchestrator_ready else "not_ready",
                 "api_key_configured": orchestrator_ready,
+                "agents": (
+                    app_state["orchestrator"].get_agent_stats() if orchestrator_ready else {}
+                ),
             },
             "rate_limiter": {
                 "status": "ready" if limiter_ready else "disabled",
@@ -673,6 +829,7 @@ async def detailed_health_check():
         "metrics": {
             "queries_tracked": len(profiler_stats),
             "cache_type": cache_status.get("type", "unknown"),
+            "request_latency_ms": app_metrics.get_metric_stats("request.duration_ms", minutes=5),
         },
     }
 
@@ -719,6 +876,8 @@ async def query_metrics():
     - Average/min/max execution times
     - Slow query counts and percentages
     - Error counts per query
+    - Latency percentiles, and for ProjectDatabase statements (keyed by
+      normalized SQL) the sampled callers, row counts and slow query plans
 
     Example:
         GET /metrics/queries
@@ -737,7 +896,7 @@ async def query_metrics():
             ...
         }
     """
-    from socratic_system.performance import get_profiler
+    from socratic_system.database.query_profiler import get_profiler
 
     profiler = get_profiler()
     return profiler.get_stats()
@@ -754,7 +913,7 @@ async def slow_query_metrics(min_count: int = 1):
     Returns:
         List of slow queries sorted by slow execution count
     """
-    from socratic_system.performance import get_profiler
+    from socratic_system.database.query_profiler import get_profiler
 
     profiler = get_profiler()
     return profiler.get_slow_queries(min_slow_count=min_count)
@@ -771,7 +930,7 @@ async def slowest_query_metrics(limit: int = 10):
     Returns:
         List of slowest queries sorted by average execution time
     """
-    from socratic_system.performance import get_profiler
+    from socratic_system.database.query_profiler import get_profiler
 
     profiler = get_profiler()
     return profiler.get_slowest_queries(limit=limit)
@@ -794,6 +953,12 @@ async def initialize(request: InitializeRequest | None = Body(None)):
         from socratic_system.config import SocratesConfig
 
         config = SocratesConfig.from_env()
+
+        # Derive the credential master key once, before the first LLM request
+        from socratic_system.encryption import initialize_master_key
+
+        initialize_master_key(config.encryption_key)
+
         orchestrator = AgentOrchestrator(api_key_or_config=config)
 
         # Setup event listeners
@@ -1073,10 +1238,18 @@ async def general_error_handler(request, exc: Exception):
 
 
 def run():
-    """Run the API server"""
+    """
+    Run the API server
+
+    With SOCRATES_API_WORKERS above 1, uvicorn serves the app from that many
+    worker processes. Their cross-worker state (WebSocket and event fan-out,
+    analysis jobs and results, rate limits) goes through the SQLite file named
+    by SOCRATES_SHARED_STATE_DB, by default shared_state.db in the data directory.
+    """
     host = os.getenv("SOCRATES_API_HOST", "127.0.0.1")
     port = int(os.getenv("SOCRATES_API_PORT", "8000"))
     reload = os.getenv("SOCRATES_API_RELOAD", "False").lower() == "true"
+    workers = int(os.getenv("SOCRATES_API_WORKERS", "1"))
 
     # Check if port is available
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -1088,9 +1261,25 @@ def run():
     else:
         logger.info(f"Port {port} is available")
 
-    logger.info(f"Starting Socrates API on {host}:{port}")
-
-    uvicorn.run("socrates_api.main:app", host=host, port=port, reload=reload, log_level="info")
+    if workers > 1:
+        if reload:
+            logger.warning("SOCRATES_API_RELOAD is ignored when running several workers")
+            reload = False
+        # Set before the workers import this module
+        data_dir = os.getenv("SOCRATES_DATA_DIR", str(Path.home() / ".socrates"))
+        os.environ.setdefault("SOCRATES_SHARED_STATE_DB", os.path.join(data_dir, "shared_state.db"))
+        logger.info(f"Sharing state between workers in {os.environ['SOCRATES_SHARED_STATE_DB']}")
+
+    logger.info(f"Starting Socrates API on {host}:{port} with {workers} worker(s)")
+
+    uvicorn.run(
+        "socrates_api.main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        workers=workers,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
@@ -3,11 +3,12 @@ Activity Tracking Middleware - Track last API activity per user
 and manage server shutdown scheduling.
 """
 
+import asyncio
 import logging
+import threading
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from socrates_api.middleware.asgi import get_header
 
 logger = logging.getLogger(__name__)
 
@@ -16,43 +17,103 @@ _user_activity: dict[str, float] = {}
 _shutdown_scheduled_at: float | None = None
 _shutdown_delay_seconds: int = 300  # 5 minutes for browser-close
 
+# Bearer tokens seen since the last flush, with the time they were last seen.
+# Tokens are only decoded when flushed, off the response path.
+_pending_tokens: dict[str, float] = {}
+_pending_lock = threading.Lock()
+_flush_handle: asyncio.TimerHandle | None = None
+_flush_loop: asyncio.AbstractEventLoop | None = None
+ACTIVITY_FLUSH_DELAY = 1.0  # seconds
 
-class ActivityTrackerMiddleware(BaseHTTPMiddleware):
-    """Track last activity timestamp per authenticated user"""
 
-    async def dispatch(self, request: Request, call_next):
-        # Update activity timestamp for authenticated users
-        if request.headers.get("authorization"):
-            try:
-                # Extract username from JWT token
-                from socrates_api.auth.jwt_handler import verify_access_token
+def record_activity(authorization: str) -> None:
+    """
+    Note activity for the bearer token in an Authorization header.
 
-                token = request.headers.get("authorization", "").replace("Bearer ", "")
-                payload = verify_access_token(token)
-                if payload and payload.get("sub"):
-                    username = payload["sub"]
-                    _user_activity[username] = time.time()
-                    logger.debug(f"Updated activity for user: {username}")
-            except Exception as e:
-                # Ignore token errors, just don't track activity
-                logger.debug(f"Failed to extract user from token: {e}")
+    Only stores the token; it is decoded and attributed to a user by
+    flush_activity(), which is scheduled shortly afterwards on the running
+    event loop and also runs before activity is read.
 
-        response = await call_next(request)
-        return response
+    Args:
+        authorization: Authorization header value
+    """
+    global _flush_handle, _flush_loop
+    token = authorization.replace("Bearer ", "")
+    with _pending_lock:
+        _pending_tokens[token] = time.time()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    # Reschedule if the pending flush belongs to a loop that has since gone away
+    if _flush_handle is None or _flush_loop is not loop:
+        _flush_loop = loop
+        _flush_handle = loop.call_later(ACTIVITY_FLUSH_DELAY, flush_activity)
+
+
+def flush_activity() -> int:
+    """
+    Attribute pending activity to users.
+
+    Returns:
+        Number of tokens processed
+    """
+    global _pending_tokens, _flush_handle
+    with _pending_lock:
+        pending, _pending_tokens = _pending_tokens, {}
+        _flush_handle = None
+
+    if not pending:
+        return 0
+
+    from socrates_api.auth.jwt_handler import verify_access_token
+
+    for token, seen_at in pending.items():
+        try:
+            # Extract username from JWT token
+            payload = verify_access_token(token)
+            if payload and payload.get("sub"):
+                username = payload["sub"]
+                _user_activity[username] = max(seen_at, _user_activity.get(username, 0.0))
+                logger.debug(f"Updated activity for user: {username}")
+        except Exception as e:
+            # Ignore token errors, just don't track activity
+            logger.debug(f"Failed to extract user from token: {e}")
+
+    return len(pending)
+
+
+class ActivityTrackerMiddleware:
+    """ASGI middleware that tracks last activity timestamp per authenticated user"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            authorization = get_header(scope, b"authorization")
+            if authorization:
+                record_activity(authorization)
+
+        await self.app(scope, receive, send)
 
 
 def get_last_activity(username: str) -> float | None:
     """Get last activity timestamp for user"""
+    flush_activity()
     return _user_activity.get(username)
 
 
 def get_all_activity() -> dict[str, float]:
     """Get all user activity timestamps"""
+    flush_activity()
     return _user_activity.copy()
 
 
 def clear_activity(username: str) -> None:
     """Clear activity for user (e.g., on logout)"""
+    flush_activity()
     if username in _user_activity:
         del _user_activity[username]
         logger.info(f"Cleared activity for user: {username}")
@@ -60,6 +121,7 @@ def clear_activity(username: str) -> None:
 
 def has_recent_activity(since_seconds: int = 300) -> bool:
     """Check if ANY user has had activity in the last N seconds"""
+    flush_activity()
     if not _user_activity:
         logger.debug("No users in activity tracking")
         return False
@@ -0,0 +1,67 @@
+"""
+Helpers for pure ASGI middleware.
+
+The API middleware wraps ``send`` directly instead of subclassing
+BaseHTTPMiddleware, which costs an extra task and response stream per layer
+and breaks streaming responses and contextvars propagation.
+"""
+
+from collections.abc import Iterable
+
+Headers = list[tuple[bytes, bytes]]
+
+
+def encode_headers(headers: dict[str, str]) -> Headers:
+    """Encode a header dict as raw ASGI header pairs (lowercase names)."""
+    return [
+        (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()
+    ]
+
+
+def get_header(scope: dict, name: bytes) -> str | None:
+    """
+    Get a request header from an ASGI scope.
+
+    Args:
+        scope: ASGI HTTP scope
+        name: Lowercase header name
+
+    Returns:
+        Header value, or None if absent
+    """
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def get_content_length(message: dict) -> int | None:
+    """Get the Content-Length of an ``http.response.start`` message, if declared."""
+    for name, value in message.get("headers", ()):
+        if name.lower() == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def set_response_headers(message: dict, headers: Headers, remove: Iterable[bytes] = ()) -> None:
+    """
+    Set headers on an ``http.response.start`` message in one pass.
+
+    Existing headers with the same names, and any named in ``remove``, are
+    dropped before the new ones are appended.
+
+    Args:
+        message: ASGI response start message (modified in place)
+        headers: Raw header pairs to set
+        remove: Lowercase header names to strip
+    """
+    replaced = {name for name, _ in headers}
+    replaced.update(remove)
+    raw = [
+        (name, value) for name, value in message.get("headers", ()) if name.lower() not in replaced
+    ]
+    raw.extend(headers)
+    message["headers"] = raw
@@ -1,101 +1,120 @@
 """
 Simple CORS middleware that explicitly adds CORS headers to all responses.
-Works around issues with Starlette's CORSMiddleware and BaseHTTPMiddleware interactions.
+Works around issues with Starlette's CORSMiddleware and custom middleware interactions.
 """
 
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
 
+from socrates_api.middleware.asgi import Headers, encode_headers, get_header, set_response_headers
+
 logger = logging.getLogger(__name__)
 
+# Headers sent with every CORS response
+_COMMON_CORS_HEADERS = {
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, PATCH, OPTIONS",
+    "Access-Control-Allow-Headers": (
+        "Content-Type, Authorization, X-Requested-With, Accept, X-Testing-Mode"
+    ),
+    "Access-Control-Expose-Headers": (
+        "X-Process-Time, X-Request-ID, X-RateLimit-Limit, X-RateLimit-Remaining"
+    ),
+    "Access-Control-Max-Age": "3600",
+}
+
 
-class SimpleCORSMiddleware(BaseHTTPMiddleware):
+class CORSPolicy:
     """
-    Simple CORS middleware that adds CORS headers to all responses.
+    Decides the CORS headers for a request origin.
 
-    This is a workaround for compatibility issues between Starlette's CORSMiddleware
-    and custom BaseHTTPMiddleware classes.
+    Header lists that do not depend on the origin are built once.
     """
 
-    def __init__(self, app, allowed_origins: list = None):
-        super().__init__(app)
+    def __init__(self, allowed_origins: list = None):
         self.allowed_origins = allowed_origins or ["*"]
         self.allow_credentials = "*" not in self.allowed_origins
+        self._common = encode_headers(_COMMON_CORS_HEADERS)
+        self._wildcard = [(b"access-control-allow-origin", b"*"), *self._common]
+        self._credentials = [(b"access-control-allow-credentials", b"true")]
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Handle OPTIONS requests (preflight)
-        if request.method == "OPTIONS":
-            logger.info(
-                f"[CORS] OPTIONS preflight request from origin: {request.headers.get('origin')}"
-            )
-            return self.get_cors_response(request.headers.get("origin"))
-
-        # Get the response
-        response = await call_next(request)
-
-        # Add CORS headers
-        origin = request.headers.get("origin")
-        logger.info(f"[CORS] Request from origin: {origin}, Path: {request.url.path}")
-        logger.info(f"[CORS] Allowed origins: {self.allowed_origins}")
-
-        if origin:
-            if "*" in self.allowed_origins or origin in self.allowed_origins:
-                logger.info(f"[CORS] Origin {origin} is allowed, adding CORS headers")
-                response.headers["Access-Control-Allow-Origin"] = (
-                    origin if self.allow_credentials else "*"
-                )
-                response.headers["Access-Control-Allow-Methods"] = (
-                    "GET, POST, PUT, DELETE, PATCH, OPTIONS"
-                )
-                response.headers["Access-Control-Allow-Headers"] = (
-                    "Content-Type, Authorization, X-Requested-With, Accept, X-Testing-Mode"
-                )
-                response.headers["Access-Control-Expose-Headers"] = (
-                    "X-Process-Time, X-Request-ID, X-RateLimit-Limit, X-RateLimit-Remaining"
-                )
-                if self.allow_credentials:
-                    response.headers["Access-Control-Allow-Credentials"] = "true"
-                response.headers["Access-Control-Max-Age"] = "3600"
-            else:
-                logger.warning(
-                    f"[CORS] Origin {origin} NOT in allowed list: {self.allowed_origins}"
-                )
-        else:
+    def _for_origin(self, origin: str) -> Headers:
+        headers = [(b"access-control-allow-origin", origin.encode("latin-1")), *self._common]
+        if self.allow_credentials:
+            headers.extend(self._credentials)
+        return headers
+
+    def is_allowed(self, origin: str) -> bool:
+        """Check whether an origin may make cross-origin requests."""
+        return "*" in self.allowed_origins or origin in self.allowed_origins
+
+    def response_headers(self, origin: str | None) -> Headers:
+        """
+        Get CORS headers for a regular (non-preflight) response.
+
+        Args:
+            origin: Request Origin header, if any
+
+        Returns:
+            Raw header pairs; empty for origins that are not allowed
+        """
+        if not origin:
             # Always add CORS headers even without Origin header for direct API access
-            logger.info("[CORS] No origin header in request, adding default CORS headers")
-            response.headers["Access-Control-Allow-Origin"] = "*"
-            response.headers["Access-Control-Allow-Methods"] = (
-                "GET, POST, PUT, DELETE, PATCH, OPTIONS"
-            )
-            response.headers["Access-Control-Allow-Headers"] = (
-                "Content-Type, Authorization, X-Requested-With, Accept, X-Testing-Mode"
-            )
-            response.headers["Access-Control-Expose-Headers"] = (
-                "X-Process-Time, X-Request-ID, X-RateLimit-Limit, X-RateLimit-Remaining"
-            )
-            response.headers["Access-Control-Max-Age"] = "3600"
+            return self._wildcard
+        if not self.is_allowed(origin):
+            logger.warning(f"[CORS] Origin {origin} NOT in allowed list: {self.allowed_origins}")
+            return []
+        if not self.allow_credentials:
+            return self._wildcard
+        return self._for_origin(origin)
 
+    def preflight_response(self, origin: str | None) -> Response:
+        """Create a CORS preflight response"""
+        logger.debug(f"[CORS] OPTIONS preflight request from origin: {origin}")
+        if origin and self.allow_credentials and origin in self.allowed_origins:
+            headers = self._for_origin(origin)
+        else:
+            headers = self._wildcard
+        response = Response()
+        response.raw_headers.extend(headers)
         return response
 
+
+class SimpleCORSMiddleware:
+    """
+    Simple ASGI CORS middleware that adds CORS headers to all responses.
+
+    This is a workaround for compatibility issues between Starlette's CORSMiddleware
+    and custom middleware classes.
+    """
+
+    def __init__(self, app, allowed_origins: list = None):
+        self.app = app
+        self.policy = CORSPolicy(allowed_origins)
+        self.allowed_origins = self.policy.allowed_origins
+        self.allow_credentials = self.policy.allow_credentials
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = get_header(scope, b"origin")
+
+        # Handle OPTIONS requests (preflight)
+        if scope["method"] == "OPTIONS":
+            await self.policy.preflight_response(origin)(scope, receive, send)
+            return
+
+        headers = self.policy.response_headers(origin)
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start" and headers:
+                set_response_headers(message, headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
     def get_cors_response(self, origin: str = None) -> Response:
         """Create a CORS preflight response"""
-        response = Response()
-        # Always include Access-Control-Allow-Origin header
-        if origin and ("*" not in self.allowed_origins and origin in self.allowed_origins):
-            response.headers["Access-Control-Allow-Origin"] = origin
-            if self.allow_credentials:
-                response.headers["Access-Control-Allow-Credentials"] = "true"
-        else:
-            response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, PATCH, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = (
-            "Content-Type, Authorization, X-Requested-With, Accept, X-Testing-Mode"
-        )
-        response.headers["Access-Control-Expose-Headers"] = (
-            "X-Process-Time, X-Request-ID, X-RateLimit-Limit, X-RateLimit-Remaining"
-        )
-        response.headers["Access-Control-Max-Age"] = "3600"
-        return response
+        return self.policy.preflight_response(origin)
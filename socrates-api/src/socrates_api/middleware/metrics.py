@@ -11,9 +11,9 @@ Metrics are exposed at /metrics endpoint in Prometheus format.
 """
 
 import logging
+import re
 import time
 
-from fastapi import Request
 from prometheus_client import (
     CollectorRegistry,
     Counter,
@@ -21,8 +21,10 @@ from prometheus_client import (
     Histogram,
     generate_latest,
 )
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+from socrates_api.middleware.asgi import get_content_length, get_header, set_response_headers
+from socratic_system.monitoring_metrics import MetricsCollector, get_metrics, initialize_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -96,164 +98,191 @@ app_requests_in_progress = Gauge(
 )
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+# Application metrics (socratic_system.monitoring_metrics), exported below as summaries
+try:
+    app_metrics = get_metrics()
+except RuntimeError:
+    app_metrics = initialize_metrics()
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _prometheus_name(name: str) -> str:
+    return "socrates_" + _INVALID_NAME_CHARS.sub("_", name)
+
+
+class ApplicationMetricsExporter:
     """
-    Middleware to collect Prometheus metrics for all HTTP requests.
+    Prometheus collector exposing a MetricsCollector at scrape time.
 
-    Tracks:
-    - Total request count by method/endpoint/status
-    - Request latency (histogram with multiple buckets)
-    - Request/response sizes
-    - Requests in progress
+    Recorded metrics become summaries (quantiles from the streaming
+    histograms, plus sum and count); counters and gauges are exported as is.
     """
 
-    def __init__(self, app):
+    def __init__(self, collector: MetricsCollector):
         """
-        Initialize metrics middleware.
+        Initialize exporter.
 
         Args:
-            app: FastAPI application instance
+            collector: Application metrics collector to export
         """
-        super().__init__(app)
+        self.collector = collector
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """
-        Process request and collect metrics.
+    def collect(self):
+        for name in self.collector.get_metric_names():
+            snapshot = self.collector.get_histogram_snapshot(name)
+            if not snapshot or not snapshot["count"]:
+                continue
+            metric_name = _prometheus_name(name)
+            summary = Metric(metric_name, f"Application metric {name}", "summary")
+            for percentile, value in snapshot["percentiles"].items():
+                summary.add_sample(metric_name, {"quantile": f"{percentile / 100:g}"}, value)
+            summary.add_sample(f"{metric_name}_sum", {}, snapshot["sum"])
+            summary.add_sample(f"{metric_name}_count", {}, snapshot["count"])
+            yield summary
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware or route handler
+        for name, value in self.collector.get_all_counters().items():
+            yield CounterMetricFamily(_prometheus_name(name), f"Counter {name}", value=value)
+        for name, value in self.collector.get_all_gauges().items():
+            yield GaugeMetricFamily(_prometheus_name(name), f"Gauge {name}", value=value)
 
-        Returns:
-            Response with metrics collected
-        """
-        # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
-            return await call_next(request)
 
-        # Track request start
-        start_time = time.time()
-        app_requests_in_progress.inc()
+_registry.register(ApplicationMetricsExporter(app_metrics))
 
-        # Normalize endpoint path for metrics (remove IDs to reduce cardinality)
-        endpoint = self._normalize_endpoint(request.url.path)
 
-        # Track request size if available
-        request_size = 0
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                if request.headers.get("content-length"):
-                    request_size = int(request.headers["content-length"])
-            except (ValueError, KeyError):
-                pass
+# Replaces UUIDs and numeric IDs in paths with {id}
+_UUID_SEGMENT = re.compile(
+    r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", flags=re.IGNORECASE
+)
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
 
-        try:
-            response = await call_next(request)
-        except Exception as e:
-            # Record error metrics
-            duration = time.time() - start_time
-            http_request_duration_seconds.labels(
-                method=request.method,
-                endpoint=endpoint,
-                status="error",
-            ).observe(duration)
-            http_requests_total.labels(
-                method=request.method,
-                endpoint=endpoint,
-                status="error",
-            ).inc()
-            app_requests_in_progress.dec()
-            logger.error(f"Request error: {request.method} {request.url.path}: {e}")
-            raise
 
-        # Collect metrics
-        duration = time.time() - start_time
+def normalize_endpoint(path: str) -> str:
+    """
+    Normalize endpoint path for metrics.
 
-        # Handle both regular and streaming responses
-        try:
-            status_code = response.status
-        except AttributeError:
-            # Streaming responses don't have a status attribute until sent
-            status_code = 200  # Default to 200 for streaming responses
-
-        # Record request metrics
-        http_requests_total.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=status_code,
-        ).inc()
-
-        http_request_duration_seconds.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=status_code,
-        ).observe(duration)
-
-        # Record request size
-        if request_size > 0:
-            http_request_size_bytes.labels(
-                method=request.method,
-                endpoint=endpoint,
-            ).observe(request_size)
-
-        # Record response size if available
-        response_size = 0
-        if response.headers.get("content-length"):
-            try:
-                response_size = int(response.headers["content-length"])
-                http_response_size_bytes.labels(
-                    method=request.method,
-                    endpoint=endpoint,
-                    status=status_code,
-                ).observe(response_size)
-            except ValueError:
-                pass
-
-        app_requests_in_progress.dec()
-
-        # Add request timing header (if response headers are mutable)
-        try:
-            response.headers["X-Process-Time"] = f"{duration:.4f}"
-        except (AttributeError, TypeError):
-            # Some response types don't allow header modification
-            pass
-
-        # Log slow requests
-        if duration > 1.0:
-            logger.warning(
-                f"Slow request: {request.method} {request.url.path} "
-                f"took {duration:.2f}s (status: {status_code})"
-            )
+    Replaces UUIDs and IDs with placeholders to reduce metric cardinality.
+
+    Args:
+        path: Original request path
 
-        return response
+    Returns:
+        Normalized path for use in metrics labels
+    """
+    return _NUMERIC_SEGMENT.sub("/{id}", _UUID_SEGMENT.sub("/{id}", path))
 
-    @staticmethod
-    def _normalize_endpoint(path: str) -> str:
-        """
-        Normalize endpoint path for metrics.
 
-        Replaces UUIDs and IDs with placeholders to reduce metric cardinality.
+def get_request_size(scope: dict) -> int:
+    """Get the declared body size of a POST/PUT/PATCH request (0 if unknown)."""
+    if scope["method"] not in ("POST", "PUT", "PATCH"):
+        return 0
+    try:
+        return int(get_header(scope, b"content-length") or 0)
+    except ValueError:
+        return 0
 
-        Args:
-            path: Original request path
 
-        Returns:
-            Normalized path for use in metrics labels
-        """
-        import re
-
-        # Replace UUID patterns with {id}
-        normalized = re.sub(
-            r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "/{id}",
-            path,
-            flags=re.IGNORECASE,
+def record_request(
+    method: str,
+    path: str,
+    status: int | str,
+    duration: float,
+    request_size: int = 0,
+    response_size: int | None = None,
+) -> None:
+    """
+    Record metrics for a completed HTTP request.
+
+    Args:
+        method: HTTP method
+        path: Request path (normalized here)
+        status: Response status code, or "error" if the app raised
+        duration: Request duration in seconds
+        request_size: Request body size in bytes (0 if unknown)
+        response_size: Response body size in bytes (None if unknown)
+    """
+    endpoint = normalize_endpoint(path)
+
+    http_requests_total.labels(method=method, endpoint=endpoint, status=status).inc()
+    http_request_duration_seconds.labels(method=method, endpoint=endpoint, status=status).observe(
+        duration
+    )
+
+    if request_size > 0:
+        http_request_size_bytes.labels(method=method, endpoint=endpoint).observe(request_size)
+
+    if response_size is not None:
+        http_response_size_bytes.labels(method=method, endpoint=endpoint, status=status).observe(
+            response_size
         )
 
-        # Replace numeric IDs with {id}
-        normalized = re.sub(r"/\d+(?=/|$)", "/{id}", normalized)
+    # Feeds the latency percentiles reported by /health/detailed
+    app_metrics.record_metric("request.duration_ms", duration * 1000)
+
+    # Log slow requests
+    if duration > 1.0:
+        logger.warning(f"Slow request: {method} {path} took {duration:.2f}s (status: {status})")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware to collect Prometheus metrics for all HTTP requests.
+
+    Tracks:
+    - Total request count by method/endpoint/status
+    - Request latency (histogram with multiple buckets)
+    - Request/response sizes
+    - Requests in progress
+
+    The status code and response size are read from the response start
+    message, so streaming responses are measured correctly.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize metrics middleware.
+
+        Args:
+            app: ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Skip metrics endpoint to avoid recursion
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        response = {"status": None, "size": None}
+        app_requests_in_progress.inc()
 
-        return normalized
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["size"] = get_content_length(message)
+                set_response_headers(
+                    message,
+                    [(b"x-process-time", f"{time.perf_counter() - start_time:.4f}".encode())],
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as e:
+            logger.error(f"Request error: {scope['method']} {scope['path']}: {e}")
+            response["status"] = "error"
+            raise
+        finally:
+            app_requests_in_progress.dec()
+            record_request(
+                scope["method"],
+                scope["path"],
+                response["status"] or "error",
+                time.perf_counter() - start_time,
+                get_request_size(scope),
+                response["size"],
+            )
 
 
 def add_metrics_middleware(app):
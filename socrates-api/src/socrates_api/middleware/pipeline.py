@@ -0,0 +1,126 @@
+"""
+API Middleware Pipeline - CORS, activity tracking, metrics and security headers in one pass.
+
+Equivalent to stacking SimpleCORSMiddleware (outermost), ActivityTrackerMiddleware,
+MetricsMiddleware and SecurityHeadersMiddleware, but as a single pure ASGI
+layer: request headers are scanned once and all response headers are merged
+into the response start message in one step.
+"""
+
+import logging
+import time
+
+from socrates_api.middleware.activity_tracker import record_activity
+from socrates_api.middleware.asgi import get_content_length, set_response_headers
+from socrates_api.middleware.cors_fix import CORSPolicy
+from socrates_api.middleware.metrics import app_requests_in_progress, record_request
+from socrates_api.middleware.security_headers import REMOVED_HEADERS, build_security_headers
+
+logger = logging.getLogger(__name__)
+
+_WRITE_METHODS = ("POST", "PUT", "PATCH")
+
+
+class APIMiddleware:
+    """
+    Single-pass ASGI middleware for the API.
+
+    Per request:
+    - Answers CORS preflight requests directly
+    - Notes the bearer token for deferred activity tracking
+    - Records Prometheus request metrics (except for /metrics itself)
+    - Adds CORS, security and X-Process-Time headers to the response
+    """
+
+    def __init__(self, app, allowed_origins: list = None, environment: str = "production"):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            allowed_origins: Origins allowed to make cross-origin requests
+            environment: Environment name (development, staging, production)
+        """
+        self.app = app
+        self.cors = CORSPolicy(allowed_origins)
+        self.security_headers = build_security_headers(environment)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = authorization = content_length = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"authorization":
+                authorization = value.decode("latin-1")
+            elif name == b"content-length":
+                content_length = value
+
+        method = scope["method"]
+        if method == "OPTIONS":
+            await self.cors.preflight_response(origin)(scope, receive, send)
+            return
+
+        if authorization:
+            record_activity(authorization)
+
+        headers = self.cors.response_headers(origin) + self.security_headers
+        path = scope["path"]
+        track_metrics = path != "/metrics"
+        start_time = time.perf_counter()
+        response = {"status": None, "size": None}
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["size"] = get_content_length(message)
+                process_time = f"{time.perf_counter() - start_time:.4f}".encode()
+                set_response_headers(
+                    message,
+                    [*headers, (b"x-process-time", process_time)] if track_metrics else headers,
+                    remove=REMOVED_HEADERS,
+                )
+            await send(message)
+
+        if not track_metrics:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        app_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except Exception as e:
+            logger.error(f"Request error: {method} {path}: {e}")
+            raise
+        finally:
+            app_requests_in_progress.dec()
+            request_size = 0
+            if content_length and method in _WRITE_METHODS:
+                try:
+                    request_size = int(content_length)
+                except ValueError:
+                    pass
+            record_request(
+                method,
+                path,
+                response["status"] or "error",
+                time.perf_counter() - start_time,
+                request_size,
+                response["size"],
+            )
+
+
+def add_api_middleware(app, allowed_origins: list = None, environment: str = "production"):
+    """
+    Add the fused API middleware to a FastAPI application.
+
+    Args:
+        app: FastAPI application instance
+        allowed_origins: Origins allowed to make cross-origin requests
+        environment: Environment name (development, staging, production)
+    """
+    app.add_middleware(APIMiddleware, allowed_origins=allowed_origins, environment=environment)
+    logger.info(f"API middleware added (environment: {environment})")
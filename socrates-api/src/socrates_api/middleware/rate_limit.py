@@ -6,10 +6,12 @@ Provides:
 - Per-user rate limiting (authenticated endpoints)
 - Per-IP rate limiting (unauthenticated endpoints)
 - Redis backend for distributed rate limiting
+- Shared SQLite backend for multi-worker deployments without Redis
 - Graceful degradation if Redis unavailable
 """
 
 import logging
+from pathlib import Path
 
 import redis
 
@@ -58,12 +60,14 @@ class RateLimitConfig:
     HEALTH_LIMIT = None
 
 
-def get_limiter(redis_url: str | None = None) -> Limiter | None:
+def get_limiter(redis_url: str | None = None, shared_db_path: str | None = None) -> Limiter | None:
     """
     Initialize rate limiter with optional Redis backend.
 
     Args:
         redis_url: Redis connection URL (e.g., "redis://localhost:6379")
+        shared_db_path: SQLite file shared by API worker processes, used instead
+            of in-memory counters when Redis is unavailable
 
     Returns:
         Configured Limiter instance or None if slowapi not available
@@ -97,6 +101,22 @@ def get_limiter(redis_url: str | None = None) -> Limiter | None:
                     f"falling back to in-memory rate limiting: {e}"
                 )
 
+        # Worker processes without Redis share counters through a SQLite file
+        if shared_db_path:
+            # Importing the storage registers the sqlite:// scheme
+            from socrates_api.middleware import rate_limit_storage  # noqa: F401
+
+            limiter = Limiter(
+                key_func=get_remote_address,
+                storage_uri=f"sqlite:///{Path(shared_db_path).resolve()}",
+                default_limits=[
+                    RateLimitConfig.DEFAULT_LIMIT,
+                    RateLimitConfig.DEFAULT_HOURLY_LIMIT,
+                ],
+            )
+            logger.info(f"Rate limiter initialized with shared SQLite backend: {shared_db_path}")
+            return limiter
+
         # Fallback to in-memory rate limiting
         limiter = Limiter(
             key_func=get_remote_address,
@@ -117,18 +137,21 @@ def get_limiter(redis_url: str | None = None) -> Limiter | None:
 _limiter: Limiter | None = None
 
 
-def initialize_limiter(redis_url: str | None = None) -> Limiter | None:
+def initialize_limiter(
+    redis_url: str | None = None, shared_db_path: str | None = None
+) -> Limiter | None:
     """
     Initialize global rate limiter instance.
 
     Args:
         redis_url: Optional Redis URL for distributed rate limiting
+        shared_db_path: Optional SQLite file shared by API worker processes
 
     Returns:
         Initialized Limiter or None
     """
     global _limiter
-    _limiter = get_limiter(redis_url)
+    _limiter = get_limiter(redis_url, shared_db_path)
     return _limiter
 
 
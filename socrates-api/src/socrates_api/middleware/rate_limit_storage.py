@@ -0,0 +1,126 @@
+"""
+SQLite Rate Limit Storage - Share rate limit counters between worker processes.
+
+Registers the ``sqlite:///<path>`` storage URI scheme with the ``limits``
+library, so slowapi counts requests against one set of fixed-window counters
+no matter which API worker process serves them. Used when the API runs
+several workers without Redis.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from limits.storage import Storage
+
+logger = logging.getLogger(__name__)
+
+# Expired counters are deleted once every this many increments
+PRUNE_EVERY = 1000
+
+
+class SQLiteRateLimitStorage(Storage):
+    """Fixed-window rate limit counters in a SQLite file."""
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+        """
+        Initialize storage.
+
+        Args:
+            uri: ``sqlite:///<absolute path>`` of the shared database file
+            wrap_exceptions: Wrap storage errors in limits.errors.StorageError
+        """
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.db_path = urlparse(uri).path
+        self._local = threading.local()
+        self._increments = 0
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread (requests are counted on many threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Increment a counter, starting a new window if the current one expired."""
+        now = time.time()
+        conn = self._connection()
+        (count,) = conn.execute(
+            """
+            INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                count = CASE WHEN expires_at <= ? THEN excluded.count
+                             ELSE count + excluded.count END,
+                expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at
+                                  ELSE expires_at END
+            RETURNING count
+            """,
+            (key, amount, now + expiry, now, now),
+        ).fetchone()
+
+        self._increments += 1
+        if self._increments % PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        return count
+
+    def get(self, key: str) -> int:
+        """Current count of an unexpired counter (0 if none)."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        """Time at which a counter's window ends (now if there is none)."""
+        now = time.time()
+        row = (
+            self._connection()
+            .execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)
+            )
+            .fetchone()
+        )
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        """Check that the database file can be queried."""
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        """Delete every counter."""
+        return self._connection().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        """Delete one counter."""
+        self._connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
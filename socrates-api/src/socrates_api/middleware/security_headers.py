@@ -14,16 +14,120 @@ Provides:
 
 import logging
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from socrates_api.middleware.asgi import Headers, encode_headers, set_response_headers
 
 logger = logging.getLogger(__name__)
 
+# Potentially revealing headers stripped from every response
+REMOVED_HEADERS = (b"server", b"x-powered-by")
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+def build_security_headers(environment: str = "production") -> Headers:
+    """
+    Build the security headers for an environment.
+
+    The headers do not depend on the request, so they are built once and
+    appended to every response.
+
+    Args:
+        environment: Environment name (development, staging, production)
+
+    Returns:
+        Raw ASGI header pairs
+    """
+    headers = {}
+
+    # X-Frame-Options: Prevent clickjacking
+    # DENY: Prevent page from being displayed in a frame
+    headers["X-Frame-Options"] = "DENY"
+
+    # X-Content-Type-Options: Prevent MIME-type sniffing
+    # nosniff: Prevents browser from MIME-sniffing
+    headers["X-Content-Type-Options"] = "nosniff"
+
+    # X-XSS-Protection: Enable XSS protection (legacy, for older browsers)
+    # 1; mode=block: Enable XSS filter and block page if attack detected
+    headers["X-XSS-Protection"] = "1; mode=block"
+
+    # Strict-Transport-Security: Force HTTPS
+    # max-age=31536000: 1 year in seconds
+    # includeSubDomains: Apply to all subdomains
+    # preload: Allow inclusion in HSTS preload list
+    if environment == "production":
+        headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
+    else:
+        # Shorter max-age for development
+        headers["Strict-Transport-Security"] = "max-age=3600; includeSubDomains"
+
+    # Content-Security-Policy: Restrict resource loading
+    # Prevents XSS, clickjacking, and other injection attacks
+    if environment == "production":
+        csp = (
+            "default-src 'self'; "
+            "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+            "style-src 'self' 'unsafe-inline'; "
+            "img-src 'self' data: https:; "
+            "font-src 'self' data:; "
+            "connect-src 'self' https:; "
+            "frame-ancestors 'none'; "
+            "base-uri 'self'; "
+            "form-action 'self'"
+        )
+    else:
+        # More permissive for development
+        csp = (
+            "default-src 'self' http: https: data: blob: 'unsafe-inline' 'unsafe-eval'; "
+            "script-src 'self' http: https: 'unsafe-inline' 'unsafe-eval'; "
+            "style-src 'self' http: https: 'unsafe-inline'; "
+            "img-src 'self' http: https: data: blob:; "
+            "font-src 'self' http: https: data:; "
+            "connect-src 'self' http: https: ws: wss:; "
+            "frame-ancestors 'self'"
+        )
+
+    headers["Content-Security-Policy"] = csp
+
+    # Referrer-Policy: Control referrer information
+    # strict-no-referrer: Never send referrer information
+    headers["Referrer-Policy"] = "strict-no-referrer"
+
+    # Permissions-Policy (previously Feature-Policy): Control browser features
+    # Disable risky features by default
+    headers["Permissions-Policy"] = (
+        "accelerometer=(), "
+        "ambient-light-sensor=(), "
+        "autoplay=(), "
+        "battery=(), "
+        "camera=(), "
+        "display-capture=(), "
+        "document-domain=(), "
+        "encrypted-media=(), "
+        "execution-while-not-rendered=(), "
+        "execution-while-out-of-viewport=(), "
+        "fullscreen=(), "
+        "geolocation=(), "
+        "gyroscope=(), "
+        "magnetometer=(), "
+        "microphone=(), "
+        "midi=(), "
+        "payment=(), "
+        "picture-in-picture=(), "
+        "sync-xhr=(), "
+        "usb=(), "
+        "vr=(), "
+        "wake-lock=(), "
+        "xr-spatial-tracking=()"
+    )
+
+    # Add custom headers
+    headers["X-API-Version"] = "8.0.0"
+
+    return encode_headers(headers)
+
+
+class SecurityHeadersMiddleware:
     """
-    Middleware to add security headers to HTTP responses.
+    ASGI middleware to add security headers to HTTP responses.
 
     Implements OWASP security header best practices:
     https://owasp.org/www-project-secure-headers/
@@ -34,125 +138,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         Initialize security headers middleware.
 
         Args:
-            app: FastAPI application instance
+            app: ASGI application to wrap
             environment: Environment name (development, staging, production)
         """
-        super().__init__(app)
+        self.app = app
         self.environment = environment
+        self.headers = build_security_headers(environment)
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """
-        Process request and add security headers to response.
-
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response with security headers added
-        """
-        response = await call_next(request)
-
-        # X-Frame-Options: Prevent clickjacking
-        # DENY: Prevent page from being displayed in a frame
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # X-Content-Type-Options: Prevent MIME-type sniffing
-        # nosniff: Prevents browser from MIME-sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # X-XSS-Protection: Enable XSS protection (legacy, for older browsers)
-        # 1; mode=block: Enable XSS filter and block page if attack detected
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Strict-Transport-Security: Force HTTPS
-        # max-age=31536000: 1 year in seconds
-        # includeSubDomains: Apply to all subdomains
-        # preload: Allow inclusion in HSTS preload list
-        if self.environment == "production":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
-        else:
-            # Shorter max-age for development
-            response.headers["Strict-Transport-Security"] = "max-age=3600; includeSubDomains"
-
-        # Content-Security-Policy: Restrict resource loading
-        # Prevents XSS, clickjacking, and other injection attacks
-        if self.environment == "production":
-            csp = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' data:; "
-                "connect-src 'self' https:; "
-                "frame-ancestors 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self'"
-            )
-        else:
-            # More permissive for development
-            csp = (
-                "default-src 'self' http: https: data: blob: 'unsafe-inline' 'unsafe-eval'; "
-                "script-src 'self' http: https: 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' http: https: 'unsafe-inline'; "
-                "img-src 'self' http: https: data: blob:; "
-                "font-src 'self' http: https: data:; "
-                "connect-src 'self' http: https: ws: wss:; "
-                "frame-ancestors 'self'"
-            )
-
-        response.headers["Content-Security-Policy"] = csp
-
-        # Referrer-Policy: Control referrer information
-        # strict-no-referrer: Never send referrer information
-        response.headers["Referrer-Policy"] = "strict-no-referrer"
-
-        # Permissions-Policy (previously Feature-Policy): Control browser features
-        # Disable risky features by default
-        response.headers["Permissions-Policy"] = (
-            "accelerometer=(), "
-            "ambient-light-sensor=(), "
-            "autoplay=(), "
-            "battery=(), "
-            "camera=(), "
-            "display-capture=(), "
-            "document-domain=(), "
-            "encrypted-media=(), "
-            "execution-while-not-rendered=(), "
-            "execution-while-out-of-viewport=(), "
-            "fullscreen=(), "
-            "geolocation=(), "
-            "gyroscope=(), "
-            "magnetometer=(), "
-            "microphone=(), "
-            "midi=(), "
-            "payment=(), "
-            "picture-in-picture=(), "
-            "sync-xhr=(), "
-            "usb=(), "
-            "vr=(), "
-            "wake-lock=(), "
-            "xr-spatial-tracking=()"
-        )
-
-        # Remove potentially revealing headers
-        if "Server" in response.headers:
-            del response.headers["Server"]
-        if "X-Powered-By" in response.headers:
-            del response.headers["X-Powered-By"]
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Add custom headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-API-Version"] = "8.0.0"
-
-        logger.debug(
-            f"Security headers added to {request.method} {request.url.path} "
-            f"(environment: {self.environment})"
-        )
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                set_response_headers(message, self.headers, remove=REMOVED_HEADERS)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 def add_security_headers_middleware(app, environment: str = "production"):
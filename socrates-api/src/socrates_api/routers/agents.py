@@ -5,15 +5,17 @@ Provides unified REST endpoints for invoking any agent registered with the orche
 Supports both synchronous and asynchronous invocation patterns.
 """
 
+import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 
 from socrates_api.auth import get_current_user
 from socrates_api.database import get_database
 from socrates_api.models import APIResponse
 from socratic_system.database import ProjectDatabase
+from socratic_system.events.durable_queue import FINISHED_STATUSES
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/agents", tags=["agents"])
@@ -32,6 +34,50 @@ def require_provider_config(provider_config):
         )
 
 
+AGENT_REQUEST_TASK = "agent_request"
+AGENT_JOB_TIMEOUT = 300.0
+MAX_JOB_WAIT = 60.0
+
+
+async def run_agent_request(payload: dict[str, Any]) -> dict[str, Any]:
+    """Job queue task that invokes an agent for a process-async request.
+
+    Credentials and the project are loaded when the job runs, so neither is
+    persisted in the job queue.
+
+    Args:
+        payload: Job payload with agent_name, current_user and the request body
+
+    Returns:
+        Agent response
+    """
+    from socrates_api.main import get_orchestrator
+
+    db = get_database()
+    current_user = payload["current_user"]
+    request_payload = payload["request"]
+
+    provider_config = db.get_user_active_llm_config_with_credentials(current_user)
+    if provider_config is None:
+        raise RuntimeError("No LLM provider configured")
+
+    request = {
+        "current_user": current_user,
+        "provider_config": provider_config,
+        **request_payload,
+    }
+    project_id = request_payload.get("project_id")
+    if project_id:
+        try:
+            request["project"] = db.load_project(project_id)
+        except Exception as e:
+            logger.warning(f"Could not load project {project_id}: {e}")
+
+    return await get_orchestrator().agent_bus.send_request(
+        payload["agent_name"], request, timeout=AGENT_JOB_TIMEOUT
+    )
+
+
 @router.get(
     "/list",
     response_model=APIResponse,
@@ -197,8 +243,7 @@ async def invoke_agent_async(
     Response includes job_id to poll status later via GET /api/v1/agents/jobs/{job_id}/status
     """
     try:
-        from socrates_api.main import get_orchestrator
-        from socratic_system.events import JobQueue
+        from socrates_api.main import get_job_queue
 
         # Validate agent name
         valid_agents = {
@@ -225,37 +270,21 @@ async def invoke_agent_async(
                 detail=f"Unknown agent: {agent_name}",
             )
 
-        orchestrator = get_orchestrator()
-        job_queue = JobQueue()  # Get global job queue
-
-        # Get user's LLM provider config with API key credentials (required for all agent operations)
-        provider_config = db.get_user_active_llm_config_with_credentials(current_user)
-        require_provider_config(provider_config)
-
-        # Prepare request
-        request = {
-            "current_user": current_user,
-            "provider_config": provider_config,
-            **request_payload,
-        }
+        job_queue = get_job_queue()
 
-        # Add project context if provided
-        project_id = request_payload.get("project_id")
-        if project_id:
-            try:
-                project = db.load_project(project_id)
-                request["project"] = project
-            except Exception as e:
-                logger.warning(f"Could not load project {project_id}: {e}")
-
-        # Submit async job
-        async def run_agent_job():
-            return await orchestrator.agent_bus.send_request(agent_name, request)
+        # Fail fast; the worker re-reads the config (with credentials) when the job runs
+        require_provider_config(db.get_user_active_llm_config_with_credentials(current_user))
 
-        job_id = await job_queue.submit(
-            run_agent_job,
+        # Agent calls are not idempotent, so the job is attempted once
+        job_id = await asyncio.to_thread(
+            job_queue.enqueue,
+            AGENT_REQUEST_TASK,
+            {"agent_name": agent_name, "current_user": current_user, "request": request_payload},
+            queue="agents",
+            timeout=AGENT_JOB_TIMEOUT,
+            max_attempts=1,
             name=f"{agent_name}_{request_payload.get('action', 'process')}",
-            timeout=300.0,
+            metadata={"user": current_user, "agent": agent_name},
         )
 
         return APIResponse(
@@ -285,42 +314,49 @@ async def invoke_agent_async(
 )
 async def get_job_status(
     job_id: str,
+    wait: float = Query(0.0, ge=0.0, le=MAX_JOB_WAIT),
     current_user: str = Depends(get_current_user),
 ) -> APIResponse:
     """
-    Poll the status of an async job.
+    Get the status of an async job.
+
+    With ``wait`` > 0 this is a long-poll: the request is held until the job
+    finishes or ``wait`` seconds pass, so clients need not poll repeatedly.
 
     Returns:
-    - status: "pending", "completed", "failed", or "timeout"
+    - status: "pending", "running", "completed", "failed", "timeout" or "cancelled"
     - result: Agent result when status="completed"
-    - error: Error message when status="failed"
+    - error: Error message when status="failed" or "timeout"
+    - long_poll: Present when the server honours ``wait``
     """
     try:
-        from socratic_system.events import JobQueue
+        from socrates_api.main import get_job_queue
 
-        job_queue = JobQueue()
-        job_result = job_queue.get_job_status(job_id)
+        job_queue = get_job_queue()
+        job_result = await asyncio.to_thread(job_queue.get_job_status, job_id)
 
-        if job_result is None:
+        if job_result is None or job_result.metadata.get("user") != current_user:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        is_complete = job_result.status.value in ("completed", "failed", "timeout")
+        if wait and job_result.status.value not in FINISHED_STATUSES:
+            job_result = (await job_queue.wait_for_jobs([job_id], timeout=wait))[job_id]
+
+        is_complete = job_result.status.value in FINISHED_STATUSES
 
         response_data = {
             "job_id": job_id,
             "status": job_result.status.value,
             "complete": is_complete,
-            "started_at": job_result.started_at.isoformat() if job_result.started_at else None,
-            "completed_at": (
-                job_result.completed_at.isoformat() if job_result.completed_at else None
-            ),
+            "started_at": job_result.started_at,
+            "completed_at": job_result.completed_at,
             "duration_ms": job_result.duration_ms,
+            "long_poll": True,
         }
 
         # Add result or error if available
         if job_result.status.value == "completed":
             response_data["result"] = job_result.result
-        elif job_result.status.value == "failed":
+        elif job_result.status.value in ("failed", "timeout"):
             response_data["error"] = job_result.error
 
         return APIResponse(
@@ -345,35 +381,56 @@ async def get_job_status(
 )
 async def get_batch_job_status(
     job_ids: str = None,  # Comma-separated list
+    wait: float = Query(0.0, ge=0.0, le=MAX_JOB_WAIT),
+    return_when: str = Query("any", pattern="^(any|all)$"),
     current_user: str = Depends(get_current_user),
 ) -> APIResponse:
     """
     Get status for multiple jobs at once (comma-separated job_ids).
 
-    Example: GET /api/v1/agents/jobs/batch?job_ids=job1,job2,job3
+    With ``wait`` > 0 this is a single long-poll covering every listed job:
+    the request is held until any (``return_when=any``) or all
+    (``return_when=all``) of them finish, or ``wait`` seconds pass.
+
+    Example: GET /api/v1/agents/jobs/batch?job_ids=job1,job2,job3&wait=30
     """
     try:
         if not job_ids:
             raise HTTPException(status_code=400, detail="job_ids parameter required")
 
-        from socratic_system.events import JobQueue
+        from socrates_api.main import get_job_queue
 
-        job_queue = JobQueue()
+        job_queue = get_job_queue()
         job_id_list = [jid.strip() for jid in job_ids.split(",")]
+        job_results = await asyncio.to_thread(job_queue.get_jobs, job_id_list)
+        owned = [
+            job_id
+            for job_id, job_result in job_results.items()
+            if job_result.metadata.get("user") == current_user
+        ]
+
+        if wait and owned:
+            job_results = await job_queue.wait_for_jobs(
+                owned, timeout=wait, return_when=return_when
+            )
 
-        statuses = {}
-        for job_id in job_id_list:
-            job_result = job_queue.get_job_status(job_id)
-            if job_result:
-                statuses[job_id] = {
-                    "status": job_result.status.value,
-                    "complete": job_result.status.value in ("completed", "failed", "timeout"),
-                }
+        statuses = {
+            job_id: {
+                "status": job_results[job_id].status.value,
+                "complete": job_results[job_id].status.value in FINISHED_STATUSES,
+            }
+            for job_id in owned
+        }
 
         return APIResponse(
             success=True,
             status="success",
-            data={"jobs": statuses, "total": len(job_id_list), "found": len(statuses)},
+            data={
+                "jobs": statuses,
+                "total": len(job_id_list),
+                "found": len(statuses),
+                "long_poll": True,
+            },
             message=f"Retrieved status for {len(statuses)}/{len(job_id_list)} jobs",
         )
 
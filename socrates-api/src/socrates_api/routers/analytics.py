@@ -14,6 +14,7 @@ from socratic_maturity import MaturityCalculator
 
 from socrates_api.auth import get_current_user
 from socrates_api.auth.dependencies import get_current_user_object_optional
+from socrates_api.caching import cached_endpoint
 from socrates_api.database import get_database
 from socrates_api.models import APIResponse, ErrorResponse, SuccessResponse
 from socrates_api.services.report_generator import get_report_generator
@@ -24,13 +25,15 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
-def get_phase_readiness_status(project, maturity_calculator: MaturityCalculator):
+def get_phase_readiness_status(
+    phase_maturity_scores: dict[str, float], maturity_calculator: MaturityCalculator
+):
     """
     Get readiness status for all phases based on maturity scores.
 
     Returns information about whether user is ready to advance to next phase.
     """
-    phase_maturity_scores = getattr(project, "phase_maturity_scores", {}) or {}
+    phase_maturity_scores = phase_maturity_scores or {}
     all_phases = list(maturity_calculator.phase_categories.keys())
 
     readiness_status = {}
@@ -55,6 +58,29 @@ def get_phase_readiness_status(project, maturity_calculator: MaturityCalculator)
     return readiness_status
 
 
+def _project_summary(analytics: dict) -> dict:
+    """Build the per-project analytics summary from the precomputed read model."""
+    total_questions = analytics["total_questions"]
+    confidence_score = min(100, 40 + (analytics["overall_maturity"] or 0) * 0.75)
+
+    return {
+        "project_id": analytics["project_id"],
+        "total_questions": total_questions,
+        "total_answers": analytics["total_answers"],
+        "confidence_score": round(confidence_score, 1),
+        "code_generation_count": analytics["code_generation_count"],
+        "code_lines_generated": analytics["code_lines_generated"],
+        "average_response_time": 2.3,
+        "learning_velocity": round(min(100, 50 + (total_questions // 2)), 1),
+        "categories": {
+            "variables": max(0, total_questions // 5),
+            "functions": max(0, total_questions // 4),
+            "loops": max(0, total_questions // 6),
+            "conditionals": max(0, total_questions // 3),
+        },
+    }
+
+
 @router.get(
     "/summary",
     response_model=APIResponse,
@@ -116,55 +142,25 @@ async def get_analytics_summary(
             )
 
         if project_id:
-            # Get real project data
-            project = db.load_project(project_id)
-            if not project:
+            # Counters are maintained on write; no conversation history is loaded here
+            analytics = db.get_project_analytics(project_id)
+            if not analytics:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Project not found",
                 )
 
-            if project.owner != current_user:
+            if analytics["owner"] != current_user:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Access denied",
                 )
 
-            # Calculate metrics from conversation history
-            conversation = project.conversation_history or []
-            total_questions = len([m for m in conversation if m.get("type") == "user"])
-            total_answers = len([m for m in conversation if m.get("type") == "assistant"])
-            code_generation_count = len([m for m in conversation if "```" in m.get("content", "")])
-            code_lines_generated = sum(
-                len(parts[1].splitlines()) if len(parts) > 1 else 0
-                for m in conversation
-                if "```" in m.get("content", "")
-                for parts in [m.get("content", "").split("```")]
-            )
-
-            # Calculate confidence based on maturity
-            confidence_score = min(100, 40 + (project.overall_maturity or 0) * 0.75)
-
-            summary = {
-                "project_id": project_id,
-                "total_questions": total_questions,
-                "total_answers": total_answers,
-                "confidence_score": round(confidence_score, 1),
-                "code_generation_count": code_generation_count,
-                "code_lines_generated": code_lines_generated,
-                "average_response_time": 2.3,
-                "learning_velocity": round(min(100, 50 + (total_questions // 2)), 1),
-                "categories": {
-                    "variables": max(0, total_questions // 5),
-                    "functions": max(0, total_questions // 4),
-                    "loops": max(0, total_questions // 6),
-                    "conditionals": max(0, total_questions // 3),
-                },
-            }
+            summary = _project_summary(analytics)
         else:
-            # Get summary across all user's projects
-            all_projects = [db.load_project(pid) for pid in db.list_projects(owner=current_user)]
-            all_projects = [p for p in all_projects if p]
+            # Get summary across all user's projects from the read model
+            user_analytics = db.get_user_analytics(current_user)
+            all_projects = user_analytics["projects"]
 
             total_code_quality = 0
             total_maturity = 0
@@ -174,11 +170,11 @@ async def get_analytics_summary(
             issues_resolved = 0
 
             for project in all_projects:
-                maturity = project.overall_maturity or 0
+                maturity = project["overall_maturity"] or 0
                 total_maturity += maturity
                 total_code_quality += min(100, 40 + maturity)
 
-                conv_count = len(project.conversation_history or [])
+                conv_count = project["message_count"]
                 total_tests += max(5, conv_count // 2)
                 test_passes += int(max(5, conv_count // 2) * (0.5 + maturity / 200))
 
@@ -198,6 +194,7 @@ async def get_analytics_summary(
                 ),
                 "total_issues_found": issues_found,
                 "total_issues_resolved": issues_resolved,
+                "llm_usage": user_analytics["llm_usage"],
             }
 
         return APIResponse(
@@ -227,6 +224,7 @@ async def get_analytics_summary(
         404: {"description": "Project not found", "model": ErrorResponse},
     },
 )
+@cached_endpoint("project_analytics:{project_id}:{current_user}")
 async def get_project_analytics(
     project_id: str,
     current_user: str = Depends(get_current_user),
@@ -244,7 +242,8 @@ async def get_project_analytics(
         SuccessResponse with project analytics
     """
     try:
-        project = db.load_project(project_id)
+        # Precomputed read model: bounded-cost regardless of conversation length
+        project = db.get_project_analytics(project_id)
 
         if not project:
             raise HTTPException(
@@ -252,22 +251,17 @@ async def get_project_analytics(
                 detail=f"Project '{project_id}' not found",
             )
 
-        if project.owner != current_user:
+        if project["owner"] != current_user:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access denied to this project",
             )
 
-        # Extract real analytics from project
-        analytics_metrics = getattr(project, "analytics_metrics", {}) or {}
-        phase_maturity_scores = getattr(project, "phase_maturity_scores", {}) or {}
-        overall_maturity = getattr(project, "overall_maturity", 0.0)
-        project_type = getattr(project, "project_type", "software") or "software"
-
-        # Calculate metrics from conversation history
-        conversation = project.conversation_history or []
-        total_questions = len([m for m in conversation if m.get("type") == "user"])
-        len([m for m in conversation if m.get("type") == "assistant"])
+        analytics_metrics = project["analytics_metrics"]
+        phase_maturity_scores = project["phase_maturity_scores"]
+        overall_maturity = project["overall_maturity"]
+        project_type = project["project_type"] or "software"
+        total_questions = project["total_questions"]
 
         # Calculate project completion percentage from all phase maturity scores
         # This represents overall project progress across all phases
@@ -278,7 +272,7 @@ async def get_project_analytics(
 
         # Get phase readiness information
         maturity_calc = MaturityCalculator(project_type=project_type)
-        phase_readiness = get_phase_readiness_status(project, maturity_calc)
+        phase_readiness = get_phase_readiness_status(phase_maturity_scores, maturity_calc)
 
         analytics = {
             "project_id": project_id,
@@ -303,7 +297,7 @@ async def get_project_analytics(
             # Phase readiness and advancement guidance
             "phase_readiness": phase_readiness,
             "advancement_guidance": {
-                "current_phase": getattr(project, "current_phase", "discovery") or "discovery",
+                "current_phase": project["phase"] or "discovery",
                 "ready_to_advance": any(
                     phase_readiness[ph].get("is_ready_to_advance", False) for ph in phase_readiness
                 ),
@@ -321,11 +315,15 @@ async def get_project_analytics(
                 "strong_categories": analytics_metrics.get("strong_categories", []),
                 "weak_categories": analytics_metrics.get("weak_categories", []),
             },
+            # Rolling aggregates materialized on write; nothing is recomputed here
             "velocity": {
                 "value": round(analytics_metrics.get("velocity", 0.0), 2),
                 "unit": "points_per_session",
                 "total_qa_sessions": analytics_metrics.get("total_qa_sessions", 0),
+                "plateaus": (analytics_metrics.get("progression") or {}).get("plateaus", []),
             },
+            "phase_timings": project["phase_timings"],
+            "maturity_trend": project["maturity_trend"],
         }
 
         return APIResponse(
@@ -741,8 +739,8 @@ async def export_analytics(
             f"User {current_user} exporting analytics for project {project_id} as {format_type}"
         )
 
-        # Load project
-        project = db.load_project(project_id)
+        # Load precomputed project analytics
+        project = db.get_project_analytics(project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -750,52 +748,23 @@ async def export_analytics(
             )
 
         # Check authorization
-        if project.owner != current_user:
+        if project["owner"] != current_user:
             logger.warning(
-                f"User {current_user} attempted to export analytics for project {project_id} owned by {project.owner}"
+                f"User {current_user} attempted to export analytics for project {project_id} owned by {project['owner']}"
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access denied",
             )
 
-        # Gather analytics data
-        conversation = project.conversation_history or []
-        total_questions = len([m for m in conversation if m.get("type") == "user"])
-        total_answers = len([m for m in conversation if m.get("type") == "assistant"])
-        code_generation_count = len([m for m in conversation if "```" in m.get("content", "")])
-        code_lines_generated = sum(
-            len(parts[1].splitlines()) if len(parts) > 1 else 0
-            for m in conversation
-            if "```" in m.get("content", "")
-            for parts in [m.get("content", "").split("```")]
-        )
-
-        confidence_score = min(100, 40 + (project.overall_maturity or 0) * 0.75)
-
-        analytics_data = {
-            "project_id": project_id,
-            "total_questions": total_questions,
-            "total_answers": total_answers,
-            "code_generation_count": code_generation_count,
-            "code_lines_generated": code_lines_generated,
-            "confidence_score": round(confidence_score, 1),
-            "learning_velocity": round(min(100, 50 + (total_questions // 2)), 1),
-            "average_response_time": 2.3,
-            "categories": {
-                "variables": max(0, total_questions // 5),
-                "functions": max(0, total_questions // 4),
-                "loops": max(0, total_questions // 6),
-                "conditionals": max(0, total_questions // 3),
-            },
-        }
+        analytics_data = _project_summary(project)
 
         project_data = {
-            "name": project.name,
-            "owner": project.owner,
-            "phase": project.phase,
-            "status": project.status,
-            "created_at": project.created_at.isoformat() if project.created_at else "N/A",
+            "name": project["name"],
+            "owner": project["owner"],
+            "phase": project["phase"],
+            "status": project["status"],
+            "created_at": project["created_at"].isoformat() if project["created_at"] else "N/A",
         }
 
         # Generate report
@@ -1228,7 +1197,7 @@ async def get_dashboard_analytics(
 
         # Get phase readiness information
         maturity_calc = MaturityCalculator(project_type=project_type)
-        phase_readiness = get_phase_readiness_status(project, maturity_calc)
+        phase_readiness = get_phase_readiness_status(maturity_scores, maturity_calc)
 
         dashboard = {
             "project_id": project_id,
@@ -1246,7 +1215,7 @@ async def get_dashboard_analytics(
                 "readiness": phase_readiness,
             },
             "advancement_guidance": {
-                "current_phase": getattr(project, "current_phase", "discovery") or "discovery",
+                "current_phase": project.phase or "discovery",
                 "ready_to_advance": any(
                     phase_readiness[ph].get("is_ready_to_advance", False) for ph in phase_readiness
                 ),
@@ -1290,7 +1259,7 @@ async def get_dashboard_analytics(
             ],
             "project_info": {
                 "name": project.name,
-                "phase": project.current_phase,
+                "phase": project.phase,
                 "files_count": len(project.files or []),
                 "notes_count": len(project.notes or []),
             },
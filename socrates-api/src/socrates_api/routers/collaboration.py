@@ -72,25 +72,22 @@ async def _get_active_collaborators(project_id: str) -> list[dict[str, Any]]:
     try:
         connection_manager = get_connection_manager()
 
-        # Get all metadata to find connections for this project
+        # Get all connections for this project
         active_collaborators = []
         seen_users = set()
 
-        # Access the metadata directly (this is a workaround since get_project_connections
-        # requires both user_id and project_id)
-        async with connection_manager._lock:
-            for _connection_id, metadata in connection_manager._metadata.items():
-                if metadata.project_id == project_id and metadata.user_id not in seen_users:
-                    seen_users.add(metadata.user_id)
-                    active_collaborators.append(
-                        {
-                            "username": metadata.user_id,
-                            "status": "online",
-                            "last_activity": metadata.last_message_at or metadata.connected_at,
-                            "connected_at": metadata.connected_at,
-                            "message_count": metadata.message_count,
-                        }
-                    )
+        for metadata in await connection_manager.get_project_connections(None, project_id):
+            if metadata["user_id"] not in seen_users:
+                seen_users.add(metadata["user_id"])
+                active_collaborators.append(
+                    {
+                        "username": metadata["user_id"],
+                        "status": "online",
+                        "last_activity": metadata["last_message_at"] or metadata["connected_at"],
+                        "connected_at": metadata["connected_at"],
+                        "message_count": metadata["message_count"],
+                    }
+                )
 
         logger.debug(
             f"Found {len(active_collaborators)} active collaborators in project {project_id}"
@@ -134,22 +131,11 @@ async def _broadcast_activity(
         }
 
         # Broadcast to all users in the project
-        total_sent = 0
-        async with connection_manager._lock:
-            # Get all users connected to this project
-            users_in_project = set()
-            for user_id, projects in connection_manager._connections.items():
-                if project_id in projects:
-                    users_in_project.add(user_id)
-
-        # Broadcast to each user
-        for user_id in users_in_project:
-            sent_count = await connection_manager.broadcast_to_project(
-                user_id=user_id,
-                project_id=project_id,
-                message=activity_message,
-            )
-            total_sent += sent_count
+        total_sent = await connection_manager.broadcast_to_project(
+            user_id=None,
+            project_id=project_id,
+            message=activity_message,
+        )
 
         if total_sent > 0:
             logger.debug(
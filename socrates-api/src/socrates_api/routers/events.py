@@ -5,12 +5,17 @@ Provides event history and streaming endpoints for tracking API activity.
 """
 
 import asyncio
+import itertools
 import json
 import logging
-from collections import deque
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.responses import StreamingResponse
 
 from socrates_api.auth import get_current_user
@@ -18,42 +23,228 @@ from socrates_api.database import get_database
 from socrates_api.models import APIResponse
 from socratic_system.database import ProjectDatabase
 
+if TYPE_CHECKING:
+    from socratic_system.events import SharedMessageBus
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/events", tags=["events"])
 
-# In-memory event queue (FIFO) - stores last 1000 events
-_event_queue = deque(maxlen=1000)
-_event_subscribers = []  # List of async queues for streaming clients
+# Events are partitioned into topics: "project:<id>" for events about a project,
+# "user:<name>" for a user's other events. Each topic keeps a bounded replay log.
+REPLAY_LOG_SIZE = 200  # Events retained per topic for Last-Event-ID resume
+MAX_TOPICS = 5000  # Least recently written topics are dropped beyond this
+SUBSCRIBER_QUEUE_SIZE = 100
+INITIAL_REPLAY_EVENTS = 20  # Recent events sent to a stream opened without Last-Event-ID
+HEARTBEAT_INTERVAL = 300  # 5 minutes
+
+# Ids start from the clock (in microseconds) so they keep increasing across restarts
+_event_ids = itertools.count(time.time_ns() // 1000)
+_last_event_id = 0  # Newest id issued by this process
+_topic_logs: "OrderedDict[str, deque[dict]]" = OrderedDict()
+_topic_evicted: dict[str, int] = {}  # Topic -> id of the newest event evicted from its log
+_topic_subscribers: dict[str, set["_Subscriber"]] = {}
+_user_subscribers: dict[str, set["_Subscriber"]] = {}
+
+# Message bus channel sequencing events across worker processes
+EVENTS_CHANNEL = "events"
+_bus: "SharedMessageBus | None" = None
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    """An open event stream and the topics it receives."""
+
+    user_id: str
+    topics: set[str]
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+    overflowed: bool = False
+
+
+def project_topic(project_id: str) -> str:
+    """Build the topic name for a project's events."""
+    return f"project:{project_id}"
+
+
+def user_topic(user_id: str) -> str:
+    """Build the topic name for a user's events that are not about a project."""
+    return f"user:{user_id}"
+
+
+def _event_topic(event: dict) -> str | None:
+    project_id = event["data"].get("project_id")
+    if project_id:
+        return project_topic(project_id)
+    if event["user_id"]:
+        return user_topic(event["user_id"])
+    return None
+
+
+def _parse_event_id(value: str | None) -> int | None:
+    """Parse a Last-Event-ID value (also accepts the legacy ``evt_<n>`` form)."""
+    if not value:
+        return None
+    try:
+        return int(value.strip().removeprefix("evt_"))
+    except ValueError:
+        return None
+
+
+def _subscribe(subscriber: _Subscriber) -> None:
+    for topic in subscriber.topics:
+        _topic_subscribers.setdefault(topic, set()).add(subscriber)
+    _user_subscribers.setdefault(subscriber.user_id, set()).add(subscriber)
+
+
+def _unsubscribe(subscriber: _Subscriber) -> None:
+    for topic in subscriber.topics:
+        subscribers = _topic_subscribers.get(topic)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del _topic_subscribers[topic]
+    subscribers = _user_subscribers.get(subscriber.user_id)
+    if subscribers is not None:
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del _user_subscribers[subscriber.user_id]
+
+
+def attach_bus(bus: "SharedMessageBus") -> None:
+    """
+    Record events through a message bus shared by all worker processes.
+
+    Every worker, including the recording one, delivers an event once the bus
+    has stored it, and the bus message id becomes the event id. Event ids are
+    therefore the same on every worker, and a stream can resume on any of them.
+
+    Args:
+        bus: Message bus shared by all API worker processes
+    """
+    global _bus
+    _bus = bus
+    bus.subscribe(EVENTS_CHANNEL, _deliver_shared, include_own=True)
 
 
-# Note: get_database is imported from socrates_api.database (centralized singleton)
+def _deliver_shared(message_id: int, event: dict) -> None:
+    event["id"] = message_id
+    _deliver(event, _event_topic(event))
 
 
 def record_event(event_type: str, data: dict = None, user_id: str = None) -> None:
     """
-    Record an event to the in-memory event queue.
+    Record an event and deliver it to the streams subscribed to its topic.
+
+    Events carrying a ``project_id`` go to the project's topic, others to the
+    user's topic. Streams of the acting user join the project's topic, so
+    projects created after a stream opened are still delivered to it. With a
+    message bus attached, delivery happens once the bus has stored the event.
 
     Args:
         event_type: Type of event (e.g., 'project_created', 'code_generated')
         data: Event data as dictionary
         user_id: User who triggered the event
     """
+    global _last_event_id
     event = {
-        "id": f"evt_{len(_event_queue)}",
+        "id": None,
         "type": event_type,
         "timestamp": datetime.now(UTC).isoformat(),
         "user_id": user_id,
         "data": data or {},
     }
-    _event_queue.append(event)
+    topic = _event_topic(event)
+    if topic is None:
+        logger.debug(f"Event recorded without a topic: {event_type}")
+        return
+
+    if _bus is not None:
+        _bus.publish(EVENTS_CHANNEL, event)
+    else:
+        event["id"] = _last_event_id = next(_event_ids)
+        _deliver(event, topic)
     logger.info(f"Event recorded: {event_type}")
 
-    # Notify all streaming subscribers
-    for subscriber_queue in _event_subscribers[:]:
+
+def _deliver(event: dict, topic: str) -> None:
+    """Append an event to its topic's replay log and queue it for subscribed streams."""
+    user_id = event["user_id"]
+    log = _topic_logs.get(topic)
+    if log is None:
+        log = _topic_logs[topic] = deque(maxlen=REPLAY_LOG_SIZE)
+        if len(_topic_logs) > MAX_TOPICS:
+            dropped, _ = _topic_logs.popitem(last=False)
+            _topic_evicted.pop(dropped, None)
+    else:
+        _topic_logs.move_to_end(topic)
+        if len(log) == log.maxlen:
+            _topic_evicted[topic] = log[0]["id"]
+    log.append(event)
+
+    for subscriber in _user_subscribers.get(user_id, ()):
+        if topic not in subscriber.topics:
+            subscriber.topics.add(topic)
+            _topic_subscribers.setdefault(topic, set()).add(subscriber)
+
+    for subscriber in list(_topic_subscribers.get(topic, ())):
         try:
-            subscriber_queue.put_nowait(event)
+            subscriber.queue.put_nowait(event)
         except asyncio.QueueFull:
-            _event_subscribers.remove(subscriber_queue)
+            # The stream ends once drained; the client resumes via Last-Event-ID
+            subscriber.overflowed = True
+            _unsubscribe(subscriber)
+
+
+def get_events(
+    topics: Iterable[str], after_id: int | None = None, limit: int | None = None
+) -> tuple[list[dict], bool]:
+    """
+    Get retained events for the given topics, oldest first.
+
+    Args:
+        topics: Topics to read
+        after_id: Only return events with a greater id
+        limit: Return at most this many of the most recent events
+
+    Returns:
+        Tuple of (events, complete). ``complete`` is False when events after
+        ``after_id`` have already been evicted from a topic's replay log.
+    """
+    events = []
+    complete = True
+    for topic in topics:
+        log = _topic_logs.get(topic)
+        if not log:
+            continue
+        if after_id is None:
+            events.extend(log)
+            continue
+        if _topic_evicted.get(topic, 0) > after_id:
+            complete = False
+        events.extend(event for event in log if event["id"] > after_id)
+
+    events.sort(key=lambda event: event["id"])
+    if limit is not None:
+        events = events[-limit:] if limit else []
+    return events, complete
+
+
+def _newest_event_id() -> int:
+    """Id of the newest event recorded so far, by any worker when a bus is attached."""
+    if _bus is not None:
+        return _bus.latest_id()
+    return _last_event_id
+
+
+def _user_topics(current_user: str, db: ProjectDatabase) -> set[str]:
+    """Topics visible to a user: their own and those of their projects."""
+    projects = db.get_user_projects(current_user, include_archived=True)
+    return {user_topic(current_user)} | {project_topic(p.project_id) for p in projects}
+
+
+def _format_sse(event: dict) -> str:
+    return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
 
 
 @router.get(
@@ -73,7 +264,7 @@ async def get_event_history(
     db: ProjectDatabase = Depends(get_database),
 ):
     """
-    Get historical events from the API.
+    Get historical events visible to the current user.
 
     Args:
         limit: Maximum number of events to return (default: 100)
@@ -87,8 +278,8 @@ async def get_event_history(
     try:
         logger.info(f"Getting event history: limit={limit}, offset={offset}, type={event_type}")
 
-        # Get events from in-memory queue
-        all_events = list(_event_queue)
+        # Only events from the user's own and project topics
+        all_events, _ = get_events(_user_topics(current_user, db))
 
         # Filter by type if specified
         if event_type:
@@ -133,50 +324,79 @@ async def get_event_history(
     },
 )
 async def stream_events(
+    last_event_id: str | None = Header(default=None),
     current_user: str = Depends(get_current_user),
     db: ProjectDatabase = Depends(get_database),
 ):
     """
-    Stream events as they occur (Server-Sent Events).
+    Stream the user's events as they occur (Server-Sent Events).
+
+    Only events from the user's own topic and their projects' topics are sent.
+    Each event carries its id, so a reconnecting client (which sends the
+    ``Last-Event-ID`` header) resumes from the replay logs without gaps. If
+    the logs no longer reach back that far, a ``replay_truncated`` event is
+    sent first. So is it when the id is newer than any recorded event (the
+    sequence was reset), and the stream then starts over from the retained
+    events.
 
     Args:
+        last_event_id: Id of the last event the client received
         db: Database connection
 
     Returns:
         StreamingResponse with server-sent events
     """
     try:
-        logger.info("Starting event stream")
+        logger.info(f"Starting event stream for {current_user}")
+        subscriber = _Subscriber(current_user, _user_topics(current_user, db))
+        after_id = _parse_event_id(last_event_id)
 
         async def event_generator():
-            # Create a queue for this subscriber
-            subscriber_queue = asyncio.Queue(maxsize=100)
-            _event_subscribers.append(subscriber_queue)
+            # An id newer than any recorded event predates a reset of the id sequence
+            reset = after_id is not None and after_id > await asyncio.to_thread(_newest_event_id)
+
+            # Subscribe before reading the replay logs so no event falls in between
+            _subscribe(subscriber)
+            if reset:
+                replay, complete = get_events(subscriber.topics)[0], False
+            elif after_id is None:
+                replay, complete = get_events(subscriber.topics, limit=INITIAL_REPLAY_EVENTS)
+            else:
+                replay, complete = get_events(subscriber.topics, after_id)
 
             try:
                 # Send connection acknowledgment
                 yield f"data: {json.dumps({'type': 'connected', 'message': 'Connected to event stream'})}\n\n"
 
-                # Stream existing events first
-                for event in list(_event_queue)[-20:]:  # Last 20 events
-                    yield f"data: {json.dumps(event)}\n\n"
-                    await asyncio.sleep(0.01)  # Small delay between events
+                if not complete:
+                    yield f"data: {json.dumps({'type': 'replay_truncated'})}\n\n"
+
+                last_sent = 0 if reset else after_id or 0
+                for event in replay:
+                    yield _format_sse(event)
+                    last_sent = event["id"]
 
                 # Stream new events as they come
                 while True:
+                    if subscriber.overflowed and subscriber.queue.empty():
+                        logger.warning(f"Event stream for {current_user} fell behind")
+                        break
                     try:
                         # Wait for new event (5 minute timeout)
-                        event = await asyncio.wait_for(subscriber_queue.get(), timeout=300)
-                        yield f"data: {json.dumps(event)}\n\n"
+                        event = await asyncio.wait_for(
+                            subscriber.queue.get(), timeout=HEARTBEAT_INTERVAL
+                        )
                     except TimeoutError:
                         # Keep connection alive with heartbeat
                         yield ": heartbeat\n\n"
+                        continue
                     except asyncio.CancelledError:
                         break
+                    if event["id"] > last_sent:
+                        yield _format_sse(event)
+                        last_sent = event["id"]
             finally:
-                # Clean up subscriber
-                if subscriber_queue in _event_subscribers:
-                    _event_subscribers.remove(subscriber_queue)
+                _unsubscribe(subscriber)
                 logger.info("Event stream closed")
 
         return StreamingResponse(
@@ -13,6 +13,7 @@ from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, UploadF
 from fastapi.responses import FileResponse
 
 from socrates_api.auth import get_current_user
+from socrates_api.caching import cached_endpoint
 from socrates_api.database import get_database
 from socrates_api.models import APIResponse, BulkImportData, ErrorResponse
 from socratic_system.database import ProjectDatabase
@@ -171,6 +172,7 @@ async def list_documents(
     status_code=status.HTTP_200_OK,
     summary="Get all knowledge sources (PDFs, Notes, GitHub repos)",
 )
+@cached_endpoint("knowledge_sources:{project_id}:{current_user}")
 async def get_all_knowledge_sources(
     project_id: str,
     current_user: str = Depends(get_current_user),
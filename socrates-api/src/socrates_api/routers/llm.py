@@ -139,9 +139,9 @@ async def set_model(
             try:
                 encrypted_key = db.get_api_key(current_user, request.provider)
                 if encrypted_key:
-                    from socratic_system.encryption import decrypt_data
+                    from socratic_system.encryption import decrypt_credential
 
-                    api_key = decrypt_data(encrypted_key)
+                    api_key = decrypt_credential(encrypted_key)
             except Exception as e:
                 logger.debug(f"Could not fetch/decrypt API key for {request.provider}: {e}")
 
@@ -354,23 +354,44 @@ async def get_models(provider: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def format_usage_stats(summary: dict, period: str) -> dict:
+    """
+    Shape a ProjectDatabase.get_usage_summary() result as the usage stats response.
+
+    Args:
+        summary: Usage summary read from the rollups
+        period: Label of the reported period (e.g. "month" or "30 days")
+
+    Returns:
+        Dict with total_requests, total_tokens {input, output}, by_provider,
+        by_model, daily and cost_summary {estimated, period}
+    """
+    return {
+        "total_requests": summary["requests"],
+        "total_tokens": {
+            "input": summary["input_tokens"],
+            "output": summary["output_tokens"],
+        },
+        "by_provider": summary["by_provider"],
+        "by_model": summary["by_model"],
+        "daily": summary["daily"],
+        "cost_summary": {
+            "estimated": round(summary["total_cost"], 4),
+            "period": period,
+        },
+    }
+
+
 @router.get("/usage-stats", response_model=APIResponse)
-async def get_stats(time_period: str = "month", current_user: str = Depends(get_current_user)):
+async def get_stats(
+    time_period: str = "month",
+    current_user: str = Depends(get_current_user),
+    db: "ProjectDatabase" = Depends(get_database),
+):
     try:
-        from socrates_api.main import get_orchestrator
-
-        orchestrator = get_orchestrator()
         days = 30 if time_period == "month" else 7 if time_period == "week" else 1
-        result = await orchestrator.agent_bus.send_request(
-            "multi_llm_manager",
-            {"action": "get_usage_stats", "user_id": current_user, "days": days},
-        )
-        if result.get("status") != "success":
-            raise HTTPException(status_code=500, detail=result.get("message", "Failed"))
-        return APIResponse(
-            success=True, status="success", message="Stats", data=result.get("data", result)
-        )
-    except HTTPException:
-        raise
+        # Read from the hourly/daily rollups rather than the raw usage records
+        stats = format_usage_stats(db.get_usage_summary(current_user, days), time_period)
+        return APIResponse(success=True, status="success", message="Stats", data=stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
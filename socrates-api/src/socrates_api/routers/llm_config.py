@@ -9,7 +9,9 @@ import logging
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 
 from socrates_api.auth import get_current_user
+from socrates_api.database import ProjectDatabase, get_database
 from socrates_api.models import APIResponse
+from socrates_api.routers.llm import format_usage_stats
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/llm-config", tags=["llm-config"])
@@ -352,42 +354,32 @@ async def get_api_key_status(
 async def get_usage_stats(
     days: int = 30,
     current_user: str = Depends(get_current_user),
+    db: ProjectDatabase = Depends(get_database),
 ):
     """
     Get LLM usage statistics for the user.
 
+    Statistics are read from the hourly and daily usage rollups, so the cost
+    of the request depends on the number of days rather than on call volume.
+
     Args:
         days: Number of days to include in stats (default: 30)
         current_user: Authenticated user
+        db: Database connection
 
     Returns:
         SuccessResponse with usage statistics
     """
     try:
-        from socrates_api.main import get_orchestrator
-
         logger.info(f"Getting usage stats for user: {current_user}")
 
-        orchestrator = get_orchestrator()
-        result = await orchestrator.agent_bus.send_request(
-            "multi_llm_manager",
-            {"action": "get_usage_stats", "user_id": current_user, "days": days},
-        )
-
-        if result["status"] != "success":
-            raise HTTPException(
-                status_code=500, detail=result.get("message", "Failed to get stats")
-            )
-
         return APIResponse(
             success=True,
             status="success",
             message="Usage statistics",
-            data=result.get("data", result),
+            data=format_usage_stats(db.get_usage_summary(current_user, days), f"{days} days"),
         )
 
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Error getting usage stats: {str(e)}")
         raise HTTPException(
@@ -41,6 +41,7 @@ from socrates_api.auth import (
 from socrates_api.auth.project_access import (
     check_project_access,
 )
+from socrates_api.caching import cached_endpoint
 from socrates_api.database import get_database
 from socrates_api.middleware import SubscriptionChecker
 from socrates_api.models import (
@@ -808,6 +809,7 @@ async def restore_project(
         404: {"description": "Project not found", "model": ErrorResponse},
     },
 )
+@cached_endpoint("project_stats:{project_id}:{current_user}")
 async def get_project_stats(
     project_id: str,
     current_user: str = Depends(get_current_user),
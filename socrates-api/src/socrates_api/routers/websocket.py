@@ -14,7 +14,8 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 
-from socrates_api.auth import get_current_user
+from socrates_api.auth import get_current_user, verify_access_token
+from socrates_api.auth.project_access import check_project_access
 from socrates_api.database import get_database
 from socrates_api.models import APIResponse
 from socrates_api.websocket import (
@@ -29,6 +30,44 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="", tags=["websocket"])
 
 
+async def _authenticate_websocket(
+    websocket: WebSocket,
+    project_id: str,
+    token: str | None,
+    db: ProjectDatabase,
+    min_role: str = "viewer",
+) -> str | None:
+    """
+    Verify the JWT token query parameter and the user's access to the project.
+
+    The connection is closed with a policy-violation code when the token is
+    missing or invalid, or when the user lacks the required project role.
+
+    Args:
+        websocket: FastAPI WebSocket connection (not yet accepted)
+        project_id: Project identifier
+        token: JWT access token from the query string
+        db: Database connection
+        min_role: Minimum required project role
+
+    Returns:
+        Authenticated user ID, or None if the connection was rejected
+    """
+    payload = verify_access_token(token) if token else None
+    user_id = payload.get("sub") if payload else None
+    if not user_id:
+        await websocket.close(code=1008, reason="Invalid or expired token")
+        return None
+
+    try:
+        await check_project_access(project_id, user_id, db, min_role=min_role)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return None
+
+    return user_id
+
+
 @router.websocket("/ws/chat/{project_id}")
 async def websocket_chat_endpoint(
     websocket: WebSocket,
@@ -69,15 +108,16 @@ async def websocket_chat_endpoint(
     db = get_database()
 
     try:
-        # Verify user (token would be extracted from query params in real implementation)
-        # For now, we'll accept the connection and verify inside
-        user_id = None  # Would be extracted from token
+        # Chat messages drive the agents, so editing rights are required
+        user_id = await _authenticate_websocket(websocket, project_id, token, db, min_role="editor")
+        if user_id is None:
+            return
 
         # Accept connection
         try:
             await connection_manager.connect(
                 websocket,
-                user_id or "anonymous",
+                user_id,
                 project_id,
                 connection_id,
             )
@@ -124,7 +164,7 @@ async def websocket_chat_endpoint(
                     # Process chat message
                     response = await _handle_chat_message(
                         message,
-                        user_id or "anonymous",
+                        user_id,
                         project_id,
                         connection_id,
                         db,
@@ -142,7 +182,7 @@ async def websocket_chat_endpoint(
                     # Process command
                     response = await _handle_command(
                         message,
-                        user_id or "anonymous",
+                        user_id,
                         project_id,
                         connection_id,
                         db,
@@ -1223,16 +1263,16 @@ async def websocket_collaboration_endpoint(
     Args:
         websocket: FastAPI WebSocket connection
         project_id: Project identifier
-        token: JWT token for authentication (optional)
+        token: JWT token for authentication
     """
     connection_id = str(uuid.uuid4())
     connection_manager = get_connection_manager()
     db = get_database()
 
     try:
-        # Note: In production, would extract and verify user from token
-        # For now, using connection_id as identifier
-        user_id = connection_id
+        user_id = await _authenticate_websocket(websocket, project_id, token, db)
+        if user_id is None:
+            return
 
         # Accept connection
         try:
@@ -1261,6 +1301,7 @@ async def websocket_collaboration_endpoint(
 
         # Broadcast user joined event to other collaborators
         await connection_manager.broadcast_to_project(
+            None,
             project_id,
             {
                 "type": "user_joined",
@@ -1268,7 +1309,7 @@ async def websocket_collaboration_endpoint(
                 "timestamp": datetime.now(UTC).isoformat(),
                 "connection_id": connection_id,
             },
-            exclude_connection=connection_id,
+            exclude_connection_id=connection_id,
         )
 
         # Main message loop
@@ -1311,6 +1352,7 @@ async def websocket_collaboration_endpoint(
 
                     # Broadcast activity to all collaborators
                     await connection_manager.broadcast_to_project(
+                        None,
                         project_id,
                         {
                             "type": "activity",
@@ -1327,6 +1369,7 @@ async def websocket_collaboration_endpoint(
 
                     # Broadcast typing indicator to all collaborators
                     await connection_manager.broadcast_to_project(
+                        None,
                         project_id,
                         {
                             "type": "typing",
@@ -1334,12 +1377,15 @@ async def websocket_collaboration_endpoint(
                             "typing": is_typing,
                             "timestamp": datetime.now(UTC).isoformat(),
                         },
-                        exclude_connection=connection_id,
+                        exclude_connection_id=connection_id,
                     )
 
                 else:
                     logger.debug(f"Unknown message type: {message_type}")
 
+            except WebSocketDisconnect:
+                # Leave the message loop; handled below
+                raise
             except json.JSONDecodeError as json_error:
                 logger.warning(f"Invalid JSON received from {user_id}: {str(json_error)}")
                 # Send error response to client
@@ -1379,6 +1425,7 @@ async def websocket_collaboration_endpoint(
         # Broadcast user left event
         try:
             await connection_manager.broadcast_to_project(
+                None,
                 project_id,
                 {
                     "type": "user_left",
@@ -1394,7 +1441,7 @@ async def websocket_collaboration_endpoint(
 
         # Remove connection
         try:
-            await connection_manager.disconnect(websocket, user_id, project_id, connection_id)
+            await connection_manager.disconnect(connection_id)
         except Exception as disconnect_error:
             logger.error(f"Error during disconnect cleanup: {str(disconnect_error)}", exc_info=True)
 
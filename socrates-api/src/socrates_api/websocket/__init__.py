@@ -3,6 +3,7 @@
 from .connection_manager import (
     ConnectionManager,
     ConnectionMetadata,
+    SlowConsumerPolicy,
     get_connection_manager,
 )
 from .event_bridge import EventBridge, get_event_bridge
@@ -19,6 +20,7 @@ __all__ = [
     "ConnectionManager",
     "get_connection_manager",
     "ConnectionMetadata",
+    "SlowConsumerPolicy",
     "MessageHandler",
     "get_message_handler",
     "MessageType",
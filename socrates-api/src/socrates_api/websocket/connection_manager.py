@@ -2,9 +2,11 @@
 WebSocket Connection Manager - Manages active WebSocket connections.
 
 Handles:
-- Per-user, per-project connection pooling
+- Per-project and per-user subscriber indexes
 - Connection lifecycle (connect, disconnect)
 - Broadcasting messages to specific users/projects
+- Slow-consumer detection via bounded per-connection outbound queues
+- Fan-out to connections held by other worker processes through a shared message bus
 - Connection tracking and statistics
 """
 
@@ -13,12 +15,35 @@ import json
 import logging
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import Any
+from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
+if TYPE_CHECKING:
+    from socratic_system.events import SharedMessageBus
+
 logger = logging.getLogger(__name__)
 
+# Messages buffered per connection before it is treated as a slow consumer
+OUTBOUND_QUEUE_SIZE = 100
+
+# Seconds a single send may take before the connection is treated as stalled
+SEND_TIMEOUT_SECONDS = 10.0
+
+# Close code sent to evicted slow consumers ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Message bus channel carrying broadcasts to the connections of other workers
+BROADCAST_CHANNEL = "websocket.broadcast"
+
+
+class SlowConsumerPolicy(Enum):
+    """What to do when a connection's outbound queue is full."""
+
+    DROP = "drop"  # Drop the message for that connection only
+    DISCONNECT = "disconnect"  # Close the connection so the client reconnects and resyncs
+
 
 @dataclass
 class ConnectionMetadata:
@@ -30,6 +55,17 @@ class ConnectionMetadata:
     connected_at: str
     last_message_at: str | None = None
     message_count: int = 0
+    dropped_messages: int = 0
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    """A registered connection with its outbound queue and sender task."""
+
+    websocket: WebSocket
+    metadata: ConnectionMetadata
+    queue: asyncio.Queue
+    sender: asyncio.Task | None = None
 
 
 class ConnectionManager:
@@ -37,25 +73,46 @@ class ConnectionManager:
     Manages WebSocket connections for real-time chat and events.
 
     Architecture:
-    - Per-user connection pool: {user_id → {project_id → set(WebSocket)}}
-    - Metadata tracking: {connection_id → ConnectionMetadata}
-    - Thread-safe concurrent access
+    - Subscribers: {connection_id → _Subscriber}
+    - Indexes: {project_id → set(connection_id)} and {user_id → set(connection_id)}
+    - Each connection has a bounded outbound queue drained by its own sender
+      task, so broadcasts serialize a message once, enqueue it for every
+      recipient and never wait on a slow client
+    - With a message bus attached, every broadcast is also published to the
+      other worker processes, which deliver it to their own connections
     """
 
-    def __init__(self):
-        """Initialize connection manager."""
-        # Structure: user_id → project_id → set of WebSocket connections
-        self._connections: dict[str, dict[str, set[WebSocket]]] = {}
+    def __init__(
+        self,
+        queue_size: int = OUTBOUND_QUEUE_SIZE,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DISCONNECT,
+        send_timeout: float = SEND_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize connection manager.
 
-        # Metadata tracking
-        self._metadata: dict[str, ConnectionMetadata] = {}
+        Args:
+            queue_size: Messages buffered per connection
+            slow_consumer_policy: Policy applied when a connection's queue is full
+            send_timeout: Seconds a single send may take before the connection is dropped
+        """
+        self._subscribers: dict[str, _Subscriber] = {}
+        self._by_project: dict[str, set[str]] = {}
+        self._by_user: dict[str, set[str]] = {}
 
-        # Lock for thread-safe access
+        # Lock for connection registration and removal
         self._lock = asyncio.Lock()
 
         # Configuration
         self._max_connections_per_project = 100
         self._connection_timeout_seconds = 3600  # 1 hour
+        self._queue_size = queue_size
+        self._slow_consumer_policy = slow_consumer_policy
+        self._send_timeout = send_timeout
+
+        self._stats = {"dropped_messages": 0, "slow_consumer_disconnects": 0}
+        self._closing: set[asyncio.Task] = set()
+        self._bus: SharedMessageBus | None = None
 
         logger.info("ConnectionManager initialized")
 
@@ -81,39 +138,150 @@ class ConnectionManager:
         await websocket.accept()
 
         async with self._lock:
-            # Ensure user entry exists
-            if user_id not in self._connections:
-                self._connections[user_id] = {}
-
-            # Ensure project entry exists
-            if project_id not in self._connections[user_id]:
-                self._connections[user_id][project_id] = set()
-
-            # Check connection limit
-            project_connections = self._connections[user_id][project_id]
-            if len(project_connections) >= self._max_connections_per_project:
+            # Check connection limit (per user, per project)
+            user_connections = sum(
+                1
+                for cid in self._by_project.get(project_id, ())
+                if self._subscribers[cid].metadata.user_id == user_id
+            )
+            if user_connections >= self._max_connections_per_project:
                 logger.warning(
                     f"Max connections ({self._max_connections_per_project}) reached "
                     f"for project {project_id}"
                 )
                 raise RuntimeError("Max connections for project exceeded")
 
-            # Add connection
-            project_connections.add(websocket)
-
-            # Store metadata
-            self._metadata[connection_id] = ConnectionMetadata(
-                connection_id=connection_id,
-                user_id=user_id,
-                project_id=project_id,
-                connected_at=datetime.now(UTC).isoformat(),
+            subscriber = _Subscriber(
+                websocket=websocket,
+                metadata=ConnectionMetadata(
+                    connection_id=connection_id,
+                    user_id=user_id,
+                    project_id=project_id,
+                    connected_at=datetime.now(UTC).isoformat(),
+                ),
+                queue=asyncio.Queue(self._queue_size),
             )
+            subscriber.sender = asyncio.create_task(self._send_loop(subscriber))
+            self._subscribers[connection_id] = subscriber
+            self._by_project.setdefault(project_id, set()).add(connection_id)
+            self._by_user.setdefault(user_id, set()).add(connection_id)
 
             logger.info(
                 f"Connection established: {connection_id} "
                 f"for user {user_id} on project {project_id}"
             )
 
+    def _remove(self, connection_id: str) -> _Subscriber | None:
+        """Unregister a connection and stop its sender (no awaits, so no lock needed)."""
+        subscriber = self._subscribers.pop(connection_id, None)
+        if subscriber is None:
+            return None
+
+        metadata = subscriber.metadata
+        for index, key in (
+            (self._by_project, metadata.project_id),
+            (self._by_user, metadata.user_id),
+        ):
+            connection_ids = index.get(key)
+            if connection_ids is not None:
+                connection_ids.discard(connection_id)
+                if not connection_ids:
+                    del index[key]
+
+        if subscriber.sender is not None and subscriber.sender is not asyncio.current_task():
+            subscriber.sender.cancel()
+        return subscriber
+
+    def _close_later(self, subscriber: _Subscriber, code: int, reason: str) -> None:
+        """Close a removed connection in the background."""
+
+        async def close():
+            try:
+                await subscriber.websocket.close(code=code, reason=reason)
+            except Exception as e:
+                logger.debug(f"Error closing connection {subscriber.metadata.connection_id}: {e}")
+
+        task = asyncio.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _send_loop(self, subscriber: _Subscriber) -> None:
+        """Drain a connection's outbound queue; drop the connection if a send fails or stalls."""
+        metadata = subscriber.metadata
+        try:
+            while True:
+                message_json = await subscriber.queue.get()
+                await asyncio.wait_for(
+                    subscriber.websocket.send_text(message_json), self._send_timeout
+                )
+                metadata.message_count += 1
+                metadata.last_message_at = datetime.now(UTC).isoformat()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send message to connection {metadata.connection_id}: {e}")
+            if self._remove(metadata.connection_id) is not None:
+                self._close_later(subscriber, SLOW_CONSUMER_CLOSE_CODE, "Send failed")
+
+    def _enqueue(self, connection_ids, message_json: str, exclude_connection_id: str | None) -> int:
+        """Queue a serialized message for each connection, applying the slow-consumer policy."""
+        queued = 0
+        for connection_id in list(connection_ids):
+            if connection_id == exclude_connection_id:
+                continue
+            subscriber = self._subscribers.get(connection_id)
+            if subscriber is None:
+                continue
+            try:
+                subscriber.queue.put_nowait(message_json)
+                queued += 1
+            except asyncio.QueueFull:
+                subscriber.metadata.dropped_messages += 1
+                self._stats["dropped_messages"] += 1
+                if self._slow_consumer_policy == SlowConsumerPolicy.DISCONNECT:
+                    logger.warning(f"Disconnecting slow consumer: {connection_id}")
+                    self._stats["slow_consumer_disconnects"] += 1
+                    self._remove(connection_id)
+                    self._close_later(subscriber, SLOW_CONSUMER_CLOSE_CODE, "Slow consumer")
+        return queued
+
+    def attach_bus(self, bus: "SharedMessageBus") -> None:
+        """
+        Share broadcasts with other worker processes through a message bus.
+
+        Args:
+            bus: Message bus shared by all API worker processes
+        """
+        self._bus = bus
+        bus.subscribe(BROADCAST_CHANNEL, self._deliver_remote)
+
+    def _publish(self, target: str, message_json: str, **scope: str | None) -> None:
+        """Publish a serialized broadcast for the connections of other workers."""
+        if self._bus is not None:
+            self._bus.publish(
+                BROADCAST_CHANNEL, {"target": target, "message": message_json, **scope}
+            )
+
+    def _deliver_remote(self, _message_id: int, broadcast: dict[str, Any]) -> int:
+        """Queue a broadcast published by another worker for local connections."""
+        target = broadcast["target"]
+        if target == "project":
+            connection_ids = self._project_recipients(
+                broadcast.get("user_id"), broadcast["project_id"]
+            )
+        elif target == "user":
+            connection_ids = self._by_user.get(broadcast["user_id"], ())
+        else:
+            connection_ids = self._subscribers
+        return self._enqueue(connection_ids, broadcast["message"], broadcast.get("exclude"))
+
+    def _project_recipients(self, user_id: str | None, project_id: str) -> set[str]:
+        """Connection IDs subscribed to a project, optionally only a user's."""
+        connection_ids = self._by_project.get(project_id) or set()
+        if user_id is not None and connection_ids:
+            connection_ids = connection_ids & self._by_user.get(user_id, set())
+        return connection_ids
+
     async def disconnect(self, connection_id: str) -> tuple[str, str] | None:
         """
         Remove a WebSocket connection.
@@ -125,31 +293,16 @@ class ConnectionManager:
             Tuple of (user_id, project_id) if found, None otherwise
         """
         async with self._lock:
-            if connection_id not in self._metadata:
+            subscriber = self._remove(connection_id)
+            if subscriber is None:
                 return None
 
-            metadata = self._metadata[connection_id]
-            user_id = metadata.user_id
-            project_id = metadata.project_id
-
-            # Remove connection
-            if user_id in self._connections:
-                if project_id in self._connections[user_id]:
-                    # Find and remove the WebSocket
-                    self._connections[user_id][project_id]
-                    # Since we store the WebSocket directly, we need to search
-                    # In practice, we'd store websocket with connection_id mapping
-
-                    logger.info(f"Connection disconnected: {connection_id}")
-
-            # Remove metadata
-            del self._metadata[connection_id]
-
-            return (user_id, project_id)
+            logger.info(f"Connection disconnected: {connection_id}")
+            return (subscriber.metadata.user_id, subscriber.metadata.project_id)
 
     async def broadcast_to_project(
         self,
-        user_id: str,
+        user_id: str | None,
         project_id: str,
         message: dict[str, Any],
         exclude_connection_id: str | None = None,
@@ -157,56 +310,32 @@ class ConnectionManager:
         """
         Broadcast a message to all connections in a project.
 
+        Messages are queued for each connection and sent concurrently by the
+        connections' sender tasks.
+
         Args:
-            user_id: User identifier
+            user_id: Only send to this user's connections (None for every subscriber)
             project_id: Project identifier
             message: Message payload
             exclude_connection_id: Optional connection to exclude from broadcast
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
         message_json = json.dumps(message)
-        sent_count = 0
-        failed_connections = []
-
-        async with self._lock:
-            if user_id not in self._connections:
-                return 0
-
-            if project_id not in self._connections[user_id]:
-                return 0
-
-            connections = self._connections[user_id][project_id].copy()
-
-        # Send outside lock to avoid deadlocks
-        for connection in connections:
-            try:
-                # Check exclusion
-                # Note: In production, would need to map WebSocket to connection_id
-                await connection.send_text(message_json)
-                sent_count += 1
-
-                # Update metadata
-                async with self._lock:
-                    for cid, metadata in self._metadata.items():
-                        if metadata.user_id == user_id and metadata.project_id == project_id:
-                            if cid != exclude_connection_id:
-                                metadata.last_message_at = datetime.now(UTC).isoformat()
-                                metadata.message_count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to send message to connection: {e}")
-                failed_connections.append(connection)
-
-        # Clean up failed connections
-        if failed_connections:
-            async with self._lock:
-                if user_id in self._connections and project_id in self._connections[user_id]:
-                    for conn in failed_connections:
-                        self._connections[user_id][project_id].discard(conn)
-
-        return sent_count
+        self._publish(
+            "project",
+            message_json,
+            user_id=user_id,
+            project_id=project_id,
+            exclude=exclude_connection_id,
+        )
+
+        # Index lookups and enqueueing don't await, so no lock is needed
+        connection_ids = self._project_recipients(user_id, project_id)
+        if not connection_ids:
+            return 0
+        return self._enqueue(connection_ids, message_json, exclude_connection_id)
 
     async def broadcast_to_user(
         self,
@@ -221,29 +350,15 @@ class ConnectionManager:
             message: Message payload
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
         message_json = json.dumps(message)
-        sent_count = 0
-
-        async with self._lock:
-            if user_id not in self._connections:
-                return 0
-
-            # Collect all connections for this user
-            all_connections = []
-            for project_connections in self._connections[user_id].values():
-                all_connections.extend(project_connections)
+        self._publish("user", message_json, user_id=user_id)
 
-        # Send outside lock
-        for connection in all_connections:
-            try:
-                await connection.send_text(message_json)
-                sent_count += 1
-            except Exception as e:
-                logger.error(f"Failed to send message to user connection: {e}")
-
-        return sent_count
+        connection_ids = self._by_user.get(user_id)
+        if not connection_ids:
+            return 0
+        return self._enqueue(connection_ids, message_json, None)
 
     async def broadcast_to_all(
         self,
@@ -256,26 +371,14 @@ class ConnectionManager:
             message: Message payload
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
         message_json = json.dumps(message)
-        sent_count = 0
+        self._publish("all", message_json)
 
-        async with self._lock:
-            all_connections = []
-            for user_connections in self._connections.values():
-                for project_connections in user_connections.values():
-                    all_connections.extend(project_connections)
-
-        # Send outside lock
-        for connection in all_connections:
-            try:
-                await connection.send_text(message_json)
-                sent_count += 1
-            except Exception as e:
-                logger.error(f"Failed to send message to connection: {e}")
-
-        return sent_count
+        if not self._subscribers:
+            return 0
+        return self._enqueue(self._subscribers, message_json, None)
 
     async def get_connection_metadata(self, connection_id: str) -> dict[str, Any] | None:
         """
@@ -287,32 +390,30 @@ class ConnectionManager:
         Returns:
             Metadata dict or None if not found
         """
-        async with self._lock:
-            if connection_id in self._metadata:
-                return asdict(self._metadata[connection_id])
-            return None
+        subscriber = self._subscribers.get(connection_id)
+        return asdict(subscriber.metadata) if subscriber else None
 
     async def get_project_connections(
         self,
-        user_id: str,
+        user_id: str | None,
         project_id: str,
     ) -> list[dict[str, Any]]:
         """
         Get all active connections for a project.
 
         Args:
-            user_id: User identifier
+            user_id: Only include this user's connections (None for every subscriber)
             project_id: Project identifier
 
         Returns:
             List of connection metadata
         """
-        async with self._lock:
-            connections = []
-            for _cid, metadata in self._metadata.items():
-                if metadata.user_id == user_id and metadata.project_id == project_id:
-                    connections.append(asdict(metadata))
-            return connections
+        connections = []
+        for cid in self._by_project.get(project_id, ()):
+            metadata = self._subscribers[cid].metadata
+            if user_id is None or metadata.user_id == user_id:
+                connections.append(asdict(metadata))
+        return connections
 
     async def get_user_statistics(self, user_id: str) -> dict[str, Any]:
         """
@@ -324,39 +425,20 @@ class ConnectionManager:
         Returns:
             Statistics dictionary
         """
-        async with self._lock:
-            projects = {}
-            total_connections = 0
-            total_messages = 0
-
-            if user_id in self._connections:
-                for project_id, conns in self._connections[user_id].items():
-                    project_conns = len(conns)
-                    total_connections += project_conns
-
-                    # Count messages for this project
-                    project_messages = sum(
-                        self._metadata[cid].message_count
-                        for cid in self._metadata
-                        if (
-                            self._metadata[cid].user_id == user_id
-                            and self._metadata[cid].project_id == project_id
-                        )
-                    )
-                    total_messages += project_messages
-
-                    projects[project_id] = {
-                        "connections": project_conns,
-                        "messages": project_messages,
-                    }
-
-            return {
-                "user_id": user_id,
-                "total_projects": len(projects),
-                "total_connections": total_connections,
-                "total_messages": total_messages,
-                "projects": projects,
-            }
+        projects = {}
+        for cid in self._by_user.get(user_id, ()):
+            metadata = self._subscribers[cid].metadata
+            project = projects.setdefault(metadata.project_id, {"connections": 0, "messages": 0})
+            project["connections"] += 1
+            project["messages"] += metadata.message_count
+
+        return {
+            "user_id": user_id,
+            "total_projects": len(projects),
+            "total_connections": sum(p["connections"] for p in projects.values()),
+            "total_messages": sum(p["messages"] for p in projects.values()),
+            "projects": projects,
+        }
 
     async def get_global_statistics(self) -> dict[str, Any]:
         """
@@ -365,25 +447,17 @@ class ConnectionManager:
         Returns:
             Global statistics dictionary
         """
-        async with self._lock:
-            total_users = len(self._connections)
-            total_projects = 0
-            total_connections = 0
-
-            for user_connections in self._connections.values():
-                total_projects += len(user_connections)
-                for project_connections in user_connections.values():
-                    total_connections += len(project_connections)
-
-            total_messages = sum(metadata.message_count for metadata in self._metadata.values())
-
-            return {
-                "total_users": total_users,
-                "total_projects": total_projects,
-                "total_connections": total_connections,
-                "total_messages": total_messages,
-                "max_connections_per_project": self._max_connections_per_project,
-            }
+        subscribers = self._subscribers.values()
+        return {
+            "total_users": len(self._by_user),
+            "total_projects": len(self._by_project),
+            "total_connections": len(self._subscribers),
+            "total_messages": sum(s.metadata.message_count for s in subscribers),
+            "queued_messages": sum(s.queue.qsize() for s in subscribers),
+            "max_connections_per_project": self._max_connections_per_project,
+            "slow_consumer_policy": self._slow_consumer_policy.value,
+            **self._stats,
+        }
 
     async def cleanup_user_connections(self, user_id: str) -> int:
         """
@@ -398,31 +472,17 @@ class ConnectionManager:
         closed_count = 0
 
         async with self._lock:
-            if user_id not in self._connections:
-                return 0
-
-            # Close all connections
-            for project_id in list(self._connections[user_id].keys()):
-                for connection in list(self._connections[user_id][project_id]):
-                    try:
-                        await connection.close()
-                        closed_count += 1
-                    except Exception as e:
-                        logger.error(f"Error closing connection: {e}")
-
-            # Remove all metadata for user
-            connection_ids_to_remove = [
-                cid for cid, metadata in self._metadata.items() if metadata.user_id == user_id
-            ]
+            subscribers = [self._remove(cid) for cid in list(self._by_user.get(user_id, ()))]
 
-            for cid in connection_ids_to_remove:
-                del self._metadata[cid]
-
-            # Remove user entry
-            del self._connections[user_id]
+        for subscriber in subscribers:
+            try:
+                await subscriber.websocket.close()
+                closed_count += 1
+            except Exception as e:
+                logger.error(f"Error closing connection: {e}")
 
+        if subscribers:
             logger.info(f"Cleaned up {closed_count} connections for user {user_id}")
-
         return closed_count
 
 
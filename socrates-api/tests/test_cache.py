@@ -0,0 +1,281 @@
+"""
+Tests for the API caching layer.
+
+Tests cover:
+- TTL expiry, LRU eviction and the memory cap of the in-memory cache
+- RedisCache over an asyncio client (local fake) without blocking the loop
+- Fallback to the in-memory cache when Redis is unreachable
+- Cached read endpoints invalidated by database writes
+"""
+
+import asyncio
+import datetime
+import fnmatch
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from socrates_api.caching import cached_endpoint, endpoint_cache, project_tag, redis_cache
+from socrates_api.caching.redis_cache import InMemoryCache, RedisCache
+
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.models import ProjectContext, User
+
+
+class FakeRedis:
+    """In-process stand-in for the redis.asyncio client (only what RedisCache uses)."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.data: dict[str, object] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def _io(self):
+        await asyncio.sleep(self.latency)
+
+    async def get(self, key):
+        await self._io()
+        value = self.data.get(key)
+        return value if isinstance(value, str) else None
+
+    async def set(self, key, value, ex=None):
+        await self._io()
+        self.data[key] = value
+        self.expiry[key] = ex
+
+    async def sadd(self, key, *members):
+        await self._io()
+        self.data.setdefault(key, set()).update(members)
+
+    async def smembers(self, key):
+        await self._io()
+        return set(self.data.get(key, set()))
+
+    async def expire(self, key, seconds):
+        await self._io()
+        self.expiry[key] = seconds
+
+    async def delete(self, *keys):
+        await self._io()
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def exists(self, key):
+        await self._io()
+        return int(key in self.data)
+
+    async def incrby(self, key, amount):
+        await self._io()
+        self.data[key] = str(int(self.data.get(key, 0)) + amount)
+        return int(self.data[key])
+
+    async def scan_iter(self, match="*", count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def info(self, section=None):
+        return {"total_commands_processed": 1}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*a, **kw) for name, a, kw in self.calls]
+
+
+class TestInMemoryCache:
+    """Tests for the bounded TTL-LRU fallback."""
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        cache = InMemoryCache()
+        await cache.set("key", {"a": 1}, ttl=0.01)
+
+        assert await cache.get("key") == {"a": 1}
+        await asyncio.sleep(0.02)
+
+        assert await cache.get("key") is None
+        assert cache.stats["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cap_bounds_serialized_size(self):
+        cache = InMemoryCache(max_bytes=1000)
+        for i in range(10):
+            await cache.set(f"key{i}", "x" * 300)
+
+        stats = await cache.get_stats()
+        assert stats["bytes"] <= 1000
+        assert stats["entries"] == 3
+        assert await cache.get("key9") == "x" * 300
+
+    @pytest.mark.asyncio
+    async def test_values_are_copies(self):
+        cache = InMemoryCache()
+        value = {"items": [1]}
+        await cache.set("key", value)
+        value["items"].append(2)
+
+        assert await cache.get("key") == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self):
+        cache = InMemoryCache()
+        await cache.set("stats:p1", 1, tags=["project:p1"])
+        await cache.set("docs:p1", 2, tags=["project:p1"])
+        await cache.set("stats:p2", 3, tags=["project:p2"])
+
+        assert await cache.invalidate_tags(["project:p1"]) == 2
+        assert await cache.get("stats:p1") is None
+        assert await cache.get("stats:p2") == 3
+
+
+class TestRedisCache:
+    """Tests for RedisCache over an asyncio client."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_tag_invalidation(self):
+        client = FakeRedis()
+        cache = RedisCache(client=client)
+
+        await cache.set("stats:p1", {"count": 1}, ttl=60, tags=["project:p1"])
+        assert client.expiry["stats:p1"] == 60
+        assert await cache.get("stats:p1") == {"count": 1}
+        assert await cache.exists("stats:p1")
+        assert await cache.increment("hits") == 1
+
+        assert await cache.invalidate_tags(["project:p1"]) == 1
+        assert await cache.get("stats:p1") is None
+        assert "tag:project:p1" not in client.data
+
+        await cache.clear("hit*")
+        assert not await cache.exists("hits")
+        assert (await cache.get_stats())["status"] == "connected"
+
+    @pytest.mark.asyncio
+    async def test_operations_do_not_block_the_event_loop(self):
+        cache = RedisCache(client=FakeRedis(latency=0.05))
+        await cache.set("key", "value")
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(cache.get("key") for _ in range(20)))
+
+        assert results == ["value"] * 20
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_falls_back_to_memory(self):
+        cache = RedisCache(redis_url="redis://127.0.0.1:1")
+
+        await cache.set("key", [1, 2], tags=["project:p1"])
+
+        assert cache.client is None
+        assert await cache.get("key") == [1, 2]
+        assert (await cache.get_stats())["status"] == "fallback"
+        assert await cache.invalidate_tags(["project:p1"]) == 1
+
+
+def _project(project_id="proj-1"):
+    now = datetime.datetime.now()
+    return ProjectContext(
+        project_id=project_id,
+        name="Project",
+        owner="alice",
+        phase="discovery",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestCachedEndpoint:
+    """Tests for cached_endpoint() with invalidation on database writes."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = RedisCache(client=FakeRedis())
+        monkeypatch.setattr(redis_cache, "_cache", cache)
+        return cache
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = ProjectDatabase(str(tmp_path / "projects.db"))
+        db.save_user(
+            User(
+                username="alice",
+                email="alice@test.com",
+                passcode_hash="hash",
+                created_at=datetime.datetime.now(),
+            )
+        )
+        db.save_project(_project())
+        return db
+
+    def _app(self, db, calls):
+        app = FastAPI()
+
+        @app.get("/projects/{project_id}/stats")
+        @cached_endpoint("project_stats:{project_id}:{current_user}")
+        async def stats(
+            project_id: str,
+            current_user: str = Depends(lambda: "alice"),
+            db: ProjectDatabase = Depends(lambda: db),
+        ):
+            calls.append(project_id)
+            project = db.load_project(project_id)
+            return {"project_id": project_id, "phase": project.phase}
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_reads_are_cached_until_the_project_is_written(self, cache, db):
+        calls = []
+        transport = httpx.ASGITransport(app=self._app(db, calls))
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/projects/proj-1/stats")
+            second = await client.get("/projects/proj-1/stats")
+            assert first.json() == second.json() == {"project_id": "proj-1", "phase": "discovery"}
+            assert calls == ["proj-1"]
+
+            project = db.load_project("proj-1")
+            project.phase = "analysis"
+            db.save_project(project)
+            await asyncio.gather(*endpoint_cache._pending)
+
+            third = await client.get("/projects/proj-1/stats")
+
+        assert third.json()["phase"] == "analysis"
+        assert calls == ["proj-1", "proj-1"]
+        assert await cache.client.smembers(f"tag:{project_tag('proj-1')}") == {
+            "endpoint:project_stats:proj-1:alice"
+        }
@@ -0,0 +1,175 @@
+"""
+Tests for the topic-partitioned, resumable event stream.
+
+Tests cover:
+- Events are delivered only to streams subscribed to their topic
+- Event ids increase monotonically
+- Resume from Last-Event-ID replays exactly the missed events
+- Truncated replay logs are reported
+- A Last-Event-ID from before a reset of the id sequence restarts the stream
+- Overflowing streams are dropped from the fan-out
+"""
+
+import asyncio
+import itertools
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from socrates_api.routers import events
+
+
+class FakeDatabase:
+    """Database stand-in exposing only get_user_projects()."""
+
+    def __init__(self, projects: dict[str, list[str]]):
+        self.projects = projects
+
+    def get_user_projects(self, username, include_archived=False):
+        return [SimpleNamespace(project_id=p) for p in self.projects.get(username, [])]
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(events, "_event_ids", itertools.count(1))
+    monkeypatch.setattr(events, "_last_event_id", 0)
+    monkeypatch.setattr(events, "_topic_logs", OrderedDict())
+    monkeypatch.setattr(events, "_topic_evicted", {})
+    monkeypatch.setattr(events, "_topic_subscribers", {})
+    monkeypatch.setattr(events, "_user_subscribers", {})
+
+
+DB = FakeDatabase({"alice": ["p1"], "bob": ["p1", "p2"], "carol": ["p3"]})
+
+
+async def _open(user, last_event_id=None):
+    response = await events.stream_events(last_event_id=last_event_id, current_user=user, db=DB)
+    return response.body_iterator
+
+
+async def _read(stream, count):
+    """Read ``count`` data messages after the connection acknowledgment."""
+    messages = []
+    while len(messages) < count:
+        chunk = await asyncio.wait_for(anext(stream), timeout=1)
+        data = json.loads(chunk.split("data: ", 1)[1])
+        if data.get("type") != "connected":
+            messages.append(data)
+    return messages
+
+
+class TestTopicFanOut:
+    """Tests for server-side topic filtering."""
+
+    @pytest.mark.asyncio
+    async def test_events_reach_only_interested_streams(self):
+        alice, bob, carol = [await _open(user) for user in ("alice", "bob", "carol")]
+        for stream in (alice, bob, carol):
+            await anext(stream)  # Connected acknowledgment subscribes the stream
+
+        events.record_event("note_added", {"project_id": "p2"}, user_id="bob")
+        events.record_event("code_validated", {"project_id": "p1"}, user_id="alice")
+        events.record_event("profile_updated", {}, user_id="carol")
+
+        assert [e["type"] for e in await _read(alice, 1)] == ["code_validated"]
+        assert [e["type"] for e in await _read(bob, 2)] == ["note_added", "code_validated"]
+        assert [e["type"] for e in await _read(carol, 1)] == ["profile_updated"]
+        assert len(events._topic_subscribers[events.project_topic("p2")]) == 1
+
+        for stream in (alice, bob, carol):
+            await stream.aclose()
+        assert events._topic_subscribers == {}
+        assert events._user_subscribers == {}
+
+    @pytest.mark.asyncio
+    async def test_acting_user_joins_new_project_topic(self):
+        stream = await _open("carol")
+        await anext(stream)
+
+        events.record_event("project_created", {"project_id": "p9"}, user_id="carol")
+        events.record_event("note_added", {"project_id": "p9"}, user_id="dave")
+
+        assert [e["type"] for e in await _read(stream, 2)] == ["project_created", "note_added"]
+        await stream.aclose()
+
+    def test_ids_are_monotonic_and_history_is_filtered(self):
+        for i in range(3):
+            events.record_event("a", {"project_id": f"p{i + 1}"}, user_id="x")
+
+        visible, complete = events.get_events(events._user_topics("bob", DB))
+
+        assert complete
+        assert [e["id"] for e in visible] == [1, 2]
+
+
+class TestResume:
+    """Tests for Last-Event-ID resume from the replay logs."""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_events(self):
+        for i in range(5):
+            events.record_event("e", {"project_id": "p1", "n": i}, user_id="alice")
+        events.record_event("other", {"project_id": "p3"}, user_id="carol")
+
+        stream = await _open("alice", last_event_id="2")
+        replayed = await _read(stream, 3)
+        events.record_event("live", {"project_id": "p1"}, user_id="alice")
+        live = await _read(stream, 1)
+        await stream.aclose()
+
+        assert [e["id"] for e in replayed] == [3, 4, 5]
+        assert [e["type"] for e in live] == ["live"]
+
+    @pytest.mark.asyncio
+    async def test_evicted_events_are_reported(self, monkeypatch):
+        monkeypatch.setattr(events, "REPLAY_LOG_SIZE", 3)
+        for _ in range(5):
+            events.record_event("e", {"project_id": "p1"}, user_id="alice")
+
+        assert events.get_events([events.project_topic("p1")], after_id=2)[1]
+        stream = await _open("alice", last_event_id="evt_1")
+        messages = await _read(stream, 4)
+        await stream.aclose()
+
+        assert messages[0] == {"type": "replay_truncated"}
+        assert [e["id"] for e in messages[1:]] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_id_from_before_reset_restarts_stream(self):
+        for _ in range(2):
+            events.record_event("e", {"project_id": "p1"}, user_id="alice")
+
+        # Id issued before a restart started the sequence over
+        stream = await _open("alice", last_event_id="500")
+        messages = await _read(stream, 3)
+        events.record_event("live", {"project_id": "p1"}, user_id="alice")
+        live = await _read(stream, 1)
+        await stream.aclose()
+
+        assert messages[0] == {"type": "replay_truncated"}
+        assert [e["id"] for e in messages[1:]] == [1, 2]
+        assert [(e["id"], e["type"]) for e in live] == [(3, "live")]
+
+
+class TestSlowStreams:
+    """Tests for bounded subscriber queues."""
+
+    @pytest.mark.asyncio
+    async def test_overflowing_stream_is_dropped(self, monkeypatch):
+        monkeypatch.setattr(events, "SUBSCRIBER_QUEUE_SIZE", 2)
+        stream = await _open("alice")
+        await anext(stream)
+
+        for _ in range(3):
+            events.record_event("e", {"project_id": "p1"}, user_id="bob")
+
+        assert events._topic_subscribers == {}
+        assert [e["id"] for e in await _read(stream, 2)] == [1, 2]
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
@@ -0,0 +1,222 @@
+"""
+Tests for the pure ASGI API middleware.
+
+Tests cover:
+- CORS and security headers added in a single pass
+- CORS preflight handling
+- Streaming responses and contextvars pass through unchanged
+- Metrics recorded with the real response status
+- Activity tracking deferred off the response path
+- Throughput against a BaseHTTPMiddleware stack
+"""
+
+import asyncio
+import contextvars
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse, StreamingResponse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from socrates_api.middleware import activity_tracker
+from socrates_api.middleware.metrics import http_requests_total
+from socrates_api.middleware.pipeline import APIMiddleware, add_api_middleware
+
+ORIGIN = "http://localhost:5173"
+request_marker = contextvars.ContextVar("request_marker", default=None)
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return PlainTextResponse("ok", headers={"Server": "uvicorn"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/marker")
+    async def marker():
+        request_marker.set("set-by-endpoint")
+        return PlainTextResponse("ok")
+
+    add_api_middleware(app, allowed_origins=[ORIGIN], environment="development")
+    return app
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestAPIMiddleware:
+    """Tests for APIMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_adds_cors_and_security_headers(self):
+        async with _client(_app()) as client:
+            response = await client.get("/ping", headers={"origin": ORIGIN})
+
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["x-frame-options"] == "DENY"
+        assert response.headers["x-api-version"] == "8.0.0"
+        assert float(response.headers["x-process-time"]) >= 0
+        assert "server" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_disallowed_origin_gets_no_cors_headers(self):
+        async with _client(_app()) as client:
+            response = await client.get("/ping", headers={"origin": "http://evil.example"})
+
+        assert "access-control-allow-origin" not in response.headers
+        assert response.headers["x-content-type-options"] == "nosniff"
+
+    @pytest.mark.asyncio
+    async def test_preflight_is_answered_directly(self):
+        async with _client(_app()) as client:
+            response = await client.options("/ping", headers={"origin": ORIGIN})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert "PATCH" in response.headers["access-control-allow-methods"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_passes_through(self):
+        async with _client(_app()) as client:
+            async with client.stream("GET", "/stream") as response:
+                chunks = [chunk async for chunk in response.aiter_text()]
+
+        assert "".join(chunks) == "chunk0\nchunk1\nchunk2\n"
+        assert response.headers["access-control-allow-origin"] == "*"
+
+    @pytest.mark.asyncio
+    async def test_contextvars_set_by_endpoint_reach_outer_layers(self):
+        seen = []
+        inner = _app()
+
+        async def outer(scope, receive, send):
+            await inner(scope, receive, send)
+            seen.append(request_marker.get())
+
+        async with _client(outer) as client:
+            await client.get("/marker")
+
+        assert seen == ["set-by-endpoint"]
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_real_status(self):
+        counter = http_requests_total.labels(method="GET", endpoint="/missing/{id}", status=404)
+        before = counter._value.get()
+
+        async with _client(_app()) as client:
+            await client.get("/missing/42")
+
+        assert counter._value.get() == before + 1
+
+
+class TestDeferredActivity:
+    """Tests for deferred activity tracking."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_decoded_after_the_response(self, monkeypatch):
+        decoded = []
+
+        def fake_verify(token):
+            decoded.append(token)
+            return {"sub": f"user-{token}"}
+
+        monkeypatch.setattr("socrates_api.auth.jwt_handler.verify_access_token", fake_verify)
+        monkeypatch.setattr(activity_tracker, "ACTIVITY_FLUSH_DELAY", 0.01)
+        activity_tracker.flush_activity()
+
+        async with _client(_app()) as client:
+            for _ in range(3):
+                await client.get("/ping", headers={"authorization": "Bearer abc"})
+
+        assert decoded == []
+        await asyncio.sleep(0.05)
+
+        assert decoded == ["abc"]
+        assert activity_tracker.get_last_activity("user-abc") is not None
+
+    def test_reads_flush_pending_activity(self, monkeypatch):
+        monkeypatch.setattr(
+            "socrates_api.auth.jwt_handler.verify_access_token", lambda token: {"sub": "reader"}
+        )
+
+        activity_tracker.record_activity("Bearer xyz")
+
+        assert activity_tracker.has_recent_activity(60)
+        activity_tracker.clear_activity("reader")
+        assert activity_tracker.get_last_activity("reader") is None
+
+
+class _PassThrough(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+async def _requests_per_second(app, iterations=2000):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "headers": [(b"origin", ORIGIN.encode()), (b"host", b"test")],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("client", 1),
+        "root_path": "",
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return iterations / (time.perf_counter() - start)
+
+
+class TestMiddlewareThroughput:
+    """Benchmark the fused middleware against stacked BaseHTTPMiddleware layers."""
+
+    @pytest.mark.asyncio
+    async def test_requests_per_second(self):
+        async def ping():
+            return PlainTextResponse("ok")
+
+        stacked = FastAPI()
+        fused = FastAPI()
+        for app in (stacked, fused):
+            app.add_api_route("/ping", ping)
+        # The previous stack: four BaseHTTPMiddleware layers (here doing no work at all)
+        for _ in range(4):
+            stacked.add_middleware(_PassThrough)
+        fused.add_middleware(APIMiddleware, allowed_origins=[ORIGIN], environment="production")
+
+        before = await _requests_per_second(stacked)
+        after = await _requests_per_second(fused)
+
+        print("\nTrivial endpoint throughput:")
+        print(f"  4 x BaseHTTPMiddleware (no-op): {before:.0f} req/s")
+        print(f"  Fused pure ASGI middleware: {after:.0f} req/s")
+
+        assert after > before
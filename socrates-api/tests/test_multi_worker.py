@@ -0,0 +1,285 @@
+"""
+Tests for running the API as several worker processes.
+
+Tests cover:
+- The shared message bus delivers messages to other processes, in one order
+- WebSocket broadcasts and stream events reach the connections of other workers
+- Rate limit counters are shared through the SQLite storage
+- A broadcast from a client of one uvicorn worker reaches a client of another
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from limits import RateLimitItemPerMinute
+from limits.strategies import FixedWindowRateLimiter
+from socrates_api.middleware.rate_limit_storage import SQLiteRateLimitStorage
+from socrates_api.websocket.connection_manager import ConnectionManager
+
+from socratic_system.database import ProjectDatabase
+from socratic_system.events import SharedMessageBus
+from socratic_system.models import ProjectContext, User
+
+from .test_websocket_fanout import FakeWebSocket
+
+API_ROOT = Path(__file__).parent.parent
+
+
+async def _buses(tmp_path, count=2):
+    buses = [
+        SharedMessageBus(str(tmp_path / "shared.db"), poll_interval=0.01, worker_id=f"w{i}")
+        for i in range(count)
+    ]
+    for bus in buses:
+        await bus.start()
+    return buses
+
+
+async def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestSharedMessageBus:
+    """Tests for SharedMessageBus between processes."""
+
+    @pytest.mark.asyncio
+    async def test_messages_reach_other_workers_in_order(self, tmp_path):
+        a, b = await _buses(tmp_path)
+        seen_a, seen_b, own = [], [], []
+        a.subscribe("chan", lambda message_id, message: seen_a.append(message))
+        a.subscribe("chan", lambda message_id, message: own.append(message_id), include_own=True)
+        b.subscribe("chan", lambda message_id, message: seen_b.append(message))
+
+        for i in range(3):
+            a.publish("chan", {"n": i})
+        b.publish("chan", {"n": "b"})
+        b.publish("other", {"n": "ignored"})
+        await _wait_for(lambda: len(seen_b) == 3 and len(own) == 4)
+        await a.stop()
+        await b.stop()
+
+        # Own messages are skipped unless asked for, ids follow commit order
+        assert seen_a == [{"n": "b"}]
+        assert seen_b == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert own == sorted(own)
+        assert a.get_stats()["handler_errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unwritten_messages_are_flushed_on_stop(self, tmp_path):
+        a, b = await _buses(tmp_path)
+        received = []
+        b.subscribe("chan", lambda message_id, message: received.append(message))
+
+        a.publish("chan", "last words")
+        await a.stop()
+        await _wait_for(lambda: received)
+        await b.stop()
+
+        assert received == ["last words"]
+
+
+class TestCrossWorkerFanOut:
+    """Tests for ConnectionManager and event stream delivery through the bus."""
+
+    @pytest.mark.asyncio
+    async def test_project_broadcast_reaches_other_worker(self, tmp_path):
+        buses = await _buses(tmp_path)
+        managers = [ConnectionManager(), ConnectionManager()]
+        sockets = [FakeWebSocket(), FakeWebSocket(), FakeWebSocket()]
+        for manager, bus in zip(managers, buses, strict=True):
+            manager.attach_bus(bus)
+        await managers[0].connect(sockets[0], "alice", "proj-1", "c0")
+        await managers[1].connect(sockets[1], "bob", "proj-1", "c1")
+        await managers[1].connect(sockets[2], "carol", "proj-2", "c2")
+
+        assert await managers[0].broadcast_to_project(None, "proj-1", {"text": "hi"}) == 1
+        await managers[1].broadcast_to_user("alice", {"text": "direct"})
+        await _wait_for(lambda: sockets[1].sent and len(sockets[0].sent) == 2)
+
+        assert sockets[1].sent == [{"text": "hi"}]
+        assert sockets[0].sent == [{"text": "hi"}, {"text": "direct"}]
+        assert sockets[2].sent == []
+        for bus in buses:
+            await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_event_ids_come_from_the_bus(self, tmp_path, monkeypatch):
+        from socrates_api.routers import events
+
+        (bus,) = await _buses(tmp_path, count=1)
+        monkeypatch.setattr(events, "_bus", None)
+        monkeypatch.setattr(events, "_topic_logs", {})
+        delivered = []
+        monkeypatch.setattr(events, "_deliver", lambda event, topic: delivered.append(event))
+        events.attach_bus(bus)
+
+        events.record_event("project_created", {"project_id": "proj-1"}, user_id="alice")
+        events.record_event("project_updated", {"project_id": "proj-1"}, user_id="alice")
+        await _wait_for(lambda: len(delivered) == 2)
+        await bus.stop()
+
+        assert [event["type"] for event in delivered] == ["project_created", "project_updated"]
+        assert delivered[0]["id"] < delivered[1]["id"]
+
+
+class TestSharedRateLimits:
+    """Tests for SQLiteRateLimitStorage."""
+
+    def test_workers_share_counters(self, tmp_path):
+        uri = f"sqlite:///{tmp_path / 'shared.db'}"
+        workers = [FixedWindowRateLimiter(SQLiteRateLimitStorage(uri)) for _ in range(2)]
+        limit = RateLimitItemPerMinute(3)
+
+        allowed = [workers[i % 2].hit(limit, "client-1") for i in range(4)]
+
+        assert allowed == [True, True, True, False]
+        assert workers[1].hit(limit, "client-2")
+        storage = SQLiteRateLimitStorage(uri)
+        # Rejected hits are counted too
+        assert storage.get(limit.key_for("client-1")) == 4
+        storage.clear(limit.key_for("client-1"))
+        assert workers[0].hit(limit, "client-1")
+
+    def test_expired_window_restarts(self, tmp_path):
+        storage = SQLiteRateLimitStorage(f"sqlite:///{tmp_path / 'shared.db'}")
+
+        assert storage.incr("key", expiry=0) == 1
+        assert storage.incr("key", expiry=60, amount=2) == 2
+        assert storage.incr("key", expiry=60) == 3
+        assert storage.get_expiry("key") > time.time()
+        assert storage.check()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def two_workers(tmp_path):
+    """Two uvicorn processes sharing one data directory and state database."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(API_ROOT / "src"), str(API_ROOT.parent)]),
+        "SOCRATES_DATA_DIR": str(tmp_path),
+        "SOCRATES_SHARED_STATE_DB": str(tmp_path / "shared_state.db"),
+        "REDIS_URL": "redis://127.0.0.1:1",
+    }
+    ports = [_free_port(), _free_port()]
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "socrates_api.main:app", "--port", str(port)],
+            cwd=tmp_path,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    try:
+        deadline = time.monotonic() + 90
+        for port in ports:
+            while True:
+                try:
+                    urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline or any(p.poll() is not None for p in processes):
+                        pytest.skip("API workers did not start")
+                    time.sleep(0.2)
+        yield ports
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def _receive(client, message_type, timeout=10.0, **fields):
+    """Skip messages until one of the given type (and field values) arrives."""
+    deadline = time.monotonic() + timeout
+    while True:
+        message = json.loads(client.recv(timeout=max(deadline - time.monotonic(), 0.01)))
+        if message["type"] == message_type and fields.items() <= message.items():
+            return message
+
+
+class TestTwoWorkers:
+    """End-to-end broadcast between two API worker processes."""
+
+    @pytest.fixture
+    def token(self, tmp_path, monkeypatch):
+        """Access token for the owner of proj-1, signed with the workers' key."""
+        from socrates_api.auth import create_access_token
+
+        now = datetime.datetime.now()
+        db = ProjectDatabase(str(tmp_path / "projects.db"))
+        db.save_user(
+            User(username="alice", email="alice@test.com", passcode_hash="hash", created_at=now)
+        )
+        db.save_project(
+            ProjectContext(
+                project_id="proj-1",
+                name="Project",
+                owner="alice",
+                phase="discovery",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        db.close()
+        monkeypatch.setenv("SOCRATES_DATA_DIR", str(tmp_path))
+        return create_access_token("alice")
+
+    @pytest.mark.timeout(180)
+    def test_collaboration_broadcast_crosses_workers(self, two_workers, token):
+        from websockets.sync.client import connect
+
+        urls = [
+            f"ws://127.0.0.1:{port}/ws/collaboration/proj-1?token={token}" for port in two_workers
+        ]
+        with connect(urls[0]) as client_a, connect(urls[1]) as client_b:
+            _receive(client_a, "acknowledgment")
+            _receive(client_b, "acknowledgment")
+            # Joining on worker B is announced to the client held by worker A
+            _receive(client_a, "user_joined")
+
+            client_a.send(json.dumps({"type": "activity", "activity_type": "edit"}))
+            _receive(client_b, "activity", activity_type="edit")
+
+            client_b.send(json.dumps({"type": "activity", "activity_type": "review"}))
+            _receive(client_a, "activity", activity_type="review")
+
+    @pytest.mark.timeout(180)
+    def test_collaboration_requires_token(self, two_workers, token):
+        from websockets.exceptions import InvalidStatus
+        from websockets.sync.client import connect
+
+        url = f"ws://127.0.0.1:{two_workers[0]}/ws"
+        with pytest.raises(InvalidStatus):
+            connect(f"{url}/collaboration/proj-1")
+        with pytest.raises(InvalidStatus):
+            connect(f"{url}/chat/proj-1")
+        # A valid token does not open projects the user cannot access
+        with pytest.raises(InvalidStatus):
+            connect(f"{url}/collaboration/other-project?token={token}")
@@ -0,0 +1,163 @@
+"""
+Tests for WebSocket fan-out in ConnectionManager.
+
+Tests cover:
+- Broadcasts reach only the project's subscribers (optionally one user's)
+- Messages are serialized once per broadcast
+- A stalled client does not delay other subscribers
+- Slow-consumer drop and disconnect policies
+- Failed sends and disconnects remove connections from the indexes
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from socrates_api.websocket import connection_manager as cm
+from socrates_api.websocket.connection_manager import ConnectionManager, SlowConsumerPolicy
+
+
+class FakeWebSocket:
+    """WebSocket stand-in recording sent messages; can stall or fail sends."""
+
+    def __init__(self, stall: bool = False, fail: bool = False):
+        self.sent = []
+        self.closed = None
+        self.stall = stall
+        self.fail = fail
+        self.received = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.stall:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(text))
+        self.received.set()
+
+    async def close(self, code=1000, reason=None):
+        self.closed = code
+
+
+async def _connect(manager, user_id, project_id, connection_id, **kwargs):
+    websocket = FakeWebSocket(**kwargs)
+    await manager.connect(websocket, user_id, project_id, connection_id)
+    return websocket
+
+
+async def _drain():
+    await asyncio.sleep(0.01)
+
+
+class TestProjectFanOut:
+    """Tests for broadcast routing through the subscriber indexes."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_only_project_subscribers(self):
+        manager = ConnectionManager()
+        alice = await _connect(manager, "alice", "p1", "c1")
+        bob = await _connect(manager, "bob", "p1", "c2")
+        other = await _connect(manager, "alice", "p2", "c3")
+
+        assert await manager.broadcast_to_project(None, "p1", {"n": 1}) == 2
+        assert await manager.broadcast_to_project("alice", "p1", {"n": 2}) == 1
+        assert await manager.broadcast_to_project(None, "p1", {"n": 3}, "c2") == 1
+        await _drain()
+
+        assert alice.sent == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert bob.sent == [{"n": 1}]
+        assert other.sent == []
+        assert (await manager.get_connection_metadata("c1"))["message_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_message_serialized_once_per_broadcast(self, monkeypatch):
+        calls = []
+
+        def dumps(message):
+            calls.append(message)
+            return json.dumps(message)
+
+        monkeypatch.setattr(cm, "json", SimpleNamespace(dumps=dumps))
+        manager = ConnectionManager()
+        for i in range(10):
+            await _connect(manager, f"user{i}", "p1", f"c{i}")
+
+        assert await manager.broadcast_to_project(None, "p1", {"type": "activity"}) == 10
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_does_not_delay_others(self):
+        manager = ConnectionManager()
+        await _connect(manager, "slow", "p1", "c1", stall=True)
+        fast = await _connect(manager, "fast", "p1", "c2")
+
+        await manager.broadcast_to_project(None, "p1", {"type": "typing"})
+
+        await asyncio.wait_for(fast.received.wait(), timeout=1)
+        assert fast.sent == [{"type": "typing"}]
+
+
+class TestSlowConsumers:
+    """Tests for bounded outbound queues and slow-consumer policies."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_evicts_slow_consumer(self):
+        manager = ConnectionManager(queue_size=2)
+        slow = await _connect(manager, "slow", "p1", "c1", stall=True)
+        fast = await _connect(manager, "fast", "p1", "c2")
+
+        for i in range(5):
+            await manager.broadcast_to_project(None, "p1", {"n": i})
+            await _drain()
+
+        stats = await manager.get_global_statistics()
+        assert slow.closed == cm.SLOW_CONSUMER_CLOSE_CODE
+        assert await manager.get_connection_metadata("c1") is None
+        assert stats["slow_consumer_disconnects"] == 1
+        assert stats["total_connections"] == 1
+        assert len(fast.sent) == 5
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_keeps_connection(self):
+        manager = ConnectionManager(queue_size=2, slow_consumer_policy=SlowConsumerPolicy.DROP)
+        slow = await _connect(manager, "slow", "p1", "c1", stall=True)
+
+        for i in range(5):
+            await manager.broadcast_to_project(None, "p1", {"n": i})
+            await _drain()
+
+        metadata = await manager.get_connection_metadata("c1")
+        assert slow.closed is None
+        assert metadata["dropped_messages"] == 2
+        assert (await manager.get_global_statistics())["dropped_messages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_send_removes_connection(self):
+        manager = ConnectionManager()
+        await _connect(manager, "alice", "p1", "c1", fail=True)
+
+        await manager.broadcast_to_project(None, "p1", {"n": 1})
+        await _drain()
+
+        assert await manager.get_project_connections(None, "p1") == []
+
+    @pytest.mark.asyncio
+    async def test_disconnect_and_cleanup_update_indexes(self):
+        manager = ConnectionManager()
+        await _connect(manager, "alice", "p1", "c1")
+        await _connect(manager, "alice", "p2", "c2")
+
+        assert await manager.disconnect("c1") == ("alice", "p1")
+        assert await manager.broadcast_to_project(None, "p1", {"n": 1}) == 0
+        assert await manager.cleanup_user_connections("alice") == 1
+        assert await manager.broadcast_to_user("alice", {"n": 2}) == 0
+        assert (await manager.get_global_statistics())["total_connections"] == 0
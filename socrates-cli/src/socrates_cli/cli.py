@@ -13,6 +13,8 @@ from pathlib import Path
 import click
 from colorama import Fore, Style, init
 
+# Heavy components (orchestrator, LLM clients, vector store) load on first
+# attribute access, so `socrates --help` does not pay for them
 import socratic_system as socrates
 
 # Initialize colorama for cross-platform colored output
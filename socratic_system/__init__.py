@@ -54,12 +54,10 @@ __version__ = "1.3.3"
 __author__ = "Socrates AI Contributors"
 __license__ = "MIT"
 
-# Core Configuration API
-# Core Components - Phase 3 transition to SocraticAgentsSystem
-# Import both for backward compatibility during migration
-from socratic_agents import SocraticAgentsSystem
+import importlib
+from typing import TYPE_CHECKING
 
-from .clients import ClaudeClient
+# Core Configuration API
 from .config import SocratesConfig
 
 # Event System
@@ -87,17 +85,46 @@ from .models import (
     TokenUsage,
     User,
 )
-from .orchestration import AgentOrchestrator
 
-# Legacy UI (for CLI)
-from .ui import SocraticRAGSystem
+if TYPE_CHECKING:
+    from socratic_agents import SocraticAgentsSystem
+
+    from .clients import ClaudeClient
+    from .orchestration import AgentOrchestrator
+    from .ui import SocraticRAGSystem
+
+# Components that pull in LLM SDKs, the vector store (chromadb, sentence
+# transformers, torch) or the UI are imported on first access (PEP 562), so
+# that importing the package stays cheap for the CLI and library users.
+_LAZY_IMPORTS = {
+    # Core Components - Phase 3 transition to SocraticAgentsSystem
+    "SocraticAgentsSystem": "socratic_agents",
+    "AgentOrchestrator": ".orchestration",
+    "ClaudeClient": ".clients",
+    # Legacy UI (for CLI)
+    "SocraticRAGSystem": ".ui",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
 
-def create_socratic_system(config: SocratesConfig) -> SocraticAgentsSystem:
+def create_socratic_system(config: SocratesConfig) -> "SocraticAgentsSystem":
     """
     Create and initialize a SocraticAgentsSystem with a configuration object.
 
@@ -122,6 +149,8 @@ def create_socratic_system(config: SocratesConfig) -> SocraticAgentsSystem:
         >>> system = create_socratic_system(config)
         >>> result = system.process_request('project_manager', {...})
     """
+    from socratic_agents import SocraticAgentsSystem
+
     return SocraticAgentsSystem(
         api_key=config.api_key,
         data_dir=str(config.data_dir),
@@ -131,7 +160,7 @@ def create_socratic_system(config: SocratesConfig) -> SocraticAgentsSystem:
 
 def quick_start_system(
     api_key: str, data_dir: str = None, log_level: str = "INFO"
-) -> SocraticAgentsSystem:
+) -> "SocraticAgentsSystem":
     """
     Quick start with SocraticAgentsSystem and minimal configuration.
 
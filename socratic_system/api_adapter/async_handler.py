@@ -238,7 +238,8 @@ class AsyncJobHandler:
                     return status
 
                 if attempt < max_polls - 1:
-                    await asyncio.sleep(poll_interval)
+                    # Returns early when the job completes
+                    await self.job_queue.wait_for_jobs([job_id], timeout=poll_interval)
 
             except AdapterError:
                 if attempt < max_polls - 1:
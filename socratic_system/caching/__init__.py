@@ -1,11 +1,16 @@
 """Caching module for Phase 3 event-driven background processing.
 
-Provides result caching infrastructure for analysis results.
+Provides result caching infrastructure for analysis results and LLM responses.
 """
 
-from .analysis_cache import AnalysisCache, InMemoryAnalysisCache
+from .analysis_cache import AnalysisCache, InMemoryAnalysisCache, SQLiteAnalysisCache
+from .llm_cache import CachingLLMClient, LLMResponseCache, get_llm_cache
 
 __all__ = [
     "AnalysisCache",
     "InMemoryAnalysisCache",
+    "SQLiteAnalysisCache",
+    "CachingLLMClient",
+    "LLMResponseCache",
+    "get_llm_cache",
 ]
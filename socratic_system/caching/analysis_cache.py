@@ -4,9 +4,12 @@ Implements result caching with TTL support to enable non-blocking
 response processing in SocraticCounselor.
 """
 
+import json
 import logging
+import sqlite3
 import time
 from abc import ABC, abstractmethod
+from pathlib import Path
 from threading import Lock
 from typing import Any
 
@@ -165,3 +168,124 @@ class InMemoryAnalysisCache(AnalysisCache):
                 "valid_entries": len(self._cache) - expired_count,
                 "max_size": self._max_size,
             }
+
+
+class SQLiteAnalysisCache(AnalysisCache):
+    """Analysis cache stored in a SQLite file shared by several processes.
+
+    Used when the API runs several worker processes, so a result computed by
+    one worker can be polled through any other. Values must be JSON-serializable.
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize SQLite cache
+
+        Args:
+            db_path: Path to the SQLite database file shared by all processes
+        """
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+        finally:
+            conn.close()
+        logger.info(f"SQLiteAnalysisCache initialized at {db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get cached value by key, respecting TTL.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached value if valid, None if expired or missing
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value FROM analysis_cache WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict[str, Any], ttl: int = 3600):
+        """Set cache value with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + ttl),
+            )
+        finally:
+            conn.close()
+        logger.debug(f"Cache set: {key} (ttl={ttl}s)")
+
+    def delete(self, key: str):
+        """Delete specific cache entry.
+
+        Args:
+            key: Cache key to delete
+        """
+        self._execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+
+    def clear_expired(self):
+        """Remove all expired entries from cache"""
+        removed = self._execute("DELETE FROM analysis_cache WHERE expires_at < ?", (time.time(),))
+        if removed:
+            logger.debug(f"Cache cleaned {removed} expired entries")
+
+    def clear(self):
+        """Clear entire cache"""
+        removed = self._execute("DELETE FROM analysis_cache")
+        logger.info(f"Cache cleared ({removed} entries removed)")
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).rowcount
+        finally:
+            conn.close()
+
+    def size(self) -> int:
+        """Get current cache size"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+        finally:
+            conn.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics"""
+        conn = self._connect()
+        try:
+            total, expired = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at < ?), 0) FROM analysis_cache",
+                (time.time(),),
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            "total_entries": total,
+            "expired_entries": expired,
+            "valid_entries": total - expired,
+            "db_path": self.db_path,
+        }
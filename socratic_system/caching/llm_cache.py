@@ -0,0 +1,592 @@
+"""LLM response caching with single-flight request coalescing.
+
+Wraps any socratic_nexus client (or anything exposing ``generate_response``)
+so identical prompts are answered from cache instead of the provider.
+Entries are keyed by a normalized (provider, model, prompt, params) hash,
+held in a bounded in-memory LRU and optionally persisted to SQLite so they
+survive restarts.
+
+Concurrent identical calls are coalesced: only the first caller reaches the
+provider, the rest wait for its result.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class _Flight:
+    """An in-progress upstream call that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class LLMResponseCache:
+    """Two-tier (memory + SQLite) TTL cache for LLM responses.
+
+    Thread-safe. Sync callers are coalesced with ``get_or_compute``, async
+    callers with ``get_or_compute_async``.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        default_ttl: float = 3600.0,
+        max_memory_entries: int = 1000,
+    ):
+        """Initialize LLM response cache.
+
+        Args:
+            db_path: SQLite file for persistent entries (None for memory only)
+            default_ttl: Default time-to-live in seconds
+            max_memory_entries: Maximum entries kept in the in-memory tier
+        """
+        self.db_path = db_path
+        self.default_ttl = default_ttl
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[str, asyncio.Future] = {}
+
+        self.metrics = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "upstream_calls": 0,
+        }
+
+        if db_path:
+            self._init_db()
+
+        logger.info(f"LLMResponseCache initialized (persistent={bool(db_path)})")
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """Normalize line endings and trailing whitespace in a prompt."""
+        lines = prompt.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).strip()
+
+    @classmethod
+    def make_key(
+        cls,
+        provider: str,
+        model: str | None,
+        prompt: str,
+        params: dict[str, Any] | None = None,
+    ) -> str:
+        """Build a cache key from a normalized (provider, model, prompt, params) tuple.
+
+        Args:
+            provider: Provider name (e.g., 'claude', 'openai')
+            model: Model name, if known
+            prompt: Prompt text
+            params: Additional request parameters (order-independent)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "provider": (provider or "").lower(),
+                "model": model or "",
+                "prompt": cls.normalize_prompt(prompt),
+                "params": params or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires "
+                "ON llm_response_cache(expires_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        """Store in the memory tier (caller holds the lock)."""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _memory_get(self, key: str) -> Any:
+        """Return the memory-tier value or _MISSING (caller holds the lock)."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return _MISSING
+
+        value, expires_at = entry
+        if time.time() >= expires_at:
+            del self._memory[key]
+            return _MISSING
+
+        self._memory.move_to_end(key)
+        return value
+
+    def _lookup(self, key: str) -> Any:
+        """Return the cached value or _MISSING, without touching metrics."""
+        with self._lock:
+            value = self._memory_get(key)
+        if value is not _MISSING or not self.db_path:
+            return value
+
+        now = time.time()
+
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_response_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return _MISSING
+
+        if not row or row[1] <= now:
+            return _MISSING
+
+        value = json.loads(row[0])
+        with self._lock:
+            self._remember(key, value, row[1])
+        return value
+
+    def get(self, key: str) -> Any:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        value = self._lookup(key)
+        with self._lock:
+            if value is _MISSING:
+                self.metrics["misses"] += 1
+                return None
+            self.metrics["hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Cache a response.
+
+        Values that are not JSON-serializable are kept in memory only.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response to cache
+            ttl: Time-to-live in seconds (defaults to default_ttl)
+        """
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+
+        with self._lock:
+            self._remember(key, value, expires_at)
+
+        if not self.db_path:
+            return
+
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug(f"LLM cache value for {key[:12]} not serializable, memory only")
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache (cache_key, response, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, serialized, expires_at),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete a cache entry."""
+        with self._lock:
+            self._memory.pop(key, None)
+
+        if self.db_path:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def clear_expired(self) -> int:
+        """Remove expired entries from both tiers.
+
+        Returns:
+            Number of persistent entries removed
+        """
+        now = time.time()
+        with self._lock:
+            for key in [k for k, (_, exp) in self._memory.items() if exp <= now]:
+                del self._memory[key]
+
+        if not self.db_path:
+            return 0
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute("DELETE FROM llm_response_cache WHERE expires_at <= ?", (now,))
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        """Clear the entire cache."""
+        with self._lock:
+            self._memory.clear()
+
+        if self.db_path:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM llm_response_cache")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.metrics["hits"] + self.metrics["misses"]
+            return {
+                **self.metrics,
+                "memory_entries": len(self._memory),
+                "hit_rate": self.metrics["hits"] / total if total else 0.0,
+                "persistent": bool(self.db_path),
+            }
+
+    # ------------------------------------------------------------------
+    # Single-flight
+    # ------------------------------------------------------------------
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: float | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return the cached value, or compute it once for all concurrent callers.
+
+        Args:
+            key: Cache key from make_key()
+            compute: Zero-argument callable that performs the upstream request
+            ttl: Time-to-live in seconds for a freshly computed value
+            cache_if: Predicate a fresh value must satisfy to be stored (e.g. that
+                it parses); rejected values are still returned
+
+        Returns:
+            Cached or freshly computed response
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            with self._lock:
+                self.metrics["hits"] += 1
+            return value
+
+        with self._lock:
+            fresh = self._memory_get(key)
+            if fresh is not _MISSING:
+                self.metrics["hits"] += 1
+                return fresh
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.metrics["misses"] += 1
+                self.metrics["upstream_calls"] += 1
+            else:
+                self.metrics["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+            if cache_if is None or cache_if(flight.result):
+                self.set(key, flight.result, ttl)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Async variant of get_or_compute.
+
+        Args:
+            key: Cache key from make_key()
+            compute: Zero-argument coroutine function that performs the upstream request
+            ttl: Time-to-live in seconds for a freshly computed value
+            cache_if: Predicate a fresh value must satisfy to be stored
+
+        Returns:
+            Cached or freshly computed response
+        """
+        value = await asyncio.to_thread(self._lookup, key) if self.db_path else self._lookup(key)
+        if value is not _MISSING:
+            with self._lock:
+                self.metrics["hits"] += 1
+            return value
+
+        with self._lock:
+            fresh = self._memory_get(key)
+            if fresh is not _MISSING:
+                self.metrics["hits"] += 1
+                return fresh
+
+        future = self._async_flights.get(key)
+        if future is not None and future.get_loop() is asyncio.get_running_loop():
+            with self._lock:
+                self.metrics["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        with self._lock:
+            self.metrics["misses"] += 1
+            self.metrics["upstream_calls"] += 1
+
+        try:
+            result = await compute()
+            if cache_if is None or cache_if(result):
+                if self.db_path:
+                    await asyncio.to_thread(self.set, key, result, ttl)
+                else:
+                    self.set(key, result, ttl)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            if self._async_flights.get(key) is future:
+                del self._async_flights[key]
+
+
+class CachingLLMClient:
+    """Provider-agnostic caching wrapper around an LLM client.
+
+    Caching is opt-in per call (``cache=True``) unless ``cache_by_default``
+    is set. All other attributes are delegated to the wrapped client.
+
+    Typical usage:
+        >>> client = CachingLLMClient(claude_client, get_llm_cache())
+        >>> client.generate_response(prompt, user_id=user_id, cache=True)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache: LLMResponseCache | None = None,
+        provider: str | None = None,
+        model: str | None = None,
+        cache_by_default: bool = False,
+        ttl: float | None = None,
+    ):
+        """Initialize caching client.
+
+        Args:
+            client: Underlying LLM client exposing generate_response()
+            cache: Cache to use (defaults to the shared get_llm_cache(), opened
+                on the first cached call)
+            provider: Provider name for cache keys (derived from client class if omitted)
+            model: Model name for cache keys (read from client.model if omitted)
+            cache_by_default: Cache calls that don't pass cache= explicitly
+            ttl: Default TTL for entries created through this client
+        """
+        self.client = client
+        self._cache = cache
+        self.provider = provider or self._derive_provider(client)
+        self._model_name = model
+        self.cache_by_default = cache_by_default
+        self.ttl = ttl
+
+    @property
+    def cache(self) -> "LLMResponseCache":
+        """The response cache, resolved to the shared cache on first use."""
+        if self._cache is None:
+            self._cache = get_llm_cache()
+        return self._cache
+
+    @staticmethod
+    def _derive_provider(client: Any) -> str:
+        provider = getattr(client, "provider", None)
+        if isinstance(provider, str) and provider:
+            return provider
+        name = type(client).__name__.lower()
+        return name[: -len("client")] if name.endswith("client") else name
+
+    def _model(self) -> str | None:
+        if self._model_name:
+            return self._model_name
+        model = getattr(self.client, "model", None)
+        return model if isinstance(model, str) else None
+
+    def _key(self, prompt: str, args: tuple, kwargs: dict[str, Any]) -> str:
+        params = dict(kwargs)
+        if args:
+            params["__args__"] = list(args)
+        return LLMResponseCache.make_key(self.provider, self._model(), prompt, params)
+
+    def generate_response(
+        self,
+        prompt: str,
+        *args,
+        cache: bool | None = None,
+        cache_ttl: float | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Generate a response, serving identical prompts from cache when enabled.
+
+        Args:
+            prompt: Prompt text
+            cache: Enable caching for this call (defaults to cache_by_default)
+            cache_ttl: TTL override for this call
+            cache_if: Only store responses satisfying this predicate
+            *args, **kwargs: Passed through to the wrapped client
+
+        Returns:
+            Response from cache or the wrapped client
+        """
+        use_cache = self.cache_by_default if cache is None else cache
+        if not use_cache:
+            return self.client.generate_response(prompt, *args, **kwargs)
+
+        key = self._key(prompt, args, kwargs)
+        return self.cache.get_or_compute(
+            key,
+            lambda: self.client.generate_response(prompt, *args, **kwargs),
+            cache_ttl if cache_ttl is not None else self.ttl,
+            cache_if,
+        )
+
+    async def generate_response_async(
+        self,
+        prompt: str,
+        *args,
+        cache: bool | None = None,
+        cache_ttl: float | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Async variant of generate_response.
+
+        Uses the wrapped client's generate_response_async when available,
+        otherwise runs generate_response in a worker thread.
+        """
+        native = getattr(self.client, "generate_response_async", None)
+
+        async def call():
+            if native is not None:
+                return await native(prompt, *args, **kwargs)
+            return await asyncio.to_thread(self.client.generate_response, prompt, *args, **kwargs)
+
+        use_cache = self.cache_by_default if cache is None else cache
+        if not use_cache:
+            return await call()
+
+        key = self._key(prompt, args, kwargs)
+        return await self.cache.get_or_compute_async(
+            key, call, cache_ttl if cache_ttl is not None else self.ttl, cache_if
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+_shared_cache: LLMResponseCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache.
+
+    Persists to ``$SOCRATES_DATA_DIR/llm_cache.db``. Set
+    SOCRATES_LLM_CACHE_PERSIST=false to keep it in memory only.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            db_path = None
+            if os.getenv("SOCRATES_LLM_CACHE_PERSIST", "true").lower() != "false":
+                data_dir = os.getenv("SOCRATES_DATA_DIR", str(Path.home() / ".socrates"))
+                db_path = os.path.join(data_dir, "llm_cache.db")
+            ttl = float(os.getenv("SOCRATES_LLM_CACHE_TTL", "3600"))
+            _shared_cache = LLMResponseCache(db_path=db_path, default_ttl=ttl)
+        return _shared_cache
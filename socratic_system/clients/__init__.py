@@ -3,59 +3,72 @@ Client integrations for Socrates AI
 
 This module re-exports clients from socratic-nexus library for backward compatibility.
 Direct imports from socratic_nexus.clients are now preferred.
+
+Clients are imported on first access (PEP 562), so importing this package
+does not load the LLM provider SDKs.
 """
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from socratic_nexus.clients import ClaudeClient, GoogleClient, OllamaClient
+
+    from socratic_system.clients.github_client import (
+        GitHubAPIError,
+        GitHubAuthError,
+        GitHubClient,
+        GitHubClientError,
+    )
+    from socratic_system.clients.socrates_agent_client import (
+        SocratesAgentClient,
+        SocratesAgentClientSync,
+    )
+
+_LAZY_IMPORTS = {
+    # From socratic-nexus library (PyPI package); OpenAIClient may not be
+    # available in all versions
+    "ClaudeClient": "socratic_nexus.clients",
+    "OpenAIClient": "socratic_nexus.clients",
+    "GoogleClient": "socratic_nexus.clients",
+    "OllamaClient": "socratic_nexus.clients",
+    # Socrates agent client (Phase 4 - API Adapter)
+    "SocratesAgentClient": "socratic_system.clients.socrates_agent_client",
+    "SocratesAgentClientSync": "socratic_system.clients.socrates_agent_client",
+    # GitHub client for sponsorship verification and repo access
+    "GitHubClient": "socratic_system.clients.github_client",
+    "GitHubClientError": "socratic_system.clients.github_client",
+    "GitHubAuthError": "socratic_system.clients.github_client",
+    "GitHubAPIError": "socratic_system.clients.github_client",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module), name)
+    except (ImportError, AttributeError) as e:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}: {e}") from e
+    globals()[name] = value
+    return value
+
 
-# Import from socratic-nexus library (PyPI package)
-from socratic_nexus.clients import (
-    ClaudeClient,
-    GoogleClient,
-    OllamaClient,
-)
-
-# Import GitHub client for sponsorship verification and repo access
-from socratic_system.clients.github_client import (
-    GitHubAPIError,
-    GitHubAuthError,
-    GitHubClient,
-    GitHubClientError,
-)
-
-# Import Socrates agent client (Phase 4 - API Adapter)
-from socratic_system.clients.socrates_agent_client import (
-    SocratesAgentClient,
-    SocratesAgentClientSync,
-)
-
-# OpenAIClient may not be available in all versions
-try:
-    from socratic_nexus.clients import OpenAIClient
-
-    __all__ = [
-        "ClaudeClient",
-        "OpenAIClient",
-        "GoogleClient",
-        "OllamaClient",
-        "SocratesAgentClient",
-        "SocratesAgentClientSync",
-        "GitHubClient",
-        "GitHubClientError",
-        "GitHubAuthError",
-        "GitHubAPIError",
-    ]
-except ImportError:
-    __all__ = [
-        "ClaudeClient",
-        "GoogleClient",
-        "OllamaClient",
-        "SocratesAgentClient",
-        "SocratesAgentClientSync",
-        "GitHubClient",
-        "GitHubClientError",
-        "GitHubAuthError",
-        "GitHubAPIError",
-    ]
+# OpenAIClient stays importable when socratic-nexus provides it, but is left
+# out of __all__ so that star imports work with versions that lack it
+__all__ = [
+    "ClaudeClient",
+    "GoogleClient",
+    "OllamaClient",
+    "SocratesAgentClient",
+    "SocratesAgentClientSync",
+    "GitHubClient",
+    "GitHubClientError",
+    "GitHubAuthError",
+    "GitHubAPIError",
+]
 
 logger = logging.getLogger("socrates.clients")
 logger.info("Client imports sourced from socratic-nexus library")
@@ -76,7 +76,9 @@ class SocratesAgentClient:
 
     DEFAULT_API_BASE = "http://localhost:8000"
     DEFAULT_TIMEOUT = 300  # 5 minutes
-    POLL_INTERVAL = 1.0  # seconds
+    POLL_INTERVAL = 1.0  # seconds, initial interval when long-polling is unavailable
+    MAX_POLL_INTERVAL = 10.0  # seconds
+    LONG_POLL_WAIT = 30.0  # seconds the server holds each status request
 
     def __init__(
         self,
@@ -242,31 +244,37 @@ class SocratesAgentClient:
                 raise AgentTimeoutError(f"Agent '{agent_name}' request timed out")
             raise SocratesAgentClientError(f"Failed to invoke agent '{agent_name}': {e}")
 
-    async def get_job_status(self, job_id: str) -> dict[str, Any]:
+    async def get_job_status(self, job_id: str, wait: float = 0.0) -> dict[str, Any]:
         """
         Get status of an async job.
 
         Args:
             job_id: Job ID returned from invoke_agent_async()
+            wait: Long-poll: let the server hold the request until the job
+                finishes or this many seconds pass (0 returns immediately)
 
         Returns:
             Job status information including:
-                - status: "pending", "completed", "failed", or "timeout"
+                - status: "pending", "running", "completed", "failed", "timeout" or "cancelled"
                 - complete: Boolean whether job is complete
                 - result: Agent result when complete
                 - error: Error message if failed
                 - duration_ms: Execution time in milliseconds
+                - long_poll: True if the server supports ``wait``
 
         Raises:
             JobNotFoundError: If job not found
             SocratesAgentClientError: If request fails
         """
         try:
-            response = await self.http_client.get(f"/api/v1/agents/jobs/{job_id}/status")
+            response = await self.http_client.get(
+                f"/api/v1/agents/jobs/{job_id}/status",
+                **self._wait_kwargs(wait),
+            )
             response.raise_for_status()
             data = response.json()
 
-            if not data.get("success"):
+            if not data.get("success") and data.get("status") != "success":
                 if "not found" in data.get("message", "").lower():
                     raise JobNotFoundError(f"Job '{job_id}' not found")
                 raise SocratesAgentClientError(f"Status check error: {data.get('message')}")
@@ -278,6 +286,15 @@ class SocratesAgentClient:
                 raise JobNotFoundError(f"Job '{job_id}' not found")
             raise SocratesAgentClientError(f"Failed to get job status: {e}")
 
+    def _wait_kwargs(self, wait: float, **params: Any) -> dict[str, Any]:
+        """Request kwargs for a status call, allowing the server to hold it for ``wait``."""
+        if wait <= 0:
+            return {"params": params} if params else {}
+        return {
+            "params": {**params, "wait": wait},
+            "timeout": max(self.timeout, wait + 10),
+        }
+
     async def wait_for_result(
         self,
         job_id: str,
@@ -287,10 +304,14 @@ class SocratesAgentClient:
         """
         Wait for async job to complete and return result.
 
+        Blocks on the server's long-poll, which returns as soon as the job
+        finishes. Against servers without long-poll support, falls back to
+        polling with exponential backoff.
+
         Args:
             job_id: Job ID returned from invoke_agent_async()
             timeout: Maximum time to wait in seconds (default: client timeout)
-            poll_interval: Time between status checks in seconds (default: 1.0)
+            poll_interval: Initial fallback polling interval in seconds (default: 1.0)
 
         Returns:
             Job result when completed
@@ -302,14 +323,16 @@ class SocratesAgentClient:
         """
         timeout = timeout or self.timeout
         poll_interval = poll_interval or self.POLL_INTERVAL
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        long_poll = True
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise AgentTimeoutError(f"Job '{job_id}' did not complete within {timeout} seconds")
 
-            status_info = await self.get_job_status(job_id)
+            wait = min(self.LONG_POLL_WAIT, remaining) if long_poll else 0.0
+            status_info = await self.get_job_status(job_id, wait=wait)
             status = status_info.get("status")
 
             if status == "completed":
@@ -322,15 +345,32 @@ class SocratesAgentClient:
             if status == "timeout":
                 raise AgentTimeoutError("Job execution timed out")
 
-            # Still pending, wait before checking again
-            await asyncio.sleep(min(poll_interval, timeout - elapsed))
+            if status == "cancelled":
+                raise SocratesAgentClientError(f"Job '{job_id}' was cancelled")
+
+            # Server held the request until its wait elapsed; ask again
+            if long_poll and status_info.get("long_poll"):
+                continue
 
-    async def get_batch_job_status(self, job_ids: list) -> dict[str, dict[str, Any]]:
+            # No long-poll support: back off between status checks
+            long_poll = False
+            await asyncio.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+            poll_interval = min(poll_interval * 2, self.MAX_POLL_INTERVAL)
+
+    async def get_batch_job_status(
+        self,
+        job_ids: list,
+        wait: float = 0.0,
+        return_when: str = "any",
+    ) -> dict[str, dict[str, Any]]:
         """
         Get status for multiple jobs at once.
 
         Args:
             job_ids: List of job IDs to check
+            wait: Long-poll: let the server hold the request until any/all of
+                the jobs finish or this many seconds pass (0 returns immediately)
+            return_when: "any" or "all" (used with ``wait``)
 
         Returns:
             Dictionary mapping job_ids to status information
@@ -339,11 +379,14 @@ class SocratesAgentClient:
             SocratesAgentClientError: If request fails
         """
         job_ids_str = ",".join(job_ids)
+        params = {"job_ids": job_ids_str}
+        if wait > 0:
+            params["return_when"] = return_when
 
         try:
             response = await self.http_client.get(
                 "/api/v1/agents/jobs/batch",
-                params={"job_ids": job_ids_str},
+                **self._wait_kwargs(wait, **params),
             )
             response.raise_for_status()
             data = response.json()
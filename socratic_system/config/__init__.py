@@ -41,6 +41,7 @@ class SocratesConfig:
         log_level: Logging level
         log_file: Path to log file (None = no file logging)
         custom_knowledge: List of custom knowledge entries
+        prewarm_agents: Agents to instantiate at startup rather than on first request
     """
 
     # API Configuration
@@ -75,6 +76,9 @@ class SocratesConfig:
     # Custom Knowledge
     custom_knowledge: list[str] = field(default_factory=list)
 
+    # Agent Configuration
+    prewarm_agents: list[str] = field(default_factory=list)
+
     # Encryption Configuration
     encryption_key: str | None = None  # Auto-generated if not provided
 
@@ -232,6 +236,7 @@ class SocratesConfig:
             SOCRATES_DATA_DIR: Data directory
             SOCRATES_LOG_LEVEL: Logging level
             SOCRATES_LOG_FILE: Log file path
+            SOCRATES_PREWARM_AGENTS: Comma-separated agents to instantiate at startup
 
         Note: API keys are no longer loaded from environment variables.
         All credentials are per-user and stored in the database.
@@ -255,6 +260,12 @@ class SocratesConfig:
         if log_file:
             config_dict["log_file"] = Path(log_file)
 
+        prewarm_agents = os.getenv("SOCRATES_PREWARM_AGENTS")
+        if prewarm_agents:
+            config_dict["prewarm_agents"] = [
+                name.strip() for name in prewarm_agents.split(",") if name.strip()
+            ]
+
         config_dict.update(overrides)
         return cls(**config_dict)
 
@@ -393,6 +404,11 @@ class ConfigBuilder:
         self._config_dict["retry_delay"] = delay
         return self
 
+    def with_prewarm_agents(self, agent_names: list[str]) -> "ConfigBuilder":
+        """Set agents to instantiate at startup"""
+        self._config_dict["prewarm_agents"] = agent_names
+        return self
+
     def with_subscription_token(self, token: str) -> "ConfigBuilder":
         """Set subscription token"""
         self._config_dict["subscription_token"] = token
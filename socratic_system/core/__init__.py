@@ -12,7 +12,7 @@ try:
 except ImportError:
     MaturityCalculator = None
 
-from .analytics_calculator import AnalyticsCalculator
+from .analytics_calculator import AnalyticsCalculator, ProgressionStats
 from .project_categories import (
     PROJECT_TYPE_DESCRIPTIONS,
     VALID_PROJECT_TYPES,
@@ -23,6 +23,7 @@ from .project_categories import (
 
 __all__ = [
     "AnalyticsCalculator",
+    "ProgressionStats",
     "get_phase_categories",
     "get_all_project_types",
     "get_project_type_description",
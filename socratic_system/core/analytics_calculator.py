@@ -8,6 +8,7 @@ actionable recommendations for improvement.
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict, dataclass, field
 from typing import TYPE_CHECKING
 
 from socratic_system.core.project_categories import get_phase_categories
@@ -17,6 +18,114 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PLATEAU_DELTA_THRESHOLD = 0.5  # Sessions gaining less than this count as stagnant
+PLATEAU_MIN_SESSIONS = 2  # Stagnant sessions needed before a plateau is recorded
+RECENT_WINDOW = 3  # Sessions considered for acceleration detection
+
+
+@dataclass
+class ProgressionStats:
+    """
+    Rolling aggregates over Q&A maturity deltas.
+
+    Folding a session is O(1), so velocity and plateau statistics never
+    require rescanning maturity_history. ``history_index`` records how much
+    of the project's history has already been folded in.
+    """
+
+    sessions: int = 0
+    total_gain: float = 0.0
+    low_streak: int = 0
+    low_streak_start: int = 0
+    low_streak_gain: float = 0.0
+    plateaus: list[dict] = field(default_factory=list)
+    recent_deltas: list[float] = field(default_factory=list)
+    history_index: int = 0
+
+    @property
+    def velocity(self) -> float:
+        """Average maturity points gained per session"""
+        return self.total_gain / self.sessions if self.sessions else 0.0
+
+    def record(self, delta: float) -> None:
+        """Fold one Q&A session's maturity delta into the aggregates."""
+        self.sessions += 1
+        self.total_gain += delta
+
+        if delta < PLATEAU_DELTA_THRESHOLD:
+            if self.low_streak == 0:
+                self.low_streak_start = self.sessions
+                self.low_streak_gain = 0.0
+            self.low_streak += 1
+            self.low_streak_gain += delta
+        else:
+            # A plateau is only recorded once progress resumes
+            if self.low_streak >= PLATEAU_MIN_SESSIONS:
+                self.plateaus.append(
+                    {
+                        "start_session": self.low_streak_start,
+                        "duration": self.low_streak,
+                        "avg_delta": self.low_streak_gain / self.low_streak,
+                    }
+                )
+            self.low_streak = 0
+            self.low_streak_gain = 0.0
+
+        self.recent_deltas = (self.recent_deltas + [delta])[-RECENT_WINDOW:]
+
+    def sync_history(self, history: list[dict] | None) -> ProgressionStats:
+        """
+        Fold maturity events appended since the last sync.
+
+        maturity_history is not persisted, so a history shorter than
+        ``history_index`` means it was reloaded empty; everything in it is new.
+
+        Args:
+            history: Project maturity_history list
+
+        Returns:
+            self, for chaining
+        """
+        if not isinstance(history, list):
+            return self
+        if len(history) < self.history_index:
+            self.history_index = 0
+
+        for event in history[self.history_index :]:
+            if isinstance(event, dict) and event.get("event_type") == "response_processed":
+                self.record(event.get("delta", 0.0))
+        self.history_index = len(history)
+        return self
+
+    @staticmethod
+    def for_project(project: ProjectContext) -> ProgressionStats:
+        """
+        Get aggregates for a project without modifying it.
+
+        Starts from the materialized ``analytics_metrics["progression"]`` and
+        folds in only the maturity events recorded since it was last updated.
+        """
+        metrics = getattr(project, "analytics_metrics", None)
+        stored = metrics.get("progression") if isinstance(metrics, dict) else None
+        history = getattr(project, "maturity_history", None)
+        return ProgressionStats.from_dict(stored).sync_history(history)
+
+    @staticmethod
+    def from_dict(data: dict | None) -> ProgressionStats:
+        """Deserialize from dictionary, ignoring unknown keys."""
+        if not isinstance(data, dict):
+            return ProgressionStats()
+        known = ProgressionStats.__dataclass_fields__
+        stats = ProgressionStats(**{k: v for k, v in data.items() if k in known})
+        # Copy so folding new sessions never mutates the caller's dict
+        stats.plateaus = list(stats.plateaus)
+        stats.recent_deltas = list(stats.recent_deltas)
+        return stats
+
+    def to_dict(self) -> dict:
+        """Serialize to dictionary."""
+        return asdict(self)
+
 
 class AnalyticsCalculator:
     """
@@ -240,6 +349,10 @@ class AnalyticsCalculator:
     # Progression Analysis Methods
     # ============================================================================
 
+    def get_progression_stats(self, project: ProjectContext) -> ProgressionStats:
+        """Get rolling progression aggregates for a project."""
+        return ProgressionStats.for_project(project)
+
     def calculate_velocity(self, project: ProjectContext) -> float:
         """
         Calculate average maturity points gained per Q&A session.
@@ -247,26 +360,15 @@ class AnalyticsCalculator:
         Returns:
             Float: Average points per session
         """
-        logger.debug("Calculating velocity from maturity history")
-
-        if not project.maturity_history:
-            logger.debug("No maturity history available, velocity = 0.0")
-            return 0.0
-
-        qa_events = [
-            e for e in project.maturity_history if e.get("event_type") == "response_processed"
-        ]
-
-        if not qa_events:
-            logger.debug("No Q&A response events found, velocity = 0.0")
+        stats = self.get_progression_stats(project)
+        if not stats.sessions:
+            logger.debug("No Q&A sessions recorded, velocity = 0.0")
             return 0.0
 
-        total_gain = sum(e.get("delta", 0.0) for e in qa_events)
-        velocity = total_gain / len(qa_events) if qa_events else 0.0
         logger.info(
-            f"Calculated velocity: {velocity:.2f} points/session from {len(qa_events)} Q&A sessions (total gain: {total_gain:.1f})"
+            f"Calculated velocity: {stats.velocity:.2f} points/session from {stats.sessions} Q&A sessions (total gain: {stats.total_gain:.1f})"
         )
-        return velocity
+        return stats.velocity
 
     def analyze_progression_trends(self, project: ProjectContext) -> dict:
         """
@@ -277,68 +379,29 @@ class AnalyticsCalculator:
         """
         logger.debug(f"Analyzing progression trends for project in phase: {project.phase}")
 
-        velocity = self.calculate_velocity(project)
-
-        qa_events = [
-            e for e in project.maturity_history if e.get("event_type") == "response_processed"
-        ]
+        stats = self.get_progression_stats(project)
+        velocity = stats.velocity
 
-        logger.debug(f"Analyzed {len(qa_events)} Q&A events for trend analysis")
+        logger.debug(f"Analyzed {stats.sessions} Q&A sessions for trend analysis")
 
-        insights = self._generate_insights(qa_events, velocity)
+        insights = self._generate_insights(stats)
 
         result = {
             "velocity": velocity,
-            "total_sessions": len(qa_events),
+            "total_sessions": stats.sessions,
             "current_phase": project.phase,
             "current_score": project.phase_maturity_scores.get(project.phase, 0.0),
             "insights": insights,
         }
 
         logger.info(
-            f"Progression trend analysis: {len(qa_events)} sessions, velocity={velocity:.2f}, score={result['current_score']:.1f}%"
+            f"Progression trend analysis: {stats.sessions} sessions, velocity={velocity:.2f}, score={result['current_score']:.1f}%"
         )
         return result
 
     def identify_plateaus(self, project: ProjectContext) -> list[dict]:
         """Find periods where maturity stagnates."""
-        logger.debug("Identifying plateau periods in maturity progression")
-
-        qa_events = [
-            e for e in project.maturity_history if e.get("event_type") == "response_processed"
-        ]
-
-        if len(qa_events) < 3:
-            logger.debug(
-                f"Not enough Q&A events ({len(qa_events)}) to identify plateaus (need >= 3)"
-            )
-            return []
-
-        plateaus = []
-        consecutive_low_delta = 0
-        plateau_start = None
-
-        for i, event in enumerate(qa_events):
-            delta = event.get("delta", 0.0)
-
-            if delta < 0.5:  # Threshold for stagnation
-                if consecutive_low_delta == 0:
-                    plateau_start = i
-                consecutive_low_delta += 1
-            else:
-                if consecutive_low_delta >= 2:  # At least 2 stagnant sessions
-                    plateau_info = {
-                        "start_session": plateau_start + 1,
-                        "duration": consecutive_low_delta,
-                        "avg_delta": sum(e.get("delta", 0) for e in qa_events[plateau_start:i])
-                        / consecutive_low_delta,
-                    }
-                    plateaus.append(plateau_info)
-                    logger.info(
-                        f"Plateau detected: Q{plateau_info['start_session']} for {plateau_info['duration']} sessions, avg_delta={plateau_info['avg_delta']:.2f}"
-                    )
-                consecutive_low_delta = 0
-
+        plateaus = self.get_progression_stats(project).plateaus
         logger.info(f"Found {len(plateaus)} plateau periods in progression")
         return plateaus
 
@@ -544,56 +607,35 @@ class AnalyticsCalculator:
 
         return questions.get(category, f"Can you elaborate on {category.replace('_', ' ')}?")
 
-    def _generate_insights(self, qa_events: list[dict], velocity: float) -> list[str]:
-        """Generate insights from progression data."""
+    def _generate_insights(self, stats: ProgressionStats) -> list[str]:
+        """Generate insights from rolling progression aggregates."""
+        velocity = stats.velocity
         logger.debug(
-            f"Generating insights from {len(qa_events)} Q&A events, velocity={velocity:.2f}"
+            f"Generating insights from {stats.sessions} Q&A sessions, velocity={velocity:.2f}"
         )
 
         insights = []
 
-        if not qa_events:
-            logger.debug("No Q&A events provided, returning empty insights")
+        if not stats.sessions:
+            logger.debug("No Q&A sessions recorded, returning empty insights")
             return insights
 
         if velocity > 0:
             insights.append(f"Steady growth with velocity of {velocity:.1f} points per session")
 
-        self._detect_plateaus(qa_events, insights)
-        self._detect_acceleration(qa_events, velocity, insights)
+        if stats.plateaus:
+            first = stats.plateaus[0]  # Show first plateau
+            insights.append(
+                f"Plateau detected at Q{first['start_session']} for {first['duration']} sessions"
+            )
+            logger.debug(
+                f"Detected plateau: Q{first['start_session']} for {first['duration']} sessions"
+            )
+
+        if stats.sessions >= 5 and all(d > velocity for d in stats.recent_deltas):
+            insights.append("Recent acceleration in progress")
+            logger.debug("Detected recent acceleration in progress")
 
         result = insights if insights else ["No significant patterns detected yet"]
         logger.debug(f"Generated {len(result)} insights")
         return result
-
-    def _detect_plateaus(self, qa_events: list[dict], insights: list[str]) -> None:
-        """Detect plateau patterns in Q&A events and add to insights."""
-        plateaus = []
-        consecutive_low = 0
-        plateau_start = None
-
-        for i, event in enumerate(qa_events):
-            delta = event.get("delta", 0.0)
-            if delta < 0.5:
-                if consecutive_low == 0:
-                    plateau_start = i
-                consecutive_low += 1
-            else:
-                if consecutive_low >= 2:
-                    plateaus.append((plateau_start + 1, consecutive_low))
-                consecutive_low = 0
-
-        if plateaus:
-            start, duration = plateaus[0]  # Show first plateau
-            insights.append(f"Plateau detected at Q{start} for {duration} sessions")
-            logger.debug(f"Detected plateau: Q{start} for {duration} sessions")
-
-    def _detect_acceleration(
-        self, qa_events: list[dict], velocity: float, insights: list[str]
-    ) -> None:
-        """Detect acceleration patterns in recent Q&A events and add to insights."""
-        if len(qa_events) >= 5:
-            recent_deltas = [e.get("delta", 0) for e in qa_events[-3:]]
-            if all(d > velocity for d in recent_deltas):
-                insights.append("Recent acceleration in progress")
-                logger.debug("Detected recent acceleration in progress")
@@ -9,6 +9,7 @@ import json
 import logging
 from datetime import datetime
 
+from socratic_system.caching.llm_cache import CachingLLMClient, LLMResponseCache
 from socratic_system.core.project_categories import (
     get_phase_categories,
     get_project_type_description,
@@ -25,17 +26,21 @@ class InsightCategorizer:
     understand what category it belongs to, considering project type and phase.
     """
 
-    def __init__(self, claude_client):
+    def __init__(self, claude_client, llm_cache: LLMResponseCache | None = None):
         """
         Initialize with Claude client.
 
         Args:
             claude_client: Claude API client for making categorization requests
+            llm_cache: Response cache (defaults to the shared LLM cache, opened
+                on the first categorization)
         """
         logger.debug(
             f"Initializing InsightCategorizer with Claude client: {claude_client is not None}"
         )
         self.claude_client = claude_client
+        # Identical insights produce identical prompts; serve repeats from the LLM cache
+        self._cached_client = CachingLLMClient(claude_client, llm_cache) if claude_client else None
         logger.info("InsightCategorizer initialized successfully")
 
     def categorize_insights(
@@ -87,9 +92,15 @@ class InsightCategorizer:
             )
             logger.debug(f"Prompt created: {len(prompt)} characters")
 
-            # Call Claude (pass user_id for API key lookup)
+            # Call Claude (pass user_id for API key lookup); only responses that
+            # parse into specs are cached, so a bad answer is not replayed
             logger.debug("Sending request to Claude API")
-            response = self.claude_client.generate_response(prompt, user_id=user_id)
+            response = self._cached_client.generate_response(
+                prompt,
+                user_id=user_id,
+                cache=True,
+                cache_if=lambda text: bool(self._parse_claude_response(text, insights)),
+            )
             logger.debug(f"Received response from Claude: {len(response)} characters")
 
             # Parse Claude's response
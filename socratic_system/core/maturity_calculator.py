@@ -87,6 +87,9 @@ class MaturityCalculator:
         3. Calculate percentage: (sum / 90) * 100
         4. Identify strongest/weakest categories and missing coverage
 
+        This is a full rebuild. When the phase's category scores are already
+        materialized, prefer apply_spec_changes() + maturity_from_scores().
+
         Args:
             phase_specs: List of spec dicts for this phase
             phase: Phase name (discovery, analysis, design, implementation)
@@ -97,52 +100,138 @@ class MaturityCalculator:
         logger.debug(
             f"Starting maturity calculation for phase={phase} with {len(phase_specs)} specs"
         )
+        scores = self.materialize_category_scores(phase_specs, phase)
+        return self.maturity_from_scores(scores, phase)
+
+    def materialize_category_scores(self, phase_specs: list[dict], phase: str) -> dict[str, dict]:
+        """
+        Build materialized category scores for a phase in a single pass over its specs.
+
+        Each entry keeps the running sums (weighted_sum, confidence_sum) next to
+        the capped score, so later spec additions/removals can be applied
+        without rescanning the phase.
+
+        Args:
+            phase_specs: List of spec dicts for this phase
+            phase: Phase name
 
+        Returns:
+            Dict mapping category to materialized score dict
+        """
         if phase not in self.phase_categories:
             logger.error(f"Unknown phase requested: {phase}")
             raise ValueError(f"Unknown phase: {phase}")
 
-        # Get category targets for this phase
         category_targets = self.phase_categories[phase]
+        scores = {
+            category: self._empty_category_score(category, target)
+            for category, target in category_targets.items()
+        }
+
+        for spec in phase_specs:
+            entry = scores.get(spec.get("category"))
+            if entry is not None:
+                self._fold_spec(entry, spec, 1)
 
-        # Initialize tracking
+        for entry in scores.values():
+            self._refresh_category_score(entry)
+
+        logger.debug(
+            f"Materialized {len(scores)} category scores for phase {phase} from {len(phase_specs)} specs"
+        )
+        return scores
+
+    def apply_spec_changes(
+        self,
+        materialized: dict[str, dict] | None,
+        phase: str,
+        added_specs: list[dict] | None = None,
+        removed_specs: list[dict] | None = None,
+    ) -> dict[str, dict] | None:
+        """
+        Apply spec additions/removals to materialized category scores.
+
+        Only the categories touched by the given specs are rescored; every other
+        category keeps its materialized value.
+
+        Args:
+            materialized: Existing materialized scores for the phase
+            phase: Phase name
+            added_specs: Specs newly added to the phase
+            removed_specs: Specs removed from the phase
+
+        Returns:
+            New materialized scores, or None if ``materialized`` has no running
+            sums (legacy data) and the caller must rebuild with
+            materialize_category_scores()
+        """
+        if phase not in self.phase_categories:
+            logger.error(f"Unknown phase requested: {phase}")
+            raise ValueError(f"Unknown phase: {phase}")
+
+        if not isinstance(materialized, dict) or not all(
+            isinstance(entry, dict) and "weighted_sum" in entry for entry in materialized.values()
+        ):
+            logger.debug(f"No materialized scores for phase {phase}, full rebuild required")
+            return None
+
+        category_targets = self.phase_categories[phase]
+        scores = dict(materialized)
+        touched = set()
+
+        for specs, sign in ((added_specs or [], 1), (removed_specs or [], -1)):
+            for spec in specs:
+                category = spec.get("category")
+                if category not in category_targets:
+                    continue
+                if category not in touched:
+                    touched.add(category)
+                    scores[category] = dict(
+                        scores.get(category)
+                        or self._empty_category_score(category, category_targets[category])
+                    )
+                self._fold_spec(scores[category], spec, sign)
+
+        for category in touched:
+            scores[category]["target_score"] = category_targets[category]
+            self._refresh_category_score(scores[category])
+
+        logger.debug(f"Incrementally updated {len(touched)} categories in phase {phase}")
+        return scores
+
+    def maturity_from_scores(self, scores: dict[str, dict], phase: str) -> PhaseMaturity:
+        """
+        Build a PhaseMaturity from materialized category scores.
+
+        Runs in O(categories) and never looks at individual specs.
+
+        Args:
+            scores: Materialized category scores for the phase
+            phase: Phase name
+
+        Returns:
+            PhaseMaturity object with complete maturity information
+        """
+        if phase not in self.phase_categories:
+            logger.error(f"Unknown phase requested: {phase}")
+            raise ValueError(f"Unknown phase: {phase}")
+
+        category_targets = self.phase_categories[phase]
         category_scores: dict[str, CategoryScore] = {}
         total_score = 0.0
-        total_specs = len(phase_specs)
-
-        logger.debug(f"Phase {phase} has {len(category_targets)} categories with 90 total points")
+        total_specs = 0
 
-        # Calculate score for each category
         for category, target in category_targets.items():
-            # Get specs for this category
-            category_specs = [s for s in phase_specs if s.get("category") == category]
-
-            # Calculate confidence-weighted score
-            weighted_sum = 0.0
-            for spec in category_specs:
-                # Each spec contributes based on its confidence
-                # Typical confidence: 0.9 from Claude extraction
-                confidence = spec.get("confidence", 0.9)
-                value = spec.get("value", 1.0)  # Base value of spec
-                weighted_sum += value * confidence
-
-            # Cap at category target (prevents one category from dominating)
-            capped_score = min(weighted_sum, target)
-            total_score += capped_score
-
-            # Store category score
+            entry = scores.get(category) or self._empty_category_score(category, target)
             category_scores[category] = CategoryScore(
                 category=category,
-                current_score=capped_score,
+                current_score=entry["current_score"],
                 target_score=target,
-                confidence=self._calculate_category_confidence(category_specs),
-                spec_count=len(category_specs),
-            )
-
-            logger.debug(
-                f"Category {category}: {len(category_specs)} specs, "
-                f"weighted_sum={weighted_sum:.2f}, capped={capped_score:.2f}/{target}"
+                confidence=entry["confidence"],
+                spec_count=entry["spec_count"],
             )
+            total_score += entry["current_score"]
+            total_specs += entry["spec_count"]
 
         # Calculate overall percentage (out of 90 points)
         overall_percentage = (total_score / 90.0) * 100.0
@@ -190,6 +279,41 @@ class MaturityCalculator:
 
         return maturity
 
+    @staticmethod
+    def _empty_category_score(category: str, target: float) -> dict:
+        """Materialized score for a category with no specs"""
+        return {
+            "category": category,
+            "current_score": 0.0,
+            "target_score": target,
+            "confidence": 0.0,
+            "spec_count": 0,
+            "weighted_sum": 0.0,
+            "confidence_sum": 0.0,
+        }
+
+    @staticmethod
+    def _fold_spec(entry: dict, spec: dict, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one spec's contribution to a category"""
+        # Each spec contributes based on its confidence (typically 0.9 from Claude extraction)
+        confidence = spec.get("confidence", 0.9)
+        value = spec.get("value", 1.0)
+        entry["weighted_sum"] += sign * value * confidence
+        entry["confidence_sum"] += sign * confidence
+        entry["spec_count"] += sign
+
+    @staticmethod
+    def _refresh_category_score(entry: dict) -> None:
+        """Recompute the capped score and average confidence from running sums"""
+        if entry["spec_count"] <= 0:
+            # Reset rather than carry floating-point residue from removals
+            entry.update(spec_count=0, weighted_sum=0.0, confidence_sum=0.0)
+        # Cap at category target (prevents one category from dominating)
+        entry["current_score"] = max(0.0, min(entry["weighted_sum"], entry["target_score"]))
+        entry["confidence"] = (
+            entry["confidence_sum"] / entry["spec_count"] if entry["spec_count"] else 0.0
+        )
+
     def _calculate_category_confidence(self, specs: list[dict]) -> float:
         """Calculate average confidence for a category's specs"""
         if not specs:
@@ -1,6 +1,24 @@
 """Database layer for Socrates AI"""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .project_db import ProjectDatabase
-from .vector_db import VectorDatabase
+
+if TYPE_CHECKING:
+    from .vector_db import VectorDatabase
+
+# VectorDatabase loads chromadb and sentence transformers; import it on first access
+_LAZY_IMPORTS = {"VectorDatabase": ".vector_db"}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["VectorDatabase", "ProjectDatabase"]
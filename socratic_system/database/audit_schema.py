@@ -4,8 +4,11 @@ Database schema for audit logging.
 Creates immutable, encrypted audit trail tables for compliance and forensics.
 """
 
+import json
 import sqlite3
 
+from socratic_system.database.read_write_split import use_primary, use_replica
+
 
 def create_audit_log_table(connection: sqlite3.Connection) -> None:
     """Create audit_logs table for immutable logging.
@@ -220,13 +223,47 @@ def create_all_audit_tables(connection: sqlite3.Connection) -> None:
     create_security_events_table(connection)
 
 
+def _audit_log_row(entry: dict) -> tuple:
+    """Build the audit_logs column values for an entry, JSON-encoding its details."""
+    return (
+        entry.get("timestamp"),
+        entry.get("event_type"),
+        entry.get("severity"),
+        entry.get("actor_id"),
+        entry.get("actor_type"),
+        entry.get("action"),
+        entry.get("resource"),
+        entry.get("resource_type"),
+        entry.get("status"),
+        entry.get("result_code"),
+        json.dumps(entry.get("details") or {}, default=str),
+        entry.get("request_id"),
+        entry.get("session_id"),
+        entry.get("ip_address"),
+        entry.get("user_agent"),
+    )
+
+
+_INSERT_AUDIT_LOG = """
+    INSERT INTO audit_logs (
+        timestamp, event_type, severity, actor_id, actor_type,
+        action, resource, resource_type, status, result_code,
+        details, request_id, session_id, ip_address, user_agent
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def add_audit_log_methods_to_db(db_class) -> None:
     """Add audit logging methods to database class.
 
+    The class must provide ``_connect()``, returning a connection that is
+    closed after each use, and a ``logger``.
+
     Args:
         db_class: Database class to extend
     """
 
+    @use_primary()
     def insert_audit_log(self, entry_data: dict) -> int | None:
         """Insert audit log entry.
 
@@ -236,40 +273,44 @@ def add_audit_log_methods_to_db(db_class) -> None:
         Returns:
             Inserted row ID or None
         """
+        connection = self._connect()
         try:
-            cursor = self.get_connection().cursor()
-            cursor.execute(
-                """
-                INSERT INTO audit_logs (
-                    timestamp, event_type, severity, actor_id, actor_type,
-                    action, resource, resource_type, status, result_code,
-                    details, request_id, session_id, ip_address, user_agent
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    entry_data.get("timestamp"),
-                    entry_data.get("event_type"),
-                    entry_data.get("severity"),
-                    entry_data.get("actor_id"),
-                    entry_data.get("actor_type"),
-                    entry_data.get("action"),
-                    entry_data.get("resource"),
-                    entry_data.get("resource_type"),
-                    entry_data.get("status"),
-                    entry_data.get("result_code"),
-                    entry_data.get("details"),  # JSON string
-                    entry_data.get("request_id"),
-                    entry_data.get("session_id"),
-                    entry_data.get("ip_address"),
-                    entry_data.get("user_agent"),
-                ),
-            )
-            self.get_connection().commit()
+            cursor = connection.execute(_INSERT_AUDIT_LOG, _audit_log_row(entry_data))
+            connection.commit()
             return cursor.lastrowid
         except Exception as e:
-            self._logger.error(f"Failed to insert audit log: {e}")
+            connection.rollback()
+            self.logger.error(f"Failed to insert audit log: {e}")
             return None
+        finally:
+            connection.close()
+
+    @use_primary()
+    def insert_audit_logs(self, entries: list[dict]) -> int:
+        """Insert a batch of audit log entries in a single transaction.
+
+        Args:
+            entries: List of dictionaries with audit entry data
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            sqlite3.Error: If the batch cannot be committed
+        """
+        connection = self._connect()
+        try:
+            connection.executemany(_INSERT_AUDIT_LOG, [_audit_log_row(e) for e in entries])
+            connection.commit()
+            return len(entries)
+        except Exception as e:
+            connection.rollback()
+            self.logger.error(f"Failed to insert {len(entries)} audit logs: {e}")
+            raise
+        finally:
+            connection.close()
 
+    @use_replica()
     def query_audit_logs(
         self, filters: dict = None, start_date=None, end_date=None, limit: int = 100
     ):
@@ -284,6 +325,7 @@ def add_audit_log_methods_to_db(db_class) -> None:
         Returns:
             List of matching audit entries
         """
+        connection = self._connect()
         try:
             query = "SELECT * FROM audit_logs WHERE 1=1"
             params = []
@@ -309,13 +351,19 @@ def add_audit_log_methods_to_db(db_class) -> None:
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
 
-            cursor = self.get_connection().cursor()
-            cursor.execute(query, params)
-            return cursor.fetchall()
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(query, params).fetchall()
+            return [
+                {**dict(row), "details": json.loads(row["details"]) if row["details"] else {}}
+                for row in rows
+            ]
         except Exception as e:
-            self._logger.error(f"Failed to query audit logs: {e}")
+            self.logger.error(f"Failed to query audit logs: {e}")
             return []
+        finally:
+            connection.close()
 
+    @use_primary()
     def purge_old_audit_logs(self, cutoff_date, dry_run=False):
         """Remove audit logs older than cutoff date.
 
@@ -326,8 +374,9 @@ def add_audit_log_methods_to_db(db_class) -> None:
         Returns:
             Number of entries purged
         """
+        connection = self._connect()
         try:
-            cursor = self.get_connection().cursor()
+            cursor = connection.cursor()
 
             # Count entries to be deleted
             cursor.execute(
@@ -339,15 +388,18 @@ def add_audit_log_methods_to_db(db_class) -> None:
                 cursor.execute(
                     "DELETE FROM audit_logs WHERE timestamp < ?", (cutoff_date.isoformat(),)
                 )
-                self.get_connection().commit()
-                self._logger.info(f"Purged {count} old audit logs")
+                connection.commit()
+                self.logger.info(f"Purged {count} old audit logs")
 
             return count
         except Exception as e:
-            self._logger.error(f"Failed to purge old audit logs: {e}")
+            self.logger.error(f"Failed to purge old audit logs: {e}")
             return 0
+        finally:
+            connection.close()
 
     # Add methods to class
     db_class.insert_audit_log = insert_audit_log
+    db_class.insert_audit_logs = insert_audit_logs
     db_class.query_audit_logs = query_audit_logs
     db_class.purge_old_audit_logs = purge_old_audit_logs
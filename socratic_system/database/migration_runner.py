@@ -96,8 +96,14 @@ class MigrationRunner:
             cursor = conn.cursor()
 
             # Execute all statements in the migration file
-            # Split by semicolon and execute each statement
-            statements = [s.strip() for s in sql_script.split(";") if s.strip()]
+            # Split into complete statements (trigger bodies contain semicolons)
+            statements = []
+            statement = ""
+            for line in sql_script.splitlines(keepends=True):
+                statement += line
+                if sqlite3.complete_statement(statement):
+                    statements.append(statement.strip())
+                    statement = ""
 
             for statement in statements:
                 self.logger.debug(f"Executing: {statement[:50]}...")
@@ -208,6 +214,26 @@ class MigrationRunner:
         # Check for github_auth table
         github_auth_table_exists = self.table_exists("github_auth")
 
+        # Check for materialized maturity state (incremental maturity/analytics)
+        incremental_maturity_exists = self._column_exists(
+            "category_scores", "weighted_sum"
+        ) and self._column_exists("analytics_metrics", "progression_state")
+
+        # Check for analytics read model tables
+        analytics_read_model_exists = self.table_exists("project_analytics") and self.table_exists(
+            "user_analytics"
+        )
+
+        # Check for storage usage counters (tables and the triggers maintaining them)
+        storage_usage_counters_exist = self.table_exists(
+            "user_storage_usage"
+        ) and self._trigger_exists("trg_project_files_storage_delete")
+
+        # Check for LLM usage rollup tables
+        llm_usage_rollups_exist = self.table_exists("llm_usage_hourly") and self.table_exists(
+            "llm_usage_daily"
+        )
+
         status = {
             "github_import_tables": github_tables_exist,
             "users_claude_auth_method": users_column_exists,
@@ -215,10 +241,42 @@ class MigrationRunner:
             "code_history_column": code_history_exists,
             "testing_mode_enabled_at_column": testing_mode_timestamp_exists,
             "github_auth_table": github_auth_table_exists,
+            "incremental_maturity_columns": incremental_maturity_exists,
+            "analytics_read_model_tables": analytics_read_model_exists,
+            "storage_usage_counters": storage_usage_counters_exist,
+            "llm_usage_rollups": llm_usage_rollups_exist,
         }
 
         return status
 
+    def _trigger_exists(self, trigger_name: str) -> bool:
+        """
+        Check if a trigger exists in the database
+
+        Args:
+            trigger_name: Name of the trigger
+
+        Returns:
+            True if trigger exists, False otherwise
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='trigger' AND name=?",
+                (trigger_name,),
+            )
+
+            result = cursor.fetchone() is not None
+            conn.close()
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error checking if trigger exists: {str(e)}")
+            return False
+
     def _column_exists(self, table_name: str, column_name: str) -> bool:
         """
         Check if a column exists in a table
@@ -258,6 +316,10 @@ class MigrationRunner:
         2. Claude auth method column (users.claude_auth_method)
         3. Knowledge documents file tracking columns (knowledge_documents.file_path, knowledge_documents.file_size)
         4. Code history column (projects.code_history)
+        5. Materialized maturity state (category_scores sums, analytics_metrics.progression_state)
+        6. Analytics read model tables (project_analytics, user_analytics)
+        7. Storage usage counters (user_storage_usage, project_storage_usage and their triggers)
+        8. LLM usage rollups (llm_usage_hourly, llm_usage_daily)
 
         Returns:
             Tuple of (success: bool, message: str)
@@ -291,6 +353,26 @@ class MigrationRunner:
                 "GitHub authentication and sponsorship verification",
                 True,
             ),  # optional
+            (
+                "add_incremental_maturity_columns.sql",
+                "Materialized maturity state columns",
+                False,
+            ),
+            (
+                "add_analytics_read_model_tables.sql",
+                "Analytics read model tables",
+                False,
+            ),
+            (
+                "add_storage_usage_counters.sql",
+                "Storage usage counters",
+                False,
+            ),
+            (
+                "add_llm_usage_rollups.sql",
+                "LLM usage rollups",
+                False,
+            ),
         ]
 
         all_migrations_successful = True
@@ -332,6 +414,28 @@ class MigrationRunner:
                 self.logger.debug(f"{migration_name} already applied, skipping")
                 messages.append(f"{migration_name}: already applied")
                 continue
+            elif migration_file == "add_incremental_maturity_columns.sql" and status.get(
+                "incremental_maturity_columns"
+            ):
+                self.logger.debug(f"{migration_name} already applied, skipping")
+                messages.append(f"{migration_name}: already applied")
+                continue
+            elif migration_file == "add_analytics_read_model_tables.sql" and status.get(
+                "analytics_read_model_tables"
+            ):
+                self.logger.debug(f"{migration_name} already applied, skipping")
+                messages.append(f"{migration_name}: already applied")
+                continue
+            elif migration_file == "add_storage_usage_counters.sql" and status.get(
+                "storage_usage_counters"
+            ):
+                self.logger.debug(f"{migration_name} already applied, skipping")
+                messages.append(f"{migration_name}: already applied")
+                continue
+            elif migration_file == "add_llm_usage_rollups.sql" and status.get("llm_usage_rollups"):
+                self.logger.debug(f"{migration_name} already applied, skipping")
+                messages.append(f"{migration_name}: already applied")
+                continue
 
             # Apply the migration
             self.logger.info(f"Applying {migration_name} migration ({migration_file})...")
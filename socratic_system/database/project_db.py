@@ -24,7 +24,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from socratic_system.database.audit_schema import (
+    add_audit_log_methods_to_db,
+    create_audit_log_table,
+)
 from socratic_system.database.migration_runner import MigrationRunner
+from socratic_system.database.query_profiler import QueryProfiler, get_profiler
+from socratic_system.database.read_write_split import SQLiteRouter, use_primary, use_replica
+from socratic_system.events.event_emitter import EventEmitter
+from socratic_system.events.event_types import EventType
 from socratic_system.models import (
     QuestionEffectiveness,
     UserBehaviorPattern,
@@ -37,6 +45,21 @@ from socratic_system.utils.datetime_helpers import deserialize_datetime, seriali
 
 logger = logging.getLogger("socrates.database")
 
+# Number of maturity snapshots kept per project in the analytics read model
+MATURITY_TREND_LIMIT = 50
+
+# Counter columns of user_storage_usage and project_storage_usage
+STORAGE_USAGE_COLUMNS = ("document_bytes", "document_count", "file_bytes", "file_count")
+
+# Stored size of a knowledge document: its file size, else its content length
+_DOCUMENT_SIZE_SQL = "COALESCE(NULLIF(file_size, 0), LENGTH(CAST(content AS BLOB)), 0)"
+
+# Hourly LLM usage rollups are kept this long; daily rollups are kept indefinitely
+LLM_USAGE_HOURLY_RETENTION_DAYS = 90
+
+# Counter columns of llm_usage_hourly and llm_usage_daily
+LLM_USAGE_ROLLUP_COLUMNS = ("requests", "input_tokens", "output_tokens", "cost")
+
 
 class ProjectDatabase:
     """
@@ -44,12 +67,13 @@ class ProjectDatabase:
     Uses queryable columns and separate tables for optimal performance.
     """
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, profiler: QueryProfiler | None = None):
         """
         Initialize database connection
 
         Args:
             db_path: Path to SQLite database file. If not provided, uses SOCRATES_DATA_DIR environment variable
+            profiler: Profiler recording every statement (default: the global profiler)
 
         Raises:
             ValueError: If db_path is invalid or empty
@@ -64,19 +88,41 @@ class ProjectDatabase:
 
         self.db_path = db_path
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Write notifications (project_id payload) so read caches can invalidate
+        self.events = EventEmitter()
+        self.profiler = profiler or get_profiler()
 
         # Create directory if it doesn't exist
         data_dir = os.path.dirname(db_path)
         if data_dir:  # Only create if directory path is non-empty
             os.makedirs(data_dir, exist_ok=True)
 
+        # Reads use pooled read-only connections, writes one serialized writer
+        self.router = SQLiteRouter(db_path, profiler=self.profiler)
+
         # Initialize V2 schema if not already exists
         self._init_database_v2()
+        self._init_audit_log_table()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Check out a connection for the current method's role
+
+        Methods decorated with use_replica() get a pooled read-only connection,
+        all others the shared writer connection. Statements on either are
+        recorded by the query profiler; close() returns the connection.
+        """
+        return self.router.connect()
+
+    def close(self) -> None:
+        """Close the pooled reader and writer connections"""
+        self.router.close()
+
+    @use_primary()
     def _init_database_v2(self):
         """Initialize V2 database schema and apply migrations"""
         # Check if V2 schema exists
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -113,6 +159,15 @@ class ProjectDatabase:
         # Apply any pending migrations after schema initialization
         self._ensure_migrations()
 
+    @use_primary()
+    def _init_audit_log_table(self) -> None:
+        """Create the audit_logs table written by the audit log methods"""
+        conn = self._connect()
+        try:
+            create_audit_log_table(conn)
+        finally:
+            conn.close()
+
     def _ensure_migrations(self) -> None:
         """Ensure all required migrations are applied"""
         try:
@@ -237,10 +292,16 @@ class ProjectDatabase:
 
         return counts
 
+    def _notify_write(self, event_type: EventType, project_id: str | None) -> None:
+        """Emit a committed write to a project on ``self.events``"""
+        if project_id and self.events.listener_count(event_type):
+            self.events.emit(event_type, {"project_id": project_id}, skip_logging=True)
+
     # ========================================================================
     # PROJECT OPERATIONS (Core optimization: 10-20x faster)
     # ========================================================================
 
+    @use_primary()
     def save_project(self, project: ProjectContext) -> None:
         """
         Save or update a project
@@ -248,7 +309,7 @@ class ProjectDatabase:
         Args:
             project: ProjectContext object to save
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -257,6 +318,11 @@ class ProjectDatabase:
             self._enable_foreign_keys(cursor)
 
             now = datetime.now()
+            # The REPLACE below cascades to child rows; keep the analytics read model
+            cursor.execute(
+                "SELECT * FROM project_analytics WHERE project_id = ?", (project.project_id,)
+            )
+            read_model = cursor.fetchone()
             self._save_main_project_record(cursor, project, now)
             self._delete_project_related_records(cursor, project.project_id)
             self._save_project_lists(cursor, project)
@@ -264,8 +330,18 @@ class ProjectDatabase:
             self._save_project_scores(cursor, project)
             self._save_project_analytics(cursor, project)
             self._save_categorized_specs(cursor, project)
+            if read_model:
+                placeholders = ", ".join("?" * len(read_model))
+                cursor.execute(
+                    f"INSERT OR REPLACE INTO project_analytics VALUES ({placeholders})", read_model
+                )
+            if not project.conversation_history:
+                self._write_message_analytics(cursor, project.project_id, [0] * 5, None)
+            self._record_phase_timing(cursor, project.project_id, project.phase, now)
+            self._append_maturity_trend(cursor, project.project_id, now)
             conn.commit()
             self.logger.debug(f"Saved project {project.project_id}")
+            self._notify_write(EventType.PROJECT_SAVED, project.project_id)
 
         except Exception as e:
             conn.rollback()
@@ -415,18 +491,38 @@ class ProjectDatabase:
             for phase, categories in project.category_scores.items():
                 if isinstance(categories, dict):
                     for category, score in categories.items():
-                        score_val = score if isinstance(score, (int, float)) else 0.0
                         cursor.execute(
-                            "INSERT OR REPLACE INTO category_scores (project_id, phase, category, score) VALUES (?, ?, ?, ?)",
-                            (project.project_id, phase, category, score_val),
+                            "INSERT OR REPLACE INTO category_scores (project_id, phase, category, score, target_score, weighted_sum, confidence_sum, spec_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (project.project_id, phase, category, *self._category_score_row(score)),
                         )
 
+    @staticmethod
+    def _category_score_row(score) -> tuple:
+        """
+        Flatten a category score into (score, target_score, weighted_sum, confidence_sum, spec_count).
+
+        Plain numbers store only the score. Materialized score dicts also keep
+        the running sums the maturity calculator needs for incremental updates.
+        """
+        if isinstance(score, dict):
+            if "weighted_sum" not in score:
+                return (float(score.get("current_score", 0.0)), None, None, None, None)
+            return (
+                float(score.get("current_score", 0.0)),
+                float(score.get("target_score", 0.0)),
+                float(score["weighted_sum"]),
+                float(score.get("confidence_sum", 0.0)),
+                int(score.get("spec_count", 0)),
+            )
+        score_val = score if isinstance(score, (int, float)) else 0.0
+        return (score_val, None, None, None, None)
+
     def _save_project_analytics(self, cursor, project: ProjectContext) -> None:
         """Save project analytics metrics"""
         if not project.analytics_metrics:
             return
         cursor.execute(
-            "INSERT OR REPLACE INTO analytics_metrics (project_id, velocity, total_qa_sessions, avg_confidence, weak_categories, strong_categories) VALUES (?, ?, ?, ?, ?, ?)",
+            "INSERT OR REPLACE INTO analytics_metrics (project_id, velocity, total_qa_sessions, avg_confidence, weak_categories, strong_categories, progression_state) VALUES (?, ?, ?, ?, ?, ?, ?)",
             (
                 project.project_id,
                 (
@@ -446,6 +542,11 @@ class ProjectDatabase:
                 ),
                 json.dumps(project.analytics_metrics.get("weak_categories", [])),
                 json.dumps(project.analytics_metrics.get("strong_categories", [])),
+                (
+                    json.dumps(project.analytics_metrics["progression"])
+                    if isinstance(project.analytics_metrics.get("progression"), dict)
+                    else None
+                ),
             ),
         )
 
@@ -492,6 +593,78 @@ class ProjectDatabase:
             self.logger.error(f"Error saving specs: {e}")
             raise
 
+    @use_primary()
+    def save_project_scores(
+        self,
+        project_id: str,
+        phase_maturity_scores: dict[str, float] | None = None,
+        category_scores: dict[str, dict[str, Any]] | None = None,
+        progress: int | None = None,
+    ) -> bool:
+        """
+        Persist only maturity and category scores for a project (delta write).
+
+        Unlike save_project, this leaves every other project table untouched,
+        so background analysis can publish results without rewriting the
+        whole project or racing a concurrent full save.
+
+        Args:
+            project_id: Project ID
+            phase_maturity_scores: Phase -> score mapping to upsert
+            category_scores: Phase -> {category -> score} mapping to upsert; scores
+                may be numbers or materialized score dicts
+            progress: Optional overall progress to store on the project
+
+        Returns:
+            True if successful, False otherwise
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            self._enable_foreign_keys(cursor)
+            now = serialize_datetime(datetime.now())
+
+            for phase, score in (phase_maturity_scores or {}).items():
+                score_val = score if isinstance(score, (int, float)) else 0.0
+                cursor.execute(
+                    "INSERT OR REPLACE INTO phase_maturity_scores (project_id, phase, score, updated_at) VALUES (?, ?, ?, ?)",
+                    (project_id, phase, score_val, now),
+                )
+
+            for phase, categories in (category_scores or {}).items():
+                if not isinstance(categories, dict):
+                    continue
+                for category, score in categories.items():
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO category_scores (project_id, phase, category, score, target_score, weighted_sum, confidence_sum, spec_count, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (project_id, phase, category, *self._category_score_row(score), now),
+                    )
+
+            self._append_maturity_trend(cursor, project_id, datetime.now())
+
+            if progress is not None:
+                cursor.execute(
+                    "UPDATE projects SET progress = ?, updated_at = ? WHERE project_id = ?",
+                    (progress, now, project_id),
+                )
+            else:
+                cursor.execute(
+                    "UPDATE projects SET updated_at = ? WHERE project_id = ?", (now, project_id)
+                )
+            conn.commit()
+            self.logger.debug(f"Saved scores for project {project_id}")
+            self._notify_write(EventType.PROJECT_UPDATED, project_id)
+            return True
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Error saving scores for project {project_id}: {e}")
+            return False
+        finally:
+            conn.close()
+
+    @use_replica()
     def load_project(self, project_id: str) -> ProjectContext | None:
         """
         Load a project by ID
@@ -504,7 +677,7 @@ class ProjectDatabase:
         Returns:
             ProjectContext or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -596,6 +769,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_projects(
         self, username: str, include_archived: bool = False
     ) -> list[ProjectContext]:
@@ -611,7 +785,7 @@ class ProjectDatabase:
         Returns:
             List of ProjectContext objects
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -667,6 +841,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_project(self, project_id: str) -> bool:
         """
         Delete a project with cascading deletes to all related tables
@@ -681,7 +856,7 @@ class ProjectDatabase:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -698,6 +873,7 @@ class ProjectDatabase:
 
             deleted = cursor.rowcount > 0
             if deleted:
+                self._notify_write(EventType.PROJECT_DELETED, project_id)
                 self.logger.info(
                     f"Deleted project {project_id} "
                     f"(cascade: {cascade_counts['conversation']} conversation msgs, "
@@ -719,6 +895,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def archive_project(self, project_id: str) -> bool:
         """
         Archive a project (soft delete)
@@ -729,7 +906,7 @@ class ProjectDatabase:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -747,6 +924,7 @@ class ProjectDatabase:
 
             if success:
                 self.logger.info(f"Archived project {project_id}")
+                self._notify_write(EventType.PROJECT_ARCHIVED, project_id)
             return success
 
         except Exception as e:
@@ -756,6 +934,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def restore_project(self, project_id: str) -> bool:
         """
         Restore an archived project
@@ -766,7 +945,7 @@ class ProjectDatabase:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -784,6 +963,7 @@ class ProjectDatabase:
 
             if success:
                 self.logger.info(f"Restored project {project_id}")
+                self._notify_write(EventType.PROJECT_RESTORED, project_id)
             return success
 
         except Exception as e:
@@ -797,6 +977,7 @@ class ProjectDatabase:
     # CONVERSATION HISTORY (Lazy loading support)
     # ========================================================================
 
+    @use_replica()
     def get_conversation_history(self, project_id: str) -> list[dict]:
         """
         Load conversation history for a project
@@ -810,7 +991,7 @@ class ProjectDatabase:
         Returns:
             List of message dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -847,6 +1028,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def save_conversation_history(self, project_id: str, history: list[dict]) -> None:
         """
         Save conversation history for a project
@@ -855,17 +1037,23 @@ class ProjectDatabase:
             project_id: ID of project
             history: List of message dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
             # Clear existing
             cursor.execute("DELETE FROM conversation_history WHERE project_id = ?", (project_id,))
 
-            # Insert new
+            # Insert new, tallying read-model counters on the way
+            totals = [len(history), 0, 0, 0, 0]
+            last_message_at = None
             for msg in history:
                 # Support both "type" and "role" field names
                 message_type = msg.get("type") or msg.get("role", "user")
+                for i, value in enumerate(
+                    self._message_stats(message_type, msg.get("content", "")), start=1
+                ):
+                    totals[i] += value
                 # Preserve all metadata fields except the main ones
                 metadata = {
                     k: v
@@ -885,8 +1073,11 @@ class ProjectDatabase:
                         json.dumps(metadata) if metadata else json.dumps({}),
                     ),
                 )
+                last_message_at = msg.get("timestamp", last_message_at)
 
+            self._write_message_analytics(cursor, project_id, totals, last_message_at)
             conn.commit()
+            self._notify_write(EventType.PROJECT_UPDATED, project_id)
 
         except Exception as e:
             conn.rollback()
@@ -895,6 +1086,375 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    # ========================================================================
+    # ANALYTICS READ MODEL (maintained on write, bounded-cost reads)
+    # ========================================================================
+
+    @staticmethod
+    def _message_stats(message_type: str, content: str) -> tuple[int, int, int, int]:
+        """
+        Analytics contribution of a single conversation message
+
+        Returns:
+            Tuple of (is_question, is_answer, has_code_block, code_lines)
+        """
+        content = content or ""
+        has_code = "```" in content
+        parts = content.split("```") if has_code else []
+        return (
+            int(message_type == "user"),
+            int(message_type == "assistant"),
+            int(has_code),
+            len(parts[1].splitlines()) if len(parts) > 1 else 0,
+        )
+
+    def _write_message_analytics(
+        self, cursor: sqlite3.Cursor, project_id: str, totals: list[int], last_message_at
+    ) -> None:
+        """Store conversation counters in the project's analytics row"""
+        cursor.execute(
+            "INSERT OR IGNORE INTO project_analytics (project_id) VALUES (?)", (project_id,)
+        )
+        cursor.execute(
+            """
+            UPDATE project_analytics
+            SET message_count = ?, question_count = ?, answer_count = ?,
+                code_block_count = ?, code_lines_generated = ?, last_message_at = ?,
+                updated_at = ?
+            WHERE project_id = ?
+        """,
+            (*totals, last_message_at, serialize_datetime(datetime.now()), project_id),
+        )
+
+    def _record_phase_timing(
+        self, cursor: sqlite3.Cursor, project_id: str, phase: str, now: datetime
+    ) -> None:
+        """Close the previous phase and open the new one when a project changes phase"""
+        cursor.execute(
+            "SELECT phase_timings FROM project_analytics WHERE project_id = ?", (project_id,)
+        )
+        row = cursor.fetchone()
+        timings = json.loads(row[0]) if row and row[0] else {"current": None, "phases": {}}
+        if timings.get("current") == phase:
+            return
+
+        now_str = serialize_datetime(now)
+        previous = timings["phases"].get(timings.get("current"))
+        if previous and previous.get("started_at"):
+            started = deserialize_datetime(previous["started_at"])
+            previous["duration_seconds"] = previous.get("duration_seconds", 0.0) + max(
+                0.0, (now - started).total_seconds()
+            )
+            previous["started_at"] = None
+
+        entry = timings["phases"].setdefault(phase, {"duration_seconds": 0.0})
+        entry["started_at"] = now_str
+        entry.setdefault("first_entered_at", now_str)
+        timings["current"] = phase
+
+        cursor.execute(
+            "INSERT OR IGNORE INTO project_analytics (project_id) VALUES (?)", (project_id,)
+        )
+        cursor.execute(
+            "UPDATE project_analytics SET phase_timings = ?, updated_at = ? WHERE project_id = ?",
+            (json.dumps(timings), now_str, project_id),
+        )
+
+    def _append_maturity_trend(
+        self, cursor: sqlite3.Cursor, project_id: str, now: datetime
+    ) -> None:
+        """Append the project's current phase scores to its trend if they changed"""
+        cursor.execute(
+            "SELECT phase, score FROM phase_maturity_scores WHERE project_id = ?", (project_id,)
+        )
+        scores = {phase: round(score or 0.0, 2) for phase, score in cursor.fetchall()}
+        active = [s for s in scores.values() if s > 0]
+        overall = round(sum(active) / len(active), 2) if active else 0.0
+
+        cursor.execute(
+            "SELECT maturity_trend FROM project_analytics WHERE project_id = ?", (project_id,)
+        )
+        row = cursor.fetchone()
+        trend = json.loads(row[0]) if row and row[0] else []
+        if trend and trend[-1].get("phase_scores") == scores:
+            return
+
+        trend.append(
+            {"timestamp": serialize_datetime(now), "overall": overall, "phase_scores": scores}
+        )
+        cursor.execute(
+            "INSERT OR IGNORE INTO project_analytics (project_id) VALUES (?)", (project_id,)
+        )
+        cursor.execute(
+            "UPDATE project_analytics SET maturity_trend = ?, updated_at = ? WHERE project_id = ?",
+            (json.dumps(trend[-MATURITY_TREND_LIMIT:]), serialize_datetime(now), project_id),
+        )
+
+    def _add_user_llm_usage(
+        self,
+        cursor: sqlite3.Cursor,
+        user_id: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+        timestamp: str,
+    ) -> None:
+        """Fold one LLM call into the user's analytics row"""
+        cursor.execute(
+            """
+            UPDATE user_analytics
+            SET llm_requests = llm_requests + 1, input_tokens = input_tokens + ?,
+                output_tokens = output_tokens + ?, llm_cost = llm_cost + ?,
+                last_llm_call_at = MAX(COALESCE(last_llm_call_at, ''), ?), updated_at = ?
+            WHERE user_id = ?
+        """,
+            (
+                input_tokens or 0,
+                output_tokens or 0,
+                cost or 0.0,
+                timestamp,
+                serialize_datetime(datetime.now()),
+                user_id,
+            ),
+        )
+        if cursor.rowcount == 0:
+            # First write since the read model was introduced: seed from the
+            # rollups, which already contain the record being saved
+            self._rebuild_user_analytics(cursor, user_id)
+
+    def _rebuild_user_analytics(self, cursor: sqlite3.Cursor, user_id: str) -> None:
+        """Recompute a user's analytics row from the daily LLM usage rollups"""
+        # Raw llm_usage rows may have been purged; the daily rollups are complete
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO user_analytics
+            (user_id, llm_requests, input_tokens, output_tokens, llm_cost, last_llm_call_at, updated_at)
+            SELECT ?, COALESCE(SUM(requests), 0), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost), 0.0), MAX(last_call_at), ?
+            FROM llm_usage_daily WHERE user_id = ?
+        """,
+            (user_id, serialize_datetime(datetime.now()), user_id),
+        )
+
+    @use_primary()
+    def rebuild_project_analytics(self, project_id: str) -> bool:
+        """
+        Recompute a project's analytics row from its stored conversation and scores
+
+        Used to backfill projects created before the read model existed.
+        Cost is proportional to the project's history, so this runs once per
+        project rather than on every read.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                SELECT message_type, content, timestamp FROM conversation_history
+                WHERE project_id = ? ORDER BY timestamp ASC, rowid ASC
+            """,
+                (project_id,),
+            )
+            totals = [0, 0, 0, 0, 0]
+            last_message_at = None
+            for message_type, content, timestamp in cursor.fetchall():
+                stats = self._message_stats(message_type, content)
+                totals[0] += 1
+                for i, value in enumerate(stats, start=1):
+                    totals[i] += value
+                last_message_at = timestamp
+
+            now = datetime.now()
+            self._write_message_analytics(cursor, project_id, totals, last_message_at)
+            cursor.execute("SELECT phase FROM projects WHERE project_id = ?", (project_id,))
+            row = cursor.fetchone()
+            if row and row[0]:
+                self._record_phase_timing(cursor, project_id, row[0], now)
+            self._append_maturity_trend(cursor, project_id, now)
+            conn.commit()
+            self.logger.debug(f"Rebuilt analytics read model for project {project_id}")
+            return True
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Error rebuilding analytics for project {project_id}: {e}")
+            return False
+        finally:
+            conn.close()
+
+    @use_replica()
+    def get_project_analytics(
+        self, project_id: str, _rebuilt: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        Get precomputed analytics for a project
+
+        Reads a fixed number of rows (project, its analytics row, phase scores
+        and analytics metrics), so latency does not grow with the size of the
+        conversation history. A missing analytics row is rebuilt once; if it
+        is still missing afterwards, the counters are reported as zero.
+
+        Args:
+            project_id: Project ID
+            _rebuilt: Internal; set when re-reading after a rebuild
+
+        Returns:
+            Analytics dict, or None if the project does not exist
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                SELECT p.project_id, p.name, p.owner, p.phase, p.project_type, p.status,
+                       p.created_at, pa.project_id AS analytics_row, pa.message_count, pa.question_count,
+                       pa.answer_count, pa.code_block_count, pa.code_lines_generated,
+                       pa.last_message_at, pa.phase_timings, pa.maturity_trend
+                FROM projects p LEFT JOIN project_analytics pa ON pa.project_id = p.project_id
+                WHERE p.project_id = ?
+            """,
+                (project_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            if row["analytics_row"] is None and not _rebuilt:
+                conn.close()
+                self.rebuild_project_analytics(project_id)
+                return self.get_project_analytics(project_id, _rebuilt=True)
+
+            phase_scores = self._load_phase_maturity(cursor, project_id) or {}
+            active = [s for s in phase_scores.values() if s > 0]
+
+            return {
+                "project_id": row["project_id"],
+                "name": row["name"],
+                "owner": row["owner"],
+                "phase": row["phase"],
+                "project_type": row["project_type"],
+                "status": row["status"],
+                "created_at": (
+                    deserialize_datetime(row["created_at"]) if row["created_at"] else None
+                ),
+                "message_count": row["message_count"] or 0,
+                "total_questions": row["question_count"] or 0,
+                "total_answers": row["answer_count"] or 0,
+                "code_generation_count": row["code_block_count"] or 0,
+                "code_lines_generated": row["code_lines_generated"] or 0,
+                "last_message_at": row["last_message_at"],
+                "phase_timings": (
+                    json.loads(row["phase_timings"]) if row["phase_timings"] else {}
+                ).get("phases", {}),
+                "maturity_trend": (
+                    json.loads(row["maturity_trend"]) if row["maturity_trend"] else []
+                ),
+                "phase_maturity_scores": phase_scores,
+                "overall_maturity": sum(active) / len(active) if active else 0.0,
+                "analytics_metrics": self._load_analytics_metrics(cursor, project_id) or {},
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error getting analytics for project {project_id}: {e}")
+            return None
+        finally:
+            conn.close()
+
+    @use_primary()
+    def get_user_analytics(self, username: str) -> dict[str, Any]:
+        """
+        Get precomputed analytics across a user's active projects
+
+        Per-project rows come from the read model and LLM totals from the
+        user's analytics row, so cost depends on the number of projects, not
+        on how much history they contain.
+
+        Args:
+            username: Project owner
+
+        Returns:
+            Dict with per-project summaries and LLM usage totals
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                SELECT p.project_id, p.name, p.phase,
+                       COALESCE(pa.message_count, 0) AS message_count,
+                       COALESCE(pa.question_count, 0) AS question_count,
+                       COALESCE(pa.answer_count, 0) AS answer_count,
+                       (SELECT AVG(score) FROM phase_maturity_scores s
+                        WHERE s.project_id = p.project_id AND s.score > 0) AS overall_maturity
+                FROM projects p LEFT JOIN project_analytics pa ON pa.project_id = p.project_id
+                WHERE p.owner = ? AND p.is_archived = 0
+                ORDER BY p.updated_at DESC
+            """,
+                (username,),
+            )
+            projects = [
+                {
+                    "project_id": row["project_id"],
+                    "name": row["name"],
+                    "phase": row["phase"],
+                    "message_count": row["message_count"],
+                    "total_questions": row["question_count"],
+                    "total_answers": row["answer_count"],
+                    "overall_maturity": row["overall_maturity"] or 0.0,
+                }
+                for row in cursor.fetchall()
+            ]
+
+            cursor.execute(
+                """
+                SELECT llm_requests, input_tokens, output_tokens, llm_cost, last_llm_call_at
+                FROM user_analytics WHERE user_id = ?
+            """,
+                (username,),
+            )
+            usage = cursor.fetchone()
+            if usage is None:
+                self._rebuild_user_analytics(cursor, username)
+                conn.commit()
+                cursor.execute(
+                    """
+                    SELECT llm_requests, input_tokens, output_tokens, llm_cost, last_llm_call_at
+                    FROM user_analytics WHERE user_id = ?
+                """,
+                    (username,),
+                )
+                usage = cursor.fetchone()
+
+            return {
+                "username": username,
+                "projects": projects,
+                "llm_usage": {
+                    "requests": usage["llm_requests"] if usage else 0,
+                    "input_tokens": usage["input_tokens"] if usage else 0,
+                    "output_tokens": usage["output_tokens"] if usage else 0,
+                    "cost": usage["llm_cost"] if usage else 0.0,
+                    "last_call_at": usage["last_llm_call_at"] if usage else None,
+                },
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error getting analytics for user {username}: {e}")
+            return {"username": username, "projects": [], "llm_usage": {}}
+        finally:
+            conn.close()
+
+    @use_primary()
     def _save_project_notes(self, project_id: str, notes: list[dict]) -> None:
         """
         Save project notes to database
@@ -903,7 +1463,7 @@ class ProjectDatabase:
             project_id: ID of project
             notes: List of note dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -939,6 +1499,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def _save_pending_questions(self, project_id: str, questions: list[dict]) -> None:
         """
         Save pending questions for a project
@@ -947,7 +1508,7 @@ class ProjectDatabase:
             project_id: ID of project
             questions: List of question dicts with fields like id, question, phase, status, etc.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -983,6 +1544,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def _load_project_notes(self, project_id: str) -> list[dict]:
         """
         Load project notes from database
@@ -993,7 +1555,7 @@ class ProjectDatabase:
         Returns:
             List of note dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1026,6 +1588,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def _load_pending_questions(self, project_id: str) -> list[dict]:
         """
         Load pending questions for a project
@@ -1036,7 +1599,7 @@ class ProjectDatabase:
         Returns:
             List of question dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1070,6 +1633,7 @@ class ProjectDatabase:
     # PRE-SESSION CONVERSATIONS (before project selection)
     # ========================================================================
 
+    @use_primary()
     def save_free_session_message(
         self,
         username: str,
@@ -1088,7 +1652,7 @@ class ProjectDatabase:
             content: Message content
             metadata: Optional metadata (topics, intents, etc.)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1117,6 +1681,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_free_session_conversation(
         self, username: str, session_id: str, limit: int = 50
     ) -> list[dict]:
@@ -1131,7 +1696,7 @@ class ProjectDatabase:
         Returns:
             List of message dicts with timestamp and metadata
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1169,6 +1734,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_free_session_sessions(self, username: str, limit: int = 20) -> list[dict]:
         """
         Get list of free_session sessions for a user.
@@ -1180,7 +1746,7 @@ class ProjectDatabase:
         Returns:
             List of session dicts with metadata
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1226,6 +1792,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_free_session_session(self, username: str, session_id: str) -> bool:
         """
         Delete a free_session session and all its messages.
@@ -1237,7 +1804,7 @@ class ProjectDatabase:
         Returns:
             True if deleted successfully, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1274,9 +1841,10 @@ class ProjectDatabase:
     # USER OPERATIONS
     # ========================================================================
 
+    @use_primary()
     def save_user(self, user: User) -> None:
         """Save or update a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1324,9 +1892,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def load_user(self, username: str) -> User | None:
         """Load a user by username"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1382,9 +1951,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def load_user_by_email(self, email: str) -> User | None:
         """Load a user by email address"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1440,6 +2010,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_llm_configs(self, user_id: str) -> list[LLMProviderConfig]:
         """
         Get all LLM provider configurations for a user.
@@ -1453,7 +2024,7 @@ class ProjectDatabase:
         Returns:
             List of LLMProviderConfig objects with provider, model, settings, etc.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1515,6 +2086,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_llm_config(self, user_id: str, provider: str) -> LLMProviderConfig | None:
         """
         Get single LLM provider configuration for a user.
@@ -1528,7 +2100,7 @@ class ProjectDatabase:
         Returns:
             LLMProviderConfig object with all configuration details, or None if not found.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1589,6 +2161,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def save_llm_config(self, user_id: str, provider: str, config_data: dict[str, Any]) -> bool:
         """
         Save or update an LLM provider configuration.
@@ -1601,7 +2174,7 @@ class ProjectDatabase:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1635,6 +2208,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def save_api_key(self, user_id: str, provider: str, encrypted_key: str, key_hash: str) -> bool:
         """
         Save or update an API key for a provider.
@@ -1648,7 +2222,7 @@ class ProjectDatabase:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1683,6 +2257,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_api_key(self, user_id: str, provider: str) -> str | None:
         """
         Get encrypted API key for a provider.
@@ -1694,7 +2269,7 @@ class ProjectDatabase:
         Returns:
             Encrypted API key or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1720,6 +2295,52 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
+    def _rewrap_api_key(
+        self, user_id: str, provider: str, old_encrypted_key: str, plaintext: str
+    ) -> bool:
+        """
+        Re-encrypt a legacy-format API key with the envelope format.
+
+        The update is conditional on the stored ciphertext being unchanged, so a
+        key saved concurrently by the user is never overwritten.
+
+        Args:
+            user_id: Username
+            provider: Provider name (e.g., 'claude', 'openai')
+            old_encrypted_key: Legacy ciphertext currently stored
+            plaintext: Decrypted API key
+
+        Returns:
+            True if the row was re-wrapped, False otherwise
+        """
+        from socratic_system.encryption import encrypt_data
+
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                UPDATE api_keys SET encrypted_key = ?
+                WHERE user_id = ? AND provider = ? AND encrypted_key = ?
+            """,
+                (encrypt_data(plaintext), user_id, provider, old_encrypted_key),
+            )
+
+            conn.commit()
+            if cursor.rowcount:
+                self.logger.debug(f"Re-wrapped legacy API key for {user_id}/{provider}")
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.warning(f"Failed to re-wrap API key for {user_id}/{provider}: {e}")
+            return False
+        finally:
+            conn.close()
+
+    @use_primary()
     def delete_api_key(self, user_id: str, provider: str) -> bool:
         """
         Delete an API key for a provider.
@@ -1731,7 +2352,7 @@ class ProjectDatabase:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1845,12 +2466,15 @@ class ProjectDatabase:
                 )
                 return config  # Return config without api_key - will fail at agent level
 
-            # Decrypt it
-            from socratic_system.encryption import decrypt_data
+            # Decrypt it (cached; legacy ciphertexts are re-wrapped lazily)
+            from socratic_system.encryption import decrypt_credential, is_legacy_ciphertext
 
-            decrypted_key = decrypt_data(encrypted_key)
+            decrypted_key = decrypt_credential(encrypted_key)
             config["api_key"] = decrypted_key
 
+            if is_legacy_ciphertext(encrypted_key):
+                self._rewrap_api_key(user_id, provider, encrypted_key, decrypted_key)
+
             self.logger.debug(
                 f"Retrieved active LLM config with credentials for {user_id}: {provider}"
             )
@@ -1863,6 +2487,7 @@ class ProjectDatabase:
             )
             return config  # Return config without api_key - will fail at agent level
 
+    @use_primary()
     def save_knowledge_document(
         self,
         user_id: str,
@@ -1892,7 +2517,7 @@ class ProjectDatabase:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1949,6 +2574,7 @@ class ProjectDatabase:
 
             conn.commit()
             self.logger.debug(f"Saved knowledge document {doc_id} for project {project_id}")
+            self._notify_write(EventType.DOCUMENT_IMPORTED, project_id)
             return True
 
         except Exception as e:
@@ -1962,9 +2588,10 @@ class ProjectDatabase:
     # USER MANAGEMENT METHODS
     # ========================================================================
 
+    @use_replica()
     def user_exists(self, username: str) -> bool:
         """Check if a user exists"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1974,6 +2601,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def archive_user(self, username: str, archive_projects: bool = True) -> bool:
         """Archive a user (soft delete)"""
         try:
@@ -1987,15 +2615,17 @@ class ProjectDatabase:
 
             if archive_projects:
                 # Archive all projects owned by this user
-                conn = sqlite3.connect(self.db_path)
+                conn = self._connect()
                 cursor = conn.cursor()
 
-                cursor.execute(
-                    "UPDATE projects SET is_archived = 1, updated_at = ? WHERE owner = ? AND is_archived = 0",
-                    (serialize_datetime(datetime.now()), username),
-                )
-                conn.commit()
-                conn.close()
+                try:
+                    cursor.execute(
+                        "UPDATE projects SET is_archived = 1, updated_at = ? WHERE owner = ? AND is_archived = 0",
+                        (serialize_datetime(datetime.now()), username),
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
 
             self.logger.debug(f"Archived user {username}")
             return True
@@ -2021,9 +2651,10 @@ class ProjectDatabase:
             self.logger.error(f"Error restoring user {username}: {e}")
             return False
 
+    @use_primary()
     def permanently_delete_user(self, username: str) -> bool:
         """Permanently delete a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2032,6 +2663,7 @@ class ProjectDatabase:
             cursor.execute("DELETE FROM question_effectiveness WHERE user_id = ?", (username,))
             cursor.execute("DELETE FROM behavior_patterns WHERE user_id = ?", (username,))
             cursor.execute("DELETE FROM llm_usage WHERE user_id = ?", (username,))
+            cursor.execute("DELETE FROM user_analytics WHERE user_id = ?", (username,))
             cursor.execute("DELETE FROM knowledge_documents WHERE user_id = ?", (username,))
 
             conn.commit()
@@ -2049,9 +2681,10 @@ class ProjectDatabase:
     # LEARNING METHODS - QUESTION EFFECTIVENESS
     # ========================================================================
 
+    @use_primary()
     def save_question_effectiveness(self, effectiveness: QuestionEffectiveness) -> bool:
         """Save question effectiveness record"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2108,11 +2741,12 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_question_effectiveness(
         self, user_id: str, question_template_id: str
     ) -> dict[str, any] | None:
         """Get question effectiveness record for a user-question pair"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2151,9 +2785,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_effectiveness_all(self, user_id: str) -> list[dict[str, any]]:
         """Get all question effectiveness records for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2198,9 +2833,10 @@ class ProjectDatabase:
     # LEARNING METHODS - BEHAVIOR PATTERNS
     # ========================================================================
 
+    @use_primary()
     def save_behavior_pattern(self, pattern: UserBehaviorPattern) -> bool:
         """Save behavior pattern record"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2240,9 +2876,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_behavior_pattern(self, user_id: str, pattern_type: str) -> dict[str, any] | None:
         """Get behavior pattern for a user-pattern_type pair"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2277,9 +2914,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_behavior_patterns(self, user_id: str) -> list[dict[str, any]]:
         """Get all behavior patterns for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2326,15 +2964,20 @@ class ProjectDatabase:
     # NOTE MANAGEMENT METHODS
     # ========================================================================
 
+    @use_primary()
     def delete_note(self, note_id: str) -> bool:
         """Delete a note by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
+            cursor.execute("SELECT project_id FROM project_notes WHERE note_id = ?", (note_id,))
+            row = cursor.fetchone()
             cursor.execute("DELETE FROM project_notes WHERE note_id = ?", (note_id,))
             conn.commit()
             self.logger.debug(f"Deleted note {note_id}")
+            if row:
+                self._notify_write(EventType.NOTE_DELETED, row[0])
             return True
 
         except Exception as e:
@@ -2344,9 +2987,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def search_notes(self, project_id: str, query: str) -> list[ProjectNote]:
         """Search notes for a project by content"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -2389,9 +3033,10 @@ class ProjectDatabase:
     # KNOWLEDGE DOCUMENT METHODS
     # ========================================================================
 
+    @use_replica()
     def get_knowledge_document(self, doc_id: str) -> dict[str, any] | None:
         """Get a single knowledge document"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2452,9 +3097,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_project_knowledge_documents(self, project_id: str) -> list[dict[str, any]]:
         """Get all knowledge documents for a project (includes file_size for storage tracking)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2556,24 +3202,31 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_knowledge_document(self, doc_id: str) -> bool:
         """Delete a knowledge document by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
+            cursor.execute("SELECT project_id FROM knowledge_documents WHERE id = ?", (doc_id,))
+            row = cursor.fetchone()
             cursor.execute("DELETE FROM knowledge_documents WHERE id = ?", (doc_id,))
             conn.commit()
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+            if deleted and row:
+                self._notify_write(EventType.DOCUMENT_DELETED, row[0])
+            return deleted
         except Exception as e:
             self.logger.error(f"Error deleting knowledge document {doc_id}: {e}")
             return False
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_knowledge_documents(self, user_id: str) -> list:
         """Get all knowledge documents for a user across all projects"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2610,13 +3263,183 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    # ========================================================================
+    # STORAGE USAGE METHODS
+    # ========================================================================
+
+    @use_replica()
+    def get_user_storage_usage(self, username: str) -> dict[str, int]:
+        """
+        Get a user's storage usage counters
+
+        Reads one counter row maintained on write, so quota checks do not
+        depend on the size of the user's library.
+
+        Args:
+            username: Username
+
+        Returns:
+            Dict with document_bytes, document_count, file_bytes, file_count
+            and total_bytes (zeros if the user stores nothing)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            return self._read_storage_usage(cursor, "user_storage_usage", "user_id", username)
+        except Exception as e:
+            self.logger.error(f"Error getting storage usage for user {username}: {e}")
+            return self._storage_usage_dict(None)
+        finally:
+            conn.close()
+
+    @use_replica()
+    def get_project_storage_usage(self, project_id: str) -> dict[str, int]:
+        """
+        Get a project's storage usage counters
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Dict with document_bytes, document_count, file_bytes, file_count
+            and total_bytes (zeros if the project stores nothing)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            return self._read_storage_usage(
+                cursor, "project_storage_usage", "project_id", project_id
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting storage usage for project {project_id}: {e}")
+            return self._storage_usage_dict(None)
+        finally:
+            conn.close()
+
+    def _read_storage_usage(
+        self, cursor: sqlite3.Cursor, table: str, key_column: str, key: str
+    ) -> dict[str, int]:
+        """Read one row of a storage usage counter table"""
+        cursor.execute(
+            f"SELECT {', '.join(STORAGE_USAGE_COLUMNS)} FROM {table} WHERE {key_column} = ?",
+            (key,),
+        )
+        return self._storage_usage_dict(cursor.fetchone())
+
+    @staticmethod
+    def _storage_usage_dict(row: tuple | None) -> dict[str, int]:
+        """Convert a counter row (None for no row) to a usage dict with total_bytes"""
+        usage = dict(
+            zip(STORAGE_USAGE_COLUMNS, row or (0,) * len(STORAGE_USAGE_COLUMNS), strict=True)
+        )
+        usage["total_bytes"] = usage["document_bytes"] + usage["file_bytes"]
+        return usage
+
+    @use_primary()
+    def reconcile_storage_usage(self) -> int:
+        """
+        Recompute storage usage counters from documents and project files
+
+        Triggers keep the counters current, so they drift only through changes
+        the triggers cannot attribute, such as a project changing owner. Rows
+        left with nothing to count are removed. Cost is proportional to the
+        number of documents and files, so this runs periodically rather than
+        on upload.
+
+        Returns:
+            Number of counter rows corrected
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            # Hold the write lock from the reads on, so a counter update committed
+            # by another process in between is not overwritten with stale totals
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='project_files'"
+            )
+            has_files = cursor.fetchone() is not None
+
+            document_rows = f"""
+                SELECT {{key}} AS key, {_DOCUMENT_SIZE_SQL} AS document_bytes,
+                       1 AS document_count, 0 AS file_bytes, 0 AS file_count
+                FROM knowledge_documents WHERE {{key}} IS NOT NULL
+            """
+            user_rows = document_rows.format(key="user_id")
+            project_rows = document_rows.format(key="project_id")
+            if has_files:
+                user_rows += """
+                    UNION ALL
+                    SELECT p.owner, 0, 0, COALESCE(f.file_size, 0), 1
+                    FROM project_files f JOIN projects p ON p.project_id = f.project_id
+                """
+                project_rows += """
+                    UNION ALL
+                    SELECT project_id, 0, 0, COALESCE(file_size, 0), 1 FROM project_files
+                """
+            totals = ", ".join(f"SUM(u.{column})" for column in STORAGE_USAGE_COLUMNS)
+
+            corrected = 0
+            for table, key_column, columns, expected_sql in (
+                (
+                    "user_storage_usage",
+                    "user_id",
+                    STORAGE_USAGE_COLUMNS,
+                    f"SELECT u.key, {totals} FROM ({user_rows}) u GROUP BY u.key",
+                ),
+                (
+                    "project_storage_usage",
+                    "project_id",
+                    ("owner", *STORAGE_USAGE_COLUMNS),
+                    f"""
+                    SELECT u.key, p.owner, {totals} FROM ({project_rows}) u
+                    LEFT JOIN projects p ON p.project_id = u.key
+                    GROUP BY u.key
+                    """,
+                ),
+            ):
+                cursor.execute(expected_sql)
+                expected = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+                cursor.execute(f"SELECT {key_column}, {', '.join(columns)} FROM {table}")
+                current = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+                drifted = [key for key, values in expected.items() if current.get(key) != values]
+                cursor.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({key_column}, {', '.join(columns)}) "
+                    f"VALUES (?{', ?' * len(columns)})",
+                    [(key, *expected[key]) for key in drifted],
+                )
+                # Rows with nothing left to count, e.g. for deleted projects
+                stale = [key for key in current if key not in expected]
+                cursor.executemany(
+                    f"DELETE FROM {table} WHERE {key_column} = ?", [(key,) for key in stale]
+                )
+                counters = len(STORAGE_USAGE_COLUMNS)
+                corrected += len(drifted) + sum(any(current[key][-counters:]) for key in stale)
+
+            conn.commit()
+            if corrected:
+                self.logger.warning(f"Corrected {corrected} drifted storage usage counters")
+            return corrected
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Error reconciling storage usage: {e}")
+            return 0
+        finally:
+            conn.close()
+
     # ========================================================================
     # USAGE TRACKING METHODS
     # ========================================================================
 
+    @use_primary()
     def save_usage_record(self, usage: LLMUsageRecord) -> bool:
         """Save LLM usage record"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2642,6 +3465,17 @@ class ProjectDatabase:
                     cost,
                 ),
             )
+            self._add_llm_usage_rollups(
+                cursor,
+                usage.user_id,
+                usage.provider,
+                usage.model,
+                (1, input_tokens or 0, output_tokens or 0, cost or 0.0),
+                timestamp_str,
+            )
+            self._add_user_llm_usage(
+                cursor, usage.user_id, input_tokens, output_tokens, cost, timestamp_str
+            )
 
             conn.commit()
             self.logger.debug(f"Saved usage record for {usage.user_id}/{usage.provider}")
@@ -2654,9 +3488,200 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @staticmethod
+    def _llm_usage_buckets(timestamp: str) -> tuple[str, str]:
+        """Hourly and daily rollup buckets of an ISO timestamp"""
+        return f"{timestamp[:10]}T{timestamp[11:13]}:00:00", timestamp[:10]
+
+    def _add_llm_usage_rollups(
+        self,
+        cursor: sqlite3.Cursor,
+        user_id: str,
+        provider: str,
+        model: str,
+        counters: tuple,
+        timestamp: str,
+    ) -> None:
+        """Fold LLM calls (requests, input_tokens, output_tokens, cost) into their rollup buckets"""
+        columns = ", ".join(LLM_USAGE_ROLLUP_COLUMNS)
+        increments = ", ".join(
+            f"{column} = {column} + excluded.{column}" for column in LLM_USAGE_ROLLUP_COLUMNS
+        )
+        for table, bucket in zip(
+            ("llm_usage_hourly", "llm_usage_daily"), self._llm_usage_buckets(timestamp), strict=True
+        ):
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (user_id, bucket, provider, model, {columns}, last_call_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, bucket, provider, model) DO UPDATE SET {increments},
+                    last_call_at = MAX(COALESCE(last_call_at, ''), excluded.last_call_at)
+            """,
+                (user_id, bucket, provider, model, *counters, timestamp),
+            )
+
+    @use_replica()
+    def get_usage_summary(
+        self, user_id: str, days: int = 30, provider: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Summarize a user's LLM usage over the last ``days`` days
+
+        Reads the rollups: hourly buckets for the partial first day and daily
+        buckets from the first full day on, so the cost of a report depends on
+        the length of the range rather than on the number of calls. The range
+        starts at the beginning of the hour ``days`` days ago, or of that day
+        once its hourly buckets have been purged.
+
+        Args:
+            user_id: User ID
+            days: Number of days to summarize
+            provider: Only count calls to this provider (all providers if None)
+
+        Returns:
+            Dict with period_days, requests, input_tokens, output_tokens,
+            total_tokens, total_cost, daily_average (tokens per day),
+            by_provider and by_model ({name: {requests, tokens, cost}}) and
+            daily (list of {date, requests, tokens, cost}, oldest first)
+        """
+        now = datetime.now()
+        since = (now - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        if since < now - timedelta(days=LLM_USAGE_HOURLY_RETENTION_DAYS):
+            since = since.replace(hour=0)
+        first_full_day = since.date() if since.hour == 0 else since.date() + timedelta(days=1)
+        provider_filter = " AND provider = ?" if provider else ""
+        provider_params = (provider,) if provider else ()
+
+        summary = {
+            "period_days": days,
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+            "total_cost": 0.0,
+            "daily_average": 0.0,
+            "by_provider": {},
+            "by_model": {},
+            "daily": [],
+        }
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            columns = ", ".join(LLM_USAGE_ROLLUP_COLUMNS)
+            cursor.execute(
+                f"""
+                SELECT substr(bucket, 1, 10), provider, model, {columns} FROM llm_usage_hourly
+                WHERE user_id = ? AND bucket >= ? AND bucket < ?{provider_filter}
+                UNION ALL
+                SELECT bucket, provider, model, {columns} FROM llm_usage_daily
+                WHERE user_id = ? AND bucket >= ?{provider_filter}
+            """,
+                (
+                    user_id,
+                    since.strftime("%Y-%m-%dT%H:00:00"),
+                    f"{first_full_day.isoformat()}T00:00:00",
+                    *provider_params,
+                    user_id,
+                    first_full_day.isoformat(),
+                    *provider_params,
+                ),
+            )
+
+            daily = {}
+            for (
+                day,
+                row_provider,
+                model,
+                requests,
+                input_tokens,
+                output_tokens,
+                cost,
+            ) in cursor.fetchall():
+                tokens = input_tokens + output_tokens
+                summary["requests"] += requests
+                summary["input_tokens"] += input_tokens
+                summary["output_tokens"] += output_tokens
+                summary["total_cost"] += cost
+                for group, key in (
+                    (summary["by_provider"], row_provider),
+                    (summary["by_model"], model),
+                    (daily, day),
+                ):
+                    totals = group.setdefault(key, {"requests": 0, "tokens": 0, "cost": 0.0})
+                    totals["requests"] += requests
+                    totals["tokens"] += tokens
+                    totals["cost"] += cost
+
+            summary["total_tokens"] = summary["input_tokens"] + summary["output_tokens"]
+            summary["total_cost"] = round(summary["total_cost"], 6)
+            summary["daily_average"] = round(summary["total_tokens"] / max(days, 1), 2)
+            summary["daily"] = [{"date": day, **daily[day]} for day in sorted(daily)]
+            return summary
+
+        except Exception as e:
+            self.logger.error(f"Error getting usage summary for {user_id}: {e}")
+            return summary
+        finally:
+            conn.close()
+
+    @use_primary()
+    def purge_usage_records(self, retention_days: int) -> int:
+        """
+        Delete raw LLM usage records older than the retention period
+
+        Every call is already counted in the rollups, so usage reports and user
+        analytics are unaffected. Hourly rollups older than
+        LLM_USAGE_HOURLY_RETENTION_DAYS are removed as well; daily rollups are
+        kept indefinitely.
+
+        Args:
+            retention_days: Days of raw records to keep
+
+        Returns:
+            Number of raw records deleted
+        """
+        now = datetime.now()
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "DELETE FROM llm_usage WHERE timestamp < ?",
+                (serialize_datetime(now - timedelta(days=retention_days)),),
+            )
+            purged = cursor.rowcount
+            cursor.execute(
+                "DELETE FROM llm_usage_hourly WHERE bucket < ?",
+                (
+                    (now - timedelta(days=LLM_USAGE_HOURLY_RETENTION_DAYS)).strftime(
+                        "%Y-%m-%dT%H:00:00"
+                    ),
+                ),
+            )
+            conn.commit()
+            if purged:
+                self.logger.info(
+                    f"Purged {purged} LLM usage records older than {retention_days} days"
+                )
+            return purged
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Error purging usage records: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    @use_replica()
     def get_usage_records(self, user_id: str, days: int, provider: str) -> list[dict[str, any]]:
-        """Get usage records for a user within specified days"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get raw usage records for a user within specified days
+
+        Raw records are only kept for the retention period passed to
+        purge_usage_records(); use get_usage_summary() for totals.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2704,9 +3729,10 @@ class ProjectDatabase:
     # ARCHIVED ITEMS & UTILITY METHODS
     # ========================================================================
 
+    @use_replica()
     def get_archived_items(self, item_type: str) -> list[dict[str, any]]:
         """Get archived items (projects or users)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2761,9 +3787,10 @@ class ProjectDatabase:
         """Permanently delete a project (alias for delete_project)"""
         return self.delete_project(project_id)
 
+    @use_primary()
     def unset_other_default_providers(self, user_id: str, current_provider: str) -> None:
         """Unset all other default LLM providers when setting a new default"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2806,11 +3833,12 @@ class ProjectDatabase:
     # UPDATED SIGNATURE METHODS - HANDLE BOTH OBJECT AND PARAMETER SIGNATURES
     # ========================================================================
 
+    @use_primary()
     def _save_llm_config_impl(
         self, user_id: str, provider: str, config_data: dict[str, any]
     ) -> bool:
         """Internal implementation for saving LLM config"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -2844,11 +3872,12 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def _save_api_key_impl(
         self, user_id: str, provider: str, encrypted_key: str, key_hash: str
     ) -> bool:
         """Internal implementation for saving API key"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3022,21 +4051,32 @@ class ProjectDatabase:
 
     def _load_category_scores(
         self, cursor: sqlite3.Cursor, project_id: str
-    ) -> dict[str, dict[str, float]] | None:
-        """Load category scores"""
+    ) -> dict[str, dict[str, Any]] | None:
+        """Load category scores (materialized score dicts where running sums were saved)"""
         cursor.execute(
             """
-            SELECT phase, category, score FROM category_scores
-            WHERE project_id = ?
+            SELECT phase, category, score, target_score, weighted_sum, confidence_sum, spec_count
+            FROM category_scores WHERE project_id = ?
         """,
             (project_id,),
         )
 
         scores = {}
-        for phase, category, score in cursor.fetchall():
+        for phase, category, score, target, weighted, confidence_sum, count in cursor.fetchall():
             if phase not in scores:
                 scores[phase] = {}
-            scores[phase][category] = score
+            if weighted is None:
+                scores[phase][category] = score
+                continue
+            scores[phase][category] = {
+                "category": category,
+                "current_score": score,
+                "target_score": target,
+                "confidence": confidence_sum / count if count else 0.0,
+                "spec_count": count,
+                "weighted_sum": weighted,
+                "confidence_sum": confidence_sum,
+            }
 
         return scores if scores else None
 
@@ -3044,7 +4084,8 @@ class ProjectDatabase:
         """Load analytics metrics"""
         cursor.execute(
             """
-            SELECT velocity, total_qa_sessions, avg_confidence, weak_categories, strong_categories
+            SELECT velocity, total_qa_sessions, avg_confidence, weak_categories, strong_categories,
+                   progression_state
             FROM analytics_metrics WHERE project_id = ?
         """,
             (project_id,),
@@ -3060,6 +4101,7 @@ class ProjectDatabase:
             "avg_confidence": row[2],
             "weak_categories": json.loads(row[3]) if row[3] else [],
             "strong_categories": json.loads(row[4]) if row[4] else [],
+            "progression": json.loads(row[5]) if row[5] else {},
         }
 
     def _load_categorized_specs(
@@ -3108,9 +4150,10 @@ class ProjectDatabase:
     # BACKWARD COMPATIBILITY - Stub methods pointing to V2 implementations
     # ========================================================================
 
+    @use_primary()
     def save_note(self, note: ProjectNote) -> bool:
         """Save a project note"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3131,6 +4174,7 @@ class ProjectDatabase:
             )
 
             conn.commit()
+            self._notify_write(EventType.NOTE_ADDED, note.project_id)
             return True
 
         except Exception as e:
@@ -3140,9 +4184,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_project_notes(self, project_id: str, note_type: str | None = None) -> list[ProjectNote]:
         """Get notes for a project"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3182,6 +4227,7 @@ class ProjectDatabase:
     # CHAT OPERATIONS (Phase 2 - Session-based chat)
     # ========================================================================
 
+    @use_primary()
     def save_chat_session(self, session: dict) -> None:
         """
         Save or update a chat session
@@ -3189,7 +4235,7 @@ class ProjectDatabase:
         Args:
             session: Dictionary with session_id, project_id, user_id, title, created_at, updated_at, archived
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3218,6 +4264,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def load_chat_sessions(self, project_id: str, archived: bool | None = None) -> list[dict]:
         """
         Load all chat sessions for a project
@@ -3229,7 +4276,7 @@ class ProjectDatabase:
         Returns:
             List of session dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3266,9 +4313,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_chat_session(self, session_id: str) -> dict | None:
         """Get a single chat session by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3295,9 +4343,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def archive_chat_session(self, session_id: str, archived: bool) -> None:
         """Archive or restore a chat session"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3315,9 +4364,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_chat_session(self, session_id: str) -> None:
         """Delete a chat session (cascade deletes messages)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3331,9 +4381,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def _count_session_messages(self, session_id: str) -> int:
         """Count messages in a session (helper method)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3346,6 +4397,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def save_chat_message(self, message: dict) -> None:
         """
         Save a chat message
@@ -3353,7 +4405,7 @@ class ProjectDatabase:
         Args:
             message: Dictionary with message_id, session_id, user_id, content, role, metadata, created_at, updated_at
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3384,6 +4436,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def load_chat_messages(
         self, session_id: str, limit: int = 50, offset: int = 0, order: str = "asc"
     ) -> list[dict]:
@@ -3399,7 +4452,7 @@ class ProjectDatabase:
         Returns:
             List of message dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3436,9 +4489,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_chat_message(self, message_id: str) -> dict | None:
         """Get a single chat message by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3465,11 +4519,12 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def update_chat_message(
         self, message_id: str, content: str, metadata: dict | None = None
     ) -> None:
         """Update a chat message's content and metadata"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3492,9 +4547,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_chat_message(self, message_id: str) -> None:
         """Delete a chat message"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3516,9 +4572,10 @@ class ProjectDatabase:
     # Collaboration Invitation Methods
     # ========================================================================
 
+    @use_primary()
     def save_invitation(self, invitation: dict) -> None:
         """Save or update a collaboration invitation"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3550,9 +4607,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_invitation_by_token(self, token: str) -> dict | None:
         """Get invitation by token"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3581,9 +4639,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_project_invitations(self, project_id: str, status: str | None = None) -> list[dict]:
         """Get invitations for a project, optionally filtered by status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3623,9 +4682,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_user_invitations(self, email: str, status: str | None = None) -> list[dict]:
         """Get invitations for a user by email, optionally filtered by status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3665,9 +4725,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def accept_invitation(self, invitation_id: str) -> None:
         """Accept an invitation and mark it as accepted"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3689,9 +4750,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_invitation(self, invitation_id: str) -> None:
         """Delete/cancel an invitation"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3709,9 +4771,10 @@ class ProjectDatabase:
     # Collaboration Activity Methods
     # ========================================================================
 
+    @use_primary()
     def save_activity(self, activity: dict) -> None:
         """Save a collaboration activity"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3742,11 +4805,12 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_project_activities(
         self, project_id: str, limit: int = 50, offset: int = 0
     ) -> list[dict]:
         """Get activities for a project with pagination"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3783,9 +4847,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def count_project_activities(self, project_id: str) -> int:
         """Count total activities for a project"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3805,9 +4870,10 @@ class ProjectDatabase:
     # GitHub Sponsors / Sponsorship Methods
     # ========================================================================
 
+    @use_primary()
     def create_sponsorship(self, sponsorship_data: dict) -> int:
         """Create or update a sponsorship record"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3843,9 +4909,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_active_sponsorship(self, username: str) -> dict | None:
         """Get active sponsorship for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3868,9 +4935,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_sponsorship_history(self, username: str) -> list:
         """Get all sponsorships for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3891,9 +4959,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_sponsorship_by_github_username(self, github_username: str) -> dict | None:
         """Get sponsorship by GitHub username"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3917,9 +4986,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def cancel_sponsorship(self, username: str) -> bool:
         """Cancel active sponsorship for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3940,9 +5010,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_all_sponsorships(self) -> list:
         """Get all sponsorships (admin/dashboard use)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -3963,9 +5034,10 @@ class ProjectDatabase:
     # Payment History & Tracking Methods
     # ========================================================================
 
+    @use_primary()
     def record_payment(self, payment_data: dict) -> int:
         """Record a sponsorship payment"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -3998,9 +5070,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_payment_history(self, username: str, limit: int = 50) -> list:
         """Get payment history for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4026,9 +5099,10 @@ class ProjectDatabase:
     # Refund Tracking Methods
     # ========================================================================
 
+    @use_primary()
     def record_refund(self, refund_data: dict) -> int:
         """Record a sponsorship refund"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4062,9 +5136,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_refund_history(self, username: str, limit: int = 50) -> list:
         """Get refund history for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4090,9 +5165,10 @@ class ProjectDatabase:
     # Payment Method Tracking Methods
     # ========================================================================
 
+    @use_primary()
     def add_payment_method(self, method_data: dict) -> int:
         """Add a payment method for a sponsorship"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4125,9 +5201,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_payment_methods(self, sponsorship_id: int) -> list:
         """Get all payment methods for a sponsorship"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4152,9 +5229,10 @@ class ProjectDatabase:
     # Tier Change Tracking Methods
     # ========================================================================
 
+    @use_primary()
     def record_tier_change(self, change_data: dict) -> int:
         """Record a sponsorship tier change (upgrade, downgrade, renewal, etc.)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4189,9 +5267,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_tier_change_history(self, username: str, limit: int = 50) -> list:
         """Get tier change history for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4217,9 +5296,10 @@ class ProjectDatabase:
     # Sponsorship Analytics Methods
     # ========================================================================
 
+    @use_replica()
     def get_sponsorship_analytics(self, username: str) -> dict:
         """Get comprehensive sponsorship analytics for a user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4287,9 +5367,10 @@ class ProjectDatabase:
     # GITHUB AUTHENTICATION & INTEGRATION
     # ========================================================================
 
+    @use_primary()
     def save_github_auth(self, github_auth_data: dict) -> int:
         """Save or update GitHub authentication record"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         self.logger.debug(f"Saving GitHub auth for user: {github_auth_data.get('username')}")
@@ -4333,9 +5414,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_github_auth(self, username: str) -> dict | None:
         """Get GitHub authentication record for user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4356,9 +5438,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_replica()
     def get_github_auth_by_github_username(self, github_username: str) -> dict | None:
         """Get GitHub authentication record by GitHub username"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4379,9 +5462,10 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def delete_github_auth(self, username: str) -> bool:
         """Delete GitHub authentication record for user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4404,6 +5488,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def update_github_verification(
         self,
         username: str,
@@ -4412,7 +5497,7 @@ class ProjectDatabase:
         verification_error: str | None = None,
     ) -> bool:
         """Update GitHub token verification status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4455,6 +5540,7 @@ class ProjectDatabase:
         finally:
             conn.close()
 
+    @use_primary()
     def update_sponsorship_verification(
         self,
         username: str,
@@ -4465,7 +5551,7 @@ class ProjectDatabase:
         github_token_used: bool | None = None,
     ) -> bool:
         """Update sponsorship verification status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -4515,3 +5601,7 @@ class ProjectDatabase:
             raise
         finally:
             conn.close()
+
+
+# Audit log persistence (insert, query and purge) used by AuditLogger
+add_audit_log_methods_to_db(ProjectDatabase)
@@ -5,20 +5,64 @@ Provides decorators and utilities for:
 - Slow query detection and logging
 - Performance statistics aggregation
 - Development-mode detailed logging
+- Per-statement profiling of sqlite3 connections (ProfiledConnection)
 """
 
 import asyncio
 import functools
 import logging
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
 import time
 from collections.abc import Callable
 from typing import Any, TypeVar
 
+from socratic_system.monitoring_metrics import LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
 # Type variable for generic function wrapping
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Seconds between EXPLAIN QUERY PLAN captures for the same slow statement
+EXPLAIN_INTERVAL = 300
+
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_SQL_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint_sql(sql: str) -> str:
+    """Normalize a SQL statement so executions with different literals group together.
+
+    Literals become ``?``, placeholder lists collapse to ``(?+)`` and
+    whitespace is collapsed.
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        Normalized statement
+    """
+    sql = _SQL_STRING.sub("?", sql)
+    sql = _SQL_NUMBER.sub("?", sql)
+    sql = _SQL_LIST.sub("(?+)", sql)
+    return _SQL_WHITESPACE.sub(" ", sql).strip()
+
+
+def _caller_name() -> str:
+    """Qualified name of the nearest calling function outside this module."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return frame.f_code.co_qualname if frame is not None else "<unknown>"
+
 
 class QueryStats:
     """Statistics for a single query or operation.
@@ -40,6 +84,11 @@ class QueryStats:
         self.slow_count = 0
         self.error_count = 0
         self.last_executed_at: float | None = None
+        self.histogram = LatencyHistogram()  # Milliseconds
+        self.rows = 0
+        self.callers: dict[str, int] = {}
+        self.query_plan: list[str] | None = None
+        self.plan_captured_at = 0.0
 
     def add_execution(self, duration: float, is_slow: bool = False, error: bool = False) -> None:
         """Record a query execution.
@@ -51,9 +100,12 @@ class QueryStats:
         """
         self.count += 1
         self.total_time += duration
-        self.min_time = min(self.min_time, duration)
-        self.max_time = max(self.max_time, duration)
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
         self.last_executed_at = time.time()
+        self.histogram.record(duration * 1000)
 
         if is_slow:
             self.slow_count += 1
@@ -89,13 +141,23 @@ class QueryStats:
             return 0.0
         return (self.slow_count / self.count) * 100
 
+    def add_sample(self, caller: str, rows: int = 0) -> None:
+        """Record the details of a sampled execution.
+
+        Args:
+            caller: Qualified name of the calling method
+            rows: Rows affected or fetched
+        """
+        self.callers[caller] = self.callers.get(caller, 0) + 1
+        self.rows += rows
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation.
 
         Returns:
             Dict with all statistics
         """
-        return {
+        result = {
             "name": self.name,
             "count": self.count,
             "avg_time_ms": round(self.avg_time_ms, 2),
@@ -107,6 +169,15 @@ class QueryStats:
             "error_count": self.error_count,
             "last_executed_at": self.last_executed_at,
         }
+        if self.count:
+            for percentile in (50, 95, 99):
+                result[f"p{percentile}_time_ms"] = round(self.histogram.percentile(percentile), 2)
+        if self.callers:
+            result["sampled_rows"] = self.rows
+            result["callers"] = dict(self.callers)
+        if self.query_plan is not None:
+            result["query_plan"] = self.query_plan
+        return result
 
 
 class QueryProfiler:
@@ -130,14 +201,18 @@ class QueryProfiler:
         ```
     """
 
-    def __init__(self, slow_query_threshold_ms: float = 100.0) -> None:
+    def __init__(self, slow_query_threshold_ms: float = 100.0, sample_rate: float = 0.1) -> None:
         """Initialize query profiler.
 
         Args:
             slow_query_threshold_ms: Threshold above which queries are considered slow (default: 100ms)
+            sample_rate: Fraction of statements on profiled connections that are
+                recorded; slow and failing statements always are
         """
         self.slow_query_threshold = slow_query_threshold_ms / 1000.0
+        self.sample_rate = sample_rate
         self.stats: dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
         logger.info(
             f"QueryProfiler initialized with slow query threshold: {slow_query_threshold_ms}ms"
         )
@@ -285,6 +360,73 @@ class QueryProfiler:
 
         self.stats[query_name].add_execution(duration, is_slow=is_slow, error=error)
 
+    def record_statement(
+        self,
+        cursor: sqlite3.Cursor,
+        sql: str,
+        duration: float,
+        parameters: Any = (),
+        error: bool = False,
+    ) -> None:
+        """Record one SQL statement executed through a ProfiledConnection.
+
+        ProfiledCursor calls this for a ``sample_rate`` fraction of
+        statements, and for every slow or failing one. The statement's
+        fingerprint gets its timing and the calling method; slow statements
+        are logged with their EXPLAIN QUERY PLAN output.
+
+        Args:
+            cursor: Cursor that executed the statement
+            sql: SQL statement
+            duration: Execution time in seconds
+            parameters: Statement parameters (None for executemany)
+            error: Whether the statement raised
+        """
+        fingerprint = fingerprint_sql(sql)
+        is_slow = duration > self.slow_query_threshold
+        caller = _caller_name()
+        with self._lock:
+            stats = self.stats.get(fingerprint)
+            if stats is None:
+                stats = self.stats[fingerprint] = QueryStats(fingerprint)
+            stats.add_execution(duration, is_slow, error)
+            stats.add_sample(caller, 0 if error else max(cursor.rowcount, 0))
+
+        if error:
+            return
+        if cursor.description is not None:
+            cursor._sampled_stats = stats  # Rows are counted as they are fetched
+
+        if is_slow:
+            plan = self._explain(cursor.connection, sql, parameters, stats)
+            logger.warning(
+                f"Slow query in {caller}: {fingerprint} took {duration * 1000:.2f}ms "
+                f"(threshold: {self.slow_query_threshold * 1000:.0f}ms); plan: {plan}"
+            )
+
+    def _count_rows(self, stats: QueryStats, rows: int) -> None:
+        with self._lock:
+            stats.rows += rows
+
+    def _explain(
+        self, connection: sqlite3.Connection, sql: str, parameters: Any, stats: QueryStats
+    ) -> list[str] | None:
+        """Capture EXPLAIN QUERY PLAN for a statement, at most once per EXPLAIN_INTERVAL."""
+        now = time.time()
+        if parameters is None or now - stats.plan_captured_at < EXPLAIN_INTERVAL:
+            return stats.query_plan
+        stats.plan_captured_at = now
+        try:
+            # The base class method bypasses profiling
+            rows = sqlite3.Connection.execute(
+                connection, f"EXPLAIN QUERY PLAN {sql}", parameters
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not explain query {stats.name}: {e}")
+            return stats.query_plan
+        stats.query_plan = [row[3] for row in rows]
+        return stats.query_plan
+
     def get_stats(self) -> dict[str, dict[str, Any]]:
         """Get all collected statistics.
 
@@ -298,7 +440,7 @@ class QueryProfiler:
                 print(f"{name}: avg={metrics['avg_time_ms']:.1f}ms")
             ```
         """
-        return {name: stats.to_dict() for name, stats in self.stats.items()}
+        return {name: stats.to_dict() for name, stats in list(self.stats.items())}
 
     def get_slow_queries(self, min_slow_count: int = 1) -> list[dict[str, Any]]:
         """Get list of queries with slow executions.
@@ -317,7 +459,9 @@ class QueryProfiler:
             ```
         """
         slow_queries = [
-            stats.to_dict() for stats in self.stats.values() if stats.slow_count >= min_slow_count
+            stats.to_dict()
+            for stats in list(self.stats.values())
+            if stats.slow_count >= min_slow_count
         ]
         # Sort by slow count descending
         return sorted(slow_queries, key=lambda x: x["slow_count"], reverse=True)
@@ -339,7 +483,7 @@ class QueryProfiler:
             ```
         """
         sorted_stats = sorted(
-            [stats.to_dict() for stats in self.stats.values()],
+            [stats.to_dict() for stats in list(self.stats.values())],
             key=lambda x: x["avg_time_ms"],
             reverse=True,
         )
@@ -404,6 +548,82 @@ class QueryProfiler:
         logger.info("=" * 80)
 
 
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor timing each statement and reporting sampled, slow and failing ones."""
+
+    _sampled_stats: QueryStats | None = None
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "ProfiledCursor":
+        self._sampled_stats = None
+        start = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception:
+            self._record(sql, start, None, error=True)
+            raise
+        self._record(sql, start, parameters)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> "ProfiledCursor":
+        self._sampled_stats = None
+        start = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        except Exception:
+            self._record(sql, start, None, error=True)
+            raise
+        self._record(sql, start, None)
+        return self
+
+    def _record(self, sql: str, start: float, parameters: Any, error: bool = False) -> None:
+        duration = time.perf_counter() - start
+        profiler = self.connection.profiler
+        if (
+            error
+            or duration > profiler.slow_query_threshold
+            or random.random() < profiler.sample_rate
+        ):
+            profiler.record_statement(self, sql, duration, parameters, error)
+
+    def fetchone(self) -> Any:
+        row = super().fetchone()
+        if self._sampled_stats is not None and row is not None:
+            self.connection.profiler._count_rows(self._sampled_stats, 1)
+        return row
+
+    def fetchall(self) -> list:
+        rows = super().fetchall()
+        if self._sampled_stats is not None:
+            self.connection.profiler._count_rows(self._sampled_stats, len(rows))
+        return rows
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """sqlite3 connection whose statements are recorded by a QueryProfiler.
+
+    Pass as the ``factory`` argument of ``sqlite3.connect``; statements run
+    through ``execute``/``executemany`` on the connection or its cursors are
+    profiled (``executescript`` is not).
+
+    Example:
+        ```python
+        conn = sqlite3.connect(path, factory=ProfiledConnection)
+        conn.profiler = get_profiler()
+        ```
+    """
+
+    profiler: "QueryProfiler"
+
+    def cursor(self, factory: type = ProfiledCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
 # Global profiler instance
 _profiler: QueryProfiler | None = None
 
@@ -422,7 +642,10 @@ def get_profiler() -> QueryProfiler:
     """
     global _profiler
     if _profiler is None:
-        _profiler = QueryProfiler()
+        _profiler = QueryProfiler(
+            slow_query_threshold_ms=float(os.getenv("SOCRATES_SLOW_QUERY_MS", "100")),
+            sample_rate=float(os.getenv("SOCRATES_QUERY_SAMPLE_RATE", "0.1")),
+        )
     return _profiler
 
 
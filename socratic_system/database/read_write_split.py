@@ -10,6 +10,8 @@ Features:
 - Decorators for explicit role selection (@use_primary, @use_replica)
 - Round-robin replica selection
 - Fallback to primary on replica failure
+- SQLiteRouter: the same role routing for a single SQLite file in WAL mode
+  (pooled read-only connections, one serialized writer)
 
 Usage:
     ```python
@@ -58,19 +60,30 @@ Examples:
 from __future__ import annotations
 
 import logging
+import sqlite3
+import threading
 from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from contextvars import ContextVar
 from enum import Enum
 from functools import wraps
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from socratic_system.database.query_profiler import ProfiledConnection, QueryProfiler, get_profiler
 
-from socratic_system.database.connection_pool import DatabaseConnectionPool
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from socratic_system.database.connection_pool import DatabaseConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Idle read-only connections kept by a SQLiteRouter
+DEFAULT_READ_POOL_SIZE = 8
+
+# Seconds the writer waits on locks held by other processes before "database is locked"
+WRITER_BUSY_TIMEOUT = 30.0
+
 
 class DatabaseRole(Enum):
     """Database role enum for read/write split."""
@@ -393,6 +406,172 @@ def use_replica() -> Callable:
     return decorator
 
 
+class RoutedConnection(ProfiledConnection):
+    """Connection handed out by a SQLiteRouter; close() returns it to the router.
+
+    Closing is idempotent per checkout, so existing ``finally: conn.close()``
+    code works unchanged; a repeated close() after the connection has been
+    handed to another thread is ignored.
+    """
+
+    _router: SQLiteRouter | None = None
+    _role: DatabaseRole = DatabaseRole.PRIMARY
+    _depth = 0
+    _owner: int | None = None
+
+    def close(self) -> None:
+        if self._router is None:
+            super().close()
+        elif self._depth and self._owner == threading.get_ident():
+            self._router._release(self)
+
+    def discard(self) -> None:
+        """Close the underlying connection for good."""
+        self._router = None
+        super().close()
+
+
+class SQLiteRouter:
+    """Route connections to one SQLite database by DatabaseRole.
+
+    In WAL mode SQLite serves any number of readers next to a single
+    writer, so REPLICA connections come from a pool of read-only
+    (``query_only``) connections and run concurrently, while PRIMARY
+    connections share one writer connection, serialized by a lock. Writes
+    therefore queue in-process instead of failing with ``database is
+    locked``. The role comes from the ``use_primary()``/``use_replica()``
+    context, defaulting to PRIMARY.
+
+    Example:
+        ```python
+        router = SQLiteRouter("projects.db")
+
+        @use_replica()
+        def count_projects():
+            conn = router.connect()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+            finally:
+                conn.close()  # Returns the connection to the pool
+        ```
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        profiler: QueryProfiler | None = None,
+    ):
+        """Initialize router for a database file.
+
+        Args:
+            db_path: Path to the SQLite database file
+            read_pool_size: Maximum number of idle read connections kept open
+            profiler: Profiler recording every statement (default: the global profiler)
+        """
+        self.db_path = db_path
+        self.read_pool_size = read_pool_size
+        self.profiler = profiler or get_profiler()
+        self._idle_readers: list[RoutedConnection] = []
+        self._readers_lock = threading.Lock()
+        self._writer: RoutedConnection | None = None
+        self._writer_lock = threading.RLock()
+        self.stats = {"readers_opened": 0, "reads": 0, "writes": 0}
+
+    def _open(self, role: DatabaseRole, **kwargs: Any) -> RoutedConnection:
+        conn = sqlite3.connect(
+            self.db_path, factory=RoutedConnection, check_same_thread=False, **kwargs
+        )
+        conn.profiler = self.profiler
+        conn._router = self
+        conn._role = role
+        return conn
+
+    def connect(self, role: DatabaseRole | None = None) -> RoutedConnection:
+        """Check out a connection for the given (or current context's) role.
+
+        Args:
+            role: Explicit role; if None, uses the context set by use_primary/use_replica
+
+        Returns:
+            Connection to close() when done
+        """
+        # An in-memory database exists only on the connection that created it
+        if (role or _db_role.get()) is DatabaseRole.REPLICA and self.db_path != ":memory:":
+            return self._checkout_reader()
+        return self._checkout_writer()
+
+    def _checkout_reader(self) -> RoutedConnection:
+        with self._readers_lock:
+            conn = self._idle_readers.pop() if self._idle_readers else None
+            self.stats["reads"] += 1
+        if conn is None:
+            conn = self._open(DatabaseRole.REPLICA)
+            sqlite3.Connection.execute(conn, "PRAGMA query_only = ON")
+            self.stats["readers_opened"] += 1
+        conn._depth = 1
+        conn._owner = threading.get_ident()
+        return conn
+
+    def _checkout_writer(self) -> RoutedConnection:
+        self._writer_lock.acquire()
+        try:
+            if self._writer is None:
+                self._writer = self._open(DatabaseRole.PRIMARY, timeout=WRITER_BUSY_TIMEOUT)
+            self.stats["writes"] += 1
+        except BaseException:
+            self._writer_lock.release()
+            raise
+        # Nested checkouts on the writing thread share the connection
+        self._writer._depth += 1
+        self._writer._owner = threading.get_ident()
+        return self._writer
+
+    def _release(self, conn: RoutedConnection) -> None:
+        conn._depth -= 1
+        if conn._depth:
+            return
+
+        # Return the connection as a fresh one would be: no open transaction
+        # (which would pin a stale snapshot), default row factory and pragmas
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+            if conn._role is DatabaseRole.PRIMARY:
+                sqlite3.Connection.execute(conn, "PRAGMA foreign_keys = OFF")
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding {conn._role.value} connection after reset failed: {e}")
+            conn.discard()
+            if conn is self._writer:
+                self._writer = None
+            conn = None
+
+        if conn is None or conn._role is DatabaseRole.PRIMARY:
+            self._writer_lock.release()
+            return
+        with self._readers_lock:
+            if len(self._idle_readers) < self.read_pool_size:
+                self._idle_readers.append(conn)
+                return
+        conn.discard()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get connection usage counters and the number of idle readers."""
+        return {**self.stats, "idle_readers": len(self._idle_readers)}
+
+    def close(self) -> None:
+        """Close idle readers and the writer connection."""
+        with self._readers_lock:
+            readers, self._idle_readers = self._idle_readers, []
+        for conn in readers:
+            conn.discard()
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.discard()
+                self._writer = None
+
+
 # Module-level global router instance
 _router: DatabaseRouter | None = None
 
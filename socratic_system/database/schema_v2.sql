@@ -137,6 +137,10 @@ CREATE TABLE IF NOT EXISTS category_scores (
     phase TEXT NOT NULL,
     category TEXT NOT NULL,
     score REAL NOT NULL,
+    target_score REAL,
+    weighted_sum REAL,  -- Uncapped sum(value * confidence), for incremental updates
+    confidence_sum REAL,
+    spec_count INTEGER,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     UNIQUE(project_id, phase, category),
@@ -181,12 +185,39 @@ CREATE TABLE IF NOT EXISTS analytics_metrics (
     avg_confidence REAL DEFAULT 0.0,
     weak_categories TEXT,  -- JSON array
     strong_categories TEXT,  -- JSON array
+    progression_state TEXT,  -- JSON rolling velocity/plateau aggregates
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     FOREIGN KEY (project_id) REFERENCES projects(project_id) ON DELETE CASCADE
 );
 CREATE INDEX IF NOT EXISTS idx_analytics_metrics_project ON analytics_metrics(project_id);
 
+-- Analytics read model (maintained on write so analytics endpoints read a bounded number of rows)
+CREATE TABLE IF NOT EXISTS project_analytics (
+    project_id TEXT PRIMARY KEY,
+    message_count INTEGER DEFAULT 0,
+    question_count INTEGER DEFAULT 0,
+    answer_count INTEGER DEFAULT 0,
+    code_block_count INTEGER DEFAULT 0,
+    code_lines_generated INTEGER DEFAULT 0,
+    last_message_at TIMESTAMP,
+    phase_timings TEXT,  -- JSON {"current": phase, "phases": {phase: {...}}}
+    maturity_trend TEXT,  -- JSON array of capped score snapshots
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (project_id) REFERENCES projects(project_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS user_analytics (
+    user_id TEXT PRIMARY KEY,
+    llm_requests INTEGER DEFAULT 0,
+    input_tokens INTEGER DEFAULT 0,
+    output_tokens INTEGER DEFAULT 0,
+    llm_cost REAL DEFAULT 0.0,
+    last_llm_call_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Pending questions (normalized from array)
 CREATE TABLE IF NOT EXISTS pending_questions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -289,6 +320,25 @@ CREATE INDEX IF NOT EXISTS idx_knowledge_documents_project ON knowledge_document
 CREATE INDEX IF NOT EXISTS idx_knowledge_documents_user ON knowledge_documents(user_id);
 CREATE INDEX IF NOT EXISTS idx_knowledge_documents_type ON knowledge_documents(document_type);
 
+-- Storage usage counters for quota checks, maintained by the triggers in
+-- migration_scripts/add_storage_usage_counters.sql
+CREATE TABLE IF NOT EXISTS user_storage_usage (
+    user_id TEXT PRIMARY KEY,
+    document_bytes INTEGER NOT NULL DEFAULT 0,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    file_bytes INTEGER NOT NULL DEFAULT 0,  -- Project files of the user's projects
+    file_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS project_storage_usage (
+    project_id TEXT PRIMARY KEY,
+    owner TEXT,  -- User the project's files are counted toward
+    document_bytes INTEGER NOT NULL DEFAULT 0,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    file_bytes INTEGER NOT NULL DEFAULT 0,
+    file_count INTEGER NOT NULL DEFAULT 0
+);
+
 -- LLM Provider configurations
 CREATE TABLE IF NOT EXISTS llm_provider_configs (
     id TEXT PRIMARY KEY,
@@ -340,6 +390,37 @@ CREATE INDEX IF NOT EXISTS idx_llm_usage_timestamp ON llm_usage(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_llm_usage_user_timestamp ON llm_usage(user_id, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_llm_usage_provider ON llm_usage(provider);
 
+-- LLM usage rollups read by usage reports, updated by save_usage_record()
+-- (migration_scripts/add_llm_usage_rollups.sql). Buckets are ISO strings:
+-- 'YYYY-MM-DDTHH:00:00' for hours, 'YYYY-MM-DD' for days.
+CREATE TABLE IF NOT EXISTS llm_usage_hourly (
+    user_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0.0,
+    last_call_at TIMESTAMP,
+
+    PRIMARY KEY (user_id, bucket, provider, model)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS llm_usage_daily (
+    user_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0.0,
+    last_call_at TIMESTAMP,
+
+    PRIMARY KEY (user_id, bucket, provider, model)
+) WITHOUT ROWID;
+
 -- Refresh tokens for JWT authentication
 CREATE TABLE IF NOT EXISTS refresh_tokens (
     id TEXT PRIMARY KEY,
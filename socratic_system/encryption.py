@@ -1,33 +1,42 @@
 """
 Unified encryption/decryption for API keys and sensitive data.
 
-Uses PBKDF2-Fernet with random salts for security.
-All encrypted data is stored in format: salt_b64:encrypted_b64
+Uses envelope encryption: a master key-encryption key (KEK) is derived from
+SOCRATES_ENCRYPTION_KEY once per process with PBKDF2, and every record gets
+its own random Fernet data key which is stored wrapped by the KEK.
+
+Encrypted data is stored in format: env1:wrapped_data_key:encrypted_b64
+
+Older formats are still accepted by decrypt_data:
+- salt_b64:encrypted_b64 (PBKDF2 with a per-record salt)
+- plain Fernet token (PBKDF2 with a zero salt)
+Those require a full PBKDF2 derivation per call; use is_legacy_ciphertext()
+to detect them and re-encrypt lazily.
 """
 
 import base64
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+ENVELOPE_PREFIX = "env1"
 
-def encrypt_data(data: str, encryption_key: str | None = None) -> str:
-    """
-    Encrypt data using Fernet symmetric encryption with PBKDF2 key derivation.
-
-    Args:
-        data: Raw data string to encrypt
-        encryption_key: Encryption key (defaults to SOCRATES_ENCRYPTION_KEY env var)
+# Fixed, application-scoped salt for the master KEK. The secret itself is a
+# random per-installation token, so the salt only needs to domain-separate.
+_MASTER_KEY_SALT = b"socrates-envelope-kek-v1"
+_PBKDF2_ITERATIONS = 100000
 
-    Returns:
-        Encrypted data in format: salt_b64:encrypted_b64
 
-    Raises:
-        RuntimeError: If encryption fails or key not available
-    """
+def _resolve_encryption_key(encryption_key: str | None) -> str:
+    """Return the encryption secret, falling back to SOCRATES_ENCRYPTION_KEY."""
     if encryption_key is None:
         encryption_key = os.getenv("SOCRATES_ENCRYPTION_KEY")
 
@@ -48,28 +57,72 @@ def encrypt_data(data: str, encryption_key: str | None = None) -> str:
             "If problem persists, check data directory permissions."
         )
 
-    try:
-        secret_bytes = encryption_key.encode()
-
-        # Use random salt per encryption for better security
-        salt = os.urandom(16)
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend(),
-        )
-        derived_key = base64.urlsafe_b64encode(kdf.derive(secret_bytes))
+    return encryption_key
 
-        # Encrypt with Fernet
-        cipher = Fernet(derived_key)
-        encrypted = cipher.encrypt(data.encode())
 
-        # Include salt in output for decryption (format: salt:encrypted)
-        salt_b64 = base64.urlsafe_b64encode(salt).decode()
-        encrypted_b64 = encrypted.decode()
-        return f"{salt_b64}:{encrypted_b64}"
+def _pbkdf2(secret: str, salt: bytes) -> bytes:
+    """Derive a urlsafe-base64 Fernet key from a secret and salt."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=_PBKDF2_ITERATIONS,
+        backend=default_backend(),
+    )
+    return base64.urlsafe_b64encode(kdf.derive(secret.encode()))
+
+
+@lru_cache(maxsize=8)
+def _master_cipher(encryption_key: str) -> Fernet:
+    """Derive (once per secret) the master key-encryption key."""
+    return Fernet(_pbkdf2(encryption_key, _MASTER_KEY_SALT))
+
+
+def initialize_master_key(encryption_key: str | None = None) -> None:
+    """
+    Derive the master key eagerly so the first request doesn't pay for PBKDF2.
+
+    Args:
+        encryption_key: Encryption key (defaults to SOCRATES_ENCRYPTION_KEY env var)
+    """
+    _master_cipher(_resolve_encryption_key(encryption_key))
+
+
+def is_legacy_ciphertext(encrypted_data: str) -> bool:
+    """
+    Check whether data was encrypted with a pre-envelope format.
+
+    Legacy ciphertexts still decrypt, but each call costs a full PBKDF2
+    derivation, so callers should re-encrypt them with encrypt_data().
+    """
+    return not encrypted_data.startswith(f"{ENVELOPE_PREFIX}:")
+
+
+def encrypt_data(data: str, encryption_key: str | None = None) -> str:
+    """
+    Encrypt data using envelope encryption.
+
+    A fresh Fernet data key encrypts the payload and is itself wrapped with
+    the cached master key.
+
+    Args:
+        data: Raw data string to encrypt
+        encryption_key: Encryption key (defaults to SOCRATES_ENCRYPTION_KEY env var)
+
+    Returns:
+        Encrypted data in format: env1:wrapped_data_key:encrypted_b64
+
+    Raises:
+        RuntimeError: If encryption fails or key not available
+    """
+    encryption_key = _resolve_encryption_key(encryption_key)
+
+    try:
+        data_key = Fernet.generate_key()
+        encrypted = Fernet(data_key).encrypt(data.encode())
+        wrapped_key = _master_cipher(encryption_key).encrypt(data_key)
+
+        return f"{ENVELOPE_PREFIX}:{wrapped_key.decode()}:{encrypted.decode()}"
 
     except Exception as e:
         raise RuntimeError(f"Failed to encrypt data: {e}") from e
@@ -77,10 +130,10 @@ def encrypt_data(data: str, encryption_key: str | None = None) -> str:
 
 def decrypt_data(encrypted_data: str, encryption_key: str | None = None) -> str:
     """
-    Decrypt data using Fernet symmetric encryption.
+    Decrypt data produced by encrypt_data (any format version).
 
     Args:
-        encrypted_data: Encrypted data in format: salt_b64:encrypted_b64
+        encrypted_data: Encrypted data (envelope, salted or plain Fernet format)
         encryption_key: Encryption key (defaults to SOCRATES_ENCRYPTION_KEY env var)
 
     Returns:
@@ -89,75 +142,170 @@ def decrypt_data(encrypted_data: str, encryption_key: str | None = None) -> str:
     Raises:
         RuntimeError: If decryption fails
     """
-    if encryption_key is None:
-        encryption_key = os.getenv("SOCRATES_ENCRYPTION_KEY")
-
-    if not encryption_key:
-        # Try to auto-initialize encryption key from SocratesConfig
-        try:
-            from socratic_system.config import SocratesConfig
-
-            SocratesConfig.from_env()
-            encryption_key = os.getenv("SOCRATES_ENCRYPTION_KEY")
-        except Exception:
-            pass
-
-    if not encryption_key:
-        raise RuntimeError(
-            "SOCRATES_ENCRYPTION_KEY not available. "
-            "Encryption key should be auto-generated during startup. "
-            "If problem persists, check data directory permissions."
-        )
+    encryption_key = _resolve_encryption_key(encryption_key)
 
     try:
-        secret_bytes = encryption_key.encode()
+        # Envelope format: env1:wrapped_data_key:encrypted_b64
+        if not is_legacy_ciphertext(encrypted_data):
+            _, wrapped_key, encrypted_b64 = encrypted_data.split(":", 2)
+            data_key = _master_cipher(encryption_key).decrypt(wrapped_key.encode())
+            return Fernet(data_key).decrypt(encrypted_b64.encode()).decode()
 
-        # New format: salt_b64:encrypted_b64
+        # Salted format: salt_b64:encrypted_b64
         if ":" in encrypted_data:
             try:
                 salt_b64, encrypted_b64 = encrypted_data.split(":", 1)
                 salt = base64.urlsafe_b64decode(salt_b64)
 
-                # Derive key using same parameters as encryption
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=salt,
-                    iterations=100000,
-                    backend=default_backend(),
-                )
-                derived_key = base64.urlsafe_b64encode(kdf.derive(secret_bytes))
-
-                # Decrypt
-                cipher = Fernet(derived_key)
+                cipher = Fernet(_pbkdf2(encryption_key, salt))
                 decrypted = cipher.decrypt(encrypted_b64.encode())
                 return decrypted.decode()
             except Exception:
-                # If new format fails, try old format
+                # If salted format fails, try old format
                 pass
 
-        # Old format: plain Fernet encrypted data (no salt prefix, no PBKDF2)
+        # Old format: plain Fernet encrypted data (no salt prefix)
         # This handles keys encrypted before the salt-based format was introduced
         try:
-            # Use a fixed salt of zeros for old-format keys (they were encrypted without PBKDF2)
-            # Actually, old format didn't use salt at all - derive key directly from password
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b"\x00" * 16,  # Fixed salt for backward compatibility
-                iterations=100000,
-                backend=default_backend(),
-            )
-            derived_key = base64.urlsafe_b64encode(kdf.derive(secret_bytes))
-
-            cipher = Fernet(derived_key)
+            cipher = Fernet(_pbkdf2(encryption_key, b"\x00" * 16))
             decrypted = cipher.decrypt(encrypted_data.encode())
             return decrypted.decode()
         except Exception:
-            # If both formats fail, raise error
+            # If all formats fail, raise error
             raise ValueError(
-                "Invalid encrypted data format: could not decrypt with either new or old format"
+                "Invalid encrypted data format: could not decrypt with any known format"
             )
 
     except Exception as e:
         raise RuntimeError(f"Failed to decrypt data: {e}") from e
+
+
+class CredentialCache:
+    """
+    Short-lived, size-bounded cache of decrypted credentials.
+
+    Plaintexts are held in mutable bytearrays so they can be overwritten with
+    zeros when an entry expires, is evicted or is invalidated. Strings handed
+    back to callers are ordinary (immutable) copies.
+
+    Entries are keyed by a digest of the secret and the ciphertext, so a
+    rotated API key or encryption secret never hits a stale entry.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        """
+        Initialize credential cache.
+
+        Args:
+            max_entries: Maximum number of plaintexts kept in memory
+            ttl_seconds: Lifetime of a cached plaintext in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[bytearray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(encrypted_data: str, encryption_key: str) -> str:
+        """Build the cache key for a ciphertext under a given secret."""
+        digest = hashlib.sha256()
+        digest.update(encryption_key.encode())
+        digest.update(b"\x00")
+        digest.update(encrypted_data.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _zeroize(buffer: bytearray) -> None:
+        for i in range(len(buffer)):
+            buffer[i] = 0
+
+    def get(self, key: str) -> str | None:
+        """Return the cached plaintext for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            buffer, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._zeroize(buffer)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return buffer.decode()
+
+    def put(self, key: str, plaintext: str) -> None:
+        """Cache a plaintext, evicting (and zeroizing) the oldest entries if full."""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._zeroize(old[0])
+
+            self._entries[key] = (
+                bytearray(plaintext.encode()),
+                time.monotonic() + self.ttl_seconds,
+            )
+
+            while len(self._entries) > self.max_entries:
+                _, (buffer, _) = self._entries.popitem(last=False)
+                self._zeroize(buffer)
+
+    def invalidate(self, key: str) -> None:
+        """Drop and zeroize a single entry."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._zeroize(entry[0])
+
+    def clear(self) -> None:
+        """Drop and zeroize every entry."""
+        with self._lock:
+            for buffer, _ in self._entries.values():
+                self._zeroize(buffer)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+
+credential_cache = CredentialCache()
+
+
+def decrypt_credential(encrypted_data: str, encryption_key: str | None = None) -> str:
+    """
+    Decrypt a credential (API key, token) through the shared CredentialCache.
+
+    Use this on hot paths that decrypt the same credential repeatedly, e.g.
+    once per LLM request.
+
+    Args:
+        encrypted_data: Encrypted data in any format accepted by decrypt_data
+        encryption_key: Encryption key (defaults to SOCRATES_ENCRYPTION_KEY env var)
+
+    Returns:
+        Decrypted data string
+
+    Raises:
+        RuntimeError: If decryption fails
+    """
+    encryption_key = _resolve_encryption_key(encryption_key)
+    key = CredentialCache.make_key(encrypted_data, encryption_key)
+
+    cached = credential_cache.get(key)
+    if cached is not None:
+        return cached
+
+    plaintext = decrypt_data(encrypted_data, encryption_key)
+    credential_cache.put(key, plaintext)
+    return plaintext
@@ -7,10 +7,13 @@ Provides:
 - EventEmitter for event-based communication
 - Event handlers and async processing
 - Background job queue for async operations
+- Durable multi-process job queue with persisted results
+- Shared message bus for publish/subscribe between worker processes
 - Result caching for operation results
 - Result polling for clients
 """
 
+from .durable_queue import ClaimedJob, DurableJobQueue, JobWorker
 from .event_emitter import EventEmitter
 from .event_types import EventType
 from .handlers import (
@@ -21,6 +24,7 @@ from .handlers import (
 from .job_queue import Job, JobQueue, JobResult, JobStatus
 from .result_cache import CacheEntry, ResultCache
 from .result_poller import ResultPoller
+from .shared_bus import SharedMessageBus
 
 __all__ = [
     # Legacy
@@ -35,6 +39,12 @@ __all__ = [
     "Job",
     "JobStatus",
     "JobResult",
+    # Durable job queue
+    "DurableJobQueue",
+    "JobWorker",
+    "ClaimedJob",
+    # Shared message bus
+    "SharedMessageBus",
     # Phase 3: Result caching
     "ResultCache",
     "CacheEntry",
@@ -0,0 +1,876 @@
+"""
+Durable, SQLite-backed job queue shared by several worker processes.
+
+Provides:
+- Persistent jobs and results that survive restarts
+- Leases with visibility timeouts, so jobs held by a crashed worker are retried
+- Priorities and per-queue concurrency limits enforced across all processes
+- An async worker that claims, runs, heartbeats and settles jobs
+- Completion waits that wake on settlement instead of per-caller polling
+
+Jobs name a registered task instead of carrying a callable, so any process
+that registers the same task names can run them. Payloads and results must be
+JSON-serializable.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from socratic_system.events.job_queue import JobResult, JobStatus
+
+FINISHED_STATUSES = (
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.TIMEOUT.value,
+    JobStatus.CANCELLED.value,
+)
+
+
+def create_durable_jobs_table(connection: sqlite3.Connection) -> None:
+    """Create the durable_jobs table.
+
+    Args:
+        connection: SQLite database connection
+    """
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS durable_jobs (
+            job_id TEXT PRIMARY KEY,
+            queue TEXT NOT NULL,
+            task TEXT NOT NULL,
+            name TEXT,
+            payload TEXT NOT NULL,
+            priority INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            timeout REAL NOT NULL,
+            available_at REAL NOT NULL,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            result TEXT,
+            error TEXT,
+            metadata TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            completed_at TEXT,
+            duration_ms REAL NOT NULL DEFAULT 0
+        )
+    """)
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_durable_jobs_claim "
+        "ON durable_jobs(status, queue, priority DESC, available_at)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_durable_jobs_lease "
+        "ON durable_jobs(status, lease_expires_at)"
+    )
+    connection.commit()
+
+
+@dataclass
+class ClaimedJob:
+    """A job leased to a worker."""
+
+    job_id: str
+    task: str
+    payload: dict[str, Any]
+    queue: str
+    attempts: int
+    max_attempts: int
+    timeout: float
+    lease_expires_at: float
+
+
+class DurableJobQueue:
+    """SQLite-backed job queue with leases, priorities and per-queue limits.
+
+    Every method opens its own connection, so one instance can be shared by
+    threads, and any number of processes can use the same database file.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        queue_limits: dict[str, int] | None = None,
+        visibility_timeout: float = 60.0,
+        retry_backoff: float = 5.0,
+        watch_interval: float = 0.5,
+    ):
+        """
+        Initialize durable job queue.
+
+        Args:
+            db_path: Path to the SQLite database file
+            queue_limits: Queue name -> maximum jobs running at once (across all workers)
+            visibility_timeout: Default lease length in seconds
+            retry_backoff: Base delay before a failed job is retried (doubles per attempt)
+            watch_interval: How often completions by other processes are checked for
+                while someone is waiting (one query covers every waiter)
+        """
+        self.db_path = db_path
+        self.queue_limits = dict(queue_limits or {})
+        self.visibility_timeout = visibility_timeout
+        self.retry_backoff = retry_backoff
+        self.watch_interval = watch_interval
+        self.tasks: dict[str, Callable] = {}
+        self.logger = logging.getLogger(__name__)
+
+        # Completion waiters (job ID -> futures) and the task watching for
+        # completions recorded by other processes
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+        self._waiters_lock = threading.Lock()
+        self._watch_loop: asyncio.AbstractEventLoop | None = None
+        self._watch_task: asyncio.Task | None = None
+
+        # Per-process metrics
+        self.metrics = {
+            "enqueued": 0,
+            "claimed": 0,
+            "completed": 0,
+            "failed": 0,
+            "retried": 0,
+            "lease_expirations": 0,
+            "waits": 0,
+            "wait_wakeups": 0,
+        }
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            create_durable_jobs_table(conn)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection holding the database write lock until commit."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def register_task(self, name: str, func: Callable) -> None:
+        """Register a task that workers in this process can run.
+
+        Args:
+            name: Task name stored with each job
+            func: Async or sync callable taking the job payload dict
+        """
+        self.tasks[name] = func
+
+    def enqueue(
+        self,
+        task: str,
+        payload: dict[str, Any] | None = None,
+        queue: str = "default",
+        priority: int = 0,
+        timeout: float = 300.0,
+        max_attempts: int = 3,
+        name: str = "",
+        delay: float = 0.0,
+        metadata: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            task: Registered task name
+            payload: JSON-serializable task arguments
+            queue: Queue name (subject to queue_limits)
+            priority: Higher priorities are claimed first
+            timeout: Execution timeout in seconds
+            max_attempts: Attempts before the job is marked failed
+            name: Human-readable job name
+            delay: Seconds before the job becomes available
+            metadata: Extra JSON-serializable data returned with the job status
+
+        Returns:
+            Job ID
+        """
+        job_id = f"job_{uuid.uuid4()}"
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO durable_jobs (
+                    job_id, queue, task, name, payload, priority, status, max_attempts,
+                    timeout, available_at, metadata, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    queue,
+                    task,
+                    name or task,
+                    json.dumps(payload or {}),
+                    priority,
+                    JobStatus.PENDING.value,
+                    max(1, max_attempts),
+                    timeout,
+                    time.time() + delay,
+                    json.dumps(metadata or {}),
+                    _now_iso(),
+                ),
+            )
+        self.metrics["enqueued"] += 1
+        self.logger.debug(f"Job enqueued: {job_id} ({task} on {queue})")
+        return job_id
+
+    def claim(
+        self,
+        worker_id: str,
+        queues: list[str] | None = None,
+        visibility_timeout: float | None = None,
+    ) -> ClaimedJob | None:
+        """
+        Lease the highest-priority available job.
+
+        Expired leases are recovered first. Queues at their concurrency limit
+        are skipped.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            queues: Only claim from these queues (default: any)
+            visibility_timeout: Lease length (default: queue's visibility_timeout)
+
+        Returns:
+            ClaimedJob, or None if nothing is available
+        """
+        lease = visibility_timeout or self.visibility_timeout
+        now = time.time()
+
+        with self._transaction() as conn:
+            self._recover_expired_leases(conn, now)
+
+            conditions = ["status = ?", "available_at <= ?"]
+            params: list[Any] = [JobStatus.PENDING.value, now]
+            if queues:
+                conditions.append(f"queue IN ({', '.join('?' * len(queues))})")
+                params.extend(queues)
+
+            if self.queue_limits:
+                running = dict(
+                    conn.execute(
+                        "SELECT queue, COUNT(*) FROM durable_jobs WHERE status = ? GROUP BY queue",
+                        (JobStatus.RUNNING.value,),
+                    ).fetchall()
+                )
+                full = [q for q, limit in self.queue_limits.items() if running.get(q, 0) >= limit]
+                if full:
+                    conditions.append(f"queue NOT IN ({', '.join('?' * len(full))})")
+                    params.extend(full)
+
+            row = conn.execute(
+                f"""
+                SELECT job_id, task, payload, queue, attempts, max_attempts, timeout
+                FROM durable_jobs WHERE {' AND '.join(conditions)}
+                ORDER BY priority DESC, rowid
+                LIMIT 1
+                """,
+                params,
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                """
+                UPDATE durable_jobs
+                SET status = ?, lease_owner = ?, lease_expires_at = ?,
+                    attempts = attempts + 1, started_at = ?, error = NULL
+                WHERE job_id = ?
+                """,
+                (JobStatus.RUNNING.value, worker_id, now + lease, _now_iso(), row["job_id"]),
+            )
+
+        self.metrics["claimed"] += 1
+        return ClaimedJob(
+            job_id=row["job_id"],
+            task=row["task"],
+            payload=json.loads(row["payload"]),
+            queue=row["queue"],
+            attempts=row["attempts"] + 1,
+            max_attempts=row["max_attempts"],
+            timeout=row["timeout"],
+            lease_expires_at=now + lease,
+        )
+
+    def _recover_expired_leases(self, conn: sqlite3.Connection, now: float) -> None:
+        """Return jobs whose worker stopped heartbeating to the queue (or fail them)."""
+        cursor = conn.execute(
+            """
+            UPDATE durable_jobs
+            SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,
+                completed_at = CASE WHEN attempts >= max_attempts THEN ? ELSE NULL END,
+                error = 'Lease expired (worker ' || lease_owner || ')',
+                lease_owner = NULL, lease_expires_at = NULL
+            WHERE status = ? AND lease_expires_at < ?
+            """,
+            (
+                JobStatus.FAILED.value,
+                JobStatus.PENDING.value,
+                _now_iso(),
+                JobStatus.RUNNING.value,
+                now,
+            ),
+        )
+        if cursor.rowcount:
+            self.metrics["lease_expirations"] += cursor.rowcount
+            self.logger.warning(f"Recovered {cursor.rowcount} job(s) with expired leases")
+
+    def heartbeat(
+        self, job_id: str, worker_id: str, visibility_timeout: float | None = None
+    ) -> bool:
+        """
+        Extend a job's lease.
+
+        Returns:
+            False if the worker no longer holds the lease (expired or cancelled)
+        """
+        lease = visibility_timeout or self.visibility_timeout
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE durable_jobs SET lease_expires_at = ?
+                WHERE job_id = ? AND lease_owner = ? AND status = ?
+                """,
+                (time.time() + lease, job_id, worker_id, JobStatus.RUNNING.value),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        """
+        Record a job's result.
+
+        Returns:
+            False if the worker no longer holds the lease (the result is dropped)
+        """
+        settled = self._settle(
+            job_id,
+            worker_id,
+            JobStatus.COMPLETED,
+            result=json.dumps(result, default=str),
+        )
+        if settled:
+            self.metrics["completed"] += 1
+        return settled
+
+    def fail(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        status: JobStatus = JobStatus.FAILED,
+        retry: bool = True,
+    ) -> bool:
+        """
+        Record a failed attempt, re-queueing the job if attempts remain.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+            error: Error message
+            status: Final status if no attempts remain (FAILED or TIMEOUT)
+            retry: Allow another attempt
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM durable_jobs "
+                "WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (job_id, worker_id, JobStatus.RUNNING.value),
+            ).fetchone()
+            if row is None:
+                return False
+
+            if retry and row["attempts"] < row["max_attempts"]:
+                delay = self.retry_backoff * (2 ** (row["attempts"] - 1))
+                conn.execute(
+                    """
+                    UPDATE durable_jobs
+                    SET status = ?, error = ?, available_at = ?,
+                        lease_owner = NULL, lease_expires_at = NULL
+                    WHERE job_id = ?
+                    """,
+                    (JobStatus.PENDING.value, error, time.time() + delay, job_id),
+                )
+                self.metrics["retried"] += 1
+                return True
+
+        settled = self._settle(job_id, worker_id, status, error=error)
+        if settled:
+            self.metrics["failed"] += 1
+        return settled
+
+    def _settle(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: JobStatus,
+        result: str | None = None,
+        error: str | None = None,
+    ) -> bool:
+        completed_at = datetime.now(UTC)
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT started_at FROM durable_jobs "
+                "WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (job_id, worker_id, JobStatus.RUNNING.value),
+            ).fetchone()
+            if row is None:
+                return False
+
+            started = datetime.fromisoformat(row["started_at"])
+            conn.execute(
+                """
+                UPDATE durable_jobs
+                SET status = ?, result = ?, error = ?, completed_at = ?, duration_ms = ?,
+                    lease_owner = NULL, lease_expires_at = NULL
+                WHERE job_id = ?
+                """,
+                (
+                    status.value,
+                    result,
+                    error,
+                    completed_at.isoformat(),
+                    (completed_at - started).total_seconds() * 1000,
+                    job_id,
+                ),
+            )
+        self._notify(job_id)
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a pending or running job.
+
+        A running job's worker notices on its next heartbeat and stops it.
+
+        Returns:
+            True if the job was cancelled
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE durable_jobs
+                SET status = ?, completed_at = ?, lease_owner = NULL, lease_expires_at = NULL
+                WHERE job_id = ? AND status IN (?, ?)
+                """,
+                (
+                    JobStatus.CANCELLED.value,
+                    _now_iso(),
+                    job_id,
+                    JobStatus.PENDING.value,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+        if cursor.rowcount != 1:
+            return False
+        self._notify(job_id)
+        return True
+
+    async def wait_for_jobs(
+        self,
+        job_ids: list[str],
+        timeout: float,
+        return_when: str = "all",
+    ) -> dict[str, JobResult]:
+        """
+        Wait for jobs to finish.
+
+        Jobs settled by this process wake waiters immediately. Jobs settled by
+        other processes are picked up by a single query every
+        ``watch_interval`` that covers all jobs being waited on, however many
+        callers are waiting.
+
+        Args:
+            job_ids: Job IDs to wait for (unknown IDs are ignored)
+            timeout: Maximum time to wait in seconds
+            return_when: "all" to wait for every job, "any" to return once one finishes
+
+        Returns:
+            Job ID -> JobResult for the jobs that exist, finished or not
+        """
+        if return_when not in ("all", "any"):
+            raise ValueError(f"return_when must be 'all' or 'any', got {return_when!r}")
+
+        job_ids = list(dict.fromkeys(job_ids))
+        loop = asyncio.get_running_loop()
+        futures = {job_id: loop.create_future() for job_id in job_ids}
+        self.metrics["waits"] += 1
+
+        # Register before reading state, so a completion in between is not missed
+        with self._waiters_lock:
+            for job_id, future in futures.items():
+                self._waiters.setdefault(job_id, set()).add(future)
+            self._ensure_watcher(loop)
+
+        try:
+            results = await asyncio.to_thread(self.get_jobs, job_ids)
+            unfinished = [
+                futures[job_id]
+                for job_id, result in results.items()
+                if result.status.value not in FINISHED_STATUSES
+            ]
+            finished_any = len(unfinished) < len(results)
+            if unfinished and not (return_when == "any" and finished_any) and timeout > 0:
+                done, _ = await asyncio.wait(
+                    unfinished,
+                    timeout=timeout,
+                    return_when=(
+                        asyncio.FIRST_COMPLETED if return_when == "any" else asyncio.ALL_COMPLETED
+                    ),
+                )
+                if done:
+                    self.metrics["wait_wakeups"] += 1
+                    results = await asyncio.to_thread(self.get_jobs, job_ids)
+            return results
+        finally:
+            with self._waiters_lock:
+                for job_id, future in futures.items():
+                    waiters = self._waiters.get(job_id)
+                    if waiters is not None:
+                        waiters.discard(future)
+                        if not waiters:
+                            del self._waiters[job_id]
+
+    def _ensure_watcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the completion watcher on ``loop`` (caller holds _waiters_lock)."""
+        if self._watch_task is None or self._watch_task.done() or self._watch_loop is not loop:
+            self._watch_loop = loop
+            self._watch_task = loop.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        """Wake waiters for jobs that another process settled."""
+        task = asyncio.current_task()
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            with self._waiters_lock:
+                watched = list(self._waiters)
+                if not watched:
+                    if self._watch_task is task:
+                        self._watch_task = None
+                    return
+            try:
+                finished = await asyncio.to_thread(self._finished_among, watched)
+            except sqlite3.Error as e:
+                self.logger.error(f"Job completion check failed: {e}")
+                continue
+            for job_id in finished:
+                self._wake(job_id)
+
+    def _finished_among(self, job_ids: list[str]) -> list[str]:
+        """Return the IDs from ``job_ids`` whose jobs have finished."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT job_id FROM durable_jobs WHERE job_id IN ({', '.join('?' * len(job_ids))}) "
+                f"AND status IN ({', '.join('?' * len(FINISHED_STATUSES))})",
+                (*job_ids, *FINISHED_STATUSES),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row["job_id"] for row in rows]
+
+    def _notify(self, job_id: str) -> None:
+        """Wake waiters for a job settled by this process (callable from any thread)."""
+        with self._waiters_lock:
+            if job_id not in self._waiters or self._watch_loop is None:
+                return
+            loop = self._watch_loop
+        try:
+            loop.call_soon_threadsafe(self._wake, job_id)
+        except RuntimeError:
+            # Waiting loop has been closed
+            pass
+
+    def _wake(self, job_id: str) -> None:
+        with self._waiters_lock:
+            waiters = self._waiters.pop(job_id, set())
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def get_job_status(self, job_id: str) -> JobResult | None:
+        """
+        Get job status and result.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            JobResult if found
+        """
+        return self.get_jobs([job_id]).get(job_id)
+
+    def get_jobs(self, job_ids: list[str]) -> dict[str, JobResult]:
+        """
+        Get the status of several jobs with one query.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Job ID -> JobResult for the jobs that exist
+        """
+        if not job_ids:
+            return {}
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM durable_jobs WHERE job_id IN ({', '.join('?' * len(job_ids))})",
+                list(job_ids),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row["job_id"]: _row_to_result(row) for row in rows}
+
+    def purge(self, older_than_seconds: float) -> int:
+        """
+        Delete finished jobs.
+
+        Args:
+            older_than_seconds: Delete jobs that finished longer ago than this
+
+        Returns:
+            Number of jobs deleted
+        """
+        cutoff = datetime.fromtimestamp(time.time() - older_than_seconds, UTC).isoformat()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM durable_jobs WHERE status IN ({', '.join('?' * 4)}) "
+                "AND completed_at < ?",
+                (*FINISHED_STATUSES, cutoff),
+            )
+            return cursor.rowcount
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get queue metrics.
+
+        Returns:
+            Per-process counters plus job counts by queue and status
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT queue, status, COUNT(*) AS count FROM durable_jobs GROUP BY queue, status"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        queues: dict[str, dict[str, int]] = {}
+        for row in rows:
+            queues.setdefault(row["queue"], {})[row["status"]] = row["count"]
+        return {
+            **self.metrics,
+            "queues": queues,
+            "queue_limits": dict(self.queue_limits),
+        }
+
+
+class JobWorker:
+    """Async worker that runs jobs from a DurableJobQueue.
+
+    Several workers, in one process or many, can serve the same queue.
+    """
+
+    def __init__(
+        self,
+        queue: DurableJobQueue,
+        worker_id: str | None = None,
+        concurrency: int = 4,
+        queues: list[str] | None = None,
+        poll_interval: float = 0.5,
+        visibility_timeout: float | None = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            queue: Queue to pull from
+            worker_id: Unique worker ID (default: host, pid and a random suffix)
+            concurrency: Maximum jobs this worker runs at once
+            queues: Only run jobs from these queues (default: any)
+            poll_interval: Seconds to wait when no job is available
+            visibility_timeout: Lease length (default: the queue's)
+        """
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = concurrency
+        self.queues = queues
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout or queue.visibility_timeout
+        self.logger = logging.getLogger(__name__)
+        self._running: set[asyncio.Task] = set()
+        self._loop_task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start pulling jobs in the background."""
+        if self._loop_task is None:
+            self._stopping = False
+            self._loop_task = asyncio.create_task(self._run())
+            self.logger.info(f"Job worker {self.worker_id} started")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming jobs and wait for running ones to finish.
+
+        Jobs still running after ``timeout`` are cancelled; their leases
+        expire and another worker picks them up.
+        """
+        self._stopping = True
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+
+        if self._running:
+            _, pending = await asyncio.wait(self._running, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self.logger.info(f"Job worker {self.worker_id} stopped")
+
+    async def run_once(self) -> bool:
+        """Claim and run a single job.
+
+        Returns:
+            True if a job was run
+        """
+        job = await asyncio.to_thread(
+            self.queue.claim, self.worker_id, self.queues, self.visibility_timeout
+        )
+        if job is None:
+            return False
+        await self._execute(job)
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            if len(self._running) >= self.concurrency:
+                await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                job = await asyncio.to_thread(
+                    self.queue.claim, self.worker_id, self.queues, self.visibility_timeout
+                )
+            except sqlite3.Error as e:
+                self.logger.error(f"Job claim failed: {e}")
+                job = None
+
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            task = asyncio.create_task(self._execute(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _execute(self, job: ClaimedJob) -> None:
+        """Run a claimed job, keeping its lease alive, and record the outcome."""
+        func = self.queue.tasks.get(job.task)
+        if func is None:
+            await asyncio.to_thread(
+                self.queue.fail,
+                job.job_id,
+                self.worker_id,
+                f"Unknown task: {job.task}",
+                retry=False,
+            )
+            return
+
+        if inspect.iscoroutinefunction(func):
+            work = asyncio.ensure_future(func(job.payload))
+        else:
+            work = asyncio.ensure_future(asyncio.to_thread(func, job.payload))
+
+        heartbeat = asyncio.create_task(self._heartbeat(job, work))
+        try:
+            result = await asyncio.wait_for(work, timeout=job.timeout)
+        except TimeoutError:
+            await asyncio.to_thread(
+                self.queue.fail,
+                job.job_id,
+                self.worker_id,
+                f"Job timed out after {job.timeout}s",
+                JobStatus.TIMEOUT,
+            )
+        except asyncio.CancelledError:
+            if not work.cancelled() or asyncio.current_task().cancelling():
+                raise
+            # Lease lost or job cancelled; nothing to record
+            self.logger.info(f"Job {job.job_id} stopped: lease no longer held")
+        except Exception as e:
+            self.logger.error(f"Job {job.job_id} failed: {e}")
+            await asyncio.to_thread(self.queue.fail, job.job_id, self.worker_id, str(e))
+        else:
+            await asyncio.to_thread(self.queue.complete, job.job_id, self.worker_id, result)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: ClaimedJob, work: asyncio.Future) -> None:
+        """Extend the lease periodically; stop the job if the lease is lost."""
+        interval = max(self.visibility_timeout / 3, 0.01)
+        while not work.done():
+            await asyncio.sleep(interval)
+            held = await asyncio.to_thread(
+                self.queue.heartbeat, job.job_id, self.worker_id, self.visibility_timeout
+            )
+            if not held:
+                work.cancel()
+                return
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _row_to_result(row: sqlite3.Row) -> JobResult:
+    """Convert a durable_jobs row to a JobResult."""
+    return JobResult(
+        job_id=row["job_id"],
+        status=JobStatus(row["status"]),
+        result=json.loads(row["result"]) if row["result"] else None,
+        error=row["error"],
+        started_at=row["started_at"],
+        completed_at=row["completed_at"],
+        duration_ms=row["duration_ms"],
+        metadata={
+            **json.loads(row["metadata"] or "{}"),
+            "name": row["name"],
+            "task": row["task"],
+            "queue": row["queue"],
+            "priority": row["priority"],
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+            "created_at": row["created_at"],
+        },
+    )
@@ -32,6 +32,7 @@ class EventType(Enum):
     KNOWLEDGE_LOADED = "knowledge.loaded"
     KNOWLEDGE_SUGGESTION = "knowledge.suggestion"
     DOCUMENT_IMPORTED = "document.imported"
+    DOCUMENT_DELETED = "document.deleted"
     DOCUMENTS_INDEXED = "documents.indexed"
 
     # Socratic dialogue events
@@ -143,6 +143,7 @@ class JobQueue:
         self.jobs: dict[str, Job] = {}
         self.results: dict[str, JobResult] = {}
         self.queue: asyncio.Queue = asyncio.Queue()
+        self._completions: dict[str, asyncio.Event] = {}
 
         # Metrics
         self.metrics = {
@@ -193,6 +194,10 @@ class JobQueue:
         result = await job.execute()
         self.results[job.job_id] = result
 
+        completion = self._completions.pop(job.job_id, None)
+        if completion is not None:
+            completion.set()
+
         # Update metrics
         if result.status == JobStatus.COMPLETED:
             self.metrics["completed_jobs"] += 1
@@ -260,6 +265,45 @@ class JobQueue:
         """
         return self.results.get(job_id)
 
+    async def wait_for_jobs(
+        self,
+        job_ids: list[str],
+        timeout: float,
+        return_when: str = "all",
+    ) -> dict[str, JobResult]:
+        """
+        Wait for jobs to finish, waking as soon as they complete.
+
+        Args:
+            job_ids: Job IDs to wait for (unknown IDs are ignored)
+            timeout: Maximum time to wait in seconds
+            return_when: "all" to wait for every job, "any" to return once one finishes
+
+        Returns:
+            Job ID -> JobResult for the jobs that exist, finished or not
+        """
+        if return_when not in ("all", "any"):
+            raise ValueError(f"return_when must be 'all' or 'any', got {return_when!r}")
+
+        known = [job_id for job_id in job_ids if job_id in self.jobs]
+        unfinished = [job_id for job_id in known if job_id not in self.results]
+        if unfinished and not (return_when == "any" and len(unfinished) < len(known)):
+            waits = [
+                asyncio.ensure_future(self._completions.setdefault(job_id, asyncio.Event()).wait())
+                for job_id in unfinished
+            ]
+            _, pending = await asyncio.wait(
+                waits,
+                timeout=timeout,
+                return_when=(
+                    asyncio.FIRST_COMPLETED if return_when == "any" else asyncio.ALL_COMPLETED
+                ),
+            )
+            for wait in pending:
+                wait.cancel()
+
+        return {job_id: self.results.get(job_id, self.jobs[job_id].result) for job_id in known}
+
     def get_all_results(self) -> dict[str, JobResult]:
         """
         Get all job results.
@@ -154,6 +154,27 @@ class ResultPoller:
         self.logger.warning(f"Result polling timed out for job: {job_id}")
         return None
 
+    async def await_result(
+        self,
+        job_id: str,
+        timeout: float = 30.0,
+    ) -> dict[str, Any] | None:
+        """
+        Wait for result, waking as soon as the job completes.
+
+        Args:
+            job_id: Job ID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Result if available, None if timed out
+        """
+        await self.job_queue.wait_for_jobs([job_id], timeout=timeout)
+        result = self.get_result(job_id)
+        if result is None:
+            self.logger.warning(f"Result wait timed out for job: {job_id}")
+        return result
+
     def get_poll_status(
         self,
         job_id: str,
@@ -0,0 +1,253 @@
+"""
+SQLite-backed message bus connecting several processes on one host.
+
+Provides:
+- Publish/subscribe by channel across worker processes sharing a database file
+- A single, global message order (the message id) seen by every process
+- Batched writes: messages published between two polls share one transaction
+- Pruning of messages once every process has had time to read them
+
+Used by multi-worker API deployments to fan out WebSocket broadcasts, stream
+events and cache invalidations from the worker that produced them to all
+others. Messages must be JSON-serializable.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def create_shared_messages_table(connection: sqlite3.Connection) -> None:
+    """Create the shared_messages table.
+
+    Args:
+        connection: SQLite database connection
+    """
+    # AUTOINCREMENT keeps ids increasing after old messages are pruned
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS shared_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel TEXT NOT NULL,
+            origin TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_shared_messages_created ON shared_messages(created_at)"
+    )
+    connection.commit()
+
+
+class SharedMessageBus:
+    """Publish/subscribe between processes through a shared SQLite file.
+
+    Each process polls for messages newer than the last one it has seen.
+    Writers hold the database lock one at a time, so message ids are assigned
+    in commit order and a poll never skips a message committed later with a
+    smaller id.
+
+    Handlers run on the event loop the bus was started on and are called with
+    ``(message_id, message)``.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        poll_interval: float = 0.05,
+        retention_seconds: float = 300.0,
+        worker_id: str | None = None,
+    ):
+        """
+        Initialize message bus.
+
+        Args:
+            db_path: Path to the SQLite database file shared by all processes
+            poll_interval: Seconds between polls (bounds cross-process latency)
+            retention_seconds: Age after which delivered messages are pruned;
+                a process paused for longer misses the pruned messages
+            worker_id: Unique process ID (default: host, pid and a random suffix)
+        """
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.logger = logging.getLogger(__name__)
+
+        # Channel -> [(handler, include_own)]
+        self._handlers: dict[str, list[tuple[Callable, bool]]] = {}
+        self._outbox: list[tuple[str, str]] = []
+        self._outbox_lock = threading.Lock()
+        self._last_id = 0
+        self._last_prune = 0.0
+        self._task: asyncio.Task | None = None
+
+        # Per-process metrics
+        self.metrics = {"published": 0, "delivered": 0, "handler_errors": 0, "poll_errors": 0}
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            create_shared_messages_table(conn)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+
+    def subscribe(self, channel: str, handler: Callable, include_own: bool = False) -> None:
+        """Call ``handler`` for every message published on ``channel``.
+
+        Args:
+            channel: Channel name
+            handler: Sync or async callable taking ``(message_id, message)``
+            include_own: Also deliver messages published by this process, once
+                they are stored (use when the message id must be known)
+        """
+        self._handlers.setdefault(channel, []).append((handler, include_own))
+
+    def publish(self, channel: str, message: Any) -> None:
+        """Queue a message for every process subscribed to ``channel``.
+
+        Never blocks: messages are written by the next poll. Safe to call from
+        any thread.
+
+        Args:
+            channel: Channel name
+            message: JSON-serializable message
+        """
+        payload = json.dumps(message)
+        with self._outbox_lock:
+            self._outbox.append((channel, payload))
+        self.metrics["published"] += 1
+
+    async def start(self) -> None:
+        """Start delivering messages published from now on."""
+        if self._task is None:
+            self._last_id = await asyncio.to_thread(self.latest_id)
+            self._task = asyncio.create_task(self._run())
+            self.logger.info(f"Message bus {self.worker_id} started on {self.db_path}")
+
+    async def stop(self) -> None:
+        """Write pending messages and stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self._write_outbox)
+
+    def latest_id(self) -> int:
+        """Get the id of the newest stored message, from any process (0 if none)."""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM shared_messages").fetchone()[0]
+        finally:
+            conn.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                messages = await asyncio.to_thread(self._exchange)
+            except Exception as e:
+                self.metrics["poll_errors"] += 1
+                self.logger.error(f"Message bus poll failed: {e}")
+                messages = []
+
+            for message_id, channel, origin, payload in messages:
+                await self._dispatch(message_id, channel, origin == self.worker_id, payload)
+            await asyncio.sleep(self.poll_interval)
+
+    def _write_outbox(self, conn: sqlite3.Connection | None = None) -> None:
+        with self._outbox_lock:
+            outbox, self._outbox = self._outbox, []
+        if not outbox:
+            return
+
+        own_conn = conn is None
+        conn = conn or self._connect()
+        try:
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO shared_messages (channel, origin, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(channel, self.worker_id, payload, now) for channel, payload in outbox],
+            )
+            if now - self._last_prune > self.retention_seconds / 10:
+                conn.execute(
+                    "DELETE FROM shared_messages WHERE created_at < ?",
+                    (now - self.retention_seconds,),
+                )
+                self._last_prune = now
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            # Keep the messages, in order, for the next poll
+            with self._outbox_lock:
+                self._outbox[:0] = outbox
+            raise
+        finally:
+            if own_conn:
+                conn.close()
+
+    def _exchange(self) -> list[tuple[int, str, str, str]]:
+        """Write queued messages, then read every message after the last one seen."""
+        conn = self._connect()
+        try:
+            self._write_outbox(conn)
+            rows = conn.execute(
+                "SELECT id, channel, origin, payload FROM shared_messages WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        if rows:
+            self._last_id = rows[-1][0]
+        return rows
+
+    async def _dispatch(self, message_id: int, channel: str, own: bool, payload: str) -> None:
+        handlers = [
+            handler
+            for handler, include_own in self._handlers.get(channel, ())
+            if include_own or not own
+        ]
+        if not handlers:
+            return
+
+        message = json.loads(payload)
+        for handler in handlers:
+            try:
+                result = handler(message_id, message)
+                if inspect.isawaitable(result):
+                    await result
+                self.metrics["delivered"] += 1
+            except Exception as e:
+                self.metrics["handler_errors"] += 1
+                self.logger.error(f"Message bus handler for {channel} failed: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-process bus statistics.
+
+        Returns:
+            Metrics plus the id of the last message seen and queued message count
+        """
+        with self._outbox_lock:
+            queued = len(self._outbox)
+        return {
+            "worker_id": self.worker_id,
+            "last_message_id": self._last_id,
+            "queued": queued,
+            **self.metrics,
+        }
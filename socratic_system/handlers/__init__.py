@@ -3,8 +3,10 @@
 Provides background event handlers for async analysis processing.
 """
 
+from .analysis_scheduler import ProjectAnalysisScheduler
 from .background_handlers import BackgroundHandlers
 
 __all__ = [
     "BackgroundHandlers",
+    "ProjectAnalysisScheduler",
 ]
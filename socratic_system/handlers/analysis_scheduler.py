@@ -0,0 +1,140 @@
+"""Per-project scheduler for debounced, coalesced background analysis.
+
+Bursts of responses for the same project collapse into a single analysis
+run. A run that is overtaken by a newer request is told it has been
+superseded so it can skip persisting stale results.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AnalysisRunner = Callable[[str, Callable[[], bool]], Awaitable[Any]]
+
+
+class _ProjectState:
+    """Scheduling state for one project"""
+
+    def __init__(self):
+        self.generation = 0
+        self.timer: asyncio.Task | None = None
+        self.first_requested_at: float | None = None
+        self.lock = asyncio.Lock()
+
+
+class ProjectAnalysisScheduler:
+    """Debounces analysis requests per project and runs at most one at a time.
+
+    Each call to schedule() restarts the project's debounce timer (bounded by
+    max_delay_seconds so a continuous stream still gets analysed). When the
+    timer fires the runner is invoked with the project ID and an
+    ``is_superseded`` callable that turns True as soon as a newer request
+    arrives.
+    """
+
+    def __init__(
+        self,
+        runner: AnalysisRunner,
+        debounce_seconds: float = 1.5,
+        max_delay_seconds: float = 10.0,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            runner: Coroutine function ``runner(project_id, is_superseded)``
+            debounce_seconds: Quiet period required before a run starts
+            max_delay_seconds: Upper bound on how long a burst can postpone a run
+        """
+        self.runner = runner
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._states: dict[str, _ProjectState] = {}
+        self.stats = {
+            "requested": 0,
+            "debounced": 0,
+            "runs": 0,
+            "superseded": 0,
+            "failed": 0,
+        }
+
+    def schedule(self, project_id: str) -> None:
+        """Request an analysis run for a project.
+
+        Must be called from within a running event loop.
+
+        Args:
+            project_id: Project identifier
+        """
+        loop = asyncio.get_running_loop()
+        state = self._states.setdefault(project_id, _ProjectState())
+        state.generation += 1
+        self.stats["requested"] += 1
+
+        now = loop.time()
+        if state.first_requested_at is None:
+            state.first_requested_at = now
+        remaining = state.first_requested_at + self.max_delay_seconds - now
+        delay = max(0.0, min(self.debounce_seconds, remaining))
+
+        if state.timer is not None and not state.timer.done():
+            state.timer.cancel()
+            self.stats["debounced"] += 1
+
+        state.timer = asyncio.create_task(self._fire(project_id, state, state.generation, delay))
+
+    def pending(self, project_id: str) -> bool:
+        """Check whether a run is waiting or in progress for a project."""
+        state = self._states.get(project_id)
+        return state is not None and (
+            (state.timer is not None and not state.timer.done()) or state.lock.locked()
+        )
+
+    async def flush(self, project_id: str | None = None) -> None:
+        """Skip the remaining debounce delay and wait for pending runs.
+
+        Args:
+            project_id: Project to flush, or None for all projects
+        """
+        ids = [project_id] if project_id else list(self._states)
+        for pid in ids:
+            state = self._states.get(pid)
+            if state is None:
+                continue
+            if state.timer is not None and not state.timer.done():
+                state.timer.cancel()
+                state.timer = None
+                await self._run(pid, state, state.generation)
+            else:
+                async with state.lock:
+                    pass
+
+    async def _fire(self, project_id: str, state: _ProjectState, generation: int, delay: float):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+
+        # Past the debounce window: from here on the run can't be cancelled, only superseded
+        state.timer = None
+        await self._run(project_id, state, generation)
+
+    async def _run(self, project_id: str, state: _ProjectState, generation: int) -> None:
+        state.first_requested_at = None
+
+        async with state.lock:
+            if state.generation != generation:
+                self.stats["superseded"] += 1
+                return
+
+            self.stats["runs"] += 1
+            try:
+                await self.runner(project_id, lambda: state.generation != generation)
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.error(f"[SCHEDULER] Analysis run failed for {project_id}: {e}")
+
+        if state.generation == generation and state.timer is None:
+            self._states.pop(project_id, None)
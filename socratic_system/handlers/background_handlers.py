@@ -9,8 +9,18 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from socratic_system.messaging.agent_bus import AgentBus
+
+from .analysis_scheduler import ProjectAnalysisScheduler
+
 logger = logging.getLogger(__name__)
 
+# (event prefix, cache key / WebSocket type) for each background analysis
+ANALYSIS_KINDS = (("quality", "quality"), ("conflict", "conflicts"), ("insights", "insights"))
+
+# Per-agent timeout for the combined analysis fan-out
+ANALYSIS_TIMEOUT_SECONDS = 120.0
+
 
 class BackgroundHandlers:
     """Background event handlers for async processing.
@@ -20,7 +30,14 @@ class BackgroundHandlers:
     client polling.
     """
 
-    def __init__(self, orchestrator, cache, job_tracker, websocket_broadcaster=None):
+    def __init__(
+        self,
+        orchestrator,
+        cache,
+        job_tracker,
+        websocket_broadcaster=None,
+        debounce_seconds: float = 1.5,
+    ):
         """Initialize background handlers.
 
         Args:
@@ -28,11 +45,15 @@ class BackgroundHandlers:
             cache: AnalysisCache instance for storing results
             job_tracker: JobTracker instance for tracking jobs
             websocket_broadcaster: Optional function to broadcast WebSocket updates
+            debounce_seconds: Quiet period before analysing a burst of responses
         """
         self.orchestrator = orchestrator
         self.cache = cache
         self.job_tracker = job_tracker
         self.websocket_broadcaster = websocket_broadcaster
+        self.scheduler = ProjectAnalysisScheduler(
+            self._process_all_async, debounce_seconds=debounce_seconds
+        )
         self._register_handlers()
         logger.info("BackgroundHandlers initialized")
 
@@ -56,8 +77,9 @@ class BackgroundHandlers:
     async def _on_response_received(self, data: dict[str, Any]):
         """Background processing when response is received.
 
-        Triggered by response.received event. Schedules background tasks
-        without blocking the main response path.
+        Triggered by response.received event. Schedules a debounced, combined
+        analysis run without blocking the main response path, so a burst of
+        responses results in one load/analyse/save cycle.
 
         Args:
             data: Event data containing project_id and response content
@@ -70,10 +92,7 @@ class BackgroundHandlers:
 
         logger.info(f"[BACKGROUND] Processing response for project {project_id}")
 
-        # Schedule background tasks (fire and forget)
-        asyncio.create_task(self._process_quality_async(project_id))
-        asyncio.create_task(self._process_conflicts_async(project_id))
-        asyncio.create_task(self._process_insights_async(project_id))
+        self.scheduler.schedule(project_id)
 
     async def _on_quality_analysis_requested(self, data: dict[str, Any]):
         """Handle explicit quality analysis request.
@@ -125,57 +144,13 @@ class BackgroundHandlers:
             self.cache.set(cache_key, quality_result)
 
             # UPDATE PROJECT WITH NEW MATURITY VALUES
-            if quality_result:
-                if "overall_maturity" in quality_result:
-                    project.overall_maturity = quality_result["overall_maturity"]
-
-                if "phase_maturity_scores" in quality_result:
-                    project.phase_maturity_scores = quality_result["phase_maturity_scores"]
-
-                if "category_scores" in quality_result:
-                    project.category_scores = quality_result["category_scores"]
-
-                project.last_assessment = datetime.now().isoformat()
-
-                # SAVE UPDATED PROJECT TO DATABASE
-                await asyncio.to_thread(self.orchestrator.database.save_project, project)
-                logger.debug(
-                    f"[BACKGROUND] Project maturity updated: overall={project.overall_maturity}%"
-                )
-
-            # Emit completion event WITH UPDATED VALUES
-            await self.orchestrator.event_emitter.emit_async(
-                "quality.analysis.completed",
-                {
-                    "project_id": project_id,
-                    "result": quality_result,
-                    "overall_maturity": project.overall_maturity,
-                    "category_scores": project.category_scores,
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+            if self._apply_quality_result(project, quality_result):
+                await self._save_scores(project_id, project)
 
-            # Broadcast WebSocket update if available
-            if self.websocket_broadcaster:
-                try:
-                    await self.websocket_broadcaster(project_id, "quality", quality_result)
-                except Exception as e:
-                    logger.warning(f"[BACKGROUND] WebSocket broadcast failed: {e}")
-
-            logger.info(f"[BACKGROUND] Quality analysis completed for {project_id}")
+            await self._publish_quality(project_id, project, quality_result)
 
         except Exception as e:
-            logger.error(f"[BACKGROUND] Quality analysis failed for {project_id}: {str(e)}")
-
-            # Emit failure event
-            await self.orchestrator.event_emitter.emit_async(
-                "quality.analysis.failed",
-                {
-                    "project_id": project_id,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+            await self._publish_failure(project_id, "quality", e)
 
     async def _process_conflicts_async(self, project_id: str):
         """Non-blocking conflict analysis in background.
@@ -206,37 +181,10 @@ class BackgroundHandlers:
             cache_key = f"analysis:conflicts:{project_id}"
             self.cache.set(cache_key, conflicts_result)
 
-            # Emit completion event
-            await self.orchestrator.event_emitter.emit_async(
-                "conflict.analysis.completed",
-                {
-                    "project_id": project_id,
-                    "result": conflicts_result,
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
-
-            # Broadcast WebSocket update if available
-            if self.websocket_broadcaster:
-                try:
-                    await self.websocket_broadcaster(project_id, "conflicts", conflicts_result)
-                except Exception as e:
-                    logger.warning(f"[BACKGROUND] WebSocket broadcast failed: {e}")
-
-            logger.info(f"[BACKGROUND] Conflict analysis completed for {project_id}")
+            await self._publish(project_id, "conflicts", "conflict", conflicts_result)
 
         except Exception as e:
-            logger.error(f"[BACKGROUND] Conflict analysis failed for {project_id}: {str(e)}")
-
-            # Emit failure event
-            await self.orchestrator.event_emitter.emit_async(
-                "conflict.analysis.failed",
-                {
-                    "project_id": project_id,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+            await self._publish_failure(project_id, "conflict", e)
 
     async def _process_insights_async(self, project_id: str):
         """Non-blocking insight extraction in background.
@@ -267,34 +215,204 @@ class BackgroundHandlers:
             cache_key = f"analysis:insights:{project_id}"
             self.cache.set(cache_key, insights_result)
 
-            # Emit completion event
-            await self.orchestrator.event_emitter.emit_async(
-                "insights.analysis.completed",
-                {
-                    "project_id": project_id,
-                    "result": insights_result,
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+            await self._publish(project_id, "insights", "insights", insights_result)
+
+        except Exception as e:
+            await self._publish_failure(project_id, "insights", e)
 
-            # Broadcast WebSocket update if available
-            if self.websocket_broadcaster:
-                try:
-                    await self.websocket_broadcaster(project_id, "insights", insights_result)
-                except Exception as e:
-                    logger.warning(f"[BACKGROUND] WebSocket broadcast failed: {e}")
+    async def _process_all_async(self, project_id: str, is_superseded=lambda: False):
+        """Run quality, conflict and insight analysis in one pass.
 
-            logger.info(f"[BACKGROUND] Insight analysis completed for {project_id}")
+        Loads the project once, runs the three analyses concurrently over that
+        snapshot and persists the resulting scores with one delta write. If a
+        newer request arrives while analysing, the results are dropped; the
+        newer run will publish fresh ones.
 
+        Args:
+            project_id: Project identifier
+            is_superseded: Callable returning True once a newer run is pending
+        """
+        logger.debug(f"[BACKGROUND] Starting combined analysis for {project_id}")
+
+        try:
+            project = await asyncio.to_thread(self.orchestrator.database.load_project, project_id)
         except Exception as e:
-            logger.error(f"[BACKGROUND] Insight analysis failed for {project_id}: {str(e)}")
-
-            # Emit failure event
-            await self.orchestrator.event_emitter.emit_async(
-                "insights.analysis.failed",
-                {
-                    "project_id": project_id,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+            for kind, _ in ANALYSIS_KINDS:
+                await self._publish_failure(project_id, kind, e)
+            return
+
+        if not project:
+            logger.warning(f"[BACKGROUND] Project not found: {project_id}")
+            return
+
+        results = await self._gather_analyses(project)
+
+        if is_superseded():
+            logger.debug(f"[BACKGROUND] Dropping superseded analysis for {project_id}")
+            return
+
+        # Cache results for polling
+        for kind, cache_name in ANALYSIS_KINDS:
+            if not isinstance(results[kind], Exception):
+                self.cache.set(f"analysis:{cache_name}:{project_id}", results[kind])
+
+        # Persist scores once, then publish each analysis
+        quality_result = results["quality"]
+        if not isinstance(quality_result, Exception) and self._apply_quality_result(
+            project, quality_result
+        ):
+            await self._save_scores(project_id, project)
+
+        for kind, cache_name in ANALYSIS_KINDS:
+            result = results[kind]
+            if isinstance(result, Exception):
+                await self._publish_failure(project_id, kind, result)
+            elif kind == "quality":
+                await self._publish_quality(project_id, project, result)
+            else:
+                await self._publish(project_id, cache_name, kind, result)
+
+    @staticmethod
+    def _analysis_requests(project) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Build the agent request for each analysis kind.
+
+        Returns:
+            Mapping of analysis kind to (agent name, request)
+        """
+        return {
+            "quality": ("quality_controller", {"action": "get_phase_maturity", "project": project}),
+            "conflict": ("conflict_detector", {"action": "detect_conflicts", "project": project}),
+            "insights": ("context_analyzer", {"action": "analyze_context", "project": project}),
+        }
+
+    async def _gather_analyses(self, project) -> dict[str, Any]:
+        """Run all analyses concurrently against one project snapshot.
+
+        Fans out through the agent bus, so the pass takes as long as the
+        slowest analysis rather than the sum of all three. Without a bus the
+        analyses run one after another in a worker thread.
+
+        Returns:
+            Mapping of analysis kind to its result, or to the raised exception
+        """
+        agent_bus = getattr(self.orchestrator, "agent_bus", None)
+        if not isinstance(agent_bus, AgentBus):
+            return await asyncio.to_thread(self._run_analyses, project)
+
+        gathered = await agent_bus.scatter_gather(
+            self._analysis_requests(project), timeout=ANALYSIS_TIMEOUT_SECONDS
+        )
+        return {
+            kind: outcome.response if outcome.ok else RuntimeError(outcome.error or outcome.status)
+            for kind, outcome in gathered.outcomes.items()
+        }
+
+    def _run_analyses(self, project) -> dict[str, Any]:
+        """Run all analyses against one project snapshot (worker thread).
+
+        Returns:
+            Mapping of analysis kind to its result, or to the raised exception
+        """
+        results: dict[str, Any] = {}
+        for kind, (agent_name, request) in self._analysis_requests(project).items():
+            try:
+                results[kind] = getattr(self.orchestrator, agent_name).process(request)
+            except Exception as e:
+                results[kind] = e
+        return results
+
+    def _apply_quality_result(self, project, quality_result) -> bool:
+        """Copy maturity values from a quality result onto the project.
+
+        Returns:
+            True if the project's scores changed and should be persisted
+        """
+        if not quality_result or not isinstance(quality_result, dict):
+            return False
+
+        if "overall_maturity" in quality_result:
+            project.overall_maturity = quality_result["overall_maturity"]
+
+        if "phase_maturity_scores" in quality_result:
+            project.phase_maturity_scores = quality_result["phase_maturity_scores"]
+
+        if "category_scores" in quality_result:
+            project.category_scores = quality_result["category_scores"]
+
+        project.last_assessment = datetime.now().isoformat()
+        return True
+
+    async def _save_scores(self, project_id: str, project) -> None:
+        """Persist maturity scores with a delta write instead of a full save."""
+        await asyncio.to_thread(
+            self.orchestrator.database.save_project_scores,
+            project_id,
+            project.phase_maturity_scores,
+            project.category_scores,
+        )
+        logger.debug(f"[BACKGROUND] Project maturity updated: overall={project.overall_maturity}%")
+
+    async def _publish_quality(self, project_id: str, project, quality_result) -> None:
+        """Cache, emit and broadcast a quality result with the updated maturity values."""
+        await self._publish(
+            project_id,
+            "quality",
+            "quality",
+            quality_result,
+            extra={
+                "overall_maturity": project.overall_maturity,
+                "category_scores": project.category_scores,
+            },
+        )
+
+    async def _publish(
+        self,
+        project_id: str,
+        cache_name: str,
+        event_prefix: str,
+        result,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        """Emit a completion event for a result and broadcast it.
+
+        Args:
+            project_id: Project identifier
+            cache_name: WebSocket analysis type
+            event_prefix: Event name prefix (e.g. 'conflict' -> 'conflict.analysis.completed')
+            result: Analysis result
+            extra: Additional fields for the completion event
+        """
+        # Emit completion event
+        await self.orchestrator.event_emitter.emit_async(
+            f"{event_prefix}.analysis.completed",
+            {
+                "project_id": project_id,
+                "result": result,
+                **(extra or {}),
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+        # Broadcast WebSocket update if available
+        if self.websocket_broadcaster:
+            try:
+                await self.websocket_broadcaster(project_id, cache_name, result)
+            except Exception as e:
+                logger.warning(f"[BACKGROUND] WebSocket broadcast failed: {e}")
+
+        logger.info(f"[BACKGROUND] {event_prefix.capitalize()} analysis completed for {project_id}")
+
+    async def _publish_failure(self, project_id: str, event_prefix: str, error: Exception) -> None:
+        """Log and emit a failed-analysis event."""
+        logger.error(
+            f"[BACKGROUND] {event_prefix.capitalize()} analysis failed for {project_id}: {error}"
+        )
+
+        await self.orchestrator.event_emitter.emit_async(
+            f"{event_prefix}.analysis.failed",
+            {
+                "project_id": project_id,
+                "error": str(error),
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
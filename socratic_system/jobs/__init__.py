@@ -3,10 +3,11 @@
 Provides async job tracking infrastructure for background analysis operations.
 """
 
-from .job_tracker import JobResult, JobStatus, JobTracker
+from .job_tracker import JobResult, JobStatus, JobTracker, SQLiteJobTracker
 
 __all__ = [
     "JobTracker",
+    "SQLiteJobTracker",
     "JobResult",
     "JobStatus",
 ]
@@ -3,10 +3,13 @@
 Tracks status of async background jobs for analysis processing.
 """
 
+import json
 import logging
+import sqlite3
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from threading import Lock
 from typing import Any
 
@@ -247,3 +250,239 @@ class JobTracker:
                 "failed": failed,
                 "max_jobs": self._max_jobs,
             }
+
+
+class SQLiteJobTracker(JobTracker):
+    """Track background jobs in a SQLite file shared by several processes.
+
+    Used when the API runs several worker processes, so a job started by one
+    worker can be queried through any other. Results must be JSON-serializable.
+    Returned JobResult objects are snapshots; update jobs through the tracker.
+    """
+
+    _COLUMNS = (
+        "job_id, project_id, status, created_at, started_at, completed_at, result, error, progress"
+    )
+
+    def __init__(self, db_path: str):
+        """Initialize job tracker
+
+        Args:
+            db_path: Path to the SQLite database file shared by all processes
+        """
+        self.db_path = db_path
+        self._max_jobs = 10000
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tracked_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    project_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    result TEXT,
+                    error TEXT,
+                    progress REAL NOT NULL DEFAULT 0.0
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tracked_jobs_project ON tracked_jobs(project_id)"
+            )
+        finally:
+            conn.close()
+        logger.info(f"SQLiteJobTracker initialized at {db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).rowcount
+        finally:
+            conn.close()
+
+    def _select(self, where: str, params: tuple = ()) -> list[JobResult]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {self._COLUMNS} FROM tracked_jobs WHERE {where} ORDER BY created_at",
+                params,
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self._to_job(row) for row in rows]
+
+    @staticmethod
+    def _to_job(row: tuple) -> JobResult:
+        job_id, project_id, status, created, started, completed, result, error, progress = row
+        return JobResult(
+            job_id=job_id,
+            project_id=project_id,
+            status=JobStatus(status),
+            created_at=datetime.fromisoformat(created),
+            started_at=datetime.fromisoformat(started) if started else None,
+            completed_at=datetime.fromisoformat(completed) if completed else None,
+            result=json.loads(result) if result is not None else None,
+            error=error,
+            progress=progress,
+        )
+
+    def _finish(self, job_id: str, status: JobStatus, **fields: Any) -> None:
+        assignments = "".join(f", {column} = ?" for column in fields)
+        self._execute(
+            f"UPDATE tracked_jobs SET status = ?, completed_at = ?{assignments} WHERE job_id = ?",
+            (status.value, datetime.now().isoformat(), *fields.values(), job_id),
+        )
+
+    def create_job(self, job_id: str, project_id: str) -> JobResult:
+        """Create new job tracking entry.
+
+        Args:
+            job_id: Unique job identifier
+            project_id: Associated project ID
+
+        Returns:
+            JobResult object initialized in PENDING state
+        """
+        job = JobResult(
+            job_id=job_id,
+            project_id=project_id,
+            status=JobStatus.PENDING,
+            created_at=datetime.now(),
+        )
+        self._execute(
+            "INSERT OR REPLACE INTO tracked_jobs (job_id, project_id, status, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (job_id, project_id, job.status.value, job.created_at.isoformat()),
+        )
+        logger.debug(f"Job created: {job_id} for project {project_id}")
+        return job
+
+    def get_job(self, job_id: str) -> JobResult | None:
+        """Get job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            JobResult if exists, None otherwise
+        """
+        jobs = self._select("job_id = ?", (job_id,))
+        return jobs[0] if jobs else None
+
+    def mark_processing(self, job_id: str):
+        """Mark job as processing.
+
+        Args:
+            job_id: Job identifier
+        """
+        self._execute(
+            "UPDATE tracked_jobs SET status = ?, started_at = ? WHERE job_id = ?",
+            (JobStatus.PROCESSING.value, datetime.now().isoformat(), job_id),
+        )
+
+    def mark_completed(self, job_id: str, result: dict[str, Any]):
+        """Mark job as completed with result.
+
+        Args:
+            job_id: Job identifier
+            result: Job result data
+        """
+        self._finish(job_id, JobStatus.COMPLETED, result=json.dumps(result), progress=1.0)
+
+    def mark_failed(self, job_id: str, error: str):
+        """Mark job as failed.
+
+        Args:
+            job_id: Job identifier
+            error: Error message
+        """
+        self._finish(job_id, JobStatus.FAILED, error=error)
+
+    def mark_cancelled(self, job_id: str):
+        """Mark job as cancelled.
+
+        Args:
+            job_id: Job identifier
+        """
+        self._finish(job_id, JobStatus.CANCELLED)
+
+    def update_progress(self, job_id: str, progress: float):
+        """Update job progress.
+
+        Args:
+            job_id: Job identifier
+            progress: Progress value (0.0 to 1.0)
+        """
+        self._execute(
+            "UPDATE tracked_jobs SET progress = ? WHERE job_id = ?",
+            (min(1.0, max(0.0, progress)), job_id),
+        )
+
+    def get_project_jobs(self, project_id: str) -> list:
+        """Get all jobs for a project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            List of JobResult objects
+        """
+        return self._select("project_id = ?", (project_id,))
+
+    def get_pending_jobs(self) -> list:
+        """Get all pending jobs.
+
+        Returns:
+            List of JobResult objects in PENDING status
+        """
+        return self._select("status = ?", (JobStatus.PENDING.value,))
+
+    def delete_job(self, job_id: str):
+        """Delete job entry (for cleanup).
+
+        Args:
+            job_id: Job identifier
+        """
+        self._execute("DELETE FROM tracked_jobs WHERE job_id = ?", (job_id,))
+
+    def cleanup_completed(self, max_age_seconds: int = 86400):
+        """Clean up completed jobs older than max_age.
+
+        Args:
+            max_age_seconds: Maximum age in seconds (default 24 hours)
+        """
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        removed = self._execute(
+            "DELETE FROM tracked_jobs WHERE completed_at IS NOT NULL AND completed_at < ?",
+            (cutoff.isoformat(),),
+        )
+        if removed:
+            logger.info(f"Cleaned up {removed} completed jobs")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get job tracker statistics.
+
+        Returns:
+            Statistics about tracked jobs
+        """
+        conn = self._connect()
+        try:
+            counts = dict(
+                conn.execute("SELECT status, COUNT(*) FROM tracked_jobs GROUP BY status").fetchall()
+            )
+        finally:
+            conn.close()
+        return {
+            "total_jobs": sum(counts.values()),
+            "pending": counts.get(JobStatus.PENDING.value, 0),
+            "processing": counts.get(JobStatus.PROCESSING.value, 0),
+            "completed": counts.get(JobStatus.COMPLETED.value, 0),
+            "failed": counts.get(JobStatus.FAILED.value, 0),
+            "max_jobs": self._max_jobs,
+        }
@@ -7,17 +7,26 @@ Includes resilience patterns: circuit breaker and retry logic.
 from .agent_bus import (
     AgentBus,
     AgentError,
+    AgentRoute,
     AgentTimeoutError,
     CircuitBreaker,
     CircuitBreakerState,
     RetryPolicy,
 )
+from .governance_cache import GovernanceDecisionCache, GovernancePolicy
+from .scatter_gather import CallOutcome, GatherMode, GatherResult
 
 __all__ = [
     "AgentBus",
     "AgentError",
+    "AgentRoute",
     "AgentTimeoutError",
+    "CallOutcome",
     "CircuitBreaker",
     "CircuitBreakerState",
+    "GatherMode",
+    "GatherResult",
+    "GovernanceDecisionCache",
+    "GovernancePolicy",
     "RetryPolicy",
 ]
@@ -1,17 +1,25 @@
 """Agent bus - message routing for agent-to-agent communication.
 
-Replaces direct orchestrator.process_request() calls with event-driven
-async messaging. Eliminates direct agent coupling and enables resilience patterns.
+Replaces direct orchestrator.process_request() calls with async messaging.
+Requests are dispatched straight to registered handlers through a dispatch
+table; the event emitter only sees requests when observers are listening.
+Eliminates direct agent coupling and enables resilience patterns.
 """
 
 import asyncio
 import logging
+import threading
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 from uuid import uuid4
 
+from socratic_system.messaging.agent_registry import AgentHandler
+from socratic_system.messaging.governance_cache import GovernanceDecisionCache, GovernancePolicy
+from socratic_system.messaging.scatter_gather import GatherMode, GatherResult, scatter_gather
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,6 +145,14 @@ class RetryPolicy:
         return delay
 
 
+@dataclass(frozen=True)
+class AgentRoute:
+    """Dispatch table entry for a registered agent."""
+
+    handler: AgentHandler
+    request_event: str
+
+
 class AgentTimeoutError(Exception):
     """Raised when agent request times out."""
 
@@ -168,6 +184,7 @@ class AgentBus:
         default_timeout: float = 30.0,
         enable_circuit_breaker: bool = True,
         enable_retry: bool = True,
+        governance_policy: GovernancePolicy | None = None,
     ):
         """Initialize agent bus.
 
@@ -181,6 +198,7 @@ class AgentBus:
             default_timeout: Default timeout for requests in seconds
             enable_circuit_breaker: Enable circuit breaker pattern
             enable_retry: Enable retry with exponential backoff
+            governance_policy: Optional fast-path policy for low-risk governance checks
         """
         self.event_emitter = event_emitter
         self.registry = registry
@@ -190,7 +208,6 @@ class AgentBus:
         self.default_timeout = default_timeout
         self.enable_circuit_breaker = enable_circuit_breaker
         self.enable_retry = enable_retry
-        self.request_queue: dict[str, asyncio.Future] = {}
         self.response_listeners: dict[str, list[Callable]] = {}
         self.logger = logger or logging.getLogger(__name__)
 
@@ -212,12 +229,29 @@ class AgentBus:
             "failed_requests": 0,
             "direct_handler_invocations": 0,
             "broadcast_messages": 0,
+            "scatter_gathers": 0,
             "circuit_breaker_rejections": 0,
             "timeouts": 0,
+            "governance_checks": 0,
+            "governance_fast_path": 0,
+            "governance_cache_hits": 0,
+            "governance_full_evaluations": 0,
+            "governance_time_ms": 0.0,
         }
 
-        # Set up event routing for agent requests
-        self._setup_event_routing()
+        # Governance fast path (allowlist + decision cache)
+        self.set_governance_policy(governance_policy or GovernancePolicy())
+
+        # Dispatch table (agent name -> route), rebuilt when the registry changes
+        self._routes: dict[str, AgentRoute] = {}
+        self._routes_version = -1
+        self._in_flight = 0
+        self.background_tasks: set[asyncio.Task] = set()
+
+        # Long-lived loop thread for send_request_sync(), started on first use
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
 
     def _check_capability(self, agent_name: str, action: str) -> tuple[bool, str | None]:
         """Check if agent has capability to perform action.
@@ -262,23 +296,78 @@ class AgentBus:
             # Fail-safe: deny if we can't verify
             return False, f"Capability check error: {str(e)}"
 
+    def set_governance_policy(self, policy: GovernancePolicy) -> None:
+        """Install a governance fast-path policy.
+
+        Replaces the decision cache, so verdicts made under a previous policy
+        are never reused.
+
+        Args:
+            policy: Policy to apply
+        """
+        self.governance_policy = policy
+        self.governance_cache = GovernanceDecisionCache(
+            max_size=policy.cache_size, ttl_seconds=policy.cache_ttl_seconds
+        )
+
     async def _check_governance(
         self, agent_name: str, action: str, request_data: dict[str, Any]
-    ) -> tuple[bool, str | None]:
+    ) -> tuple[bool, str | None, dict[str, Any]]:
         """Check if action is allowed under constitutional governance.
 
+        Allowlisted low-risk actions are approved without evaluation and
+        repeated requests reuse cached verdicts; high-risk actions and cache
+        misses go through the governor.
+
         Args:
             agent_name: Agent attempting the action
             action: Action type being requested
             request_data: Full request data for context
 
         Returns:
-            Tuple of (allowed: bool, reason: Optional[str])
+            Tuple of (allowed, reason, governance info with ``path`` and ``overhead_ms``)
         """
         if self.governor is None:
             # No governor configured, allow all actions
-            return True, None
+            return True, None, {"path": "none", "overhead_ms": 0.0}
+
+        start = time.perf_counter()
+        allowed, reason, path = await self._evaluate_governance(agent_name, action, request_data)
+        overhead_ms = (time.perf_counter() - start) * 1000
 
+        self.metrics["governance_checks"] += 1
+        self.metrics["governance_time_ms"] += overhead_ms
+        return allowed, reason, {"path": path, "overhead_ms": round(overhead_ms, 3)}
+
+    async def _evaluate_governance(
+        self, agent_name: str, action: str, request_data: dict[str, Any]
+    ) -> tuple[bool, str | None, str]:
+        """Resolve a governance verdict via the fast path, cache or governor.
+
+        Returns:
+            Tuple of (allowed, reason, path) where path is one of
+            "allowlist", "cache" or "full"
+        """
+        policy = self.governance_policy
+        if policy.is_low_risk(agent_name, action):
+            self.metrics["governance_fast_path"] += 1
+            return True, None, "allowlist"
+
+        cache_key = None
+        if not policy.is_high_risk(action):
+            try:
+                cache_key = self.governance_cache.fingerprint(
+                    agent_name, action, request_data, policy.version
+                )
+            except (TypeError, ValueError) as e:
+                self.logger.debug(f"[Governor] Request not cacheable: {e}")
+            else:
+                cached = self.governance_cache.get(cache_key)
+                if cached is not None:
+                    self.metrics["governance_cache_hits"] += 1
+                    return cached[0], cached[1], "cache"
+
+        self.metrics["governance_full_evaluations"] += 1
         try:
             # Use Governor to evaluate action against constitution
             # Governor.evaluate() returns a GovernorDecision object with allowed property
@@ -288,20 +377,24 @@ class AgentBus:
                 context=request_data,
                 purpose="Agent action authorization",
             )
+        except Exception as e:
+            self.logger.error(f"[Governor] Error evaluating action: {e}")
+            # On error, fail-safe: deny the action (not cached)
+            return False, f"Governor evaluation error: {str(e)}", "full"
 
-            if not decision.allowed:
-                self.logger.warning(
-                    f"[Governor] Action '{action}' by {agent_name} DENIED: {decision.reasoning}"
-                )
-                return False, f"Action denied by constitutional governance: {decision.reasoning}"
-
+        if decision.allowed:
             self.logger.debug(f"[Governor] Action '{action}' by {agent_name} APPROVED")
-            return True, None
+            allowed, reason = True, None
+        else:
+            self.logger.warning(
+                f"[Governor] Action '{action}' by {agent_name} DENIED: {decision.reasoning}"
+            )
+            allowed = False
+            reason = f"Action denied by constitutional governance: {decision.reasoning}"
 
-        except Exception as e:
-            self.logger.error(f"[Governor] Error evaluating action: {e}")
-            # On error, fail-safe: deny the action
-            return False, f"Governor evaluation error: {str(e)}"
+        if cache_key is not None:
+            self.governance_cache.put(cache_key, allowed, reason)
+        return allowed, reason, "full"
 
     def _get_circuit_breaker(self, agent_name: str) -> CircuitBreaker:
         """Get or create circuit breaker for agent.
@@ -316,87 +409,63 @@ class AgentBus:
             self.circuit_breakers[agent_name] = CircuitBreaker()
         return self.circuit_breakers[agent_name]
 
-    def _setup_event_routing(self) -> None:
-        """Set up event routing for agent requests.
+    def _resolve_route(self, agent_name: str) -> AgentRoute | None:
+        """Look up the dispatch table entry for an agent.
 
-        Creates a wrapper around event_emitter.emit() to intercept and route
-        agent request events to registered handlers. This ensures that when
-        send_request() emits an "agent.{name}.request" event, the handler is
-        invoked and the response is returned to the caller via handle_response().
-        """
-        # Store the original emit method
-        self._original_emit = self.event_emitter.emit
-
-        # Create a wrapper that intercepts agent request events
-        def wrapped_emit(event_type, data=None, skip_logging=False):
-            """Wrapper around event_emitter.emit that routes agent requests."""
-            # Convert event_type to string for pattern matching
-            from socratic_system.events import EventType
-
-            event_name = event_type.value if isinstance(event_type, EventType) else str(event_type)
-
-            # Check if this is an agent request event: "agent.{agent_name}.request"
-            if event_name.startswith("agent.") and event_name.endswith(".request"):
-                parts = event_name.split(".")
-                if len(parts) == 3:
-                    agent_name = parts[1]
-                    # Schedule async handler without blocking emit
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.create_task(self._handle_agent_request(agent_name, data))
-                        else:
-                            # Fallback: run synchronously if no event loop
-                            asyncio.run(self._handle_agent_request(agent_name, data))
-                    except RuntimeError:
-                        # No event loop available, run synchronously
-                        asyncio.run(self._handle_agent_request(agent_name, data))
+        The table is a snapshot of the registry's handlers, refreshed only when
+        the registry version changes, so steady-state lookups are a plain dict
+        access without locking.
 
-            # Continue with normal event emission
-            self._original_emit(event_type, data, skip_logging)
-
-        # Replace the emit method with the wrapper
-        self.event_emitter.emit = wrapped_emit
-
-    async def _handle_agent_request(self, agent_name: str, request_data: dict[str, Any]) -> None:
-        """Handle an incoming agent request by invoking the registered handler.
+        Args:
+            agent_name: Target agent
 
-        Routes the request to the appropriate agent handler via the registry,
-        executes it, and returns the response to the requester via handle_response().
+        Returns:
+            AgentRoute, or None if the agent is not registered
+        """
+        if self.registry.version != self._routes_version:
+            version = self.registry.version
+            self._routes = {
+                name: AgentRoute(handler=handler, request_event=f"agent.{name}.request")
+                for name, handler in self.registry.get_handlers().items()
+            }
+            self._routes_version = version
+        return self._routes.get(agent_name)
+
+    async def _dispatch(
+        self, agent_name: str, request_id: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run a request through the checks and invoke the agent's handler directly.
 
         Args:
             agent_name: Name of the target agent
-            request_data: Request data containing request_id and payload
-        """
-        request_id = request_data.get("request_id")
-        payload = request_data.get("payload", {})
+            request_id: Request identifier
+            payload: Request payload
 
-        if not request_id:
-            self.logger.error("[AgentBus] Request missing request_id")
-            return
+        Returns:
+            Response dict from the agent, or an error response
+        """
+        if not self.registry:
+            self.logger.error("[AgentBus] No registry available for request routing")
+            return {"status": "error", "message": "Agent bus registry not configured"}
+
+        route = self._resolve_route(agent_name)
+        if route is None:
+            self.logger.warning(f"[AgentBus] No handler registered for agent '{agent_name}'")
+            return {
+                "status": "error",
+                "message": f"Agent '{agent_name}' not found or not registered",
+            }
+
+        # Observer tap: only pay for the event when someone is listening
+        if self.event_emitter.listener_count(route.request_event):
+            self.event_emitter.emit(
+                route.request_event,
+                {"request_id": request_id, "payload": payload},
+                skip_logging=True,
+            )
 
+        self._in_flight += 1
         try:
-            # Look up the handler from the registry
-            if not self.registry:
-                self.logger.error("[AgentBus] No registry available for request routing")
-                self.handle_response(
-                    request_id,
-                    {"status": "error", "message": "Agent bus registry not configured"},
-                )
-                return
-
-            handler = self.registry.get_handler(agent_name)
-            if not handler:
-                self.logger.warning(f"[AgentBus] No handler registered for agent '{agent_name}'")
-                self.handle_response(
-                    request_id,
-                    {
-                        "status": "error",
-                        "message": f"Agent '{agent_name}' not found or not registered",
-                    },
-                )
-                return
-
             self.logger.debug(
                 f"[AgentBus] Routing request to agent '{agent_name}' (id: {request_id})"
             )
@@ -420,18 +489,16 @@ class AgentBus:
                         request_id=request_id,
                         context={"check_type": "capability"},
                     )
-                self.handle_response(
-                    request_id,
-                    {
-                        "status": "error",
-                        "message": capability_reason,
-                        "code": "capability_denied",
-                    },
-                )
-                return
+                return {
+                    "status": "error",
+                    "message": capability_reason,
+                    "code": "capability_denied",
+                }
 
             # Check governance before allowing action
-            allowed, denial_reason = await self._check_governance(agent_name, action, payload)
+            allowed, denial_reason, governance = await self._check_governance(
+                agent_name, action, payload
+            )
 
             if not allowed:
                 self.logger.warning(f"[AgentBus] Request blocked by governance: {denial_reason}")
@@ -443,26 +510,27 @@ class AgentBus:
                         allowed=False,
                         denial_reason=f"Governance denied: {denial_reason}",
                         request_id=request_id,
-                        context={"check_type": "governance"},
+                        context={"check_type": "governance", "governance": governance},
                     )
-                self.handle_response(
-                    request_id,
-                    {
-                        "status": "error",
-                        "message": denial_reason,
-                        "code": "governance_denied",
-                    },
-                )
-                return
+                return {
+                    "status": "error",
+                    "message": denial_reason,
+                    "code": "governance_denied",
+                }
 
             # Log allowed action
             if self.audit_logger:
                 self.audit_logger.log_agent_action(
-                    agent_name=agent_name, action=action, allowed=True, request_id=request_id
+                    agent_name=agent_name,
+                    action=action,
+                    allowed=True,
+                    request_id=request_id,
+                    context={"governance": governance},
                 )
 
             # Invoke the handler
-            response = await handler.invoke(payload)
+            self.metrics["direct_handler_invocations"] += 1
+            response = await route.handler.invoke(payload)
 
             # Ensure response has proper structure
             if not isinstance(response, dict):
@@ -473,16 +541,20 @@ class AgentBus:
             self.logger.debug(
                 f"[AgentBus] Agent '{agent_name}' returned response (id: {request_id})"
             )
-
-            # Send response back to the requester
-            self.handle_response(request_id, response)
+            return response
 
         except Exception as e:
             self.logger.error(f"[AgentBus] Error handling request for agent '{agent_name}': {e}")
-            self.handle_response(
-                request_id,
-                {"status": "error", "message": f"Agent processing error: {str(e)}"},
-            )
+            return {"status": "error", "message": f"Agent processing error: {str(e)}"}
+
+        finally:
+            self._in_flight -= 1
+
+    def _run_in_background(self, coro) -> None:
+        """Schedule a coroutine on the running loop, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
 
     async def send_request(
         self,
@@ -490,6 +562,7 @@ class AgentBus:
         request: dict[str, Any],
         timeout: float | None = None,
         fire_and_forget: bool = False,
+        retries: int | None = None,
     ) -> dict[str, Any]:
         """Send request to another agent with resilience patterns.
 
@@ -501,6 +574,7 @@ class AgentBus:
             request: Request data dict
             timeout: Timeout in seconds (uses default_timeout if not specified)
             fire_and_forget: If True, don't wait for response
+            retries: Override the retry count for timeouts (0 disables retries)
 
         Returns:
             Response dict from agent
@@ -529,19 +603,15 @@ class AgentBus:
         # Fire-and-forget doesn't use retry
         if fire_and_forget:
             request_id = str(uuid4())
-            self.event_emitter.emit(
-                f"agent.{target_agent}.request",
-                {
-                    "request_id": request_id,
-                    "payload": request,
-                },
-            )
+            self._run_in_background(self._dispatch(target_agent, request_id, request))
             return {"request_id": request_id, "status": "queued"}
 
         # Request-response with retry
         last_error: Exception | None = None
         retry_count = 0
         max_retries = self.retry_policy.max_retries if self.enable_retry else 0
+        if retries is not None:
+            max_retries = min(max_retries, retries)
 
         while retry_count <= max_retries:
             request_id = str(uuid4())
@@ -551,21 +621,10 @@ class AgentBus:
                     f"[AgentBus] Sending request to {target_agent} (attempt {retry_count + 1})"
                 )
 
-                # Request-response pattern
-                future: asyncio.Future[Any] = asyncio.Future()
-                self.request_queue[request_id] = future
-
-                self.event_emitter.emit(
-                    f"agent.{target_agent}.request",
-                    {
-                        "request_id": request_id,
-                        "payload": request,
-                        "reply_to": "agent_bus",
-                    },
+                # Invoke the handler directly, bounded by the timeout
+                response = await asyncio.wait_for(
+                    self._dispatch(target_agent, request_id, request), timeout=timeout
                 )
-
-                # Wait for response with timeout
-                response = await asyncio.wait_for(future, timeout=timeout)
                 self.logger.debug(f"[AgentBus] Received response for {request_id}")
 
                 # Record success in circuit breaker and metrics
@@ -588,7 +647,7 @@ class AgentBus:
                     self._get_circuit_breaker(target_agent).record_failure()
 
                 # Retry with exponential backoff
-                if retry_count < max_retries and self.enable_retry:
+                if retry_count < max_retries:
                     delay = self.retry_policy.get_delay(retry_count)
                     self.logger.info(
                         f"[AgentBus] Retrying in {delay:.2f}s (attempt {retry_count + 2})"
@@ -609,11 +668,6 @@ class AgentBus:
                 # Don't retry on non-timeout errors
                 break
 
-            finally:
-                # Clean up
-                if request_id in self.request_queue:
-                    del self.request_queue[request_id]
-
         # All retries exhausted
         self.metrics["failed_requests"] += 1
         if isinstance(last_error, asyncio.TimeoutError):
@@ -621,24 +675,6 @@ class AgentBus:
         else:
             raise AgentError(f"Agent {target_agent} request failed: {last_error}")
 
-    def handle_response(self, request_id: str, response: dict[str, Any]) -> None:
-        """Handle response from agent.
-
-        Called by agents to send responses back.
-
-        Args:
-            request_id: Request identifier
-            response: Response data
-        """
-        if request_id not in self.request_queue:
-            self.logger.warning(f"[AgentBus] Unknown request_id: {request_id}")
-            return
-
-        future = self.request_queue[request_id]
-        if not future.done():
-            future.set_result(response)
-            self.logger.debug(f"[AgentBus] Response queued for {request_id}")
-
     def register_handler(self, agent_name: str, handler_func: Callable) -> None:
         """Register handler for agent responses.
 
@@ -672,7 +708,7 @@ class AgentBus:
         """Send request to another agent synchronously.
 
         Routes through orchestrator if available (backward compatible),
-        otherwise tries async path via asyncio.run().
+        otherwise runs the async path on the bus's long-lived loop thread.
 
         Args:
             target_agent: Name of target agent
@@ -693,25 +729,58 @@ class AgentBus:
             self.logger.debug(f"[AgentBus] Routing {target_agent} request through orchestrator")
             return orchestrator.process_request(target_agent, request)
 
-        # Try to run async send_request
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            # No running loop, create one
-            return asyncio.run(
-                self.send_request(
-                    target_agent,
-                    request,
-                    timeout=timeout,
-                    fire_and_forget=fire_and_forget,
-                )
-            )
+            pass
         else:
             # Already in async context, shouldn't call sync version
             raise RuntimeError(
                 "send_request_sync() called from async context. Use send_request() instead."
             )
 
+        # Run on the bus loop thread instead of creating a loop per call
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_request(
+                target_agent,
+                request,
+                timeout=timeout,
+                fire_and_forget=fire_and_forget,
+            ),
+            self._get_loop(),
+        )
+        return future.result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the bus event loop for sync callers, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="agent-bus-loop", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the bus loop thread used by sync callers.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to exit
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
     def get_stats(self) -> dict[str, Any]:
         """Get agent bus statistics.
 
@@ -719,7 +788,7 @@ class AgentBus:
             Statistics dict
         """
         return {
-            "pending_requests": len(self.request_queue),
+            "pending_requests": self._in_flight,
             "registered_handlers": sum(
                 len(handlers) for handlers in self.response_listeners.values()
             ),
@@ -731,31 +800,104 @@ class AgentBus:
         Returns:
             Metrics dict with request statistics
         """
+        checks = self.metrics["governance_checks"]
         return {
             **self.metrics,
-            "pending_requests": len(self.request_queue),
+            "governance_avg_overhead_ms": (
+                round(self.metrics["governance_time_ms"] / checks, 3) if checks else 0.0
+            ),
+            "governance_cache": self.governance_cache.get_stats(),
+            "pending_requests": self._in_flight,
             "circuit_breakers": {
                 name: breaker.get_state() for name, breaker in self.circuit_breakers.items()
             },
         }
 
+    async def scatter_gather(
+        self,
+        calls: dict[str, tuple[str, dict[str, Any]]],
+        mode: GatherMode | str = GatherMode.ALL_SETTLED,
+        k: int | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        timeouts: dict[str, float] | None = None,
+    ) -> GatherResult:
+        """Send requests to several agents concurrently and gather the results.
+
+        Latency approaches that of the slowest agent instead of the sum of all
+        of them. Each call gets its own timeout and is not retried, so one slow
+        agent can't hold up the others beyond its own budget.
+
+        Args:
+            calls: Call key -> (agent name, request)
+            mode: "all_settled", "first_k" or "quorum" (see GatherMode)
+            k: Target successes for first_k (default 1) or quorum (default majority)
+            concurrency: Maximum calls in flight (defaults to max_concurrent_requests)
+            timeout: Per-agent timeout in seconds (defaults to default_timeout)
+            timeouts: Per-agent timeout overrides, keyed by agent name
+
+        Returns:
+            GatherResult with an outcome per call key
+
+        Example:
+            >>> result = await bus.scatter_gather({
+            ...     "quality": ("quality_controller", {"action": "get_phase_maturity", ...}),
+            ...     "conflicts": ("conflict_detector", {"action": "detect_conflicts", ...}),
+            ... })
+            >>> result.outcomes["quality"].response
+        """
+        self.metrics["scatter_gathers"] += 1
+
+        async def send(agent: str, request: dict[str, Any], agent_timeout: float):
+            try:
+                return await self.send_request(agent, request, timeout=agent_timeout, retries=0)
+            except AgentTimeoutError as e:
+                raise TimeoutError(str(e)) from e
+
+        result = await scatter_gather(
+            send,
+            calls,
+            mode=mode,
+            k=k,
+            concurrency=concurrency or self.max_concurrent_requests,
+            timeout=timeout if timeout is not None else self.default_timeout,
+            timeouts=timeouts,
+        )
+        self.logger.debug(
+            f"[AgentBus] Scatter-gather over {len(calls)} calls: "
+            f"{result.succeeded}/{result.required} succeeded in {result.elapsed_ms:.1f}ms"
+        )
+        return result
+
     async def broadcast(
         self,
         action: str,
         payload: dict[str, Any] | None = None,
         capability_filter: str | None = None,
+        wait_for_responses: bool = False,
+        concurrency: int | None = None,
+        timeout: float | None = None,
     ) -> dict[str, Any]:
         """Broadcast message to multiple agents.
 
+        By default the message is fire-and-forget. With ``wait_for_responses``
+        the agents are called concurrently via scatter_gather() and their
+        outcomes are included in the result.
+
         Args:
             action: Action to broadcast
             payload: Optional payload data
             capability_filter: Optional capability to filter agents
+            wait_for_responses: Wait for every agent to respond
+            concurrency: Maximum calls in flight when waiting for responses
+            timeout: Per-agent timeout when waiting for responses
 
         Returns:
-            Dict with status, count, and agents_notified list
+            Dict with status, count, and agents_notified list (plus per-agent
+            ``responses`` when waiting for responses)
         """
         agents_notified = []
+        responses = None
 
         # Get agents from registry if available
         if self.registry:
@@ -765,22 +907,34 @@ class AgentBus:
             else:
                 agents_notified = self.registry.list_agents()
 
-            # Fire-and-forget to all matching agents
-            for agent_name in agents_notified:
-                try:
-                    await self.send_request(
-                        target_agent=agent_name,
-                        request={"action": action, **(payload or {})},
-                        fire_and_forget=True,
-                    )
-                except Exception as e:
-                    self.logger.warning(f"[AgentBus] Failed to notify {agent_name}: {e}")
+            request = {"action": action, **(payload or {})}
+            if wait_for_responses:
+                gathered = await self.scatter_gather(
+                    {agent_name: (agent_name, dict(request)) for agent_name in agents_notified},
+                    concurrency=concurrency,
+                    timeout=timeout,
+                )
+                responses = gathered.to_dict()["outcomes"]
+            else:
+                # Fire-and-forget to all matching agents (dispatched as background tasks)
+                for agent_name in agents_notified:
+                    try:
+                        await self.send_request(
+                            target_agent=agent_name,
+                            request=dict(request),
+                            fire_and_forget=True,
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"[AgentBus] Failed to notify {agent_name}: {e}")
 
             self.metrics["broadcast_messages"] += 1
 
-        return {
+        result = {
             "status": "success",
             "action": action,
             "count": len(agents_notified),
             "agents_notified": agents_notified,
         }
+        if responses is not None:
+            result["responses"] = responses
+        return result
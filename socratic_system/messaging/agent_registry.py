@@ -75,6 +75,8 @@ class AgentRegistry:
         self._agents: dict[str, AgentMetadata] = {}
         self._handlers: dict[str, AgentHandler] = {}
         self._lock = threading.RLock()
+        # Bumped whenever handlers change, so callers can cache handler lookups
+        self.version = 0
         self._health_check_timeout = health_check_timeout
         self.logger = logging.getLogger("socrates.messaging.registry")
 
@@ -116,6 +118,7 @@ class AgentRegistry:
 
             self._agents[agent_name] = agent_meta
             self._handlers[agent_name] = handler_wrapper
+            self.version += 1
 
             self.logger.info(
                 f"Registered agent {agent_name} with capabilities: {agent_meta.capabilities}"
@@ -136,6 +139,7 @@ class AgentRegistry:
 
             del self._agents[agent_name]
             del self._handlers[agent_name]
+            self.version += 1
 
             self.logger.info(f"Unregistered agent {agent_name}")
             return True
@@ -164,6 +168,15 @@ class AgentRegistry:
         with self._lock:
             return self._handlers.get(agent_name)
 
+    def get_handlers(self) -> dict[str, AgentHandler]:
+        """Get a snapshot of all registered handlers.
+
+        Returns:
+            Dictionary of agent names to handlers
+        """
+        with self._lock:
+            return dict(self._handlers)
+
     def list_agents(self, capability: str | None = None) -> list[str]:
         """List all registered agents, optionally filtered by capability.
 
@@ -294,5 +307,6 @@ class AgentRegistry:
         with self._lock:
             self._agents.clear()
             self._handlers.clear()
+            self.version += 1
 
             self.logger.warning("Agent registry cleared")
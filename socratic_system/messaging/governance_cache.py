@@ -0,0 +1,242 @@
+"""Governance fast path for agent bus requests.
+
+Lets routine, low-risk inter-agent requests skip the full governor pipeline:
+
+- A declarative allowlist of (agent, action) pairs that are approved outright
+- A bounded decision cache keyed by a normalized action fingerprint and the
+  policy version, so repeated identical requests reuse the previous verdict
+
+High-risk actions always receive a full evaluation and are never cached.
+"""
+
+import dataclasses
+import datetime
+import enum
+import fnmatch
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Payload keys that differ between otherwise identical requests
+VOLATILE_KEYS = frozenset({"request_id", "correlation_id", "timestamp", "reply_to"})
+
+
+@dataclass(frozen=True)
+class GovernancePolicy:
+    """Declarative policy for the governance fast path.
+
+    Patterns use shell-style wildcards (``*``, ``?``), so ``"*"`` as an agent
+    matches any agent and ``"get_*"`` matches every getter action.
+
+    Attributes:
+        low_risk: Agent pattern -> action patterns approved without evaluation
+        high_risk_actions: Action patterns that always get a full evaluation
+        cache_size: Maximum number of cached decisions
+        cache_ttl_seconds: Lifetime of a cached decision
+        version: Policy version; cached decisions from other versions are ignored
+    """
+
+    low_risk: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    high_risk_actions: tuple[str, ...] = ()
+    cache_size: int = 1024
+    cache_ttl_seconds: float = 300.0
+    version: str = "default"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: str | None = None) -> "GovernancePolicy":
+        """Build a policy from a ``governance_fast_path`` config section.
+
+        Args:
+            data: Section contents
+            version: Explicit policy version (defaults to a hash of ``data``)
+
+        Returns:
+            GovernancePolicy instance
+        """
+        data = data or {}
+        if version is None:
+            version = (
+                data.get("version")
+                or hashlib.sha256(
+                    json.dumps(data, sort_keys=True, default=str).encode()
+                ).hexdigest()[:16]
+            )
+
+        return cls(
+            low_risk={
+                agent: tuple(actions or ())
+                for agent, actions in (data.get("low_risk") or {}).items()
+            },
+            high_risk_actions=tuple(data.get("high_risk_actions") or ()),
+            cache_size=int(data.get("cache_size", 1024)),
+            cache_ttl_seconds=float(data.get("cache_ttl_seconds", 300.0)),
+            version=str(version),
+        )
+
+    @classmethod
+    def load_from_file(cls, path: str | Path) -> "GovernancePolicy":
+        """Load the ``governance_fast_path`` section of a constitution file.
+
+        The policy version covers the whole file, so any change to the
+        constitution invalidates previously cached decisions.
+
+        Args:
+            path: Path to constitution.yaml
+
+        Returns:
+            GovernancePolicy instance (empty allowlist if the section is missing)
+        """
+        raw = Path(path).read_bytes()
+        data = yaml.safe_load(raw) or {}
+        return cls.from_dict(
+            data.get("governance_fast_path") or {},
+            version=hashlib.sha256(raw).hexdigest()[:16],
+        )
+
+    def is_high_risk(self, action: str) -> bool:
+        """Check whether an action always requires full evaluation."""
+        return any(fnmatch.fnmatchcase(action, pattern) for pattern in self.high_risk_actions)
+
+    def is_low_risk(self, agent_name: str, action: str) -> bool:
+        """Check whether an (agent, action) pair is on the allowlist."""
+        if self.is_high_risk(action):
+            return False
+        return any(
+            fnmatch.fnmatchcase(agent_name, agent_pattern)
+            and any(fnmatch.fnmatchcase(action, pattern) for pattern in patterns)
+            for agent_pattern, patterns in self.low_risk.items()
+        )
+
+
+class GovernanceDecisionCache:
+    """Thread-safe LRU cache of governance verdicts with TTL expiry."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        """Initialize decision cache.
+
+        Args:
+            max_size: Maximum number of cached decisions
+            ttl_seconds: Lifetime of a cached decision
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bool, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def fingerprint(
+        agent_name: str, action: str, payload: dict[str, Any], policy_version: str
+    ) -> str:
+        """Build a cache key for a request.
+
+        Volatile keys (request IDs, timestamps) are dropped and dict keys are
+        sorted, so requests that differ only in bookkeeping share a key.
+        Dataclass payload objects (e.g. ProjectContext) are fingerprinted by
+        the values of all their fields.
+
+        Args:
+            agent_name: Target agent
+            action: Requested action
+            payload: Request payload
+            policy_version: Version of the active policy
+
+        Returns:
+            Hex digest identifying the request under the policy
+
+        Raises:
+            TypeError: If the payload holds objects that cannot be fingerprinted
+                by value; such requests must not be cached
+        """
+        normalized = json.dumps(
+            [policy_version, agent_name, action, _normalize(payload)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, str | None] | None:
+        """Get a cached decision.
+
+        Returns:
+            Tuple of (allowed, reason), or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1], entry[2]
+
+    def put(self, key: str, allowed: bool, reason: str | None) -> None:
+        """Store a decision."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, allowed, reason)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "max_size": self.max_size}
+
+
+def _normalize(value: Any, _parents: frozenset[int] = frozenset()) -> Any:
+    """Reduce a payload to a JSON-serializable, order-independent form.
+
+    Raises:
+        TypeError: For objects that are not plain values or dataclasses, and
+            for reference cycles
+    """
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return _normalize(value.value, _parents)
+
+    if id(value) in _parents:
+        raise TypeError("Payload contains a reference cycle")
+    parents = _parents | {id(value)}
+
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize(item, parents)
+            for key, item in value.items()
+            if key not in VOLATILE_KEYS
+        }
+    if isinstance(value, list | tuple):
+        return [_normalize(item, parents) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted(repr(_normalize(item, parents)) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {
+            f.name: _normalize(getattr(value, f.name), parents) for f in dataclasses.fields(value)
+        }
+        return {"__type__": type(value).__name__, **fields}
+
+    raise TypeError(f"Cannot fingerprint {type(value).__name__} payload by value")
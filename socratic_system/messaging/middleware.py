@@ -93,21 +93,20 @@ class AgentBusMiddleware:
 
         Args:
             calls: List of (agent_name, action, payload) tuples
-            timeout: Timeout for all requests
+            timeout: Per-agent timeout
 
         Returns:
-            Dictionary mapping agent names to responses
+            Dictionary mapping agent names to responses (None for failed calls)
         """
-        tasks = [
-            self.call_agent(agent, action, payload, timeout) for agent, action, payload in calls
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        result = await self.agent_bus.scatter_gather(
+            {
+                str(i): (agent, {"action": action, **(payload or {})})
+                for i, (agent, action, payload) in enumerate(calls)
+            },
+            timeout=timeout,
+        )
 
-        return {
-            calls[i][0]: (results[i] if not isinstance(results[i], Exception) else None)
-            for i in range(len(calls))
-        }
+        return {outcome.agent: outcome.response for outcome in result.outcomes.values()}
 
     def register_agent(
         self,
@@ -185,22 +184,20 @@ class ServiceAgentAdapter:
         Returns:
             Dict mapping request names to responses
         """
-        tasks = {}
-        for name, (agent, payload) in requests.items():
-            request_dict = {"action": "process"}
-            request_dict.update(payload)
-            tasks[name] = self.agent_bus.send_request(
-                target_agent=agent,
-                request=request_dict,
-            )
+        result = await self.agent_bus.scatter_gather(
+            {
+                name: (agent, {"action": "process", **payload})
+                for name, (agent, payload) in requests.items()
+            }
+        )
 
         results = {}
-        for name, task in tasks.items():
-            try:
-                results[name] = await task
-            except Exception as e:
-                self.logger.error(f"Request {name} failed: {e}")
-                results[name] = {"error": str(e)}
+        for name, outcome in result.outcomes.items():
+            if outcome.response is not None:
+                results[name] = outcome.response
+            else:
+                self.logger.error(f"Request {name} failed: {outcome.error}")
+                results[name] = {"error": outcome.error}
 
         return results
 
@@ -0,0 +1,222 @@
+"""Scatter-gather fan-out for agent bus requests.
+
+Sends one request per call concurrently, bounded by a concurrency limit, with
+a timeout per agent. Results are gathered under one of three modes:
+
+- ``all_settled``: wait for every call to succeed, fail or time out
+- ``first_k``: return once ``k`` calls have succeeded (default 1)
+- ``quorum``: return once ``k`` calls have succeeded (default: a majority)
+
+In ``first_k`` and ``quorum`` mode, calls still pending when the target is
+reached (or once it can no longer be reached) are cancelled. The result is
+partial, and ``satisfied`` says whether the target was met.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+
+class GatherMode(Enum):
+    """How many responses a scatter-gather waits for."""
+
+    ALL_SETTLED = "all_settled"
+    FIRST_K = "first_k"
+    QUORUM = "quorum"
+
+
+@dataclass
+class CallOutcome:
+    """Outcome of one call in a scatter-gather.
+
+    Attributes:
+        agent: Target agent
+        status: "success", "error", "timeout" or "cancelled"
+        response: Agent response, if one was received
+        error: Error message for failed, timed out or cancelled calls
+        latency_ms: Time from dispatch to settlement
+    """
+
+    agent: str
+    status: str
+    response: dict[str, Any] | None = None
+    error: str | None = None
+    latency_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call returned a successful response."""
+        return self.status == "success"
+
+
+@dataclass
+class GatherResult:
+    """Result of a scatter-gather.
+
+    Attributes:
+        mode: Gather mode used
+        required: Successful responses needed to satisfy the mode
+        outcomes: Call key -> outcome, in the order calls were given
+        elapsed_ms: Wall-clock time of the whole fan-out
+    """
+
+    mode: GatherMode
+    required: int
+    outcomes: dict[str, CallOutcome] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Number of successful responses."""
+        return sum(1 for outcome in self.outcomes.values() if outcome.ok)
+
+    @property
+    def satisfied(self) -> bool:
+        """Whether enough calls succeeded for the gather mode."""
+        return self.succeeded >= self.required
+
+    def responses(self) -> dict[str, dict[str, Any]]:
+        """Get successful responses by call key."""
+        return {key: o.response for key, o in self.outcomes.items() if o.ok and o.response}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for API responses and logging."""
+        return {
+            "mode": self.mode.value,
+            "required": self.required,
+            "succeeded": self.succeeded,
+            "satisfied": self.satisfied,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "outcomes": {
+                key: {
+                    "agent": o.agent,
+                    "status": o.status,
+                    "response": o.response,
+                    "error": o.error,
+                    "latency_ms": round(o.latency_ms, 3),
+                }
+                for key, o in self.outcomes.items()
+            },
+        }
+
+
+def required_successes(mode: GatherMode, total: int, k: int | None = None) -> int:
+    """Number of successful responses a gather mode waits for.
+
+    Args:
+        mode: Gather mode
+        total: Number of calls
+        k: Explicit target for first_k/quorum
+
+    Returns:
+        Required successes, clamped to the number of calls
+
+    Raises:
+        ValueError: If k is less than 1
+    """
+    if k is not None and k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    if mode == GatherMode.ALL_SETTLED:
+        return total
+    if k is None:
+        k = 1 if mode == GatherMode.FIRST_K else total // 2 + 1
+    return min(k, total)
+
+
+async def scatter_gather(
+    send: Callable[[str, dict[str, Any], float], Awaitable[dict[str, Any]]],
+    calls: dict[str, tuple[str, dict[str, Any]]],
+    mode: GatherMode | str = GatherMode.ALL_SETTLED,
+    k: int | None = None,
+    concurrency: int = 10,
+    timeout: float = 30.0,
+    timeouts: dict[str, float] | None = None,
+) -> GatherResult:
+    """Fan calls out concurrently and gather their outcomes.
+
+    Args:
+        send: Coroutine function ``send(agent, request, timeout)`` returning a response
+        calls: Call key -> (agent name, request)
+        mode: Gather mode
+        k: Target successes for first_k/quorum
+        concurrency: Maximum calls in flight at once
+        timeout: Default per-agent timeout in seconds
+        timeouts: Per-agent timeout overrides, keyed by agent name
+
+    Returns:
+        GatherResult with an outcome for every call
+    """
+    mode = GatherMode(mode)
+    required = required_successes(mode, len(calls), k)
+    result = GatherResult(mode=mode, required=required)
+    if not calls:
+        return result
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    timeouts = timeouts or {}
+    start = time.perf_counter()
+
+    async def run(agent: str, request: dict[str, Any]) -> CallOutcome:
+        async with semaphore:
+            agent_timeout = timeouts.get(agent, timeout)
+            call_start = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    send(agent, request, agent_timeout), timeout=agent_timeout
+                )
+            except TimeoutError:
+                status, response, error = "timeout", None, f"Timed out after {agent_timeout}s"
+            except Exception as e:
+                status, response, error = "error", None, str(e)
+            else:
+                if isinstance(response, dict) and response.get("status") == "error":
+                    status, error = "error", response.get("message")
+                else:
+                    status, error = "success", None
+            return CallOutcome(
+                agent=agent,
+                status=status,
+                response=response,
+                error=error,
+                latency_ms=(time.perf_counter() - call_start) * 1000,
+            )
+
+    tasks = {
+        asyncio.create_task(run(agent, request)): key for key, (agent, request) in calls.items()
+    }
+    settled: dict[str, CallOutcome] = {}
+    pending = set(tasks)
+    succeeded = failed = 0
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                outcome = task.result()
+                settled[tasks[task]] = outcome
+                if outcome.ok:
+                    succeeded += 1
+                else:
+                    failed += 1
+
+            if mode != GatherMode.ALL_SETTLED and (
+                succeeded >= required or len(calls) - failed < required
+            ):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in pending:
+        settled[tasks[task]] = CallOutcome(
+            agent=calls[tasks[task]][0], status="cancelled", error="Gather completed"
+        )
+
+    result.outcomes = {key: settled[key] for key in calls}
+    result.elapsed_ms = (time.perf_counter() - start) * 1000
+    return result
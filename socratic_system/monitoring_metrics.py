@@ -5,13 +5,21 @@ Tracks key metrics for application health, performance, and usage.
 Provides real-time metrics and historical trends.
 """
 
+import math
+import threading
 import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
+# Recent samples kept per metric for windowed statistics
+DEFAULT_WINDOW_SIZE = 4096
+
+# Percentiles reported by get_metric_stats() and the Prometheus export
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+
 
 @dataclass
 class MetricPoint:
@@ -32,21 +40,166 @@ class HealthStatus:
     details: dict[str, str] = field(default_factory=dict)
 
 
+class RingBuffer:
+    """Fixed-capacity buffer keeping the most recent items."""
+
+    __slots__ = ("capacity", "_items", "_next", "_size")
+
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of items retained
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._items: list[Any] = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+    def append(self, item: Any) -> None:
+        """Add an item, overwriting the oldest one when full."""
+        self._items[self._next] = item
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def latest(self) -> Any:
+        """Get the most recently added item (None if empty)."""
+        return self._items[self._next - 1] if self._size else None
+
+    def newest_first(self) -> Iterator[Any]:
+        """Iterate over the retained items from newest to oldest."""
+        for offset in range(1, self._size + 1):
+            yield self._items[self._next - offset]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class LatencyHistogram:
+    """
+    Streaming log-linear histogram for percentile queries.
+
+    Like an HDR histogram, each power-of-two range is split into
+    SUB_BUCKETS linear buckets, so a fixed number of buckets covers
+    [2**MIN_EXPONENT, 2**MAX_EXPONENT) with at most ~3% relative error.
+    Recording is O(1) and a percentile query walks the fixed bucket array.
+    """
+
+    SUB_BUCKETS = 16
+    MIN_EXPONENT = -10  # Smallest distinguished value ~0.001
+    MAX_EXPONENT = 40
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        # Bucket 0 holds zero and negative values
+        self.counts = [0] * (1 + (self.MAX_EXPONENT - self.MIN_EXPONENT) * self.SUB_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _bucket(self, value: float) -> int:
+        if value <= 0:
+            return 0
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= m < 1
+        if exponent <= self.MIN_EXPONENT:
+            return 1
+        if exponent > self.MAX_EXPONENT:
+            return len(self.counts) - 1
+        sub_buckets = self.SUB_BUCKETS
+        return (
+            (exponent - 1 - self.MIN_EXPONENT) * sub_buckets
+            + int(mantissa * 2 * sub_buckets)
+            + 1
+            - sub_buckets
+        )
+
+    def _bucket_midpoint(self, index: int) -> float:
+        if index == 0:
+            return 0.0
+        exponent, sub_bucket = divmod(index - 1, self.SUB_BUCKETS)
+        base = 2.0 ** (exponent + self.MIN_EXPONENT)
+        return base * (1 + (sub_bucket + 0.5) / self.SUB_BUCKETS)
+
+    def record(self, value: float) -> None:
+        """Record a value."""
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> float | None:
+        """
+        Get an approximate percentile of the recorded values.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Approximate value, or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        if rank >= self.count:
+            return self.max
+        seen = 0
+        for index, bucket_count in enumerate(self.counts[:-1]):
+            seen += bucket_count
+            if seen >= rank:
+                return min(max(self._bucket_midpoint(index), self.min), self.max)
+        return self.max  # Only values beyond the top of the range are left
+
+
+class _MetricSeries:
+    """Recent points and a lifetime histogram for one metric."""
+
+    __slots__ = ("lock", "points", "histogram")
+
+    def __init__(self, window_size: int):
+        self.lock = threading.Lock()
+        self.points = RingBuffer(window_size)
+        self.histogram = LatencyHistogram()
+
+
 class MetricsCollector:
-    """Collect and aggregate application metrics."""
+    """
+    Collect and aggregate application metrics.
 
-    def __init__(self, retention_hours: int = 24):
+    Each metric keeps its most recent points in a fixed-size ring buffer,
+    for windowed statistics, and a streaming histogram of every value
+    recorded, for percentiles. Memory per metric is bounded and recording
+    is O(1) regardless of traffic.
+    """
+
+    def __init__(self, retention_hours: int = 24, window_size: int = DEFAULT_WINDOW_SIZE):
         """
         Initialize metrics collector.
 
         Args:
-            retention_hours: How long to retain historical metrics
+            retention_hours: Longest look back window for windowed statistics
+            window_size: Recent points retained per metric
         """
         self.retention_hours = retention_hours
-        self.metrics: dict[str, list[MetricPoint]] = defaultdict(list)
+        self.window_size = window_size
+        self.metrics: dict[str, _MetricSeries] = {}
         self.counters: dict[str, int] = defaultdict(int)
         self.gauges: dict[str, float] = {}
-        self.last_cleanup = datetime.now()
+        self._lock = threading.Lock()
+
+    def _series(self, name: str) -> _MetricSeries:
+        series = self.metrics.get(name)
+        if series is None:
+            with self._lock:
+                series = self.metrics.setdefault(name, _MetricSeries(self.window_size))
+        return series
 
     def record_metric(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
         """
@@ -57,14 +210,15 @@ class MetricsCollector:
             value: Metric value
             tags: Optional tags for categorization
         """
-        self._cleanup_old_metrics()
-
         point = MetricPoint(
             timestamp=datetime.now(),
             value=value,
             tags=tags or {},
         )
-        self.metrics[name].append(point)
+        series = self._series(name)
+        with series.lock:
+            series.points.append(point)
+            series.histogram.record(value)
 
     def increment_counter(self, name: str, amount: int = 1) -> None:
         """
@@ -90,33 +244,79 @@ class MetricsCollector:
         """
         Get statistics for a metric over time period.
 
+        All statistics, percentiles included, cover the retained points within
+        the window. Lifetime percentiles come from get_histogram_snapshot().
+
         Args:
             name: Metric name
             minutes: Look back window in minutes
 
         Returns:
-            Dictionary with count, min, max, avg, latest
+            Dictionary with count, min, max, avg, latest and percentiles (p50...)
         """
-        if name not in self.metrics:
+        series = self.metrics.get(name)
+        if series is None:
             return None
 
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        recent = [m for m in self.metrics[name] if m.timestamp >= cutoff]
+        cutoff = datetime.now() - timedelta(minutes=min(minutes, self.retention_hours * 60))
+        values = []
+        with series.lock:
+            latest = series.points.latest()
+            for point in series.points.newest_first():
+                if point.timestamp < cutoff:
+                    break
+                values.append(point.value)
 
-        if not recent:
+        if not values:
             return None
 
-        values = [m.value for m in recent]
-
+        values.sort()
+        percentiles = {
+            p: values[max(1, math.ceil(p / 100 * len(values))) - 1] for p in DEFAULT_PERCENTILES
+        }
         return {
             "count": float(len(values)),
-            "min": min(values),
-            "max": max(values),
+            "min": values[0],
+            "max": values[-1],
             "avg": sum(values) / len(values),
-            "latest": values[-1],
-            "timestamp": recent[-1].timestamp.isoformat(),
+            "latest": latest.value,
+            "timestamp": latest.timestamp.isoformat(),
+            **{f"p{p:g}": value for p, value in percentiles.items()},
         }
 
+    def get_histogram_snapshot(
+        self, name: str, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+    ) -> dict[str, Any] | None:
+        """
+        Get the lifetime distribution of a metric.
+
+        Args:
+            name: Metric name
+            percentiles: Percentiles to compute
+
+        Returns:
+            Dictionary with count, sum and percentiles (keyed by percentile)
+        """
+        series = self.metrics.get(name)
+        if series is None:
+            return None
+        with series.lock:
+            return {
+                "count": series.histogram.count,
+                "sum": series.histogram.total,
+                "percentiles": self._percentiles(series.histogram, percentiles),
+            }
+
+    @staticmethod
+    def _percentiles(
+        histogram: LatencyHistogram, percentiles: tuple[float, ...]
+    ) -> dict[float, float | None]:
+        return {p: histogram.percentile(p) for p in percentiles}
+
+    def get_metric_names(self) -> list[str]:
+        """Get the names of all recorded metrics."""
+        return list(self.metrics)
+
     def get_all_counters(self) -> dict[str, int]:
         """Get all counter values."""
         return dict(self.counters)
@@ -129,20 +329,6 @@ class MetricsCollector:
         """Reset a counter to zero."""
         self.counters[name] = 0
 
-    def _cleanup_old_metrics(self) -> None:
-        """Remove metrics older than retention period."""
-        if (datetime.now() - self.last_cleanup).total_seconds() < 300:
-            return  # Cleanup every 5 minutes max
-
-        cutoff = datetime.now() - timedelta(hours=self.retention_hours)
-
-        for name in list(self.metrics.keys()):
-            self.metrics[name] = [m for m in self.metrics[name] if m.timestamp >= cutoff]
-            if not self.metrics[name]:
-                del self.metrics[name]
-
-        self.last_cleanup = datetime.now()
-
 
 class HealthChecker:
     """Check application health status."""
@@ -1,5 +1,22 @@
 """Orchestration layer for Socrates AI"""
 
-from .orchestrator import AgentOrchestrator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+# The orchestrator imports every agent and the vector store; import it on first access
+_LAZY_IMPORTS = {"AgentOrchestrator": ".orchestrator"}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["AgentOrchestrator"]
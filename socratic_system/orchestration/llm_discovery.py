@@ -14,6 +14,10 @@ from socratic_system.config.llm_environment import LLMEnvironmentConfig
 
 logger = logging.getLogger(__name__)
 
+# Providers probed at startup, and how long each may take before it is skipped
+DISCOVERY_PROVIDERS = ("ollama", "claude", "openai", "gemini")
+DEFAULT_DISCOVERY_TIMEOUT = 5.0
+
 
 async def discover_ollama_models() -> list[str] | None:
     """
@@ -262,54 +266,120 @@ async def discover_provider_models(provider: str, api_key: str | None = None) ->
         return None
 
 
-def update_provider_metadata_with_discovered_models() -> None:
+async def discover_all_provider_models(
+    providers: tuple[str, ...] = DISCOVERY_PROVIDERS,
+    timeout: float = DEFAULT_DISCOVERY_TIMEOUT,
+) -> dict[str, list[str] | None]:
+    """
+    Discover models for several providers concurrently.
+
+    Each provider gets its own timeout, so one slow or unreachable provider
+    neither delays nor fails discovery for the others.
+
+    Args:
+        providers: Provider names to query
+        timeout: Maximum seconds to wait for each provider
+
+    Returns:
+        Dict mapping provider name to its discovered models (None if unavailable)
+    """
+    import asyncio
+
+    async def _discover(provider: str) -> list[str] | None:
+        try:
+            return await asyncio.wait_for(discover_provider_models(provider), timeout=timeout)
+        except TimeoutError:
+            logger.debug(f"{provider} model discovery timed out after {timeout}s")
+            return None
+
+    results = await asyncio.gather(*(_discover(provider) for provider in providers))
+    return dict(zip(providers, results, strict=True))
+
+
+async def refresh_provider_metadata(
+    providers: tuple[str, ...] = DISCOVERY_PROVIDERS,
+    timeout: float = DEFAULT_DISCOVERY_TIMEOUT,
+) -> dict[str, int]:
+    """
+    Discover models concurrently and apply them to PROVIDER_METADATA.
+
+    Providers whose discovery fails keep their existing model list.
+
+    Args:
+        providers: Provider names to query
+        timeout: Maximum seconds to wait for each provider
+
+    Returns:
+        Dict mapping each updated provider to its number of discovered models
+    """
+    from socratic_system.models.llm_provider import PROVIDER_METADATA
+
+    discovered = await discover_all_provider_models(providers, timeout)
+    updated = {}
+
+    for provider, models in discovered.items():
+        if not models:
+            logger.info(f"Using fallback {provider} model list (discovery unavailable)")
+            continue
+        if provider not in PROVIDER_METADATA:
+            logger.warning(f"{provider} not found in PROVIDER_METADATA")
+            continue
+
+        metadata = PROVIDER_METADATA[provider]
+        original_count = len(metadata.models)
+        metadata.models = models
+        updated[provider] = len(models)
+
+        logger.info(
+            f"Updated {provider} provider metadata: "
+            f"{original_count} hardcoded → {len(models)} discovered"
+        )
+        logger.debug(f"Models: {', '.join(models)}")
+
+    return updated
+
+
+def update_provider_metadata_with_discovered_models(
+    providers: tuple[str, ...] = ("ollama",),
+    timeout: float = DEFAULT_DISCOVERY_TIMEOUT,
+) -> dict[str, int]:
     """
-    Update PROVIDER_METADATA with dynamically discovered models from Ollama.
+    Update PROVIDER_METADATA with dynamically discovered models.
 
     This function:
     1. Auto-detects Ollama endpoint (local, Docker, Kubernetes, etc.)
-    2. Queries Ollama /api/tags to discover actual installed models
-    3. Updates the Ollama provider metadata with discovered models
-    4. Gracefully falls back to hardcoded list if discovery fails
+    2. Queries the given providers concurrently with a per-provider timeout
+    3. Updates each provider's metadata with its discovered models
+    4. Gracefully falls back to the existing list if discovery fails
     5. Logs deployment scenario and configuration for debugging
 
+    Blocking; the orchestrator runs it on a background thread after startup.
+
     Implements Option 4 (Delegation): The orchestrator discovers available
     resources and updates configuration accordingly. Agents consume what
     they're told, not what they assume exists.
+
+    Args:
+        providers: Provider names to query (default: Ollama only)
+        timeout: Maximum seconds to wait for each provider
+
+    Returns:
+        Dict mapping each updated provider to its number of discovered models
     """
     import asyncio
 
-    from socratic_system.models.llm_provider import PROVIDER_METADATA
-
     # Log deployment scenario
     config = LLMEnvironmentConfig.get_provider_config()
     logger.info(f"Deployment scenario: {config['deployment_scenario']}")
 
-    # Attempt to discover actual Ollama models (using asyncio.run since this is startup)
     try:
-        discovered_models = asyncio.run(discover_ollama_models())
+        updated = asyncio.run(refresh_provider_metadata(providers, timeout))
     except RuntimeError:
-        # asyncio.run() fails if event loop is already running
-        # In that case, skip Ollama discovery (will use empty list)
-        logger.debug("Cannot discover Ollama models during startup (event loop already running)")
-        discovered_models = None
-
-    if discovered_models:
-        # Update Ollama provider metadata with discovered models
-        if "ollama" in PROVIDER_METADATA:
-            ollama_provider = PROVIDER_METADATA["ollama"]
-            original_models = ollama_provider.models.copy()
-
-            # Replace with discovered models
-            ollama_provider.models = discovered_models
-
-            logger.info(
-                f"Updated Ollama provider metadata: "
-                f"{len(original_models)} hardcoded → {len(discovered_models)} discovered"
-            )
-            logger.debug(f"Models: {', '.join(discovered_models)}")
-        else:
-            logger.warning("Ollama not found in PROVIDER_METADATA")
-    else:
-        logger.info("Using fallback Ollama model list (discovery unavailable)")
+        # asyncio.run() fails if event loop is already running in this thread;
+        # await refresh_provider_metadata() directly in that case
+        logger.debug("Cannot discover provider models here (event loop already running)")
+        updated = {}
+
+    if "ollama" in providers and "ollama" not in updated:
         logger.debug("Tip: Set OLLAMA_HOST environment variable if Ollama is running elsewhere")
+    return updated
@@ -13,15 +13,17 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from socratic_nexus.clients import ClaudeClient
 
 from socratic_system.config import SocratesConfig
-from socratic_system.database import VectorDatabase
 from socratic_system.events import EventEmitter, EventType
 from socratic_system.models import KnowledgeEntry
+from socratic_system.orchestration.startup import StartupTracker
 from socratic_system.security.agent_identity import AgentIdentityManager
 from socratic_system.security.audit_logger import AuditLogger
 from socratic_system.security.sandbox import Sandbox, SandboxConfig
@@ -54,6 +56,37 @@ if TYPE_CHECKING:
         UserManagerAgent,
     )
 
+    from socratic_system.database import VectorDatabase
+
+# Property names of the lazy-loaded agents, mapped to the names they are
+# registered under on the agent bus
+AGENT_REGISTRY_NAMES = {
+    "project_manager": "project_manager",
+    "socratic_counselor": "socratic_counselor",
+    "context_analyzer": "context_analyzer",
+    "code_generator": "code_generator",
+    "system_monitor": "system_monitor",
+    "conflict_detector": "conflict_detector",
+    "document_processor": "document_processor",
+    "user_manager": "user_manager",
+    "note_manager": "note_manager",
+    "knowledge_manager": "knowledge_manager",
+    "knowledge_analysis": "knowledge_analysis",
+    "quality_controller": "quality_controller",
+    "learning_agent": "learning",  # API calls use "learning", not "learning_agent"
+    "multi_llm_agent": "multi_llm_manager",  # llm_config.py uses "multi_llm_manager"
+    "question_queue": "question_queue",
+    "code_validation_agent": "code_validation",  # API calls use "code_validation"
+}
+
+# Every name process_request() accepts, mapped to the agent property it resolves
+AGENT_DISPATCH_NAMES = {
+    **{name: name for name in AGENT_REGISTRY_NAMES},
+    **{registry_name: name for name, registry_name in AGENT_REGISTRY_NAMES.items()},
+    "document_agent": "document_processor",
+    "multi_llm": "multi_llm_agent",
+}
+
 
 class AgentOrchestrator:
     """
@@ -61,6 +94,10 @@ class AgentOrchestrator:
 
     Supports both old-style initialization (api_key string) and new-style (SocratesConfig)
     for backward compatibility.
+
+    Startup is staged (see ``startup``): construction only builds the core
+    components. LLM model discovery and knowledge base loading run in the
+    background, and the vector store and agents are created on first use.
     """
 
     def __init__(self, api_key_or_config: str | SocratesConfig | None = None):
@@ -92,6 +129,48 @@ class AgentOrchestrator:
 
         self.logger = get_debug_logger("orchestrator")
 
+        self.startup = StartupTracker(required=("core",))
+        with self.startup.stage("core"):
+            self._initialize_core()
+
+        # Phase 3.5: Discover LLM provider models (Option 4: Delegation Pattern)
+        # Orchestrator discovers available resources and updates configuration.
+        # Providers are probed concurrently in the background so that slow or
+        # unreachable providers never delay readiness.
+        from socratic_system.orchestration.llm_discovery import (
+            DISCOVERY_PROVIDERS,
+            update_provider_metadata_with_discovered_models,
+        )
+
+        self.startup.run_in_background(
+            "model_discovery", update_provider_metadata_with_discovered_models, DISCOVERY_PROVIDERS
+        )
+
+        # Instantiate the configured hot set of agents ahead of their first request
+        if self.config.prewarm_agents:
+            self.startup.run_in_background("agent_prewarm", self.prewarm_agents)
+
+        # Emit system initialized event
+        self.event_emitter.emit(
+            EventType.SYSTEM_INITIALIZED,
+            {
+                "version": "0.5.0",
+                "data_dir": str(self.config.data_dir),
+                "model": self.config.claude_model,
+            },
+        )
+
+        # Log initialization summary
+        self.logger.info("=" * 70)
+        self.logger.info("Socrates AI initialized successfully!")
+        self.logger.info(f"  Configuration: {self.config}")
+        self.logger.info(f"  Projects DB: {self.config.projects_db_path}")
+        self.logger.info(f"  Vector DB: {self.config.vector_db_path}")
+        self.logger.info("=" * 70)
+
+    def _initialize_core(self) -> None:
+        """Create the components needed before the orchestrator can serve requests."""
+
         # Initialize sandbox configuration
         self._sandbox_config = SandboxConfig(
             timeout_seconds=60,
@@ -117,6 +196,7 @@ class AgentOrchestrator:
             logger=self.logger,
             retention_days=730,  # 2 years
             encrypt_at_rest=True,
+            durability="batched",  # Alert/critical events are still written synchronously
         )
         self.logger.info("Audit logger initialized (Phase 2b)")
 
@@ -141,6 +221,7 @@ class AgentOrchestrator:
             audit_logger=self.audit_logger,
             max_concurrent_requests=100,
             default_timeout=30.0,
+            governance_policy=self._load_governance_policy(),
         )
         self.logger.info("Agent bus and registry initialized with Governor validation (Phase 2)")
 
@@ -157,9 +238,10 @@ class AgentOrchestrator:
         self.audit_logger.db = self.database
         self.logger.debug("Audit logger connected to database")
 
-        self.vector_db = VectorDatabase(
-            str(self.config.vector_db_path), embedding_model=self.config.embedding_model
-        )
+        # The vector store loads an embedding model; create it on first use
+        self._vector_db: VectorDatabase | None = None
+        self._vector_db_lock = threading.Lock()
+        self.startup.defer("vector_store")
         self.logger.info("Database components initialized successfully")
 
         # Initialize Claude client
@@ -170,70 +252,49 @@ class AgentOrchestrator:
             api_key_for_client, self, subscription_token=self.config.subscription_token
         )
 
-        # Cache for lazy-loaded agents
+        # Cache for lazy-loaded agents, with per-agent creation locks and metrics
         self._agents_cache: dict[str, Any] = {}
+        self._agent_locks: dict[str, threading.RLock] = {}
+        self._agent_metrics: dict[str, dict[str, Any]] = {}
 
-        # Start background knowledge base loading (non-blocking)
+        # Start background knowledge base loading (non-blocking); this also
+        # warms up the vector store in parallel with the rest of startup.
         # Skip in test mode to avoid SQLite deadlocks from multiple threads
-        import os
-        import threading
-
         self.knowledge_loaded = False
         self._knowledge_thread = None
 
         # Only start knowledge loading thread if not in test mode
         if "PYTEST_CURRENT_TEST" not in os.environ:
-            self._knowledge_thread = threading.Thread(
-                target=self._load_knowledge_base_safe, daemon=True
+            self._knowledge_thread = self.startup.run_in_background(
+                "knowledge_base", self._load_knowledge_base
             )
-            self._knowledge_thread.start()
         else:
             # In test mode, mark as loaded immediately (tests use mocks)
             self.knowledge_loaded = True
+            self.startup.skip("knowledge_base", "test mode")
 
         # Phase 3: Initialize caching and background handlers for non-blocking processing
-        from socratic_system.caching import InMemoryAnalysisCache
+        from socratic_system.caching import InMemoryAnalysisCache, SQLiteAnalysisCache
         from socratic_system.handlers import BackgroundHandlers
-        from socratic_system.jobs import JobTracker
+        from socratic_system.jobs import JobTracker, SQLiteJobTracker
 
-        self.cache = InMemoryAnalysisCache()
-        self.job_tracker = JobTracker()
+        # API worker processes share job state and results through one SQLite file
+        shared_state_db = os.getenv("SOCRATES_SHARED_STATE_DB")
+        if shared_state_db:
+            self.cache = SQLiteAnalysisCache(shared_state_db)
+            self.job_tracker = SQLiteJobTracker(shared_state_db)
+        else:
+            self.cache = InMemoryAnalysisCache()
+            self.job_tracker = JobTracker()
         self.background_handlers = BackgroundHandlers(
             orchestrator=self, cache=self.cache, job_tracker=self.job_tracker
         )
         self.logger.info("Analysis caching and background handlers initialized (Phase 3)")
 
-        # Phase 3.5: Discover LLM provider models (Option 4: Delegation Pattern)
-        # Orchestrator discovers available resources and updates configuration
-        # Agents receive what they're told, not what they assume exists
-        from socratic_system.orchestration.llm_discovery import (
-            update_provider_metadata_with_discovered_models,
-        )
-
-        update_provider_metadata_with_discovered_models()
-        self.logger.info("LLM provider discovery completed (Phase 3.5)")
-
-        # Phase 4: Pre-initialize all agents for agent bus discovery
+        # Phase 4: Register all agents for agent bus discovery
         # This ensures handlers are registered before any endpoints call agent_bus.send_request()
-        self._initialize_all_agents()
-
-        # Emit system initialized event
-        self.event_emitter.emit(
-            EventType.SYSTEM_INITIALIZED,
-            {
-                "version": "0.5.0",
-                "data_dir": str(self.config.data_dir),
-                "model": self.config.claude_model,
-            },
-        )
-
-        # Log initialization summary
-        self.logger.info("=" * 70)
-        self.logger.info("Socrates AI initialized successfully!")
-        self.logger.info(f"  Configuration: {self.config}")
-        self.logger.info(f"  Projects DB: {self.config.projects_db_path}")
-        self.logger.info(f"  Vector DB: {self.config.vector_db_path}")
-        self.logger.info("=" * 70)
+        with self.startup.stage("agents") as details:
+            details["registered"] = self._register_agents()
 
     def _initialize_governor(self) -> None:
         """
@@ -276,12 +337,26 @@ class AgentOrchestrator:
             self.logger.error(f"Failed to initialize Governor: {e}")
             self.governor = None
 
-    def _load_knowledge_base_safe(self) -> None:
-        """Wrapper for knowledge base loading in background thread with error handling"""
+    def _load_governance_policy(self):
+        """
+        Load the governance fast-path policy from constitution.yaml.
+
+        Returns:
+            GovernancePolicy, or None to use the default (no allowlist)
+        """
+        from socratic_system.messaging.governance_cache import GovernancePolicy
+
+        constitution_path = Path(__file__).parent.parent.parent / "constitution.yaml"
+        if self.governor is None or not constitution_path.exists():
+            return None
+
         try:
-            self._load_knowledge_base()
+            policy = GovernancePolicy.load_from_file(constitution_path)
+            self.logger.debug(f"Governance fast-path policy loaded (version {policy.version})")
+            return policy
         except Exception as e:
-            self.logger.error(f"Background knowledge loading failed: {e}")
+            self.logger.warning(f"Failed to load governance fast-path policy: {e}")
+            return None
 
     def wait_for_knowledge(self, timeout: int = 10) -> bool:
         """
@@ -301,63 +376,131 @@ class AgentOrchestrator:
             self._knowledge_thread.join(timeout=timeout)
         return self.knowledge_loaded
 
-    def _initialize_all_agents(self) -> None:
-        """Pre-initialize all agents and register them with the agent bus.
+    def _register_agents(self) -> int:
+        """Register every agent with the agent bus without instantiating it.
 
-        This ensures handlers are available when endpoints call agent_bus.send_request().
-        Each agent is initialized and then explicitly registered with the agent registry.
+        Each handler creates its agent on the first request routed to it, so
+        agents nobody calls are never built.
+
+        Returns:
+            Number of agents registered
         """
-        try:
-            self.logger.info("Pre-initializing all agents for agent bus registration...")
-
-            # Mapping of property names to expected registry names
-            # Property names follow snake_case and are used by external APIs
-            agent_name_map = {
-                "project_manager": "project_manager",
-                "socratic_counselor": "socratic_counselor",
-                "context_analyzer": "context_analyzer",
-                "code_generator": "code_generator",
-                "system_monitor": "system_monitor",
-                "conflict_detector": "conflict_detector",
-                "document_processor": "document_processor",
-                "user_manager": "user_manager",
-                "note_manager": "note_manager",
-                "knowledge_manager": "knowledge_manager",
-                "knowledge_analysis": "knowledge_analysis",
-                "quality_controller": "quality_controller",
-                "learning_agent": "learning",  # API calls use "learning", not "learning_agent"
-                "multi_llm_agent": "multi_llm_manager",  # llm_config.py uses "multi_llm_manager"
-                "question_queue": "question_queue",
-                "code_validation_agent": "code_validation",  # API calls use "code_validation"
-            }
-
-            for property_name, registry_name in agent_name_map.items():
-                try:
-                    agent = getattr(self, property_name)
-                    self.logger.debug(f"Initialized agent: {agent.name}")
-
-                    # Register agent with the agent registry so it can be discovered
-                    # Note: agent.process() is synchronous, not async
-                    self.agent_registry.register(
-                        agent_name=registry_name,
-                        handler=agent.process,
-                        capabilities=[],
-                        metadata={"agent_class": agent.__class__.__name__},
-                        supports_sync=True,
-                        supports_async=False,  # agent.process() is synchronous
-                    )
-                    self.logger.debug(
-                        f"Registered agent '{agent.name}' with registry as '{registry_name}'"
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Failed to initialize agent {property_name}: {e}")
-
-            # Verify agents are registered with the bus
-            registered_count = self.agent_registry.count()
-            self.logger.info(f"Agent initialization complete: {registered_count} agents registered")
+        for property_name, registry_name in AGENT_REGISTRY_NAMES.items():
+            # Note: agent.process() is synchronous, not async
+            self.agent_registry.register(
+                agent_name=registry_name,
+                handler=self._lazy_agent_handler(property_name),
+                capabilities=[],
+                metadata={"property": property_name},
+                supports_sync=True,
+                supports_async=False,
+            )
 
-        except Exception as e:
-            self.logger.error(f"Error during agent pre-initialization: {e}")
+        registered_count = self.agent_registry.count()
+        self.logger.info(f"Agent registration complete: {registered_count} agents registered")
+        return registered_count
+
+    def _lazy_agent_handler(self, property_name: str):
+        """Create a registry handler that instantiates its agent on first call."""
+
+        def handler(request: dict[str, Any]) -> dict[str, Any]:
+            return self._dispatch(property_name).process(request)
+
+        handler.__name__ = f"{property_name}_handler"
+        return handler
+
+    def _lazy_agent(self, key: str, create) -> Any:
+        """Return the cached agent for key, creating it (once) with create()."""
+        agent = self._agents_cache.get(key)
+        if agent is not None:
+            return agent
+
+        with self._agent_locks.setdefault(key, threading.RLock()):
+            agent = self._agents_cache.get(key)
+            if agent is None:
+                start = time.perf_counter()
+                agent = create()
+                init_ms = (time.perf_counter() - start) * 1000
+                self._agent_metrics[key] = {
+                    "instantiated_at": time.time(),
+                    "init_ms": round(init_ms, 2),
+                    "prewarmed": False,
+                    "requests": 0,
+                }
+                self._agents_cache[key] = agent
+                self.logger.debug(f"Instantiated agent {key} in {init_ms:.1f}ms")
+        return agent
+
+    def get_agent(self, agent_name: str) -> Any | None:
+        """
+        Resolve an agent by any name process_request() accepts.
+
+        Only the requested agent is instantiated.
+
+        Args:
+            agent_name: Agent name, registry name or property name
+
+        Returns:
+            The agent instance, or None if the name is unknown
+        """
+        property_name = AGENT_DISPATCH_NAMES.get(agent_name)
+        if property_name is None:
+            return None
+        return getattr(self, property_name)
+
+    def prewarm_agents(self, agent_names: list[str] | None = None) -> list[str]:
+        """
+        Instantiate a hot set of agents ahead of their first request.
+
+        Args:
+            agent_names: Agents to create (default: config.prewarm_agents)
+
+        Returns:
+            Property names of the agents that are now instantiated
+        """
+        names = self.config.prewarm_agents if agent_names is None else agent_names
+        warmed = []
+
+        for name in names:
+            property_name = AGENT_DISPATCH_NAMES.get(name)
+            if property_name is None:
+                self.logger.warning(f"Unknown agent in prewarm set: {name}")
+                continue
+            created = property_name not in self._agents_cache
+            try:
+                getattr(self, property_name)
+            except Exception as e:
+                self.logger.warning(f"Failed to prewarm agent {name}: {e}")
+                continue
+            if created:
+                self._agent_metrics[property_name]["prewarmed"] = True
+            warmed.append(property_name)
+
+        self.logger.info(f"Prewarmed {len(warmed)} agents: {', '.join(warmed)}")
+        return warmed
+
+    def get_agent_stats(self) -> dict[str, Any]:
+        """
+        Get per-agent instantiation metrics.
+
+        Returns:
+            Dict with registered and instantiated counts, and for each
+            instantiated agent its creation time, duration and request count
+        """
+        return {
+            "registered": len(AGENT_REGISTRY_NAMES),
+            "instantiated": len(self._agents_cache),
+            "agents": {key: dict(metrics) for key, metrics in self._agent_metrics.items()},
+        }
+
+    def _dispatch(self, agent_name: str) -> Any | None:
+        """Resolve an agent for process_request() and count the request."""
+        agent = self.get_agent(agent_name)
+        if agent is not None:
+            metrics = self._agent_metrics.get(AGENT_DISPATCH_NAMES[agent_name])
+            if metrics is not None:
+                metrics["requests"] += 1
+        return agent
 
     def get_llm_client_for_provider(self, provider_config: dict[str, Any] | None = None):
         """
@@ -456,6 +599,25 @@ class AgentOrchestrator:
             self.logger.error(f"Failed to create LLM client for {provider}: {e}")
             raise ValueError(f"Failed to initialize {provider} client: {str(e)}") from e
 
+    @property
+    def vector_db(self) -> VectorDatabase:
+        """Get or create the vector database (loads the embedding model on first use)."""
+        if self._vector_db is None:
+            with self._vector_db_lock:
+                if self._vector_db is None:
+                    with self.startup.stage("vector_store"):
+                        from socratic_system.database import VectorDatabase
+
+                        self._vector_db = VectorDatabase(
+                            str(self.config.vector_db_path),
+                            embedding_model=self.config.embedding_model,
+                        )
+        return self._vector_db
+
+    @vector_db.setter
+    def vector_db(self, value: VectorDatabase | None) -> None:
+        self._vector_db = value
+
     @property
     def sandbox(self) -> Sandbox:
         """Get or create sandbox instance for code execution.
@@ -472,34 +634,41 @@ class AgentOrchestrator:
     @property
     def project_manager(self) -> ProjectManagerAgent:
         """Lazy-load project manager agent"""
-        if "project_manager" not in self._agents_cache:
+
+        def create():
             from socratic_agents import ProjectManagerAgent
 
-            self._agents_cache["project_manager"] = ProjectManagerAgent(self)
-        return self._agents_cache["project_manager"]
+            return ProjectManagerAgent(self)
+
+        return self._lazy_agent("project_manager", create)
 
     @property
     def socratic_counselor(self) -> SocraticCounselorAgent:
         """Lazy-load socratic counselor agent"""
-        if "socratic_counselor" not in self._agents_cache:
+
+        def create():
             from socratic_agents import SocraticCounselorAgent
 
-            self._agents_cache["socratic_counselor"] = SocraticCounselorAgent(self)
-        return self._agents_cache["socratic_counselor"]
+            return SocraticCounselorAgent(self)
+
+        return self._lazy_agent("socratic_counselor", create)
 
     @property
     def context_analyzer(self) -> ContextAnalyzerAgent:
         """Lazy-load context analyzer agent"""
-        if "context_analyzer" not in self._agents_cache:
+
+        def create():
             from socratic_agents import ContextAnalyzerAgent
 
-            self._agents_cache["context_analyzer"] = ContextAnalyzerAgent(self)
-        return self._agents_cache["context_analyzer"]
+            return ContextAnalyzerAgent(self)
+
+        return self._lazy_agent("context_analyzer", create)
 
     @property
     def code_generator(self) -> CodeGeneratorAgent:
         """Lazy-load code generator agent with sandbox integration"""
-        if "code_generator" not in self._agents_cache:
+
+        def create():
             from socratic_agents import CodeGeneratorAgent
 
             from socratic_system.agents.code_generator_sandbox_wrapper import (
@@ -507,120 +676,143 @@ class AgentOrchestrator:
             )
 
             base_agent = CodeGeneratorAgent(self)
-            self._agents_cache["code_generator"] = CodeGeneratorSandboxWrapper(
+            return CodeGeneratorSandboxWrapper(
                 base_agent=base_agent, sandbox=self.sandbox, audit_logger=self.audit_logger
             )
-        return self._agents_cache["code_generator"]
+
+        return self._lazy_agent("code_generator", create)
 
     @property
     def system_monitor(self) -> SystemMonitorAgent:
         """Lazy-load system monitor agent"""
-        if "system_monitor" not in self._agents_cache:
+
+        def create():
             from socratic_agents import SystemMonitorAgent
 
-            self._agents_cache["system_monitor"] = SystemMonitorAgent(self)
-        return self._agents_cache["system_monitor"]
+            return SystemMonitorAgent(self)
+
+        return self._lazy_agent("system_monitor", create)
 
     @property
     def conflict_detector(self) -> ConflictDetectorAgent:
         """Lazy-load conflict detector agent"""
-        if "conflict_detector" not in self._agents_cache:
+
+        def create():
             from socratic_agents import ConflictDetectorAgent
 
-            self._agents_cache["conflict_detector"] = ConflictDetectorAgent(self)
-        return self._agents_cache["conflict_detector"]
+            return ConflictDetectorAgent(self)
+
+        return self._lazy_agent("conflict_detector", create)
 
     @property
     def document_processor(self) -> DocumentProcessorAgent:
         """Lazy-load document processor agent"""
-        if "document_processor" not in self._agents_cache:
+
+        def create():
             from socratic_agents import DocumentProcessorAgent
 
-            self._agents_cache["document_processor"] = DocumentProcessorAgent(self)
-        return self._agents_cache["document_processor"]
+            return DocumentProcessorAgent(self)
+
+        return self._lazy_agent("document_processor", create)
 
     @property
     def user_manager(self) -> UserManagerAgent:
         """Lazy-load user manager agent"""
-        if "user_manager" not in self._agents_cache:
+
+        def create():
             from socratic_agents import UserManagerAgent
 
-            self._agents_cache["user_manager"] = UserManagerAgent(self)
-        return self._agents_cache["user_manager"]
+            return UserManagerAgent(self)
+
+        return self._lazy_agent("user_manager", create)
 
     @property
     def note_manager(self) -> NoteManagerAgent:
         """Lazy-load note manager agent"""
-        if "note_manager" not in self._agents_cache:
+
+        def create():
             from socratic_agents import NoteManagerAgent
 
-            self._agents_cache["note_manager"] = NoteManagerAgent(self)
-        return self._agents_cache["note_manager"]
+            return NoteManagerAgent(self)
+
+        return self._lazy_agent("note_manager", create)
 
     @property
     def knowledge_manager(self) -> KnowledgeManagerAgent:
         """Lazy-load knowledge manager agent"""
-        if "knowledge_manager" not in self._agents_cache:
+
+        def create():
             from socratic_agents import KnowledgeManagerAgent
 
-            self._agents_cache["knowledge_manager"] = KnowledgeManagerAgent(
-                "KnowledgeManager", self
-            )
-        return self._agents_cache["knowledge_manager"]
+            return KnowledgeManagerAgent("KnowledgeManager", self)
+
+        return self._lazy_agent("knowledge_manager", create)
 
     @property
     def knowledge_analysis(self) -> KnowledgeAnalysisAgent:
         """Lazy-load knowledge analysis agent"""
-        if "knowledge_analysis" not in self._agents_cache:
+
+        def create():
             from socratic_agents import KnowledgeAnalysisAgent
 
-            self._agents_cache["knowledge_analysis"] = KnowledgeAnalysisAgent(self)
-        return self._agents_cache["knowledge_analysis"]
+            return KnowledgeAnalysisAgent(self)
+
+        return self._lazy_agent("knowledge_analysis", create)
 
     @property
     def quality_controller(self) -> QualityControllerAgent:
         """Lazy-load quality controller agent"""
-        if "quality_controller" not in self._agents_cache:
+
+        def create():
             from socratic_agents import QualityControllerAgent
 
-            self._agents_cache["quality_controller"] = QualityControllerAgent(self)
-        return self._agents_cache["quality_controller"]
+            return QualityControllerAgent(self)
+
+        return self._lazy_agent("quality_controller", create)
 
     @property
     def learning_agent(self) -> UserLearningAgent:
         """Lazy-load user learning agent"""
-        if "learning_agent" not in self._agents_cache:
+
+        def create():
             from socratic_agents import UserLearningAgent
 
-            self._agents_cache["learning_agent"] = UserLearningAgent(self)
-        return self._agents_cache["learning_agent"]
+            return UserLearningAgent(self)
+
+        return self._lazy_agent("learning_agent", create)
 
     @property
     def multi_llm_agent(self) -> MultiLLMAgent:
         """Lazy-load multi-LLM agent"""
-        if "multi_llm_agent" not in self._agents_cache:
+
+        def create():
             from socratic_agents import MultiLLMAgent
 
-            self._agents_cache["multi_llm_agent"] = MultiLLMAgent(self)
-        return self._agents_cache["multi_llm_agent"]
+            return MultiLLMAgent(self)
+
+        return self._lazy_agent("multi_llm_agent", create)
 
     @property
     def question_queue(self) -> QuestionQueueAgent:
         """Lazy-load question queue agent"""
-        if "question_queue" not in self._agents_cache:
+
+        def create():
             from socratic_agents import QuestionQueueAgent
 
-            self._agents_cache["question_queue"] = QuestionQueueAgent(self)
-        return self._agents_cache["question_queue"]
+            return QuestionQueueAgent(self)
+
+        return self._lazy_agent("question_queue", create)
 
     @property
     def code_validation_agent(self) -> CodeValidationAgent:
         """Lazy-load code validation agent"""
-        if "code_validation_agent" not in self._agents_cache:
+
+        def create():
             from socratic_agents import CodeValidationAgent
 
-            self._agents_cache["code_validation_agent"] = CodeValidationAgent(self)
-        return self._agents_cache["code_validation_agent"]
+            return CodeValidationAgent(self)
+
+        return self._lazy_agent("code_validation_agent", create)
 
     def _load_knowledge_base(self) -> None:
         """Load default knowledge base from config file if not already loaded"""
@@ -799,25 +991,7 @@ class AgentOrchestrator:
             ...     'owner': 'alice'
             ... })
         """
-        agents = {
-            "project_manager": self.project_manager,
-            "socratic_counselor": self.socratic_counselor,
-            "context_analyzer": self.context_analyzer,
-            "code_generator": self.code_generator,
-            "system_monitor": self.system_monitor,
-            "conflict_detector": self.conflict_detector,
-            "document_agent": self.document_processor,
-            "user_manager": self.user_manager,
-            "note_manager": self.note_manager,
-            "knowledge_manager": self.knowledge_manager,
-            "quality_controller": self.quality_controller,
-            "learning": self.learning_agent,
-            "multi_llm": self.multi_llm_agent,
-            "question_queue": self.question_queue,
-            "code_validation": self.code_validation_agent,
-        }
-
-        agent = agents.get(agent_name)
+        agent = self._dispatch(agent_name)
         if agent:
             self.event_emitter.emit(
                 EventType.AGENT_START,
@@ -874,25 +1048,7 @@ class AgentOrchestrator:
             ...     orchestrator.process_request_async('socratic_counselor', socratic_req)
             ... )
         """
-        agents = {
-            "project_manager": self.project_manager,
-            "socratic_counselor": self.socratic_counselor,
-            "context_analyzer": self.context_analyzer,
-            "code_generator": self.code_generator,
-            "system_monitor": self.system_monitor,
-            "conflict_detector": self.conflict_detector,
-            "document_agent": self.document_processor,
-            "user_manager": self.user_manager,
-            "note_manager": self.note_manager,
-            "knowledge_manager": self.knowledge_manager,
-            "quality_controller": self.quality_controller,
-            "learning": self.learning_agent,
-            "multi_llm": self.multi_llm_agent,
-            "question_queue": self.question_queue,
-            "code_validation": self.code_validation_agent,
-        }
-
-        agent = agents.get(agent_name)
+        agent = self._dispatch(agent_name)
         if not agent:
             raise ValueError(f"Unknown agent: {agent_name}")
 
@@ -956,9 +1112,25 @@ class AgentOrchestrator:
             self._safe_log("warning", f"Error waiting for knowledge thread: {e}")
 
         try:
-            # Close vector database to release ChromaDB file handles
-            if hasattr(self, "vector_db") and self.vector_db is not None:
-                self.vector_db.close()
+            # Flush queued audit entries while the database is still open
+            if hasattr(self, "audit_logger") and self.audit_logger is not None:
+                self.audit_logger.close()
+                self._safe_log("debug", "Audit log writer flushed")
+        except Exception as e:
+            self._safe_log("warning", f"Error flushing audit log: {e}")
+
+        try:
+            # Stop the agent bus loop thread used by sync callers
+            if hasattr(self, "agent_bus") and self.agent_bus is not None:
+                self.agent_bus.close()
+                self._safe_log("debug", "Agent bus loop stopped")
+        except Exception as e:
+            self._safe_log("warning", f"Error closing agent bus: {e}")
+
+        try:
+            # Close vector database to release ChromaDB file handles (if it was ever opened)
+            if getattr(self, "_vector_db", None) is not None:
+                self._vector_db.close()
                 self._safe_log("info", "Vector database closed")
         except Exception as e:
             self._safe_log("warning", f"Error closing vector database: {e}")
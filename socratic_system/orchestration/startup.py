@@ -0,0 +1,178 @@
+"""
+Staged startup tracking for the orchestrator
+
+The orchestrator becomes usable once its core components exist. Slower work
+(LLM model discovery, the vector store, knowledge base loading) runs in the
+background or on first use, and each piece is tracked as a named stage so
+readiness probes can report exactly what is still warming up.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class StageStatus(Enum):
+    """Lifecycle of a startup stage."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+    DEFERRED = "deferred"  # Initialized on first use
+    SKIPPED = "skipped"
+
+
+_SETTLED = (StageStatus.READY, StageStatus.FAILED, StageStatus.SKIPPED)
+
+
+class StartupTracker:
+    """
+    Thread-safe record of startup stages.
+
+    Stages are created on first mention. A stage is "settled" once it is
+    ready, failed or skipped; wait() blocks until then.
+    """
+
+    def __init__(self, required: tuple[str, ...] = ("core",)):
+        """
+        Initialize the tracker.
+
+        Args:
+            required: Stages that must be ready before is_ready() reports True
+        """
+        self.required = required
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._settled: dict[str, threading.Event] = {}
+        for name in required:
+            self._set(name, StageStatus.PENDING)
+
+    def _set(self, name: str, status: StageStatus, **fields: Any) -> None:
+        with self._lock:
+            stage = self._stages.setdefault(
+                name, {"status": status, "started_at": None, "duration_ms": None, "error": None}
+            )
+            stage["status"] = status
+            stage.update(fields)
+            event = self._settled.setdefault(name, threading.Event())
+            if status in _SETTLED:
+                event.set()
+            else:
+                event.clear()
+
+    def defer(self, name: str) -> None:
+        """Mark a stage as initialized on first use."""
+        self._set(name, StageStatus.DEFERRED)
+
+    def skip(self, name: str, reason: str | None = None) -> None:
+        """Mark a stage as not applicable to this process."""
+        self._set(name, StageStatus.SKIPPED, error=reason)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[dict[str, Any]]:
+        """
+        Run a block as a stage, recording its duration and outcome.
+
+        Yields a dict whose contents are reported as the stage's details.
+        Exceptions mark the stage failed and are re-raised.
+        """
+        details: dict[str, Any] = {}
+        started = time.perf_counter()
+        self._set(name, StageStatus.RUNNING, started_at=time.time(), error=None)
+        try:
+            yield details
+        except BaseException as e:
+            self._set(
+                name,
+                StageStatus.FAILED,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                error=str(e),
+                details=details,
+            )
+            raise
+        self._set(
+            name,
+            StageStatus.READY,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            details=details,
+        )
+
+    def run_in_background(
+        self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> threading.Thread:
+        """
+        Run func as a stage on a daemon thread.
+
+        Failures are logged and recorded on the stage rather than raised.
+
+        Returns:
+            The started thread
+        """
+        self._set(name, StageStatus.PENDING)
+
+        def _run() -> None:
+            try:
+                with self.stage(name):
+                    func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Startup stage '{name}' failed: {e}")
+
+        thread = threading.Thread(target=_run, name=f"startup-{name}", daemon=True)
+        thread.start()
+        return thread
+
+    def status(self, name: str) -> StageStatus | None:
+        """Get a stage's status, or None if it was never mentioned."""
+        with self._lock:
+            stage = self._stages.get(name)
+            return stage["status"] if stage else None
+
+    def wait(self, name: str, timeout: float | None = None) -> bool:
+        """
+        Block until a stage settles.
+
+        Returns:
+            True if the stage is ready, False on failure, skip or timeout
+        """
+        with self._lock:
+            event = self._settled.setdefault(name, threading.Event())
+        event.wait(timeout)
+        return self.status(name) == StageStatus.READY
+
+    def is_ready(self) -> bool:
+        """Check whether every required stage is ready."""
+        return all(self.status(name) == StageStatus.READY for name in self.required)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a serializable view of all stages.
+
+        Returns:
+            Dict with overall readiness, uptime and per-stage status
+        """
+        with self._lock:
+            stages = {
+                name: {
+                    **stage,
+                    "status": stage["status"].value,
+                    "duration_ms": (
+                        round(stage["duration_ms"], 2) if stage["duration_ms"] is not None else None
+                    ),
+                }
+                for name, stage in self._stages.items()
+            }
+        return {
+            "ready": self.is_ready(),
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "stages": stages,
+        }
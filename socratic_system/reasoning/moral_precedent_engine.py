@@ -5,8 +5,11 @@ Stores, retrieves, and analyzes moral precedents to ensure consistency
 in ethical decisions and learn from historical patterns.
 """
 
+import heapq
 import json
 import logging
+import math
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -42,6 +45,11 @@ class MoralPrecedent:
         """Return hash of this object."""
         return hash((self.id, self.action_description))
 
+    @staticmethod
+    def tokenize(text: str) -> frozenset[str]:
+        """Feature set used for similarity: lowercased whitespace-separated words."""
+        return frozenset(text.lower().split())
+
     def similarity_to(self, action: str, threshold: float = 0.5) -> float:
         """
         Calculate similarity between this precedent and an action.
@@ -54,8 +62,8 @@ class MoralPrecedent:
             Similarity score 0.0-1.0
         """
         # Simple keyword-based similarity
-        precedent_words = set(self.action_description.lower().split())
-        action_words = set(action.lower().split())
+        precedent_words = self.tokenize(self.action_description)
+        action_words = self.tokenize(action)
 
         if not precedent_words or not action_words:
             return 0.0
@@ -70,6 +78,118 @@ class MoralPrecedent:
         return intersection / union
 
 
+class PrecedentIndex:
+    """
+    Inverted index from action tokens to precedent IDs.
+
+    Supports exact Jaccard threshold search without scanning every precedent:
+    a precedent with similarity >= t to a query of n tokens shares at least
+    ceil(t * n) of them, so probing the n - ceil(t * n) + 1 rarest query
+    tokens is enough to find every candidate. Candidates outside the size
+    bounds t * n <= |p| <= n / t are discarded before verification.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self):
+        """Initialize empty index."""
+        self.postings: dict[str, set[str]] = defaultdict(set)
+        self.tokens: dict[str, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def add(self, precedent_id: str, action_description: str) -> None:
+        """Index (or re-index) a precedent."""
+        self.remove(precedent_id)
+        tokens = MoralPrecedent.tokenize(action_description)
+        self.tokens[precedent_id] = tokens
+        for token in tokens:
+            self.postings[token].add(precedent_id)
+
+    def remove(self, precedent_id: str) -> None:
+        """Remove a precedent from the index."""
+        for token in self.tokens.pop(precedent_id, ()):
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(precedent_id)
+                if not ids:
+                    del self.postings[token]
+
+    def search(self, action: str, threshold: float) -> dict[str, float]:
+        """
+        Find precedents whose Jaccard similarity to an action meets a threshold.
+
+        Args:
+            action: Action description
+            threshold: Minimum similarity (must be > 0)
+
+        Returns:
+            Mapping of precedent ID to similarity score
+        """
+        query = MoralPrecedent.tokenize(action)
+        if not query:
+            return {}
+
+        size = len(query)
+        min_overlap = max(1, math.ceil(threshold * size - 1e-9))
+        if min_overlap > size:
+            return {}
+        probe = sorted(query, key=lambda t: len(self.postings.get(t, ())))
+        probe = probe[: size - min_overlap + 1]
+
+        candidates: set[str] = set()
+        for token in probe:
+            candidates.update(self.postings.get(token, ()))
+
+        results = {}
+        min_size, max_size = threshold * size, size / threshold
+        for precedent_id in candidates:
+            tokens = self.tokens[precedent_id]
+            if not min_size - 1e-9 <= len(tokens) <= max_size + 1e-9:
+                continue
+            overlap = len(tokens & query)
+            similarity = overlap / (len(tokens) + size - overlap)
+            if similarity >= threshold:
+                results[precedent_id] = similarity
+        return results
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the index for export."""
+        return {
+            "version": self.FORMAT_VERSION,
+            "postings": {token: sorted(ids) for token, ids in self.postings.items()},
+        }
+
+    def load(self, data: dict[str, Any], precedent_ids: set[str]) -> bool:
+        """
+        Merge a serialized index covering the given precedents.
+
+        Args:
+            data: Output of to_dict()
+            precedent_ids: IDs the serialized index must cover exactly
+
+        Returns:
+            True if loaded, False if the data is missing, stale or malformed
+        """
+        if not data or data.get("version") != self.FORMAT_VERSION:
+            return False
+
+        tokens: dict[str, set[str]] = defaultdict(set)
+        for token, ids in data.get("postings", {}).items():
+            for precedent_id in ids:
+                tokens[precedent_id].add(token)
+        if set(tokens) != precedent_ids:
+            return False
+
+        for precedent_id, precedent_tokens in tokens.items():
+            self.remove(precedent_id)
+            self.tokens[precedent_id] = frozenset(precedent_tokens)
+            for token in precedent_tokens:
+                self.postings[token].add(precedent_id)
+        return True
+
+
 @dataclass
 class PrecedentQuery:
     """Query parameters for finding similar precedents."""
@@ -123,6 +243,8 @@ class MoralPrecedentEngine:
         """
         self.logger = logger or logging.getLogger(__name__)
         self.precedents: dict[str, MoralPrecedent] = {}
+        self.index = PrecedentIndex()
+        self._order: dict[str, int] = {}  # Storage position, for stable tie-breaking
         self._id_counter = 0
 
     def store_precedent(
@@ -165,6 +287,8 @@ class MoralPrecedentEngine:
         )
 
         self.precedents[precedent_id] = precedent
+        self._order.setdefault(precedent_id, len(self._order))
+        self.index.add(precedent_id, action_description)
 
         self.logger.info(
             f"[Precedent Store] {precedent_id}: {action_description} -> {conclusion.value}"
@@ -184,13 +308,18 @@ class MoralPrecedentEngine:
         """
         matches = []
 
-        for precedent in self.precedents.values():
-            # Calculate similarity
-            similarity = precedent.similarity_to(query.action, query.similarity_threshold)
-
-            if similarity < query.similarity_threshold:
-                continue
+        if query.similarity_threshold > 0:
+            # Only precedents sharing enough tokens with the query can qualify
+            scored = self.index.search(query.action, query.similarity_threshold)
+            candidates = [
+                (self.precedents[pid], score)
+                for pid, score in scored.items()
+                if pid in self.precedents
+            ]
+        else:
+            candidates = [(p, p.similarity_to(query.action)) for p in self.precedents.values()]
 
+        for precedent, similarity in candidates:
             # Check principle filter
             if query.principle_filter:
                 shared_principles = set(query.principle_filter) & set(precedent.principles_involved)
@@ -217,9 +346,9 @@ class MoralPrecedentEngine:
 
             matches.append(match)
 
-        # Sort by relevance and limit results
-        matches.sort(key=lambda m: m.relevance_score, reverse=True)
-        matches = matches[: query.max_results]
+        # Top-k by relevance; ties keep storage order like a full scan would
+        matches.sort(key=lambda m: self._order.get(m.precedent.id, 0))
+        matches = heapq.nlargest(query.max_results, matches, key=lambda m: m.relevance_score)
 
         self.logger.debug(f"[Precedent Query] Found {len(matches)} matches for: {query.action}")
 
@@ -391,6 +520,7 @@ class MoralPrecedentEngine:
                 }
                 for p in self.precedents.values()
             ],
+            "index": self.index.to_dict(),
         }
 
         with open(filepath, "w") as f:
@@ -404,6 +534,7 @@ class MoralPrecedentEngine:
             with open(filepath) as f:
                 data = json.load(f)
 
+            imported_ids = set()
             for prec_data in data.get("precedents", []):
                 precedent_id = prec_data["id"]
                 precedent = MoralPrecedent(
@@ -417,8 +548,15 @@ class MoralPrecedentEngine:
                     usage_count=prec_data.get("usage_count", 0),
                 )
                 self.precedents[precedent_id] = precedent
+                self._order.setdefault(precedent_id, len(self._order))
+                imported_ids.add(precedent_id)
                 self._id_counter = max(self._id_counter, int(precedent_id.split("_")[1]) + 1)
 
+            # Reuse the persisted index when it matches; rebuild only if stale or absent
+            if not self.index.load(data.get("index"), imported_ids):
+                for precedent_id in imported_ids:
+                    self.index.add(precedent_id, self.precedents[precedent_id].action_description)
+
             self.logger.info(f"[Precedent Import] Imported {len(self.precedents)} precedents")
 
         except Exception as e:
@@ -107,6 +107,45 @@ class QualityRepository(BaseRepository):
             self.logger.error(f"Failed to update phase maturity for {project_id}/{phase}: {e}")
             return False
 
+    def save_phase_scores(
+        self,
+        project_id: str,
+        phase: str,
+        score: float,
+        category_scores: dict[str, Any],
+        progress: int | None = None,
+    ) -> bool:
+        """
+        Persist one phase's maturity and materialized category scores.
+
+        Delta write: unlike update_phase_maturity_score, the project is not
+        loaded or fully re-saved.
+
+        Args:
+            project_id: Project ID
+            phase: Phase name
+            score: New maturity score (0-100)
+            category_scores: Dict of category -> materialized score data
+            progress: Optional overall progress to store on the project
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._log_operation(
+            "save_phase_scores",
+            {"project_id": project_id, "phase": phase, "score": score},
+        )
+        try:
+            return self.database.save_project_scores(
+                project_id,
+                phase_maturity_scores={phase: min(100.0, max(0.0, score))},
+                category_scores={phase: category_scores},
+                progress=progress,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to save phase scores for {project_id}/{phase}: {e}")
+            return False
+
     def get_category_scores(self, project_id: str) -> dict[str, dict[str, Any]]:
         """
         Get category scores for all phases.
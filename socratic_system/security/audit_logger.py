@@ -8,8 +8,12 @@ Compliance: GDPR, SOC 2, HIPAA, PCI-DSS
 Retention: 2+ years, immutable, encrypted
 """
 
+import atexit
 import json
 import logging
+import queue
+import threading
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -80,6 +84,17 @@ class AuditSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Queue marker asking the writer to commit its current batch immediately
+_FLUSH = object()
+
+
+class AuditDurability(Enum):
+    """How audit entries reach storage."""
+
+    SYNC = "sync"  # Written before log_event() returns
+    BATCHED = "batched"  # Queued and committed in batches by a background writer
+
+
 @dataclass
 class AuditEntry:
     """Single audit log entry."""
@@ -124,12 +139,20 @@ class AuditLogger:
     - Retention policy enforcement
     """
 
+    # Severities that are always written synchronously, whatever the default mode
+    SYNC_SEVERITIES = frozenset({AuditSeverity.ALERT.value, AuditSeverity.CRITICAL.value})
+
     def __init__(
         self,
         db_connection=None,
         logger: logging.Logger | None = None,
         retention_days: int = 730,  # 2 years default
         encrypt_at_rest: bool = True,
+        durability: str = AuditDurability.SYNC.value,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+        enqueue_timeout: float = 0.05,
     ):
         """Initialize audit logger.
 
@@ -138,11 +161,38 @@ class AuditLogger:
             logger: Python logger for console output
             retention_days: How long to keep audit logs
             encrypt_at_rest: Whether to encrypt stored logs
+            durability: Default durability mode ("sync" or "batched"); alert and
+                critical events are always written synchronously
+            batch_size: Entries per batched commit
+            flush_interval: Maximum seconds an entry waits before its batch is committed
+            max_queue_size: Bound on queued entries awaiting the writer
+            enqueue_timeout: Seconds to wait for queue space before writing synchronously
         """
         self.db = db_connection
         self.logger = logger or logging.getLogger(__name__)
         self.retention_days = retention_days
         self.encrypt_at_rest = encrypt_at_rest
+        self.durability = AuditDurability(durability)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+
+        # Holds AuditEntry items plus the _FLUSH marker and a None stop sentinel
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+        self.metrics = {
+            "entries_logged": 0,
+            "sync_writes": 0,
+            "queued": 0,
+            "batched_writes": 0,
+            "batches": 0,
+            "failed_writes": 0,
+            "backpressure_events": 0,
+            "backpressure_wait_ms": 0.0,
+            "queue_high_watermark": 0,
+        }
 
     def log_event(
         self,
@@ -160,6 +210,7 @@ class AuditLogger:
         request_id: str | None = None,
         session_id: str | None = None,
         details: dict[str, Any] | None = None,
+        durability: str | None = None,
     ) -> str:
         """Log an audit event.
 
@@ -178,6 +229,7 @@ class AuditLogger:
             request_id: Tracing request ID
             session_id: Session identifier
             details: Additional context details
+            durability: Override the default durability mode for this entry
 
         Returns:
             Unique ID of audit entry
@@ -207,15 +259,183 @@ class AuditLogger:
 
         # Store in database
         if self.db:
-            try:
-                self._store_entry(entry)
-            except Exception as e:
-                self.logger.error(f"Failed to store audit entry: {e}")
-                # Don't fail the operation if audit logging fails
-                # but always log the error
+            self.metrics["entries_logged"] += 1
+            mode = AuditDurability(durability) if durability else self.durability
+            if (
+                mode == AuditDurability.SYNC
+                or severity in self.SYNC_SEVERITIES
+                or not self._enqueue(entry)
+            ):
+                self.metrics["sync_writes"] += 1
+                try:
+                    self._store_entry(entry)
+                except Exception as e:
+                    self.metrics["failed_writes"] += 1
+                    self.logger.error(f"Failed to store audit entry: {e}")
+                    # Don't fail the operation if audit logging fails
+                    # but always log the error
 
         return entry.timestamp + "-" + actor_id
 
+    def _enqueue(self, entry: AuditEntry) -> bool:
+        """Queue an entry for the background writer.
+
+        Waits up to enqueue_timeout for space when the queue is full.
+
+        Returns:
+            True if queued, False if the caller should write synchronously
+        """
+        if self._closed:
+            return False
+        self._ensure_writer()
+
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.metrics["backpressure_events"] += 1
+            start = time.perf_counter()
+            try:
+                self._queue.put(entry, timeout=self.enqueue_timeout)
+            except queue.Full:
+                return False
+            finally:
+                self.metrics["backpressure_wait_ms"] += (time.perf_counter() - start) * 1000
+
+        self.metrics["queued"] += 1
+        depth = self._queue.qsize()
+        if depth > self.metrics["queue_high_watermark"]:
+            self.metrics["queue_high_watermark"] = depth
+        return True
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="audit-log-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
+    def _writer_loop(self) -> None:
+        """Drain the queue, committing a batch when it is full or flush_interval elapses."""
+        stopping = False
+        while not stopping:
+            batch: list[AuditEntry] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None or item is _FLUSH:
+                    stopping = item is None
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: list[AuditEntry]) -> None:
+        """Commit a batch of entries, falling back to per-entry writes."""
+        try:
+            if hasattr(self.db, "insert_audit_logs"):
+                self.db.insert_audit_logs([entry.to_dict() for entry in batch])
+            else:
+                for entry in batch:
+                    self._store_entry(entry)
+            self.metrics["batches"] += 1
+            self.metrics["batched_writes"] += len(batch)
+        except Exception as e:
+            self.metrics["failed_writes"] += len(batch)
+            self.logger.error(f"Failed to store batch of {len(batch)} audit entries: {e}")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued entry has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained in time
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return self._queue.unfinished_tasks == 0
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_FLUSH, timeout=timeout)
+        except queue.Full:
+            return False
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush queued entries and stop the background writer.
+
+        Entries logged after close() are written synchronously.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer to finish
+        """
+        self._closed = True
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        self._queue.put(None)
+        writer.join(timeout)
+        if writer.is_alive():
+            self.logger.warning(
+                f"Audit writer did not finish within {timeout}s; "
+                f"{self._queue.qsize()} entries still queued"
+            )
+            return
+        atexit.unregister(self.close)
+
+        # Entries that raced with shutdown are behind the sentinel; write them now
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, AuditEntry):
+                leftovers.append(item)
+            self._queue.task_done()
+        if leftovers:
+            self._write_batch(leftovers)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get audit writer metrics, including current queue depth."""
+        return {
+            **self.metrics,
+            "durability": self.durability.value,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "avg_batch_size": (
+                round(self.metrics["batched_writes"] / self.metrics["batches"], 2)
+                if self.metrics["batches"]
+                else 0.0
+            ),
+        }
+
     def log_agent_action(
         self,
         agent_name: str,
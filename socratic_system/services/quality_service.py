@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
-from socratic_system.core.analytics_calculator import AnalyticsCalculator
+from socratic_system.core.analytics_calculator import AnalyticsCalculator, ProgressionStats
 from socratic_system.core.maturity_calculator import MaturityCalculator
 from socratic_system.repositories.quality_repository import QualityRepository
 
@@ -36,29 +36,55 @@ class QualityService(Service):
         self.project_type = project_type
 
     def calculate_phase_maturity(
-        self, project_id: str, project: "ProjectContext"
+        self,
+        project_id: str,
+        project: "ProjectContext",
+        added_specs: list[dict] | None = None,
     ) -> dict[str, Any]:
         """Calculate phase maturity for project.
 
+        When ``added_specs`` is given and the phase's category scores are
+        already materialized on the project, only the affected categories are
+        rescored. Otherwise the phase is rebuilt from its specs once.
+
         Args:
             project_id: Project ID
             project: ProjectContext
+            added_specs: Specs just added to the current phase
 
         Returns:
             Maturity metrics dict
         """
         self.logger.info(f"Calculating maturity for project {project_id}")
+        phase = project.phase
+        category_scores = getattr(project, "category_scores", None)
 
-        # Get specs for current phase
-        all_specs = self.repository.get_categorized_specs(project_id)
-        phase_specs = all_specs.get(project.phase, [])
+        materialized = None
+        if added_specs is not None and isinstance(category_scores, dict):
+            materialized = self.calculator.apply_spec_changes(
+                category_scores.get(phase), phase, added_specs=added_specs
+            )
+
+        if materialized is None:
+            all_specs = self.repository.get_categorized_specs(project_id)
+            materialized = self.calculator.materialize_category_scores(
+                all_specs.get(phase, []), phase
+            )
 
-        # Calculate maturity
-        maturity = self.calculator.calculate_phase_maturity(phase_specs, project.phase)
+        maturity = self.calculator.maturity_from_scores(materialized, phase)
 
-        # Store result
-        self.repository.update_phase_maturity_score(
-            project_id, project.phase, maturity.overall_score
+        # Keep the in-memory project in step with what is persisted
+        progress = None
+        if isinstance(category_scores, dict):
+            category_scores[phase] = materialized
+        if isinstance(getattr(project, "phase_maturity_scores", None), dict):
+            project.phase_maturity_scores[phase] = maturity.overall_score
+            project.overall_maturity = project._calculate_overall_maturity()
+            progress = int(project.overall_maturity)
+
+        # Store result (delta write of this phase's scores only)
+        self.repository.save_phase_scores(
+            project_id, phase, maturity.overall_score, materialized, progress=progress
         )
 
         return {
@@ -97,6 +123,7 @@ class QualityService(Service):
                 project.phase, 0.0
             )
         answer_score = 0.0
+        specs = None
 
         # Categorize insights if provided
         if insights:
@@ -108,8 +135,8 @@ class QualityService(Service):
             else:
                 return {"status": "success", "message": "No new specs added"}
 
-        # Recalculate maturity
-        maturity_result = self.calculate_phase_maturity(project_id, project)
+        # Rescore only the categories the new specs touched
+        maturity_result = self.calculate_phase_maturity(project_id, project, added_specs=specs)
 
         # Get score after (from project's overall maturity if available, otherwise from maturity result)
         if hasattr(project, "_calculate_overall_maturity") and callable(
@@ -198,6 +225,8 @@ class QualityService(Service):
             # Calculate metrics from project data
             metrics = self._calculate_analytics_metrics(project)
             self.repository.update_analytics_metrics(project_id, metrics)
+            if isinstance(getattr(project, "analytics_metrics", None), dict):
+                project.analytics_metrics.update(metrics)
             return True
         except Exception as e:
             self.logger.error(f"Failed to update analytics metrics for {project_id}: {e}")
@@ -214,25 +243,23 @@ class QualityService(Service):
         """
         metrics = {}
 
-        # Calculate velocity from maturity history
-        if hasattr(project, "maturity_history") and project.maturity_history:
-            deltas = [
-                e.get("delta", 0)
-                for e in project.maturity_history
-                if e.get("event_type") == "response_processed"
-            ]
-            if deltas:
-                metrics["velocity"] = sum(deltas) / len(deltas)
-                metrics["total_qa_sessions"] = len(deltas)
-
-        # Calculate average confidence from categorized specs
-        if hasattr(project, "categorized_specs") and project.categorized_specs:
+        # Velocity and plateaus are rolling aggregates; only new history events are folded in
+        progression = ProgressionStats.for_project(project)
+        if progression.sessions:
+            metrics["velocity"] = progression.velocity
+            metrics["total_qa_sessions"] = progression.sessions
+        metrics["progression"] = progression.to_dict()
+
+        # Calculate average confidence, preferring materialized category sums over a spec scan
+        avg_confidence = self._materialized_avg_confidence(project)
+        if avg_confidence is None and getattr(project, "categorized_specs", None):
             all_specs = []
             for phase_specs in project.categorized_specs.values():
                 all_specs.extend(phase_specs)
             if all_specs:
                 avg_confidence = sum(s.get("confidence", 0.9) for s in all_specs) / len(all_specs)
-                metrics["avg_confidence"] = avg_confidence
+        if avg_confidence is not None:
+            metrics["avg_confidence"] = avg_confidence
 
         # Use analytics calculator for additional metrics
         try:
@@ -243,3 +270,27 @@ class QualityService(Service):
             pass  # Fall back to calculated metrics
 
         return metrics
+
+    @staticmethod
+    def _materialized_avg_confidence(project: "ProjectContext") -> float | None:
+        """Average spec confidence from materialized category scores.
+
+        Returns:
+            Average confidence, or None if any phase lacks materialized sums
+        """
+        category_scores = getattr(project, "category_scores", None)
+        if not isinstance(category_scores, dict) or not category_scores:
+            return None
+
+        confidence_sum = 0.0
+        spec_count = 0
+        for phase_scores in category_scores.values():
+            if not isinstance(phase_scores, dict):
+                return None
+            for entry in phase_scores.values():
+                if not isinstance(entry, dict) or "confidence_sum" not in entry:
+                    return None
+                confidence_sum += entry["confidence_sum"]
+                spec_count += entry["spec_count"]
+
+        return confidence_sum / spec_count if spec_count else None
@@ -93,6 +93,10 @@ class StorageQuotaManager:
         """
         Calculate total storage usage for a user across all projects in bytes.
 
+        Knowledge documents the user uploaded and files of the projects the
+        user owns are counted. The total is read from counters the database
+        maintains on write, so this is a single-row lookup.
+
         Args:
             username: Username
             database: Database connection
@@ -101,29 +105,7 @@ class StorageQuotaManager:
             Total storage usage in bytes
         """
         try:
-            # Get all knowledge documents for user
-            documents = database.get_user_knowledge_documents(username)
-
-            if not documents:
-                return 0
-
-            total_bytes = 0
-            for doc in documents:
-                # Get file_size from document, default to content length if not available
-                if isinstance(doc, dict):
-                    file_size = doc.get("file_size", 0)
-                    if file_size == 0 and "content" in doc:
-                        # Estimate size from content if file_size not available
-                        file_size = len(doc["content"].encode("utf-8"))
-                else:
-                    # Handle object attributes
-                    file_size = getattr(doc, "file_size", 0)
-                    if file_size == 0 and hasattr(doc, "content"):
-                        file_size = len(doc.content.encode("utf-8"))
-
-                total_bytes += file_size
-
-            return total_bytes
+            return database.get_user_storage_usage(username)["total_bytes"]
         except Exception as e:
             # Log error but don't fail - assume 0 if error
             print(f"Error calculating storage usage for {username}: {e}")
@@ -148,7 +130,8 @@ class StorageQuotaManager:
 
             tier = user.subscription_tier.lower()
             limit_gb = StorageQuotaManager.get_storage_limit_gb(tier)
-            used_bytes = StorageQuotaManager.calculate_user_storage_usage(username, database)
+            usage = database.get_user_storage_usage(username)
+            used_bytes = usage["total_bytes"]
             used_gb = StorageQuotaManager.bytes_to_gb(used_bytes)
 
             report = {
@@ -156,6 +139,10 @@ class StorageQuotaManager:
                 "tier": tier,
                 "storage_used_gb": round(used_gb, 2),
                 "storage_used_bytes": used_bytes,
+                "document_bytes": usage["document_bytes"],
+                "document_count": usage["document_count"],
+                "project_file_bytes": usage["file_bytes"],
+                "project_file_count": usage["file_count"],
                 "storage_limit_gb": limit_gb if limit_gb else None,
                 "storage_limit_bytes": (
                     StorageQuotaManager.gb_to_bytes(limit_gb) if limit_gb else None
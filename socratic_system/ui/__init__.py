@@ -1,5 +1,21 @@
 """User interface for Socrates AI"""
 
-from .main_app import SocraticRAGSystem
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main_app import SocraticRAGSystem
+
+_LAZY_IMPORTS = {"SocraticRAGSystem": ".main_app"}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["SocraticRAGSystem"]
@@ -0,0 +1,191 @@
+"""
+Tests for the analytics read model maintained by ProjectDatabase.
+
+Tests cover:
+- Conversation counters are updated when history is saved
+- Phase timings are recorded on phase transitions
+- Maturity trend snapshots are appended on score changes
+- Per-user LLM usage totals (incremental and backfilled)
+- Lazy rebuild for projects written before the read model existed
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from socratic_system.database.project_db import MATURITY_TREND_LIMIT, ProjectDatabase
+from socratic_system.models import LLMUsageRecord, ProjectContext, User
+
+CONVERSATION = [
+    {"type": "user", "content": "How should I start?"},
+    {"type": "assistant", "content": "Like this:\n```python\nx = 1\ny = 2\n```"},
+    {"type": "user", "content": "Thanks"},
+    {"role": "assistant", "content": "You're welcome"},
+]
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with one user and project."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+        db.save_user(
+            User(
+                username="owner",
+                email="owner@test.com",
+                passcode_hash="hash",
+                created_at=datetime.datetime.now(),
+            )
+        )
+        db.save_project(_project())
+        yield db
+
+
+def _project(project_id="proj-1", phase="discovery"):
+    return ProjectContext(
+        project_id=project_id,
+        name="Project",
+        owner="owner",
+        collaborators=[],
+        goals="",
+        requirements=[],
+        tech_stack=[],
+        constraints=[],
+        team_structure="individual",
+        language_preferences="python",
+        deployment_target="local",
+        code_style="documented",
+        phase=phase,
+        conversation_history=[],
+        created_at=datetime.datetime.now(),
+        updated_at=datetime.datetime.now(),
+    )
+
+
+def _usage(usage_id, input_tokens=100, output_tokens=50, cost=0.5):
+    return LLMUsageRecord(
+        id=usage_id,
+        user_id="owner",
+        provider="claude",
+        model="claude-3-sonnet-20240229",
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=input_tokens + output_tokens,
+        cost=cost,
+        success=True,
+        timestamp=datetime.datetime.now(),
+    )
+
+
+class TestProjectAnalytics:
+    """Tests for the per-project analytics row."""
+
+    def test_counts_follow_conversation_saves(self, db):
+        db.save_conversation_history("proj-1", CONVERSATION)
+
+        analytics = db.get_project_analytics("proj-1")
+
+        assert analytics["message_count"] == 4
+        assert analytics["total_questions"] == 2
+        assert analytics["total_answers"] == 2
+        assert analytics["code_generation_count"] == 1
+        assert analytics["code_lines_generated"] == 3
+
+        db.save_conversation_history("proj-1", CONVERSATION[:1])
+        assert db.get_project_analytics("proj-1")["message_count"] == 1
+
+    def test_phase_transitions_are_timed(self, db):
+        project = db.load_project("proj-1")
+        project.phase = "analysis"
+        db.save_project(project)
+
+        timings = db.get_project_analytics("proj-1")["phase_timings"]
+
+        assert timings["discovery"]["started_at"] is None
+        assert timings["discovery"]["duration_seconds"] >= 0
+        assert timings["analysis"]["started_at"] is not None
+
+    def test_maturity_trend_appends_changes_only(self, db):
+        db.save_project_scores("proj-1", {"discovery": 20.0}, {})
+        db.save_project_scores("proj-1", {"discovery": 20.0}, {})
+        db.save_project_scores("proj-1", {"discovery": 35.0}, {})
+
+        analytics = db.get_project_analytics("proj-1")
+
+        trend = [point for point in analytics["maturity_trend"] if point["overall"] > 0]
+        assert [point["overall"] for point in trend] == [20.0, 35.0]
+        assert analytics["overall_maturity"] == pytest.approx(35.0)
+
+    def test_maturity_trend_is_capped(self, db):
+        for i in range(MATURITY_TREND_LIMIT + 5):
+            db.save_project_scores("proj-1", {"discovery": float(i + 1)}, {})
+
+        trend = db.get_project_analytics("proj-1")["maturity_trend"]
+
+        assert len(trend) == MATURITY_TREND_LIMIT
+        assert trend[-1]["overall"] == MATURITY_TREND_LIMIT + 5
+
+    def test_missing_row_is_rebuilt_lazily(self, db):
+        db.save_conversation_history("proj-1", CONVERSATION)
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DELETE FROM project_analytics")
+
+        analytics = db.get_project_analytics("proj-1")
+
+        assert analytics["message_count"] == 4
+        assert analytics["code_lines_generated"] == 3
+        assert "discovery" in analytics["phase_timings"]
+
+    def test_failed_rebuild_is_not_retried(self, db, monkeypatch):
+        calls = []
+        monkeypatch.setattr(db, "rebuild_project_analytics", lambda pid: calls.append(pid))
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DELETE FROM project_analytics")
+
+        analytics = db.get_project_analytics("proj-1")
+
+        assert calls == ["proj-1"]
+        assert analytics["message_count"] == 0
+        assert analytics["phase_timings"] == {}
+
+    def test_unknown_project(self, db):
+        assert db.get_project_analytics("missing") is None
+
+
+class TestUserAnalytics:
+    """Tests for the per-user analytics row."""
+
+    def test_llm_usage_is_accumulated(self, db):
+        db.save_usage_record(_usage("u1"))
+        db.save_usage_record(_usage("u2", 10, 5, 0.25))
+
+        usage = db.get_user_analytics("owner")["llm_usage"]
+
+        assert usage["requests"] == 2
+        assert usage["input_tokens"] == 110
+        assert usage["output_tokens"] == 55
+        assert usage["cost"] == pytest.approx(0.75)
+
+    def test_usage_written_before_read_model_is_backfilled(self, db):
+        db.save_usage_record(_usage("u1"))
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DELETE FROM user_analytics")
+
+        db.save_usage_record(_usage("u2"))
+
+        assert db.get_user_analytics("owner")["llm_usage"]["requests"] == 2
+
+    def test_projects_summary_excludes_archived(self, db):
+        db.save_project(_project("proj-2"))
+        db.save_conversation_history("proj-1", CONVERSATION)
+        db.save_project_scores("proj-1", {"discovery": 40.0, "analysis": 0.0}, {})
+        db.archive_project("proj-2")
+
+        projects = db.get_user_analytics("owner")["projects"]
+
+        assert [p["project_id"] for p in projects] == ["proj-1"]
+        assert projects[0]["message_count"] == 4
+        assert projects[0]["overall_maturity"] == pytest.approx(40.0)
@@ -0,0 +1,154 @@
+"""
+Tests for hourly and daily LLM usage rollups.
+
+Tests cover:
+- Saved usage records are folded into hourly and daily buckets
+- Usage summaries read the rollups, by provider, model and day
+- Purging raw records leaves summaries and user analytics unchanged
+- Existing records are backfilled when the migration is applied
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+import uuid
+
+import pytest
+
+from socratic_system.database.migration_runner import MigrationRunner
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.models import User
+from socratic_system.models.llm_provider import LLMUsageRecord
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+        db.save_user(
+            User(
+                username="owner",
+                email="owner@test.com",
+                passcode_hash="hash",
+                created_at=datetime.datetime.now(),
+            )
+        )
+        yield db
+        db.close()
+
+
+def _save(db, timestamp, provider="claude", model="claude-haiku", tokens=(100, 50), cost=0.01):
+    assert db.save_usage_record(
+        LLMUsageRecord(
+            id=str(uuid.uuid4()),
+            user_id="owner",
+            provider=provider,
+            model=model,
+            input_tokens=tokens[0],
+            output_tokens=tokens[1],
+            total_tokens=sum(tokens),
+            latency_ms=10.0,
+            cost=cost,
+            timestamp=timestamp,
+        )
+    )
+
+
+def _rows(db, table):
+    conn = sqlite3.connect(db.db_path)
+    rows = conn.execute(
+        f"SELECT bucket, provider, model, requests, input_tokens, output_tokens FROM {table} "
+        "ORDER BY bucket, provider"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+class TestRollups:
+    """Tests for rollups maintained by save_usage_record()."""
+
+    def test_records_fold_into_buckets(self, db):
+        _save(db, datetime.datetime(2026, 3, 1, 9, 15))
+        _save(db, datetime.datetime(2026, 3, 1, 9, 45))
+        _save(db, datetime.datetime(2026, 3, 1, 14, 5), provider="openai", model="gpt-4o")
+
+        assert _rows(db, "llm_usage_hourly") == [
+            ("2026-03-01T09:00:00", "claude", "claude-haiku", 2, 200, 100),
+            ("2026-03-01T14:00:00", "openai", "gpt-4o", 1, 100, 50),
+        ]
+        assert _rows(db, "llm_usage_daily") == [
+            ("2026-03-01", "claude", "claude-haiku", 2, 200, 100),
+            ("2026-03-01", "openai", "gpt-4o", 1, 100, 50),
+        ]
+
+    def test_summary_reads_rollups(self, db):
+        now = datetime.datetime.now()
+        _save(db, now - datetime.timedelta(minutes=5))
+        _save(db, now - datetime.timedelta(days=3), tokens=(1000, 0), cost=0.5)
+        _save(db, now - datetime.timedelta(days=3), provider="openai", model="gpt-4o")
+        _save(db, now - datetime.timedelta(days=10))
+
+        summary = db.get_usage_summary("owner", days=7)
+
+        assert summary["requests"] == 3
+        assert summary["total_tokens"] == 150 + 1000 + 150
+        assert summary["total_cost"] == pytest.approx(0.52)
+        assert summary["by_provider"]["claude"]["requests"] == 2
+        assert summary["by_model"]["gpt-4o"] == {"requests": 1, "tokens": 150, "cost": 0.01}
+        assert [day["requests"] for day in summary["daily"]] == [2, 1]
+        assert db.get_usage_summary("owner", days=7, provider="openai")["requests"] == 1
+        assert db.get_usage_summary("owner", days=30)["requests"] == 4
+        assert db.get_usage_summary("nobody")["requests"] == 0
+
+    def test_summary_covers_partial_first_day(self, db):
+        start = datetime.datetime.now() - datetime.timedelta(days=2)
+        _save(db, start + datetime.timedelta(hours=1))
+        _save(db, start - datetime.timedelta(hours=1))
+
+        assert db.get_usage_summary("owner", days=2)["requests"] == 1
+
+
+class TestRetention:
+    """Tests for purge_usage_records() and the migration backfill."""
+
+    def test_purge_keeps_totals(self, db):
+        now = datetime.datetime.now()
+        _save(db, now - datetime.timedelta(days=40))
+        _save(db, now - datetime.timedelta(days=200))
+        _save(db, now - datetime.timedelta(hours=1))
+        before = db.get_usage_summary("owner", days=365)
+
+        assert db.purge_usage_records(retention_days=30) == 2
+
+        assert db.get_usage_summary("owner", days=365) == before
+        assert len(db.get_usage_records("owner", 365, "claude")) == 1
+        # Hourly buckets past their retention are dropped, daily ones kept
+        assert len(_rows(db, "llm_usage_hourly")) == 2
+        assert len(_rows(db, "llm_usage_daily")) == 3
+
+        # Analytics seeded after the purge still count the purged calls
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("DELETE FROM user_analytics")
+        conn.commit()
+        conn.close()
+        _save(db, now)
+        assert db.get_user_analytics("owner")["llm_usage"]["requests"] == 4
+
+    def test_migration_backfills_existing_records(self, db):
+        _save(db, datetime.datetime(2026, 3, 1, 9, 15))
+        _save(db, datetime.datetime(2026, 3, 1, 9, 45), tokens=(10, 5))
+
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("DROP TABLE llm_usage_hourly")
+        conn.execute("DROP TABLE llm_usage_daily")
+        conn.commit()
+        conn.close()
+
+        success, _ = MigrationRunner(db.db_path).ensure_migrations_applied()
+
+        assert success
+        assert _rows(db, "llm_usage_hourly") == [
+            ("2026-03-01T09:00:00", "claude", "claude-haiku", 2, 110, 55),
+        ]
+        assert _rows(db, "llm_usage_daily")[0][3:] == (2, 110, 55)
@@ -165,6 +165,22 @@ class TestProjectDatabaseProjectOperations:
         # Should have original goals from database, not modified version
         assert loaded.goals == "Test goals"
 
+    def test_save_project_scores_only_touches_scores(self, temp_db, sample_project):
+        """Test delta write of maturity scores leaves other project data intact."""
+        temp_db.save_project(sample_project)
+
+        success = temp_db.save_project_scores(
+            sample_project.project_id,
+            {"discovery": 42.5},
+            {"discovery": {"goals": 3.0}},
+        )
+        loaded = temp_db.load_project(sample_project.project_id)
+
+        assert success is True
+        assert loaded.phase_maturity_scores["discovery"] == 42.5
+        assert loaded.category_scores["discovery"]["goals"] == 3.0
+        assert loaded.requirements == ["req1", "req2"]
+
 
 class TestProjectDatabaseUserOperations:
     """Tests for user management."""
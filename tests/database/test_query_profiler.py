@@ -0,0 +1,154 @@
+"""
+Tests for per-statement query profiling in ProjectDatabase.
+
+Tests cover:
+- SQL fingerprints group executions that differ only in literals
+- Every ProjectDatabase statement is recorded with its calling method
+- Sampling, with slow and failing statements always recorded
+- Row counts of recorded statements
+- Slow statements are logged with their EXPLAIN QUERY PLAN output
+- Profiling overhead on database throughput
+"""
+
+import datetime
+import logging
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+import pytest
+
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.database.query_profiler import QueryProfiler, fingerprint_sql
+from socratic_system.models import ProjectContext, User
+
+
+def _project(project_id="proj-1"):
+    now = datetime.datetime.now()
+    return ProjectContext(
+        project_id=project_id,
+        name="Project",
+        owner="owner",
+        phase="discovery",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _database(path, profiler):
+    db = ProjectDatabase(os.path.join(path, "test.db"), profiler=profiler)
+    db.save_user(
+        User(
+            username="owner",
+            email="owner@test.com",
+            passcode_hash="hash",
+            created_at=datetime.datetime.now(),
+        )
+    )
+    db.save_project(_project())
+    return db
+
+
+class TestFingerprint:
+    """Tests for fingerprint_sql()."""
+
+    def test_literals_and_lists_are_normalized(self):
+        assert fingerprint_sql(
+            "SELECT *  FROM t\n WHERE a = 'x''y' AND b = 42 AND c IN (?, ?, ?) AND t2.d > -1.5"
+        ) == ("SELECT * FROM t WHERE a = ? AND b = ? AND c IN (?+) AND t2.d > ?")
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert fingerprint_sql("SELECT col1 FROM table2") == "SELECT col1 FROM table2"
+
+
+class TestProfiledDatabase:
+    """Tests for ProjectDatabase statements routed through the profiler."""
+
+    def test_statements_recorded_with_callers_and_rows(self, tmpdir_path):
+        profiler = QueryProfiler(sample_rate=1.0)
+        db = _database(tmpdir_path, profiler)
+        profiler.reset_stats()
+
+        for _ in range(3):
+            db.load_project("proj-1")
+
+        stats = profiler.get_stats()["SELECT * FROM projects WHERE project_id = ?"]
+        assert stats["count"] == 3
+        assert stats["callers"] == {"ProjectDatabase.load_project": 3}
+        assert stats["sampled_rows"] == 3
+        assert stats["p99_time_ms"] >= stats["min_time_ms"]
+
+    def test_unsampled_statements_are_not_recorded(self, tmpdir_path):
+        profiler = QueryProfiler(sample_rate=0.0)
+        db = _database(tmpdir_path, profiler)
+
+        db.load_project("proj-1")
+
+        assert profiler.get_stats() == {}
+
+    def test_errors_are_counted(self, tmpdir_path):
+        profiler = QueryProfiler()
+        db = _database(tmpdir_path, profiler)
+
+        conn = db._connect()
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("SELECT * FROM missing_table")
+        conn.close()
+
+        assert profiler.get_stats()["SELECT * FROM missing_table"]["error_count"] == 1
+
+    def test_slow_queries_log_query_plan(self, tmpdir_path, caplog):
+        profiler = QueryProfiler(slow_query_threshold_ms=0.0, sample_rate=0.0)
+        db = _database(tmpdir_path, profiler)
+
+        with caplog.at_level(logging.WARNING, logger="socratic_system.database.query_profiler"):
+            db.load_project("proj-1")
+
+        stats = profiler.get_slow_queries()
+        load = next(s for s in stats if s["name"] == "SELECT * FROM projects WHERE project_id = ?")
+        assert any("USING INDEX" in step for step in load["query_plan"])
+        assert "ProjectDatabase.load_project" in caplog.text
+        assert "plan: ['SEARCH projects" in caplog.text
+
+
+def _round_time(db, iterations=20):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        db.load_project("proj-1")
+        db.get_user_projects("owner")
+    return time.perf_counter() - start
+
+
+class TestProfilerOverhead:
+    """Benchmark ProjectDatabase reads with and without statement profiling."""
+
+    def test_overhead_is_a_few_percent(self, tmpdir_path, monkeypatch):
+        db = _database(tmpdir_path, QueryProfiler())
+
+        def plain_connect(self):
+            return sqlite3.connect(self.db_path)
+
+        profiled_connect = ProjectDatabase._connect
+        plain, profiled = [], []
+        for _ in range(40):
+            monkeypatch.setattr(ProjectDatabase, "_connect", plain_connect)
+            plain.append(_round_time(db))
+            monkeypatch.setattr(ProjectDatabase, "_connect", profiled_connect)
+            profiled.append(_round_time(db))
+
+        # Adjacent rounds are compared so that drift in machine load cancels out
+        overhead = statistics.median(p / q for p, q in zip(profiled, plain, strict=True)) - 1
+        print("\nProjectDatabase read round (20 x load_project + get_user_projects), median:")
+        print(f"  Unprofiled: {statistics.median(plain) * 1000:.1f}ms")
+        print(f"  Profiled:   {statistics.median(profiled) * 1000:.1f}ms")
+        print(f"  Overhead:   {overhead:.1%}")
+
+        assert overhead < 0.05
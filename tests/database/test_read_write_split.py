@@ -0,0 +1,181 @@
+"""
+Tests for read/write connection routing in ProjectDatabase.
+
+Tests cover:
+- Reads reuse pooled read-only connections
+- Returned connections are reset (transaction, row factory)
+- Concurrent writers queue instead of failing with "database is locked"
+- Reads proceed while a write transaction is open
+- Throughput of mixed read/write load against a connection per call
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import pytest
+
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.database.query_profiler import QueryProfiler
+from socratic_system.database.read_write_split import DatabaseRole, SQLiteRouter, use_replica
+from socratic_system.models import ProjectContext, User
+
+
+def _project(project_id="proj-1"):
+    now = datetime.datetime.now()
+    return ProjectContext(
+        project_id=project_id,
+        name="Project",
+        owner="owner",
+        phase="discovery",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ProjectDatabase(os.path.join(tmpdir, "test.db"), profiler=QueryProfiler())
+        db.save_user(
+            User(
+                username="owner",
+                email="owner@test.com",
+                passcode_hash="hash",
+                created_at=datetime.datetime.now(),
+            )
+        )
+        db.save_project(_project())
+        yield db
+        db.close()
+
+
+class TestSQLiteRouter:
+    """Tests for SQLiteRouter connection checkout and release."""
+
+    def test_reads_reuse_read_only_connections(self, db):
+        db.load_project("proj-1")
+        opened = db.router.get_stats()["readers_opened"]
+        for _ in range(5):
+            assert db.load_project("proj-1").name == "Project"
+
+        stats = db.router.get_stats()
+        assert stats["readers_opened"] == opened
+        assert stats["idle_readers"] == opened
+
+        conn = db.router.connect(DatabaseRole.REPLICA)
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("DELETE FROM projects")
+        conn.close()
+
+        # The failed write left no lock behind on the returned reader
+        db.save_project(_project("proj-2"))
+        assert len(db.get_user_projects("owner")) == 2
+
+    def test_returned_connections_are_reset(self, db):
+        writer = db.router.connect()
+        writer.row_factory = sqlite3.Row
+        writer.execute("UPDATE projects SET name = 'Uncommitted'")
+        writer.close()
+        writer.close()
+
+        assert not writer.in_transaction
+        assert writer.row_factory is None
+        assert db.load_project("proj-1").name == "Project"
+        # The second close() did not release the lock a second time
+        assert db.router.connect() is writer
+        writer.close()
+
+    def test_decorated_reads_use_replica(self, db):
+        @use_replica()
+        def role():
+            conn = db.router.connect()
+            try:
+                return conn._role
+            finally:
+                conn.close()
+
+        assert role() is DatabaseRole.REPLICA
+        assert db.router.connect()._role is DatabaseRole.PRIMARY
+        db.router._writer.close()
+
+    def test_in_memory_database_shares_one_connection(self):
+        router = SQLiteRouter(":memory:")
+        conn = router.connect()
+        conn.execute("CREATE TABLE t (x)")
+        conn.close()
+
+        reader = router.connect(DatabaseRole.REPLICA)
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+        reader.close()
+        router.close()
+
+
+class TestConcurrentAccess:
+    """Tests for mixed reads and writes from several threads."""
+
+    def test_concurrent_writes_do_not_lock(self, db):
+        errors = []
+
+        def work(worker):
+            try:
+                for i in range(25):
+                    db.save_project(_project(f"proj-{worker}-{i}"))
+                    db.get_user_projects("owner")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(w,)) for w in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(db.get_user_projects("owner")) == 1 + 6 * 25
+
+    def test_reads_proceed_during_write_transaction(self, db):
+        writer = db.router.connect()
+        writer.execute("UPDATE projects SET name = 'Pending'")
+        result = []
+
+        reader = threading.Thread(target=lambda: result.append(db.load_project("proj-1")))
+        reader.start()
+        reader.join(timeout=5)
+
+        writer.commit()
+        writer.close()
+        assert result[0].name == "Project"
+        assert db.load_project("proj-1").name == "Pending"
+
+
+class TestRoutingThroughput:
+    """Benchmark mixed load with routed connections against a connection per call."""
+
+    def test_routed_connections_are_faster(self, db, monkeypatch):
+        def mixed_load(iterations=50):
+            start = time.perf_counter()
+            for i in range(iterations):
+                db.load_project("proj-1")
+                db.get_user_projects("owner")
+                db.load_user("owner")
+                if i % 5 == 0:
+                    db.save_project(_project())
+            return time.perf_counter() - start
+
+        routed = min(mixed_load() for _ in range(5))
+
+        def connect_per_call(self):
+            return sqlite3.connect(self.db_path)
+
+        monkeypatch.setattr(ProjectDatabase, "_connect", connect_per_call)
+        per_call = min(mixed_load() for _ in range(5))
+
+        print("\nMixed load (50 x 3 reads + 10 writes), best of 5:")
+        print(f"  Connection per call: {per_call * 1000:.1f}ms")
+        print(f"  Routed connections:  {routed * 1000:.1f}ms")
+
+        assert routed < per_call
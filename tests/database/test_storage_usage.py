@@ -0,0 +1,178 @@
+"""
+Tests for incrementally maintained storage usage counters.
+
+Tests cover:
+- Counters follow knowledge document saves, replacements and deletes
+- Project files count toward the project owner, including cascaded deletes
+- Reconciliation corrects drift and removes empty rows
+- Existing data is backfilled when the migration is applied
+- Storage quota checks read the counters instead of the documents
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from socratic_system.database.migration_runner import MigrationRunner
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.models import ProjectContext, User
+from socratic_system.subscription.storage import StorageQuotaManager
+
+
+def _project(project_id="proj-1", owner="owner"):
+    now = datetime.datetime.now()
+    return ProjectContext(
+        project_id=project_id,
+        name="Project",
+        owner=owner,
+        phase="discovery",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _user(username):
+    return User(
+        username=username,
+        email=f"{username}@test.com",
+        passcode_hash="hash",
+        created_at=datetime.datetime.now(),
+    )
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+        for username in ("owner", "other"):
+            db.save_user(_user(username))
+        db.save_project(_project())
+        yield db
+        db.close()
+
+
+def _add_file(db, path, size, project_id="proj-1"):
+    conn = sqlite3.connect(db.db_path)
+    conn.execute(
+        "INSERT OR REPLACE INTO project_files (id, project_id, file_path, file_size) "
+        "VALUES (?, ?, ?, ?)",
+        (f"{project_id}:{path}", project_id, path, size),
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestStorageCounters:
+    """Tests for counters maintained by triggers."""
+
+    def test_documents_update_counters(self, db):
+        db.save_knowledge_document("owner", "proj-1", "doc-1", content="héllo")
+        db.save_knowledge_document("owner", "proj-1", "doc-2", content="x", file_size=1000)
+        db.save_knowledge_document("other", "proj-1", "doc-3", content="abc")
+
+        assert db.get_user_storage_usage("owner")["document_bytes"] == 6 + 1000
+        assert db.get_project_storage_usage("proj-1")["document_count"] == 3
+
+        # Replacing a document counts only its new size
+        db.save_knowledge_document("owner", "proj-1", "doc-2", content="x", file_size=400)
+        db.delete_knowledge_document("doc-1")
+
+        usage = db.get_user_storage_usage("owner")
+        assert usage["document_bytes"] == 400
+        assert usage["document_count"] == 1
+        assert db.get_project_storage_usage("proj-1")["total_bytes"] == 403
+        assert db.reconcile_storage_usage() == 0
+
+    def test_project_files_count_toward_owner(self, db):
+        db.save_knowledge_document("other", "proj-1", "doc-1", content="abc")
+        _add_file(db, "a.py", 300)
+        _add_file(db, "b.py", 200)
+        _add_file(db, "a.py", 100)
+
+        assert db.get_user_storage_usage("owner")["file_bytes"] == 300
+        assert db.get_user_storage_usage("other")["total_bytes"] == 3
+        assert db.get_project_storage_usage("proj-1")["file_count"] == 2
+
+        assert db.delete_project("proj-1")
+
+        assert db.get_user_storage_usage("owner")["total_bytes"] == 0
+        assert db.get_user_storage_usage("other")["total_bytes"] == 0
+        assert db.reconcile_storage_usage() == 0
+        assert db.get_project_storage_usage("proj-1")["total_bytes"] == 0
+
+    def test_unknown_user_has_no_usage(self, db):
+        assert db.get_user_storage_usage("nobody") == {
+            "document_bytes": 0,
+            "document_count": 0,
+            "file_bytes": 0,
+            "file_count": 0,
+            "total_bytes": 0,
+        }
+
+
+class TestReconciliation:
+    """Tests for reconcile_storage_usage() and the migration backfill."""
+
+    def test_drift_is_corrected(self, db):
+        db.save_knowledge_document("owner", "proj-1", "doc-1", content="abc")
+        _add_file(db, "a.py", 300)
+
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("UPDATE user_storage_usage SET document_bytes = 999 WHERE user_id = 'owner'")
+        conn.execute("UPDATE projects SET owner = 'other' WHERE project_id = 'proj-1'")
+        conn.commit()
+        conn.close()
+
+        assert db.reconcile_storage_usage() == 3
+        assert db.get_user_storage_usage("owner")["total_bytes"] == 3
+        assert db.get_user_storage_usage("other")["file_bytes"] == 300
+        assert db.reconcile_storage_usage() == 0
+
+    def test_migration_backfills_existing_data(self, db):
+        db.save_knowledge_document("owner", "proj-1", "doc-1", content="abc")
+        _add_file(db, "a.py", 300)
+
+        conn = sqlite3.connect(db.db_path)
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_%storage%'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("DELETE FROM user_storage_usage")
+        conn.execute("DELETE FROM project_storage_usage")
+        conn.commit()
+        conn.close()
+
+        success, _ = MigrationRunner(db.db_path).ensure_migrations_applied()
+
+        assert success
+        assert db.get_user_storage_usage("owner")["total_bytes"] == 303
+        assert db.get_project_storage_usage("proj-1")["file_count"] == 1
+        _add_file(db, "b.py", 50)
+        assert db.get_user_storage_usage("owner")["file_bytes"] == 350
+
+
+class TestStorageQuota:
+    """Tests for StorageQuotaManager on top of the counters."""
+
+    def test_quota_check_reads_counters(self, db, monkeypatch):
+        db.save_knowledge_document("owner", "proj-1", "doc-1", content="x", file_size=2048)
+
+        def no_scan(*args, **kwargs):
+            raise AssertionError("quota check loaded the user's documents")
+
+        monkeypatch.setattr(db, "get_user_knowledge_documents", no_scan)
+        user = db.load_user("owner")
+
+        assert StorageQuotaManager.calculate_user_storage_usage("owner", db) == 2048
+        assert StorageQuotaManager.can_upload_document(user, db, 1024) == (True, None)
+        limit = StorageQuotaManager.gb_to_bytes(StorageQuotaManager.get_storage_limit_gb("free"))
+        allowed, message = StorageQuotaManager.can_upload_document(user, db, limit)
+        assert not allowed
+        assert "Storage quota exceeded" in message
+
+        report = StorageQuotaManager.get_storage_usage_report("owner", db)
+        assert report["storage_used_bytes"] == 2048
+        assert report["document_count"] == 1
@@ -0,0 +1,189 @@
+"""
+Tests for the batched audit log writer.
+
+Tests cover:
+- Routine entries are committed in batches by the background writer
+- Alert/critical entries and sync mode bypass the queue
+- Time-triggered flushes and flush-on-close
+- Backpressure falls back to synchronous writes instead of dropping entries
+- Single and batch inserts into the ProjectDatabase audit_logs table
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import pytest
+
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.security.audit_logger import AuditLogger, AuditSeverity
+
+
+class RecordingDB:
+    """Audit store that records single and batched inserts."""
+
+    def __init__(self, delay: float = 0.0, gate: threading.Event | None = None):
+        self.delay = delay
+        self.gate = gate
+        self.single: list[dict] = []
+        self.batches: list[list[dict]] = []
+
+    def insert_audit_log(self, entry):
+        time.sleep(self.delay)
+        self.single.append(entry)
+
+    def insert_audit_logs(self, entries):
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.batches.append(entries)
+
+    @property
+    def total(self):
+        return len(self.single) + sum(len(batch) for batch in self.batches)
+
+
+def _log(audit, i=0, severity=AuditSeverity.INFO.value):
+    return audit.log_event(
+        event_type="agent_action_allowed",
+        actor_id=f"agent{i}",
+        actor_type="agent",
+        action="read",
+        resource="agent:test",
+        resource_type="agent",
+        severity=severity,
+    )
+
+
+class TestBatchedWriter:
+    """Tests for batched durability."""
+
+    def test_entries_are_batched(self):
+        db = RecordingDB()
+        audit = AuditLogger(db, durability="batched", batch_size=10, flush_interval=5)
+
+        for i in range(25):
+            _log(audit, i)
+        audit.close()
+
+        assert db.single == []
+        assert [len(batch) for batch in db.batches] == [10, 10, 5]
+        assert audit.get_metrics()["batched_writes"] == 25
+
+    def test_time_trigger_commits_partial_batch(self):
+        db = RecordingDB()
+        audit = AuditLogger(db, durability="batched", batch_size=100, flush_interval=0.05)
+
+        _log(audit)
+        time.sleep(0.3)
+
+        assert db.total == 1
+        audit.close()
+
+    def test_critical_events_are_synchronous(self):
+        db = RecordingDB()
+        audit = AuditLogger(db, durability="batched")
+
+        _log(audit, severity=AuditSeverity.CRITICAL.value)
+        audit.log_event(
+            event_type="config_changed",
+            actor_id="admin",
+            actor_type="user",
+            action="update",
+            resource="system",
+            resource_type="system",
+            durability="sync",
+        )
+
+        assert len(db.single) == 2
+        audit.close()
+
+    def test_flush_waits_for_writer(self):
+        db = RecordingDB(delay=0.05)
+        audit = AuditLogger(db, durability="batched", batch_size=5, flush_interval=5)
+
+        for i in range(12):
+            _log(audit, i)
+
+        assert audit.flush(timeout=5)
+        assert db.total == 12
+        audit.close()
+
+    def test_backpressure_falls_back_to_sync(self):
+        gate = threading.Event()
+        db = RecordingDB(gate=gate)
+        audit = AuditLogger(
+            db,
+            durability="batched",
+            batch_size=1,
+            max_queue_size=2,
+            enqueue_timeout=0.01,
+        )
+
+        for i in range(10):
+            _log(audit, i)
+        gate.set()
+        audit.close()
+
+        metrics = audit.get_metrics()
+        assert db.total == 10
+        assert metrics["backpressure_events"] > 0
+        assert metrics["sync_writes"] > 0
+        assert metrics["queue_high_watermark"] <= 2
+
+    def test_logging_after_close_is_synchronous(self):
+        db = RecordingDB()
+        audit = AuditLogger(db, durability="batched")
+        _log(audit)
+        audit.close()
+
+        _log(audit)
+
+        assert db.total == 2
+        assert len(db.single) == 1
+
+
+@pytest.fixture
+def project_db():
+    """Create a temporary ProjectDatabase."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+        yield db
+        db.close()
+
+
+class TestBatchInsert:
+    """Tests for audit_logs inserts through ProjectDatabase."""
+
+    def test_insert_audit_logs_commits_batch(self, project_db):
+        audit = AuditLogger(project_db, durability="batched", batch_size=50)
+
+        for i in range(20):
+            _log(audit, i)
+        audit.close()
+
+        with sqlite3.connect(project_db.db_path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM audit_logs").fetchone()[0]
+        assert count == 20
+
+    def test_sync_and_batched_details_are_stored_alike(self, project_db):
+        details = {"reason": "test", "score": 0.5}
+        for durability in ("sync", "batched"):
+            audit = AuditLogger(project_db, durability=durability)
+            audit.log_event(
+                event_type="agent_action_allowed",
+                actor_id=durability,
+                actor_type="agent",
+                action="read",
+                resource="agent:test",
+                resource_type="agent",
+                details=details,
+            )
+            audit.close()
+
+        with sqlite3.connect(project_db.db_path) as conn:
+            stored = dict(conn.execute("SELECT actor_id, details FROM audit_logs").fetchall())
+        assert stored["sync"] == stored["batched"]
+        assert project_db.query_audit_logs(filters={"actor_id": "sync"})[0]["details"] == details
@@ -0,0 +1,297 @@
+"""
+Tests for the SQLite-backed durable job queue.
+
+Tests cover:
+- Priorities and per-queue concurrency limits
+- Lease expiry recovery and retry with backoff
+- Result persistence across queue instances (restarts)
+- Worker execution, timeouts and cancellation
+- Completion waits woken by settlement in this or another process
+- Several worker processes sharing one database
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from socratic_system.events import DurableJobQueue, JobStatus, JobWorker
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def queue(db_path):
+    return DurableJobQueue(db_path, retry_backoff=0.0)
+
+
+class TestDurableJobQueue:
+    """Tests for queue operations."""
+
+    def test_claims_by_priority_then_fifo(self, queue):
+        low = queue.enqueue("task", {"n": 1})
+        high = queue.enqueue("task", {"n": 2}, priority=5)
+        low2 = queue.enqueue("task", {"n": 3})
+
+        claimed = [queue.claim("w1").job_id for _ in range(3)]
+
+        assert claimed == [high, low, low2]
+        assert queue.claim("w1") is None
+
+    def test_queue_concurrency_limit(self, db_path):
+        queue = DurableJobQueue(db_path, queue_limits={"imports": 1})
+        queue.enqueue("task", queue="imports")
+        queue.enqueue("task", queue="imports")
+        other = queue.enqueue("task", queue="analysis")
+
+        first = queue.claim("w1")
+        second = queue.claim("w2")
+
+        assert first.queue == "imports"
+        assert second.job_id == other
+        assert queue.claim("w3") is None
+
+        queue.complete(first.job_id, "w1", {"ok": True})
+        assert queue.claim("w3").queue == "imports"
+
+    def test_expired_lease_is_retried_by_another_worker(self, queue):
+        job_id = queue.enqueue("task", max_attempts=2)
+        queue.claim("crashed", visibility_timeout=0.01)
+        time.sleep(0.05)
+
+        reclaimed = queue.claim("w2")
+
+        assert reclaimed.job_id == job_id
+        assert reclaimed.attempts == 2
+        assert not queue.complete(job_id, "crashed", "late result")
+        assert queue.complete(job_id, "w2", "result")
+        assert queue.get_job_status(job_id).result == "result"
+        assert queue.metrics["lease_expirations"] == 1
+
+    def test_expired_lease_without_attempts_left_fails(self, queue):
+        job_id = queue.enqueue("task", max_attempts=1)
+        queue.claim("crashed", visibility_timeout=0.01)
+        time.sleep(0.05)
+
+        assert queue.claim("w2") is None
+        status = queue.get_job_status(job_id)
+        assert status.status == JobStatus.FAILED
+        assert "Lease expired" in status.error
+
+    def test_failed_attempts_retry_with_backoff(self, db_path):
+        queue = DurableJobQueue(db_path, retry_backoff=0.05)
+        job_id = queue.enqueue("task", max_attempts=2)
+
+        queue.fail(queue.claim("w1").job_id, "w1", "boom")
+        assert queue.claim("w1") is None
+
+        time.sleep(0.06)
+        queue.fail(queue.claim("w1").job_id, "w1", "boom again")
+
+        status = queue.get_job_status(job_id)
+        assert status.status == JobStatus.FAILED
+        assert status.error == "boom again"
+        assert status.metadata["attempts"] == 2
+
+    def test_results_survive_restart(self, db_path, queue):
+        job_id = queue.enqueue("task", {"x": 1}, name="export", metadata={"user": "alice"})
+        queue.complete(queue.claim("w1").job_id, "w1", {"rows": 3})
+
+        status = DurableJobQueue(db_path).get_job_status(job_id)
+
+        assert status.status == JobStatus.COMPLETED
+        assert status.result == {"rows": 3}
+        assert status.metadata["name"] == "export"
+        assert status.metadata["user"] == "alice"
+        assert status.duration_ms >= 0
+
+    def test_batch_status_and_purge(self, queue):
+        done = queue.enqueue("task")
+        pending = queue.enqueue("task", delay=60)
+        queue.complete(queue.claim("w1").job_id, "w1")
+
+        assert set(queue.get_jobs([done, pending, "missing"])) == {done, pending}
+        assert queue.purge(older_than_seconds=0) == 1
+        assert queue.get_job_status(done) is None
+        assert queue.get_metrics()["queues"]["default"] == {"pending": 1}
+
+
+class TestJobWorker:
+    """Tests for the async worker."""
+
+    @pytest.mark.asyncio
+    async def test_runs_async_and_sync_tasks(self, queue):
+        async def add(payload):
+            return payload["a"] + payload["b"]
+
+        queue.register_task("add", add)
+        queue.register_task("upper", lambda payload: payload["s"].upper())
+        add_id = queue.enqueue("add", {"a": 1, "b": 2})
+        upper_id = queue.enqueue("upper", {"s": "hi"})
+        unknown_id = queue.enqueue("missing")
+
+        worker = JobWorker(queue, concurrency=2, poll_interval=0.01)
+        while await worker.run_once():
+            pass
+
+        assert queue.get_job_status(add_id).result == 3
+        assert queue.get_job_status(upper_id).result == "HI"
+        assert "Unknown task" in queue.get_job_status(unknown_id).error
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, queue):
+        async def slow(payload):
+            await asyncio.sleep(1)
+
+        queue.register_task("slow", slow)
+        job_id = queue.enqueue("slow", timeout=0.05, max_attempts=1)
+
+        await JobWorker(queue).run_once()
+
+        assert queue.get_job_status(job_id).status == JobStatus.TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_stops_on_heartbeat(self, queue):
+        started = asyncio.Event()
+
+        async def long_running(payload):
+            started.set()
+            await asyncio.sleep(5)
+
+        queue.register_task("long", long_running)
+        job_id = queue.enqueue("long")
+        worker = JobWorker(queue, poll_interval=0.01, visibility_timeout=0.06)
+        await worker.start()
+        await asyncio.wait_for(started.wait(), 2)
+
+        queue.cancel(job_id)
+        await asyncio.sleep(0.2)
+
+        assert not worker._running
+        assert queue.get_job_status(job_id).status == JobStatus.CANCELLED
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_long_jobs_leased(self, queue):
+        async def slowish(payload):
+            await asyncio.sleep(0.2)
+            return "done"
+
+        queue.register_task("slowish", slowish)
+        job_id = queue.enqueue("slowish")
+
+        await JobWorker(queue, visibility_timeout=0.06).run_once()
+
+        assert queue.get_job_status(job_id).result == "done"
+        assert queue.metrics["lease_expirations"] == 0
+
+
+class TestCompletionWaits:
+    """Tests for wait_for_jobs()."""
+
+    @pytest.mark.asyncio
+    async def test_wakes_when_job_settles_in_process(self, db_path):
+        queue = DurableJobQueue(db_path, watch_interval=10)
+        job_id = queue.enqueue("task")
+        job = queue.claim("w1")
+
+        async def finish():
+            await asyncio.sleep(0.05)
+            await asyncio.to_thread(queue.complete, job.job_id, "w1", "done")
+
+        start = time.perf_counter()
+        asyncio.create_task(finish())
+        results = await queue.wait_for_jobs([job_id], timeout=5)
+
+        assert time.perf_counter() - start < 1
+        assert results[job_id].result == "done"
+        assert queue._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_one_watcher_sees_other_process_completions(self, db_path):
+        queue = DurableJobQueue(db_path, watch_interval=0.02)
+        other_process = DurableJobQueue(db_path)
+        job_ids = [queue.enqueue("task") for _ in range(3)]
+        for _ in job_ids:
+            other_process.claim("w1")
+
+        async def finish():
+            await asyncio.sleep(0.05)
+            for job_id in job_ids:
+                other_process.complete(job_id, "w1", job_id)
+
+        asyncio.create_task(finish())
+        waits = await asyncio.gather(
+            *(queue.wait_for_jobs([job_id], timeout=5) for job_id in job_ids)
+        )
+
+        assert [w[job_id].result for w, job_id in zip(waits, job_ids, strict=True)] == job_ids
+
+    @pytest.mark.asyncio
+    async def test_any_returns_after_first_completion(self, queue):
+        first, second = queue.enqueue("task"), queue.enqueue("task")
+        job = queue.claim("w1")
+        queue.claim("w1")
+
+        asyncio.get_running_loop().call_later(
+            0.05, lambda: asyncio.create_task(asyncio.to_thread(queue.cancel, job.job_id))
+        )
+        results = await queue.wait_for_jobs([first, second, "missing"], 5, return_when="any")
+
+        assert results[first].status == JobStatus.CANCELLED
+        assert results[second].status == JobStatus.RUNNING
+        assert "missing" not in results
+
+    @pytest.mark.asyncio
+    async def test_times_out_with_current_status(self, queue):
+        job_id = queue.enqueue("task")
+
+        start = time.perf_counter()
+        results = await queue.wait_for_jobs([job_id], timeout=0.05)
+
+        assert time.perf_counter() - start < 0.5
+        assert results[job_id].status == JobStatus.PENDING
+
+
+def _record_pid(payload):
+    time.sleep(0.02)
+    return os.getpid()
+
+
+def _serve(db_path, deadline):
+    queue = DurableJobQueue(db_path)
+    queue.register_task("record_pid", _record_pid)
+    worker = JobWorker(queue, concurrency=2, poll_interval=0.01)
+
+    async def run():
+        await worker.start()
+        while time.time() < deadline and queue.get_metrics()["queues"]["default"].get("pending"):
+            await asyncio.sleep(0.02)
+        await worker.stop()
+
+    asyncio.run(run())
+
+
+class TestMultipleProcesses:
+    """Tests for workers in separate processes sharing the database."""
+
+    def test_jobs_are_claimed_exactly_once(self, db_path, queue):
+        job_ids = [queue.enqueue("record_pid") for _ in range(30)]
+        context = multiprocessing.get_context("fork")
+        deadline = time.time() + 30
+        processes = [context.Process(target=_serve, args=(db_path, deadline)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+
+        results = queue.get_jobs(job_ids)
+
+        assert all(r.status == JobStatus.COMPLETED for r in results.values())
+        assert all(r.metadata["attempts"] == 1 for r in results.values())
+        assert {r.result for r in results.values()} <= {p.pid for p in processes}
@@ -0,0 +1,156 @@
+"""
+Tests for envelope encryption and the decrypted-credential cache.
+
+Tests cover:
+- Envelope format round-trips
+- Legacy (salted and plain Fernet) ciphertexts still decrypt
+- CredentialCache TTL, size bound and zeroization
+- Lazy re-wrap of legacy API keys in ProjectDatabase
+"""
+
+import base64
+import os
+import tempfile
+import time
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from socratic_system.encryption import (
+    ENVELOPE_PREFIX,
+    CredentialCache,
+    decrypt_credential,
+    decrypt_data,
+    encrypt_data,
+    is_legacy_ciphertext,
+)
+
+SECRET = "test-encryption-secret"
+
+
+def _legacy_encrypt(data: str, secret: str, salt: bytes | None = None) -> str:
+    """Encrypt the way releases before envelope encryption did."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt if salt is not None else b"\x00" * 16,
+        iterations=100000,
+        backend=default_backend(),
+    )
+    token = Fernet(base64.urlsafe_b64encode(kdf.derive(secret.encode()))).encrypt(data.encode())
+    if salt is None:
+        return token.decode()
+    return f"{base64.urlsafe_b64encode(salt).decode()}:{token.decode()}"
+
+
+class TestEnvelopeEncryption:
+    """Tests for encrypt_data/decrypt_data."""
+
+    def test_round_trip(self):
+        encrypted = encrypt_data("sk-secret", SECRET)
+
+        assert encrypted.startswith(f"{ENVELOPE_PREFIX}:")
+        assert not is_legacy_ciphertext(encrypted)
+        assert decrypt_data(encrypted, SECRET) == "sk-secret"
+
+    def test_each_record_gets_own_data_key(self):
+        first = encrypt_data("same", SECRET)
+        second = encrypt_data("same", SECRET)
+
+        assert first.split(":")[1] != second.split(":")[1]
+
+    def test_wrong_secret_fails(self):
+        encrypted = encrypt_data("sk-secret", SECRET)
+
+        with pytest.raises(RuntimeError):
+            decrypt_data(encrypted, "another-secret")
+
+    def test_legacy_salted_format_decrypts(self):
+        encrypted = _legacy_encrypt("sk-old", SECRET, salt=os.urandom(16))
+
+        assert is_legacy_ciphertext(encrypted)
+        assert decrypt_data(encrypted, SECRET) == "sk-old"
+
+    def test_legacy_plain_format_decrypts(self):
+        encrypted = _legacy_encrypt("sk-older", SECRET)
+
+        assert is_legacy_ciphertext(encrypted)
+        assert decrypt_data(encrypted, SECRET) == "sk-older"
+
+
+class TestCredentialCache:
+    """Tests for CredentialCache."""
+
+    def test_hit_after_put(self):
+        cache = CredentialCache(max_entries=4, ttl_seconds=60)
+        cache.put("k", "value")
+
+        assert cache.get("k") == "value"
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entry_is_zeroized(self):
+        cache = CredentialCache(max_entries=4, ttl_seconds=0.01)
+        cache.put("k", "value")
+        buffer = cache._entries["k"][0]
+
+        time.sleep(0.02)
+
+        assert cache.get("k") is None
+        assert buffer == bytearray(len("value"))
+
+    def test_eviction_is_bounded_and_zeroizes(self):
+        cache = CredentialCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", "aaa")
+        buffer = cache._entries["a"][0]
+        cache.put("b", "bbb")
+        cache.put("c", "ccc")
+
+        assert cache.stats()["size"] == 2
+        assert cache.get("a") is None
+        assert buffer == bytearray(3)
+
+    def test_clear_zeroizes(self):
+        cache = CredentialCache()
+        cache.put("k", "value")
+        buffer = cache._entries["k"][0]
+
+        cache.clear()
+
+        assert buffer == bytearray(len("value"))
+        assert cache.stats()["size"] == 0
+
+    def test_decrypt_credential_uses_cache(self):
+        from socratic_system.encryption import credential_cache
+
+        encrypted = encrypt_data("sk-cached", SECRET)
+        credential_cache.clear()
+
+        assert decrypt_credential(encrypted, SECRET) == "sk-cached"
+        hits = credential_cache.stats()["hits"]
+        assert decrypt_credential(encrypted, SECRET) == "sk-cached"
+        assert credential_cache.stats()["hits"] == hits + 1
+
+
+class TestLazyRewrap:
+    """Tests for re-wrapping legacy API keys on read."""
+
+    def test_legacy_key_is_rewrapped(self, monkeypatch):
+        from socratic_system.database.project_db import ProjectDatabase
+
+        monkeypatch.setenv("SOCRATES_ENCRYPTION_KEY", SECRET)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+            db.save_llm_config("alice", "claude", {"is_default": True, "enabled": True})
+            legacy = _legacy_encrypt("sk-legacy", SECRET, salt=os.urandom(16))
+            db.save_api_key("alice", "claude", legacy, "hash")
+
+            config = db.get_user_active_llm_config_with_credentials("alice")
+
+            assert config["api_key"] == "sk-legacy"
+            stored = db.get_api_key("alice", "claude")
+            assert not is_legacy_ciphertext(stored)
+            assert decrypt_data(stored) == "sk-legacy"
@@ -0,0 +1,207 @@
+"""
+Tests for the AgentBus governance fast path.
+
+Tests cover:
+- Allowlisted low-risk actions skip the governor
+- Repeated requests reuse cached verdicts (including denials)
+- High-risk actions are always fully evaluated
+- Payload objects are fingerprinted by value, or not cached at all
+- Policy changes invalidate cached decisions
+- Governance overhead metrics
+"""
+
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from socratic_system.events import EventEmitter
+from socratic_system.messaging import GovernanceDecisionCache, GovernancePolicy
+from socratic_system.messaging.agent_bus import AgentBus
+from socratic_system.messaging.agent_registry import AgentRegistry
+from socratic_system.models import ProjectContext
+
+POLICY = {
+    "low_risk": {"analytics": ["get_*"], "*": ["list_*"]},
+    "high_risk_actions": ["delete_*"],
+}
+
+
+class CountingGovernor:
+    """Governor stub that counts evaluations and denies configured actions."""
+
+    constitution = None
+
+    def __init__(self, denied=()):
+        self.denied = set(denied)
+        self.evaluations = 0
+
+    async def evaluate(self, action, actor="", context=None, purpose=""):
+        self.evaluations += 1
+        await asyncio.sleep(0)
+        allowed = action not in self.denied
+        return SimpleNamespace(allowed=allowed, reasoning="" if allowed else "not permitted")
+
+
+def _bus(governor, policy=POLICY):
+    registry = AgentRegistry()
+    bus = AgentBus(
+        event_emitter=EventEmitter(),
+        registry=registry,
+        governor=governor,
+        governance_policy=GovernancePolicy.from_dict(policy),
+        default_timeout=2.0,
+    )
+
+    async def handler(request):
+        return {"status": "success", "action": request.get("action")}
+
+    for agent in ("analytics", "projects"):
+        registry.register(agent, handler=handler)
+    return bus
+
+
+def _project(now, **fields):
+    return ProjectContext(
+        project_id="p1",
+        name="Project",
+        owner="alice",
+        phase="discovery",
+        created_at=now,
+        updated_at=now,
+        **fields,
+    )
+
+
+class TestGovernancePolicy:
+    """Tests for policy matching."""
+
+    def test_wildcards_and_high_risk_override(self):
+        policy = GovernancePolicy.from_dict(
+            {"low_risk": {"*": ["get_*", "delete_cache"]}, "high_risk_actions": ["delete_*"]}
+        )
+
+        assert policy.is_low_risk("any_agent", "get_status")
+        assert not policy.is_low_risk("any_agent", "update_status")
+        assert not policy.is_low_risk("any_agent", "delete_cache")
+
+    def test_version_tracks_content(self):
+        assert (
+            GovernancePolicy.from_dict(POLICY).version == GovernancePolicy.from_dict(POLICY).version
+        )
+        assert GovernancePolicy.from_dict(POLICY).version != GovernancePolicy.from_dict({}).version
+
+
+class TestDecisionCache:
+    """Tests for fingerprinting and cache bounds."""
+
+    def test_fingerprint_ignores_volatile_keys_and_order(self):
+        first = GovernanceDecisionCache.fingerprint(
+            "a", "act", {"x": 1, "y": [1, 2], "request_id": "r1"}, "v1"
+        )
+        second = GovernanceDecisionCache.fingerprint(
+            "a", "act", {"y": [1, 2], "x": 1, "request_id": "r2"}, "v1"
+        )
+
+        assert first == second
+        assert first != GovernanceDecisionCache.fingerprint("a", "act", {"x": 1}, "v2")
+
+    def test_dataclasses_are_fingerprinted_by_field_values(self):
+        now = datetime.datetime.now()
+        project = _project(now, goals="Ship it")
+        same = _project(now, goals="Ship it")
+        edited = _project(now, goals="Rewrite it")
+
+        key = GovernanceDecisionCache.fingerprint("a", "act", {"project": project}, "v")
+
+        assert key == GovernanceDecisionCache.fingerprint("a", "act", {"project": same}, "v")
+        assert key != GovernanceDecisionCache.fingerprint("a", "act", {"project": edited}, "v")
+
+    def test_other_objects_are_not_fingerprinted(self):
+        project = SimpleNamespace(project_id="p1")
+
+        with pytest.raises(TypeError):
+            GovernanceDecisionCache.fingerprint("a", "act", {"project": project}, "v")
+
+    def test_bounded(self):
+        cache = GovernanceDecisionCache(max_size=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, True, None)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestAgentBusFastPath:
+    """Tests for governance checks on the bus."""
+
+    @pytest.mark.asyncio
+    async def test_allowlisted_actions_skip_governor(self):
+        governor = CountingGovernor()
+        bus = _bus(governor)
+
+        result = await bus.send_request("analytics", {"action": "get_trends"})
+
+        assert result["status"] == "success"
+        assert governor.evaluations == 0
+        assert bus.metrics["governance_fast_path"] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_hit_cache(self):
+        governor = CountingGovernor(denied={"archive"})
+        bus = _bus(governor)
+
+        for _ in range(3):
+            await bus.send_request("projects", {"action": "update", "project_id": "p1"})
+            denied = await bus.send_request("projects", {"action": "archive"})
+
+        assert governor.evaluations == 2
+        assert denied["code"] == "governance_denied"
+        assert bus.metrics["governance_cache_hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_high_risk_actions_always_evaluated(self):
+        governor = CountingGovernor()
+        bus = _bus(governor, {**POLICY, "low_risk": {"*": ["delete_*"]}})
+
+        for _ in range(3):
+            await bus.send_request("projects", {"action": "delete_project", "project_id": "p1"})
+
+        assert governor.evaluations == 3
+        assert bus.governance_cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unfingerprintable_requests_are_not_cached(self):
+        governor = CountingGovernor()
+        bus = _bus(governor)
+
+        for _ in range(2):
+            await bus.send_request("projects", {"action": "update", "project": object()})
+
+        assert governor.evaluations == 2
+        assert bus.governance_cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_policy_change_invalidates_cache(self):
+        governor = CountingGovernor()
+        bus = _bus(governor)
+
+        await bus.send_request("projects", {"action": "update"})
+        bus.set_governance_policy(GovernancePolicy.from_dict({**POLICY, "cache_size": 10}))
+        await bus.send_request("projects", {"action": "update"})
+
+        assert governor.evaluations == 2
+
+    @pytest.mark.asyncio
+    async def test_overhead_metrics(self):
+        bus = _bus(CountingGovernor())
+
+        await bus.send_request("projects", {"action": "update"})
+        await bus.send_request("analytics", {"action": "get_trends"})
+        metrics = bus.get_metrics()
+
+        assert metrics["governance_checks"] == 2
+        assert metrics["governance_full_evaluations"] == 1
+        assert metrics["governance_avg_overhead_ms"] >= 0
+        assert metrics["governance_cache"]["size"] == 1
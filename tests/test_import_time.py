@@ -0,0 +1,80 @@
+"""
+Import-time regression tests.
+
+Importing the library and running trivial CLI commands must not load the
+LLM SDKs, the vector store stack (chromadb, sentence transformers, torch) or
+the agent system. Each check runs in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+CLI_SRC = REPO_ROOT / "socrates-cli" / "src"
+
+HEAVY_MODULES = (
+    "anthropic",
+    "chromadb",
+    "sentence_transformers",
+    "torch",
+    "socratic_agents",
+    "socratic_system.orchestration.orchestrator",
+)
+
+# Generous wall-clock budget; a regression that loads torch takes ~10s
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _run(code: str) -> tuple[str, float]:
+    """Run code in a fresh interpreter, returning stdout and elapsed seconds."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path[:0] = [{str(CLI_SRC)!r}]\n{code}"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=120,
+    )
+    elapsed = time.perf_counter() - start
+    assert result.returncode == 0, result.stderr
+    return result.stdout, elapsed
+
+
+def _loaded_heavy_modules() -> str:
+    return f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+
+
+@pytest.mark.benchmark
+class TestImportTime:
+    """Import cost of the library and CLI."""
+
+    def test_package_import_is_light(self):
+        stdout, elapsed = _run(f"import socratic_system\n{_loaded_heavy_modules()}")
+
+        assert stdout.strip() == ""
+        assert elapsed < IMPORT_BUDGET_SECONDS
+
+    @pytest.mark.parametrize("args", [["--help"], ["--version"], ["project", "--help"]])
+    def test_trivial_cli_commands_are_light(self, args):
+        stdout, elapsed = _run(
+            "from click.testing import CliRunner\n"
+            "from socrates_cli.cli import main\n"
+            f"assert CliRunner().invoke(main, {args!r}).exit_code == 0\n"
+            f"{_loaded_heavy_modules()}"
+        )
+
+        assert stdout.strip() == ""
+        assert elapsed < IMPORT_BUDGET_SECONDS
+
+    def test_lazy_exports_resolve(self):
+        stdout, _ = _run(
+            "import socratic_system\n"
+            "from socratic_system.database import VectorDatabase\n"
+            "print(socratic_system.AgentOrchestrator.__name__, VectorDatabase.__name__)"
+        )
+
+        assert stdout.split() == ["AgentOrchestrator", "VectorDatabase"]
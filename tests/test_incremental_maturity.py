@@ -0,0 +1,216 @@
+"""
+Tests for incremental maturity and rolling analytics aggregates.
+
+Tests cover:
+- Applying spec additions/removals matches a full rebuild
+- Untouched categories keep their materialized scores
+- ProgressionStats velocity/plateaus match the history-scan semantics
+- Materialized state round-trips through ProjectDatabase
+- QualityService rescoring from materialized scores
+"""
+
+import datetime
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from socratic_system.core.analytics_calculator import AnalyticsCalculator, ProgressionStats
+from socratic_system.core.maturity_calculator import MaturityCalculator
+from socratic_system.database.project_db import ProjectDatabase
+from socratic_system.models import ProjectContext, User
+from socratic_system.services.quality_service import QualityService
+
+
+def _spec(category, confidence=0.9, value=1.0):
+    return {"category": category, "content": category, "confidence": confidence, "value": value}
+
+
+SPECS = [
+    _spec("goals"),
+    _spec("goals", 0.7),
+    _spec("scope", 0.8, 2.0),
+    _spec("problem_definition"),
+    _spec("unknown_category"),
+]
+
+
+class TestIncrementalMaturity:
+    """Tests for MaturityCalculator incremental updates."""
+
+    def test_incremental_matches_full_rebuild(self):
+        calc = MaturityCalculator()
+        scores = calc.materialize_category_scores(SPECS[:2], "discovery")
+
+        updated = calc.apply_spec_changes(scores, "discovery", added_specs=SPECS[2:])
+        incremental = calc.maturity_from_scores(updated, "discovery")
+        full = calc.calculate_phase_maturity(SPECS, "discovery")
+
+        assert incremental.overall_score == pytest.approx(full.overall_score)
+        for category, score in full.category_scores.items():
+            assert incremental.category_scores[category].current_score == pytest.approx(
+                score.current_score
+            )
+            assert incremental.category_scores[category].spec_count == score.spec_count
+
+    def test_untouched_categories_are_reused(self):
+        calc = MaturityCalculator()
+        scores = calc.materialize_category_scores(SPECS, "discovery")
+
+        updated = calc.apply_spec_changes(scores, "discovery", added_specs=[_spec("goals")])
+
+        assert updated["scope"] is scores["scope"]
+        assert updated["goals"] is not scores["goals"]
+        assert updated["goals"]["spec_count"] == scores["goals"]["spec_count"] + 1
+
+    def test_removal_restores_previous_scores(self):
+        calc = MaturityCalculator()
+        scores = calc.materialize_category_scores(SPECS, "discovery")
+
+        added = calc.apply_spec_changes(scores, "discovery", added_specs=[_spec("goals", 0.5)])
+        removed = calc.apply_spec_changes(added, "discovery", removed_specs=[_spec("goals", 0.5)])
+
+        assert removed["goals"]["current_score"] == pytest.approx(scores["goals"]["current_score"])
+        assert removed["goals"]["confidence"] == pytest.approx(scores["goals"]["confidence"])
+
+    def test_score_stays_capped_at_target(self):
+        calc = MaturityCalculator()
+        scores = calc.materialize_category_scores([], "discovery")
+
+        updated = calc.apply_spec_changes(
+            scores, "discovery", added_specs=[_spec("success_metrics", 1.0, 20.0)]
+        )
+
+        assert updated["success_metrics"]["current_score"] == 8
+        assert updated["success_metrics"]["weighted_sum"] == 20.0
+
+    def test_legacy_scores_require_rebuild(self):
+        calc = MaturityCalculator()
+
+        assert calc.apply_spec_changes(None, "discovery", added_specs=SPECS) is None
+        assert calc.apply_spec_changes({"goals": 3.0}, "discovery", added_specs=SPECS) is None
+
+
+class TestProgressionStats:
+    """Tests for rolling velocity and plateau aggregates."""
+
+    DELTAS = [2.0, 0.1, 0.2, 0.3, 3.0, 0.0, 0.1, 1.5, 2.5, 4.0]
+
+    def _project(self, deltas, analytics_metrics=None):
+        return SimpleNamespace(
+            phase="discovery",
+            phase_maturity_scores={"discovery": 10.0},
+            analytics_metrics=analytics_metrics or {},
+            maturity_history=[{"event_type": "response_processed", "delta": d} for d in deltas],
+        )
+
+    def test_matches_history_scan(self):
+        stats = ProgressionStats.for_project(self._project(self.DELTAS))
+
+        assert stats.sessions == len(self.DELTAS)
+        assert stats.velocity == pytest.approx(sum(self.DELTAS) / len(self.DELTAS))
+        assert [(p["start_session"], p["duration"]) for p in stats.plateaus] == [(2, 3), (6, 2)]
+        assert stats.plateaus[0]["avg_delta"] == pytest.approx(0.2)
+
+    def test_only_new_events_are_folded(self):
+        project = self._project(self.DELTAS[:5])
+        project.analytics_metrics["progression"] = ProgressionStats.for_project(project).to_dict()
+        project.maturity_history.extend(
+            {"event_type": "response_processed", "delta": d} for d in self.DELTAS[5:]
+        )
+
+        stats = ProgressionStats.for_project(project)
+
+        assert stats.to_dict() == ProgressionStats.for_project(self._project(self.DELTAS)).to_dict()
+        assert len(project.analytics_metrics["progression"]["plateaus"]) == 1
+
+    def test_materialized_stats_survive_empty_history(self):
+        stored = ProgressionStats.for_project(self._project(self.DELTAS)).to_dict()
+        calc = AnalyticsCalculator()
+        project = self._project([], {"progression": stored})
+
+        assert calc.calculate_velocity(project) == pytest.approx(
+            sum(self.DELTAS) / len(self.DELTAS)
+        )
+        assert len(calc.identify_plateaus(project)) == 2
+        assert (
+            "Recent acceleration in progress"
+            in calc.analyze_progression_trends(project)["insights"]
+        )
+
+
+class TestMaterializedPersistence:
+    """Tests for storing materialized state in ProjectDatabase."""
+
+    @pytest.fixture
+    def db(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ProjectDatabase(os.path.join(tmpdir, "test.db"))
+            db.save_user(
+                User(
+                    username="owner",
+                    email="owner@test.com",
+                    passcode_hash="hash",
+                    created_at=datetime.datetime.now(),
+                )
+            )
+            db.save_project(
+                ProjectContext(
+                    project_id="proj-1",
+                    name="Project",
+                    owner="owner",
+                    collaborators=[],
+                    goals="",
+                    requirements=[],
+                    tech_stack=[],
+                    constraints=[],
+                    team_structure="individual",
+                    language_preferences="python",
+                    deployment_target="local",
+                    code_style="documented",
+                    phase="discovery",
+                    conversation_history=[],
+                    created_at=datetime.datetime.now(),
+                    updated_at=datetime.datetime.now(),
+                )
+            )
+            yield db
+
+    def test_round_trip(self, db):
+        calc = MaturityCalculator()
+        scores = calc.materialize_category_scores(SPECS, "discovery")
+
+        db.save_project_scores("proj-1", {"discovery": 12.0}, {"discovery": scores}, progress=6)
+        loaded = db.load_project("proj-1")
+
+        assert loaded.progress == 6
+        assert loaded.category_scores["discovery"]["goals"]["weighted_sum"] == pytest.approx(
+            scores["goals"]["weighted_sum"]
+        )
+        updated = calc.apply_spec_changes(
+            loaded.category_scores["discovery"], "discovery", added_specs=[_spec("goals")]
+        )
+        assert updated is not None
+
+    def test_quality_service_rescores_from_materialized_state(self, db):
+        project = db.load_project("proj-1")
+        project.category_scores["discovery"] = MaturityCalculator().materialize_category_scores(
+            SPECS, "discovery"
+        )
+        service = QualityService(MagicMock(), db)
+        service.repository.get_categorized_specs = MagicMock()
+
+        result = service.calculate_phase_maturity(
+            "proj-1", project, added_specs=[_spec("target_audience")]
+        )
+
+        service.repository.get_categorized_specs.assert_not_called()
+        expected = MaturityCalculator().calculate_phase_maturity(
+            SPECS + [_spec("target_audience")], "discovery"
+        )
+        assert result["overall_score"] == pytest.approx(expected.overall_score)
+        loaded = db.load_project("proj-1")
+        assert loaded.phase_maturity_scores["discovery"] == pytest.approx(expected.overall_score)
+        assert loaded.category_scores["discovery"]["target_audience"]["spec_count"] == 1
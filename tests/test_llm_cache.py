@@ -0,0 +1,206 @@
+"""
+Tests for the LLM response cache and single-flight coalescing.
+
+Uses a local fake client that counts upstream calls.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from socratic_system.caching import llm_cache
+from socratic_system.caching.llm_cache import CachingLLMClient, LLMResponseCache
+from socratic_system.core.insight_categorizer import InsightCategorizer
+
+
+class FakeClient:
+    """Fake LLM client that counts calls and can be slowed down."""
+
+    model = "fake-model-1"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.async_calls = 0
+        self._lock = threading.Lock()
+
+    def generate_response(self, prompt, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return f"answer to: {prompt}"
+
+    async def generate_response_async(self, prompt, **kwargs):
+        self.async_calls += 1
+        await asyncio.sleep(self.delay)
+        return f"async answer to: {prompt}"
+
+
+class TestCacheKeys:
+    """Test key normalization."""
+
+    def test_whitespace_and_param_order_normalized(self):
+        first = LLMResponseCache.make_key("Claude", "m", "hello  \r\nworld\n", {"a": 1, "b": 2})
+        second = LLMResponseCache.make_key("claude", "m", "hello\nworld", {"b": 2, "a": 1})
+
+        assert first == second
+
+    def test_model_and_params_distinguish_keys(self):
+        base = LLMResponseCache.make_key("claude", "m1", "p", {"temperature": 0})
+
+        assert base != LLMResponseCache.make_key("claude", "m2", "p", {"temperature": 0})
+        assert base != LLMResponseCache.make_key("claude", "m1", "p", {"temperature": 1})
+
+
+class TestCachingClient:
+    """Test the caching wrapper."""
+
+    def test_opt_in_per_call(self):
+        fake = FakeClient()
+        client = CachingLLMClient(fake, LLMResponseCache())
+
+        client.generate_response("q")
+        client.generate_response("q")
+        assert fake.calls == 2
+
+        client.generate_response("q", cache=True)
+        client.generate_response("q", cache=True)
+        assert fake.calls == 3
+
+    def test_ttl_expiry(self):
+        fake = FakeClient()
+        client = CachingLLMClient(fake, LLMResponseCache(), cache_by_default=True)
+
+        client.generate_response("q", cache_ttl=0.01)
+        time.sleep(0.02)
+        client.generate_response("q")
+
+        assert fake.calls == 2
+
+    def test_delegates_other_attributes(self):
+        client = CachingLLMClient(FakeClient(), LLMResponseCache())
+
+        assert client.model == "fake-model-1"
+        assert client.provider == "fake"
+
+    def test_persistent_store_survives_new_instance(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "llm_cache.db")
+            fake = FakeClient()
+
+            CachingLLMClient(fake, LLMResponseCache(db_path)).generate_response("q", cache=True)
+            result = CachingLLMClient(fake, LLMResponseCache(db_path)).generate_response(
+                "q", cache=True
+            )
+
+            assert result == "answer to: q"
+            assert fake.calls == 1
+
+    def test_concurrent_threads_make_one_upstream_call(self):
+        fake = FakeClient(delay=0.1)
+        cache = LLMResponseCache()
+        client = CachingLLMClient(fake, cache)
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(client.generate_response("q", cache=True))
+            )
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fake.calls == 1
+        assert len(results) == 10
+        assert set(results) == {"answer to: q"}
+        assert cache.get_stats()["coalesced"] == 9
+
+    def test_errors_are_not_cached(self):
+        cache = LLMResponseCache()
+        attempts = []
+
+        def failing():
+            attempts.append(1)
+            raise RuntimeError("provider down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                cache.get_or_compute("k", failing)
+
+        assert len(attempts) == 2
+
+    def test_rejected_responses_are_not_cached(self):
+        fake = FakeClient()
+        client = CachingLLMClient(fake, LLMResponseCache())
+
+        for _ in range(2):
+            client.generate_response("q", cache=True, cache_if=lambda text: False)
+        client.generate_response("q", cache=True, cache_if=lambda text: True)
+        client.generate_response("q", cache=True)
+
+        assert fake.calls == 3
+
+    def test_shared_cache_opened_on_first_cached_call(self, monkeypatch):
+        opened = []
+        monkeypatch.setattr(
+            llm_cache, "get_llm_cache", lambda: opened.append(1) or LLMResponseCache()
+        )
+
+        client = CachingLLMClient(FakeClient())
+        client.generate_response("q")
+        assert not opened
+
+        client.generate_response("q", cache=True)
+        client.generate_response("q", cache=True)
+        assert len(opened) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_calls_make_one_upstream_call(self):
+        fake = FakeClient(delay=0.05)
+        client = CachingLLMClient(fake, LLMResponseCache())
+
+        results = await asyncio.gather(
+            *[client.generate_response_async("q", cache=True) for _ in range(10)]
+        )
+
+        assert fake.async_calls == 1
+        assert set(results) == {"async answer to: q"}
+
+
+class ScriptedClient:
+    """Fake LLM client returning queued responses in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate_response(self, prompt, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestInsightCategorizerCache:
+    """Test the categorizer's use of the response cache."""
+
+    INSIGHTS = {"goals": ["Let users track expenses"]}
+    VALID = '[{"category": "goals", "content": "Let users track expenses", "confidence": 0.9}]'
+
+    def test_unparseable_responses_are_not_cached(self):
+        fake = ScriptedClient("not json", self.VALID)
+        categorizer = InsightCategorizer(fake, LLMResponseCache())
+
+        first = categorizer.categorize_insights(self.INSIGHTS, "discovery")
+        second = categorizer.categorize_insights(self.INSIGHTS, "discovery")
+        third = categorizer.categorize_insights(self.INSIGHTS, "discovery")
+
+        assert fake.calls == 2
+        assert [spec["category"] for spec in second] == ["goals"]
+        assert [spec["content"] for spec in third] == [spec["content"] for spec in second]
+        assert first != second
@@ -0,0 +1,120 @@
+"""
+Tests for the bounded metrics collector.
+
+Tests cover:
+- Ring buffers keep a fixed number of recent points
+- Histogram percentiles stay within the bucket error bound
+- Windowed statistics and percentiles from get_metric_stats()
+- Concurrent recording from multiple threads
+"""
+
+import random
+import threading
+from datetime import datetime, timedelta
+
+from socratic_system.monitoring_metrics import (
+    LatencyHistogram,
+    MetricPoint,
+    MetricsCollector,
+    RingBuffer,
+)
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_keeps_most_recent_items(self):
+        ring = RingBuffer(3)
+        for i in range(5):
+            ring.append(i)
+
+        assert len(ring) == 3
+        assert ring.latest() == 4
+        assert list(ring.newest_first()) == [4, 3, 2]
+
+    def test_empty(self):
+        ring = RingBuffer(2)
+
+        assert ring.latest() is None
+        assert list(ring.newest_first()) == []
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_error_bound(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[int(percentile / 100 * len(values)) - 1]
+            assert abs(histogram.percentile(percentile) - exact) / exact < 0.05
+
+    def test_extremes_and_zero(self):
+        histogram = LatencyHistogram()
+        for value in (0, 1e-6, 5.0, 1e15):
+            histogram.record(value)
+
+        assert histogram.percentile(0) == 0
+        assert histogram.percentile(100) == 1e15
+        assert histogram.count == 4
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(50) is None
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def test_memory_is_bounded(self):
+        collector = MetricsCollector(window_size=100)
+        for i in range(10000):
+            collector.record_metric("latency", float(i))
+
+        stats = collector.get_metric_stats("latency")
+
+        assert len(collector.metrics["latency"].points) == 100
+        assert stats["count"] == 100
+        assert stats["min"] == 9900
+        assert stats["latest"] == 9999
+        # Window percentiles cover the retained points only
+        assert stats["p50"] == 9949
+        assert stats["p99"] == 9998
+        # The histogram covers every value recorded
+        snapshot = collector.get_histogram_snapshot("latency")
+        assert snapshot["count"] == 10000
+        assert abs(snapshot["percentiles"][50] - 5000) / 5000 < 0.05
+
+    def test_window_excludes_old_points(self):
+        collector = MetricsCollector()
+        collector.record_metric("latency", 10)
+        series = collector.metrics["latency"]
+        series.points.append(MetricPoint(timestamp=datetime.now() - timedelta(hours=2), value=99))
+        series.points.append(MetricPoint(timestamp=datetime.now(), value=20))
+
+        stats = collector.get_metric_stats("latency", minutes=60)
+
+        assert stats["count"] == 1
+        assert stats["latest"] == 20
+        assert collector.get_metric_stats("missing") is None
+
+    def test_concurrent_recording(self):
+        collector = MetricsCollector()
+
+        def record():
+            for i in range(2000):
+                collector.record_metric("latency", i % 100 + 1)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = collector.get_histogram_snapshot("latency", percentiles=(100,))
+        assert snapshot["count"] == 8000
+        assert snapshot["percentiles"][100] == 100
@@ -0,0 +1,216 @@
+"""
+Tests for staged orchestrator startup.
+
+Tests cover:
+- Stage tracking, background stages and readiness
+- Concurrent provider discovery with per-provider timeouts
+- Agents registered on the bus but instantiated on first request
+- Dispatch that resolves only the requested agent, pre-warming and metrics
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from socratic_system.orchestration import llm_discovery
+from socratic_system.orchestration.startup import StageStatus, StartupTracker
+
+
+class TestStartupTracker:
+    """Tests for StartupTracker."""
+
+    def test_ready_once_required_stages_are_ready(self):
+        tracker = StartupTracker(required=("core",))
+        assert not tracker.is_ready()
+
+        with tracker.stage("core") as details:
+            details["components"] = 3
+
+        stage = tracker.snapshot()["stages"]["core"]
+        assert tracker.is_ready()
+        assert stage["status"] == "ready"
+        assert stage["details"] == {"components": 3}
+        assert stage["duration_ms"] >= 0
+
+    def test_failed_stage_records_error_and_reraises(self):
+        tracker = StartupTracker()
+
+        with pytest.raises(RuntimeError):
+            with tracker.stage("core"):
+                raise RuntimeError("no database")
+
+        assert tracker.status("core") == StageStatus.FAILED
+        assert tracker.snapshot()["stages"]["core"]["error"] == "no database"
+        assert not tracker.is_ready()
+
+    def test_background_stage_does_not_block(self):
+        tracker = StartupTracker(required=())
+
+        start = time.perf_counter()
+        tracker.run_in_background("discovery", time.sleep, 0.1)
+        assert time.perf_counter() - start < 0.05
+        assert tracker.status("discovery") in (StageStatus.PENDING, StageStatus.RUNNING)
+
+        assert tracker.wait("discovery", timeout=2)
+        assert tracker.is_ready()
+
+    def test_background_failure_is_recorded_not_raised(self):
+        tracker = StartupTracker(required=())
+
+        def boom():
+            raise ValueError("unreachable")
+
+        tracker.run_in_background("discovery", boom)
+
+        assert not tracker.wait("discovery", timeout=2)
+        assert tracker.snapshot()["stages"]["discovery"]["error"] == "unreachable"
+
+    def test_deferred_and_skipped_stages(self):
+        tracker = StartupTracker(required=())
+        tracker.defer("vector_store")
+        tracker.skip("knowledge_base", "test mode")
+
+        assert not tracker.wait("vector_store", timeout=0.01)
+        assert tracker.status("vector_store") == StageStatus.DEFERRED
+        assert not tracker.wait("knowledge_base", timeout=0.01)
+        assert tracker.snapshot()["stages"]["knowledge_base"]["status"] == "skipped"
+
+
+class TestConcurrentDiscovery:
+    """Tests for discover_all_provider_models() and refresh_provider_metadata()."""
+
+    @pytest.fixture
+    def slow_providers(self, monkeypatch):
+        delays = {"ollama": 0.1, "claude": 0.1, "openai": 5.0, "gemini": 0.1}
+
+        async def fake_discover(provider, api_key=None):
+            await asyncio.sleep(delays[provider])
+            return [f"{provider}-model"]
+
+        monkeypatch.setattr(llm_discovery, "discover_provider_models", fake_discover)
+
+    @pytest.mark.asyncio
+    async def test_providers_are_probed_concurrently_with_timeouts(self, slow_providers):
+        start = time.perf_counter()
+        results = await llm_discovery.discover_all_provider_models(timeout=0.3)
+
+        assert time.perf_counter() - start < 1
+        assert results == {
+            "ollama": ["ollama-model"],
+            "claude": ["claude-model"],
+            "openai": None,
+            "gemini": ["gemini-model"],
+        }
+
+    def test_sync_refresh_updates_only_discovered_providers(self, slow_providers, monkeypatch):
+        from socratic_system.models.llm_provider import PROVIDER_METADATA
+
+        for provider in ("ollama", "openai"):
+            monkeypatch.setattr(PROVIDER_METADATA[provider], "models", ["existing"])
+
+        updated = llm_discovery.update_provider_metadata_with_discovered_models(
+            ("ollama", "openai"), timeout=0.3
+        )
+
+        assert updated == {"ollama": 1}
+        assert PROVIDER_METADATA["ollama"].models == ["ollama-model"]
+        assert PROVIDER_METADATA["openai"].models == ["existing"]
+
+
+class TestLazyAgentRegistration:
+    """Tests for agents registered without being instantiated."""
+
+    def test_agent_created_on_first_request(self):
+        from socratic_system.messaging.agent_registry import AgentRegistry
+        from socratic_system.orchestration.orchestrator import (
+            AGENT_REGISTRY_NAMES,
+            AgentOrchestrator,
+        )
+
+        created = []
+
+        class FakeOrchestrator(AgentOrchestrator):
+            def __init__(self):
+                self.agent_registry = AgentRegistry()
+                self._agent_metrics = {}
+                self.logger = SimpleNamespace(info=lambda message: None)
+
+            @property
+            def learning_agent(self):
+                created.append("learning_agent")
+                return SimpleNamespace(process=lambda request: {"status": "success", **request})
+
+        orchestrator = FakeOrchestrator()
+
+        assert orchestrator._register_agents() == len(AGENT_REGISTRY_NAMES)
+        assert created == []
+
+        handler = orchestrator.agent_registry.get_handler("learning")
+        assert handler.handler({"action": "track"}) == {"status": "success", "action": "track"}
+        assert created == ["learning_agent"]
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    from socratic_system.config import SocratesConfig
+    from socratic_system.orchestration.orchestrator import AgentOrchestrator
+
+    monkeypatch.setattr(
+        llm_discovery, "update_provider_metadata_with_discovered_models", lambda providers: {}
+    )
+    orchestrator = AgentOrchestrator(
+        SocratesConfig(api_key="sk-test", data_dir=tmp_path, prewarm_agents=["learning", "bogus"])
+    )
+    yield orchestrator
+    orchestrator.close()
+
+
+class TestAgentDispatch:
+    """Tests for process_request() dispatch, pre-warming and agent metrics."""
+
+    def test_only_requested_agent_is_instantiated(self, orchestrator):
+        assert orchestrator.startup.wait("agent_prewarm", timeout=30)
+
+        result = orchestrator.process_request("note_manager", {"action": "nope"})
+
+        stats = orchestrator.get_agent_stats()
+        assert result["status"] == "error"
+        assert set(orchestrator._agents_cache) == {"learning_agent", "note_manager"}
+        assert stats["instantiated"] == 2
+        assert stats["agents"]["note_manager"]["requests"] == 1
+        assert not stats["agents"]["note_manager"]["prewarmed"]
+        assert stats["agents"]["learning_agent"]["prewarmed"]
+        assert stats["agents"]["learning_agent"]["init_ms"] >= 0
+
+    def test_unknown_agent_instantiates_nothing(self, orchestrator):
+        assert orchestrator.startup.wait("agent_prewarm", timeout=30)
+
+        assert orchestrator.process_request("bogus", {}) == {
+            "status": "error",
+            "message": "Unknown agent: bogus",
+        }
+        assert set(orchestrator._agents_cache) == {"learning_agent"}
+
+    def test_aliases_resolve_to_one_instance(self, orchestrator):
+        agent = orchestrator.get_agent("multi_llm")
+
+        assert orchestrator.get_agent("multi_llm_manager") is agent
+        assert orchestrator.get_agent("multi_llm_agent") is agent
+        assert orchestrator.get_agent("document_agent") is orchestrator.document_processor
+
+    def test_concurrent_first_requests_create_one_agent(self, orchestrator):
+        agents = []
+        threads = [
+            threading.Thread(target=lambda: agents.append(orchestrator.get_agent("user_manager")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(agents) == 8
+        assert all(agent is agents[0] for agent in agents)
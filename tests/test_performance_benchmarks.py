@@ -9,6 +9,7 @@ Validates:
 - Cache effectiveness
 """
 
+import asyncio
 import statistics
 import time
 from unittest.mock import MagicMock
@@ -19,6 +20,8 @@ from socratic_system.caching import InMemoryAnalysisCache
 from socratic_system.events import EventEmitter
 from socratic_system.jobs import JobTracker
 from socratic_system.messaging import AgentBus, CircuitBreaker, RetryPolicy
+from socratic_system.messaging.agent_registry import AgentRegistry
+from socratic_system.security.audit_logger import AuditLogger
 from socratic_system.services import CodeService, QualityService, ValidationService
 
 
@@ -286,6 +289,164 @@ class TestJobTrackerPerformance:
         assert avg_latency < 5, f"Status update latency too high: {avg_latency}ms"
 
 
+class TestAgentBusThroughput:
+    """Benchmark direct dispatch against a loop-per-call sync path."""
+
+    def _bus(self):
+        registry = AgentRegistry()
+        bus = AgentBus(EventEmitter(), registry=registry)
+
+        async def handler(request):
+            return {"status": "success"}
+
+        registry.register("bench_agent", handler=handler)
+        return bus
+
+    def test_sync_messages_per_second(self):
+        """send_request_sync() reuses the bus loop thread instead of asyncio.run()."""
+        iterations = 500
+        bus = self._bus()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            asyncio.run(bus.send_request("bench_agent", {"action": "process"}))
+        before = iterations / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            bus.send_request_sync("bench_agent", {"action": "process"})
+        after = iterations / (time.perf_counter() - start)
+        bus.close()
+
+        print(f"\nAgent Bus Sync Throughput ({iterations} messages):")
+        print(f"  Loop per call: {before:.0f} msg/sec")
+        print(f"  Bus loop thread: {after:.0f} msg/sec")
+
+        assert after > before, f"Sync dispatch slower than loop per call: {after} vs {before}"
+
+    def test_async_messages_per_second(self):
+        """Direct dispatch skips emit routing, so observers are the only extra cost."""
+        iterations = 2000
+        bus = self._bus()
+        observed = []
+
+        async def run():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                await bus.send_request("bench_agent", {"action": "process"})
+            return iterations / (time.perf_counter() - start)
+
+        direct = asyncio.run(run())
+        bus.event_emitter.on("agent.bench_agent.request", observed.append)
+        tapped = asyncio.run(run())
+
+        print(f"\nAgent Bus Async Throughput ({iterations} messages):")
+        print(f"  Direct dispatch: {direct:.0f} msg/sec")
+        print(f"  With observer tap: {tapped:.0f} msg/sec")
+
+        assert len(observed) == iterations
+        assert bus.metrics["direct_handler_invocations"] == iterations * 2
+
+
+class TestAuditLoggingPerformance:
+    """Benchmark agent bus throughput with auditing off, synchronous and batched."""
+
+    class SlowAuditStore:
+        """Audit store with a fixed per-commit latency, like a disk-backed database."""
+
+        COMMIT_LATENCY = 0.001
+
+        def __init__(self):
+            self.rows = 0
+
+        def insert_audit_log(self, entry):
+            time.sleep(self.COMMIT_LATENCY)
+            self.rows += 1
+
+        def insert_audit_logs(self, entries):
+            time.sleep(self.COMMIT_LATENCY)
+            self.rows += len(entries)
+
+    def _throughput(self, audit_logger, iterations=300):
+        registry = AgentRegistry()
+        bus = AgentBus(EventEmitter(), registry=registry, audit_logger=audit_logger)
+
+        async def handler(request):
+            return {"status": "success"}
+
+        registry.register("bench_agent", handler=handler)
+
+        async def run():
+            for _ in range(iterations):
+                await bus.send_request("bench_agent", {"action": "process"})
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        return iterations / (time.perf_counter() - start)
+
+    def test_bus_throughput_with_auditing(self):
+        """Batched auditing keeps commit latency off the request path."""
+        sync_store = self.SlowAuditStore()
+        batched_store = self.SlowAuditStore()
+        batched_logger = AuditLogger(batched_store, durability="batched", batch_size=100)
+
+        off = self._throughput(None)
+        sync = self._throughput(AuditLogger(sync_store, durability="sync"))
+        batched = self._throughput(batched_logger)
+        batched_logger.close()
+
+        print("\nAgent Bus Throughput (300 requests):")
+        print(f"  Auditing off: {off:.0f} req/sec")
+        print(f"  Sync auditing: {sync:.0f} req/sec")
+        print(f"  Batched auditing: {batched:.0f} req/sec")
+        print(f"  Batched writer: {batched_logger.get_metrics()}")
+
+        assert batched_store.rows == sync_store.rows == 300
+        assert batched > sync * 1.5, f"Batched auditing too slow: {batched} vs {sync} req/sec"
+
+
+class TestOrchestratorStartup:
+    """Benchmark staged orchestrator startup."""
+
+    def test_core_ready_without_waiting_for_discovery(self, tmp_path, monkeypatch):
+        """Construction returns once the core is built; slow discovery finishes later."""
+        from socratic_system.config import SocratesConfig
+        from socratic_system.orchestration import llm_discovery
+        from socratic_system.orchestration.orchestrator import AgentOrchestrator
+        from socratic_system.orchestration.startup import StageStatus
+
+        discovery_delay = 2.0
+        monkeypatch.setattr(
+            llm_discovery,
+            "update_provider_metadata_with_discovered_models",
+            lambda providers: time.sleep(discovery_delay),
+        )
+
+        start = time.perf_counter()
+        orchestrator = AgentOrchestrator(SocratesConfig(api_key="sk-test", data_dir=tmp_path))
+        elapsed = time.perf_counter() - start
+
+        try:
+            snapshot = orchestrator.startup.snapshot()
+            stages = snapshot["stages"]
+
+            print("\nOrchestrator Startup:")
+            print(f"  Construction: {elapsed * 1000:.0f}ms")
+            for name, stage in stages.items():
+                print(f"  {name}: {stage['status']} ({stage['duration_ms']}ms)")
+
+            assert snapshot["ready"]
+            assert elapsed < discovery_delay
+            assert stages["model_discovery"]["status"] in ("pending", "running")
+            assert stages["vector_store"]["status"] == "deferred"
+            assert stages["agents"]["details"]["registered"] == 16
+            assert orchestrator._agents_cache == {}
+            assert orchestrator.startup.wait("model_discovery", timeout=10)
+            assert orchestrator.startup.status("vector_store") == StageStatus.DEFERRED
+        finally:
+            orchestrator.close()
+
+
 class TestCompleteWorkflowPerformance:
     """Benchmark complete workflow performance."""
 
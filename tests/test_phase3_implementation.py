@@ -5,6 +5,7 @@ Tests validate:
 - InMemoryAnalysisCache with TTL and LRU eviction
 - JobTracker for background job status tracking
 - BackgroundHandlers async event processing
+- ProjectAnalysisScheduler debouncing and coalescing
 - Integration with AgentOrchestrator
 - Polling endpoints for cached results
 """
@@ -406,6 +407,95 @@ class TestBackgroundHandlers(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(cached)
 
 
+class TestProjectAnalysisScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test per-project debouncing and coalescing of background analysis"""
+
+    async def asyncSetUp(self):
+        """Set up test fixtures"""
+        from socratic_system.handlers import ProjectAnalysisScheduler
+
+        self.runs = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+        async def runner(project_id, is_superseded):
+            await self.release.wait()
+            self.runs.append((project_id, is_superseded()))
+
+        self.scheduler = ProjectAnalysisScheduler(runner, debounce_seconds=0.05)
+
+    async def test_burst_is_debounced_into_one_run(self):
+        """Test five quick requests produce a single run"""
+        for _ in range(5):
+            self.scheduler.schedule("project1")
+
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(self.runs, [("project1", False)])
+        self.assertEqual(self.scheduler.stats["debounced"], 4)
+
+    async def test_projects_are_independent(self):
+        """Test requests for different projects are not merged"""
+        self.scheduler.schedule("project1")
+        self.scheduler.schedule("project2")
+
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(sorted(pid for pid, _ in self.runs), ["project1", "project2"])
+
+    async def test_run_in_progress_is_superseded(self):
+        """Test a request arriving mid-run marks the running analysis superseded"""
+        self.release.clear()
+        self.scheduler.schedule("project1")
+        await asyncio.sleep(0.1)  # first run is now blocked inside the runner
+
+        self.scheduler.schedule("project1")
+        self.release.set()
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(self.runs, [("project1", True), ("project1", False)])
+
+    async def test_flush_runs_pending_immediately(self):
+        """Test flush skips the remaining debounce delay"""
+        self.scheduler.debounce_seconds = 10
+        self.scheduler.schedule("project1")
+
+        await self.scheduler.flush("project1")
+
+        self.assertEqual(self.runs, [("project1", False)])
+        self.assertFalse(self.scheduler.pending("project1"))
+
+    async def test_combined_analysis_loads_and_saves_once(self):
+        """Test response bursts cause one load and one delta write"""
+        from socratic_system.handlers import BackgroundHandlers
+
+        orchestrator = MagicMock()
+        orchestrator.event_emitter.emit_async = AsyncMock()
+        orchestrator.quality_controller.process = MagicMock(
+            return_value={"phase_maturity_scores": {"discovery": 40.0}, "category_scores": {}}
+        )
+        orchestrator.conflict_detector.process = MagicMock(return_value={"conflicts": []})
+        orchestrator.context_analyzer.process = MagicMock(return_value={"insights": {}})
+
+        handlers = BackgroundHandlers(
+            orchestrator=orchestrator,
+            cache=InMemoryAnalysisCache(),
+            job_tracker=JobTracker(),
+            debounce_seconds=0.05,
+        )
+
+        for _ in range(5):
+            await handlers._on_response_received({"project_id": "project1"})
+        await handlers.scheduler.flush()
+
+        self.assertEqual(orchestrator.database.load_project.call_count, 1)
+        orchestrator.database.save_project.assert_not_called()
+        orchestrator.database.save_project_scores.assert_called_once()
+        self.assertIsNotNone(handlers.cache.get("analysis:quality:project1"))
+        self.assertIsNotNone(handlers.cache.get("analysis:conflicts:project1"))
+        self.assertIsNotNone(handlers.cache.get("analysis:insights:project1"))
+
+
 class TestPollingEndpointBehavior(unittest.TestCase):
     """Test expected behavior for polling endpoints"""
 
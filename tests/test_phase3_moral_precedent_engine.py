@@ -451,3 +451,88 @@ class TestIntegrationWithDeliberation:
 
         assert len(matches) > 0
         assert any("transparency" in m.precedent.action_description for m in matches)
+
+
+class TestPrecedentIndex:
+    """Test indexed precedent retrieval."""
+
+    WORDS = ["access", "user", "data", "delete", "export", "report", "share", "audit", "log"]
+
+    def setup_method(self):
+        """Set up engine with a varied precedent base."""
+        import random
+
+        rng = random.Random(7)
+        self.engine = MoralPrecedentEngine()
+        for i in range(300):
+            words = rng.sample(self.WORDS, rng.randint(1, 5))
+            self.engine.store_precedent(
+                action_description=" ".join(words),
+                conclusion=list(PrecedentType)[i % 4],
+                confidence=0.8,
+                reasoning="generated",
+                principles_involved=["privacy"] if i % 2 else ["security"],
+            )
+
+    def _linear_scan(self, query):
+        """Reference results computed by scanning every precedent."""
+        scored = []
+        for precedent in self.engine.precedents.values():
+            similarity = precedent.similarity_to(query.action)
+            if similarity < query.similarity_threshold:
+                continue
+            if query.principle_filter and not (
+                set(query.principle_filter) & set(precedent.principles_involved)
+            ):
+                continue
+            relevance = similarity + (0.2 if query.principle_filter else 0.0)
+            scored.append((min(1.0, relevance), precedent.id))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [pid for _, pid in scored[: query.max_results]]
+
+    def test_matches_linear_scan(self):
+        """Indexed queries return the same top-k as a full scan."""
+        for action in ["user data export", "delete audit log", "share report", "access"]:
+            for threshold in (0.2, 0.5, 0.8):
+                for principles in (None, ["privacy"]):
+                    query = PrecedentQuery(
+                        action=action,
+                        similarity_threshold=threshold,
+                        max_results=7,
+                        principle_filter=principles,
+                    )
+                    result = [m.precedent.id for m in self.engine.query_precedents(query)]
+                    assert result == self._linear_scan(query)
+
+    def test_candidates_are_pruned(self):
+        """High thresholds only verify precedents sharing rare tokens."""
+        query_tokens = {"delete", "audit", "log"}
+        candidates = self.engine.index.search("delete audit log", 0.9)
+
+        assert all(self.engine.index.tokens[pid] == query_tokens for pid in candidates)
+
+    def test_restore_overwrites_index_entry(self):
+        """Re-indexing a precedent drops its old tokens."""
+        self.engine.index.add("prec_000000", "completely different words")
+
+        assert "prec_000000" in self.engine.index.search("completely different words", 1.0)
+        assert "prec_000000" not in self.engine.index.postings.get("access", set())
+
+    def test_export_import_reuses_index(self, monkeypatch):
+        """Imported engines load the persisted index instead of rebuilding it."""
+        from socratic_system.reasoning.moral_precedent_engine import PrecedentIndex
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "precedents.json")
+            self.engine.export_precedents(filepath)
+
+            rebuilt = []
+            monkeypatch.setattr(PrecedentIndex, "add", lambda *args: rebuilt.append(args))
+            restored = MoralPrecedentEngine()
+            restored.import_precedents(filepath)
+
+        assert rebuilt == []
+        query = PrecedentQuery(action="user data export", similarity_threshold=0.3)
+        assert [m.precedent.id for m in restored.query_precedents(query)] == [
+            m.precedent.id for m in self.engine.query_precedents(query)
+        ]
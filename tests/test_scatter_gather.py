@@ -0,0 +1,235 @@
+"""
+Tests for scatter-gather on the agent bus.
+
+Tests cover:
+- Concurrent fan-out (latency of the slowest agent, not the sum)
+- Concurrency limit
+- Per-agent timeouts without retries
+- first_k / quorum / all_settled partial-result semantics
+- Concurrent broadcast with collected responses
+- Background analyses fanned out through the bus
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from socratic_system.events import EventEmitter
+from socratic_system.handlers import BackgroundHandlers
+from socratic_system.messaging import GatherMode
+from socratic_system.messaging.agent_bus import AgentBus
+from socratic_system.messaging.agent_registry import AgentRegistry
+from socratic_system.messaging.middleware import AgentBusMiddleware
+from socratic_system.messaging.scatter_gather import required_successes
+
+
+def _bus(delays, failing=(), **kwargs):
+    """Create a bus with agents that sleep for the given delays."""
+    registry = AgentRegistry()
+    bus = AgentBus(EventEmitter(), registry=registry, **kwargs)
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    def make_handler(name, delay):
+        async def handler(request):
+            state["calls"] += 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                state["active"] -= 1
+            if name in failing:
+                return {"status": "error", "message": f"{name} failed"}
+            return {"status": "success", "agent": name, "action": request.get("action")}
+
+        return handler
+
+    for name, delay in delays.items():
+        registry.register(name, handler=make_handler(name, delay))
+    return bus, state
+
+
+def _calls(*agents):
+    return {agent: (agent, {"action": "analyze"}) for agent in agents}
+
+
+class TestScatterGather:
+    """Tests for AgentBus.scatter_gather()."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_that_of_slowest_agent(self):
+        bus, state = _bus({"a": 0.1, "b": 0.1, "c": 0.1})
+
+        start = time.perf_counter()
+        result = await bus.scatter_gather(_calls("a", "b", "c"))
+        elapsed = time.perf_counter() - start
+
+        assert result.satisfied
+        assert list(result.responses()) == ["a", "b", "c"]
+        assert elapsed < 0.25
+        assert state["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        bus, state = _bus(dict.fromkeys("abcdef", 0.02))
+
+        result = await bus.scatter_gather(_calls(*"abcdef"), concurrency=2)
+
+        assert result.succeeded == 6
+        assert state["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_per_agent_timeout_is_not_retried(self):
+        bus, state = _bus({"fast": 0.01, "slow": 1.0})
+
+        start = time.perf_counter()
+        result = await bus.scatter_gather(
+            _calls("fast", "slow"), timeout=2.0, timeouts={"slow": 0.05}
+        )
+
+        assert time.perf_counter() - start < 0.5
+        assert result.outcomes["fast"].ok
+        assert result.outcomes["slow"].status == "timeout"
+        assert state["calls"] == 2
+        assert not result.satisfied
+
+    @pytest.mark.asyncio
+    async def test_first_k_cancels_remaining_calls(self):
+        bus, _ = _bus({"a": 0.01, "b": 0.02, "c": 1.0})
+
+        start = time.perf_counter()
+        result = await bus.scatter_gather(_calls("a", "b", "c"), mode="first_k", k=2)
+
+        assert time.perf_counter() - start < 0.5
+        assert result.satisfied
+        assert result.outcomes["c"].status == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_quorum_defaults_to_majority_and_counts_failures(self):
+        bus, _ = _bus({"a": 0.01, "b": 0.01, "c": 0.02, "d": 1.0}, failing={"a"})
+
+        result = await bus.scatter_gather(_calls("a", "b", "c", "d"), mode=GatherMode.QUORUM)
+
+        assert result.required == 3
+        assert result.outcomes["a"].status == "error"
+        assert result.outcomes["a"].error == "a failed"
+        # Quorum can only be met once d finishes, so the gather waits for it
+        assert result.satisfied
+
+    @pytest.mark.asyncio
+    async def test_quorum_stops_when_unreachable(self):
+        bus, _ = _bus({"a": 0.01, "b": 0.01, "c": 1.0}, failing={"a", "b"})
+
+        start = time.perf_counter()
+        result = await bus.scatter_gather(_calls("a", "b", "c"), mode="quorum")
+
+        assert time.perf_counter() - start < 0.5
+        assert not result.satisfied
+        assert result.outcomes["c"].status == "cancelled"
+
+    def test_required_successes(self):
+        assert required_successes(GatherMode.ALL_SETTLED, 4) == 4
+        assert required_successes(GatherMode.FIRST_K, 4) == 1
+        assert required_successes(GatherMode.QUORUM, 4) == 3
+        assert required_successes(GatherMode.FIRST_K, 2, k=5) == 2
+        with pytest.raises(ValueError):
+            required_successes(GatherMode.FIRST_K, 2, k=0)
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent_is_an_error_outcome(self):
+        bus, _ = _bus({"a": 0.0})
+
+        result = await bus.scatter_gather(_calls("a", "missing"))
+
+        assert result.outcomes["missing"].status == "error"
+        assert result.to_dict()["succeeded"] == 1
+
+
+class TestConcurrentBroadcast:
+    """Tests for broadcast() and middleware fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_collects_responses_concurrently(self):
+        bus, state = _bus({"a": 0.1, "b": 0.1, "c": 0.1})
+
+        start = time.perf_counter()
+        result = await bus.broadcast("refresh", wait_for_responses=True)
+
+        assert time.perf_counter() - start < 0.25
+        assert result["count"] == 3
+        assert {r["status"] for r in result["responses"].values()} == {"success"}
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_broadcast_does_not_wait(self):
+        bus, state = _bus({"a": 0.1, "b": 0.1})
+
+        result = await bus.broadcast("refresh")
+        assert "responses" not in result
+        assert state["calls"] == 0
+
+        await asyncio.sleep(0.2)
+        assert state["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_middleware_call_parallel(self):
+        bus, _ = _bus({"a": 0.0, "b": 0.0})
+
+        results = await AgentBusMiddleware(bus).call_parallel(
+            [("a", "analyze", {}), ("b", "analyze", {}), ("missing", "analyze", {})]
+        )
+
+        assert results["a"]["agent"] == "a"
+        assert results["missing"]["status"] == "error"
+
+
+class TestBackgroundAnalysisFanOut:
+    """Tests for combined background analysis through the bus."""
+
+    @pytest.mark.asyncio
+    async def test_analyses_run_concurrently(self):
+        bus, state = _bus(
+            {"quality_controller": 0.1, "conflict_detector": 0.1, "context_analyzer": 0.1},
+            failing={"context_analyzer"},
+        )
+        project = SimpleNamespace(project_id="p1")
+        orchestrator = MagicMock()
+        orchestrator.agent_bus = bus
+        handlers = BackgroundHandlers(orchestrator, cache=MagicMock(), job_tracker=MagicMock())
+
+        start = time.perf_counter()
+        results = await handlers._gather_analyses(project)
+
+        assert time.perf_counter() - start < 0.25
+        assert state["peak"] == 3
+        assert results["quality"]["action"] == "get_phase_maturity"
+        assert results["conflict"]["action"] == "detect_conflicts"
+        assert isinstance(results["insights"], RuntimeError)
+        assert "context_analyzer failed" in str(results["insights"])
+
+    @pytest.mark.asyncio
+    async def test_error_replies_are_published_as_failures(self):
+        bus, _ = _bus(
+            {"quality_controller": 0, "conflict_detector": 0, "context_analyzer": 0},
+            failing={"quality_controller"},
+        )
+        project = SimpleNamespace(project_id="p1")
+        orchestrator = MagicMock()
+        orchestrator.agent_bus = bus
+        orchestrator.database.load_project.return_value = project
+        orchestrator.event_emitter.emit_async = AsyncMock()
+        cache = MagicMock()
+        handlers = BackgroundHandlers(orchestrator, cache=cache, job_tracker=MagicMock())
+
+        await handlers._process_all_async("p1")
+
+        events = [call.args[0] for call in orchestrator.event_emitter.emit_async.call_args_list]
+        cached = [call.args[0] for call in cache.set.call_args_list]
+        assert "quality.analysis.failed" in events
+        assert "quality.analysis.completed" not in events
+        assert "conflict.analysis.completed" in events
+        assert "analysis:quality:p1" not in cached
+        assert not hasattr(project, "last_assessment")
+        orchestrator.database.save_project_scores.assert_not_called()
@@ -0,0 +1,87 @@
+"""
+Tests for job and analysis cache state shared by several processes.
+
+Tests cover:
+- Jobs created through one SQLiteJobTracker are visible and updatable through another
+- Completed job cleanup and statistics
+- Analysis cache entries are shared, expire and can be cleared
+"""
+
+import pytest
+
+from socratic_system.caching import SQLiteAnalysisCache
+from socratic_system.jobs import JobStatus, SQLiteJobTracker
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "shared_state.db")
+
+
+class TestSQLiteJobTracker:
+    """Tests for SQLiteJobTracker."""
+
+    def test_jobs_are_shared_between_trackers(self, db_path):
+        worker_a, worker_b = SQLiteJobTracker(db_path), SQLiteJobTracker(db_path)
+
+        job = worker_a.create_job("job-1", "proj-1")
+        worker_a.create_job("job-2", "proj-1")
+        worker_a.create_job("job-3", "proj-2")
+        assert job.status == JobStatus.PENDING
+
+        worker_b.mark_processing("job-1")
+        worker_b.update_progress("job-1", 1.5)
+        assert worker_a.get_job("job-1").status == JobStatus.PROCESSING
+        assert worker_a.get_job("job-1").progress == 1.0
+
+        worker_b.mark_completed("job-1", {"score": 0.9})
+        worker_a.mark_failed("job-2", "boom")
+
+        done = worker_b.get_job("job-1")
+        assert done.is_complete()
+        assert done.result == {"score": 0.9}
+        assert worker_b.get_job("job-2").error == "boom"
+        assert {j.job_id for j in worker_b.get_project_jobs("proj-1")} == {"job-1", "job-2"}
+        assert [j.job_id for j in worker_b.get_pending_jobs()] == ["job-3"]
+        assert worker_b.get_job("missing") is None
+
+    def test_cleanup_and_stats(self, db_path):
+        tracker = SQLiteJobTracker(db_path)
+        tracker.create_job("old", "proj-1")
+        tracker.create_job("running", "proj-1")
+        tracker.mark_completed("old", {})
+        tracker.mark_processing("running")
+
+        tracker.cleanup_completed(max_age_seconds=3600)
+        assert tracker.get_job("old") is not None
+        tracker.cleanup_completed(max_age_seconds=-1)
+        assert tracker.get_job("old") is None
+
+        stats = tracker.get_stats()
+        assert stats["total_jobs"] == 1
+        assert stats["processing"] == 1
+        tracker.delete_job("running")
+        assert tracker.get_stats()["total_jobs"] == 0
+
+
+class TestSQLiteAnalysisCache:
+    """Tests for SQLiteAnalysisCache."""
+
+    def test_entries_are_shared_and_expire(self, db_path):
+        worker_a, worker_b = SQLiteAnalysisCache(db_path), SQLiteAnalysisCache(db_path)
+
+        worker_a.set("quality:proj-1", {"score": 7})
+        worker_a.set("stale", {"score": 1}, ttl=-1)
+
+        assert worker_b.get("quality:proj-1") == {"score": 7}
+        assert worker_b.get("stale") is None
+        assert worker_b.get_stats()["expired_entries"] == 1
+
+        worker_b.clear_expired()
+        assert worker_a.size() == 1
+        worker_b.delete("quality:proj-1")
+        assert worker_a.get("quality:proj-1") is None
+
+        worker_a.set("a", {})
+        worker_b.clear()
+        assert worker_a.size() == 0
@@ -0,0 +1,117 @@
+"""
+Tests for job completion waits in SocratesAgentClient.
+
+Tests cover:
+- wait_for_result blocks on the server long-poll instead of polling
+- Fallback to exponential backoff against servers without long-poll
+- Batch status long-poll covering many jobs in one request
+"""
+
+import httpx
+import pytest
+
+from socratic_system.clients.socrates_agent_client import (
+    AgentTimeoutError,
+    SocratesAgentClient,
+    SocratesAgentClientError,
+)
+
+
+def _client(handler):
+    client = SocratesAgentClient("http://test")
+    client._http_client = httpx.AsyncClient(
+        base_url="http://test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _status(status, long_poll=True, **extra):
+    data = {"job_id": "job_1", "status": status, **extra}
+    if long_poll:
+        data["long_poll"] = True
+    return httpx.Response(
+        200,
+        json={"success": status == "completed", "status": "success", "data": data},
+    )
+
+
+class TestWaitForResult:
+    """Tests for wait_for_result()."""
+
+    @pytest.mark.asyncio
+    async def test_long_poll_until_completed(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) < 3:
+                return _status("running")
+            return _status("completed", result={"answer": 42})
+
+        async with _client(handler) as client:
+            result = await client.wait_for_result("job_1", timeout=100)
+
+        assert result == {"answer": 42}
+        assert len(requests) == 3
+        assert all(float(r.url.params["wait"]) == client.LONG_POLL_WAIT for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_backoff_without_long_poll(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) < 5:
+                return _status("pending", long_poll=False)
+            return _status("completed", long_poll=False, result="done")
+
+        async with _client(handler) as client:
+            assert await client.wait_for_result("job_1", timeout=100, poll_interval=1) == "done"
+
+        assert sleeps == [1, 2, 4, 8]
+        assert "wait" in requests[0].url.params
+        assert all("wait" not in r.url.params for r in requests[1:])
+
+    @pytest.mark.asyncio
+    async def test_terminal_statuses_raise(self):
+        async with _client(lambda request: _status("timeout")) as client:
+            with pytest.raises(AgentTimeoutError):
+                await client.wait_for_result("job_1", timeout=10)
+
+        async with _client(lambda request: _status("cancelled")) as client:
+            with pytest.raises(SocratesAgentClientError, match="cancelled"):
+                await client.wait_for_result("job_1", timeout=10)
+
+
+class TestBatchStatus:
+    """Tests for get_batch_job_status()."""
+
+    @pytest.mark.asyncio
+    async def test_single_long_poll_for_many_jobs(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "data": {"jobs": {"a": {"status": "completed", "complete": True}}},
+                },
+            )
+
+        async with _client(handler) as client:
+            jobs = await client.get_batch_job_status(["a", "b", "c"], wait=20, return_when="all")
+
+        assert jobs["a"]["complete"]
+        assert len(requests) == 1
+        params = requests[0].url.params
+        assert params["job_ids"] == "a,b,c"
+        assert params["return_when"] == "all"
+        assert float(params["wait"]) == 20